@@ -13,21 +13,22 @@ def free_mortgage(player, asset, current_gameboard):
     purchaseable an Exception will automatically be raised.
     :return: successful action code if the player has succeeded in freeing the mortgage on asset, otherwise failure code
     """
-    logger.debug(player.player_name+' is attempting to free up mortgage on asset '+asset.name)
+    logger.debug('%s is attempting to free up mortgage on asset %s', player.player_name, asset.name)
     if asset.owned_by != player:
-        logger.debug(player.player_name+' is trying to free up mortgage on property that is not theirs. Returning failure code')
+        logger.debug('%s is trying to free up mortgage on property that is not theirs. Returning failure code', player.player_name)
         return flag_config_dict['failure_code']
     elif asset.is_mortgaged is False or asset not in player.mortgaged_assets:  # the or is unnecessary but serves as a check
-        logger.debug(asset.name+'  is not mortgaged to begin with. Returning failure code')
+        logger.debug('%s  is not mortgaged to begin with. Returning failure code', asset.name)
         return flag_config_dict['failure_code']
     elif player.current_cash <= asset.calculate_mortgage_owed(asset, current_gameboard):
-        logger.debug(player.player_name+ ' does not have cash to free mortgage on asset '+str(asset.name)+'. Returning failure code')
+        logger.debug('%s does not have cash to free mortgage on asset %s. Returning failure code', player.player_name, asset.name)
         return flag_config_dict['failure_code']
     else:
         player.charge_player(asset.calculate_mortgage_owed(asset, current_gameboard), current_gameboard, bank_flag=True)
-        logger.debug(player.player_name+"Player has paid down mortgage with interest. Setting status of asset to unmortgaged, and removing asset from player's mortgaged set")
+        logger.debug("%sPlayer has paid down mortgage with interest. Setting status of asset to unmortgaged, and removing asset from player's mortgaged set", player.player_name)
         asset.is_mortgaged = False
         player.mortgaged_assets.remove(asset)
+        player.update_asset_values(asset)
         logger.debug('Mortgage has successfully been freed. Returning successful action code')
         return flag_config_dict['successful_action']
 
@@ -44,17 +45,17 @@ def make_sell_property_offer(from_player, asset, to_player, price):
     """
 
     if to_player.is_property_offer_outstanding:
-        logger.debug(to_player.player_name+' already has a property offer. You must wait. Returning failure code')
+        logger.debug('%s already has a property offer. You must wait. Returning failure code', to_player.player_name)
         return flag_config_dict['failure_code']
     elif asset.owned_by != from_player:
-        logger.debug(from_player.player_name+'player does not own this property and cannot make an offer. Returning failure code')
+        logger.debug('%splayer does not own this property and cannot make an offer. Returning failure code', from_player.player_name)
         return flag_config_dict['failure_code']
     elif asset.loc_class == 'real_estate' and (asset.num_houses > 0 or asset.num_hotels > 0):
-        logger.debug(asset.name+' has improvements. Clear them before making an offer! Returning failure code') # note that this entails a risk since you
+        logger.debug('%s has improvements. Clear them before making an offer! Returning failure code', asset.name) # note that this entails a risk since you
         # could clear the improvements, and still not get an offer accepted. Decide at your own peril!
         return flag_config_dict['failure_code']
     else:
-        logger.debug('Instantiating data structures outstanding_property_offer and setting is_property_offer_outstanding to True to enable property offer to '+to_player.player_name)
+        logger.debug('Instantiating data structures outstanding_property_offer and setting is_property_offer_outstanding to True to enable property offer to %s', to_player.player_name)
         to_player.outstanding_property_offer['asset'] = asset
         to_player.outstanding_property_offer['from_player'] = from_player
         to_player.outstanding_property_offer['price'] = price
@@ -74,23 +75,20 @@ def sell_property(player, asset, current_gameboard):
     """
 
     if asset.owned_by != player:
-        logger.debug(player.player_name+' does not own this property and cannot sell it. Returning failure code')
+        logger.debug('%s does not own this property and cannot sell it. Returning failure code', player.player_name)
         return flag_config_dict['failure_code']
 
     elif asset.loc_class == 'real_estate' and (asset.num_houses > 0 or asset.num_hotels > 0) :
-        logger.debug(asset.name+' has improvements. Clear them before trying to sell! Returning failure code')
+        logger.debug('%s has improvements. Clear them before trying to sell! Returning failure code', asset.name)
         return flag_config_dict['failure_code']
 
     else:
         if asset.color in player.full_color_sets_possessed:
-            # if color is monopolized by player, check if there are improvements on the other properties of the color group
-            for same_colored_asset in current_gameboard['color_assets'][asset.color]:
-                if same_colored_asset == asset:
-                    continue
-                elif same_colored_asset.num_houses > 0 or same_colored_asset.num_hotels > 0:
-                    logger.debug(same_colored_asset.name + ' belongs to same color group as the property involved in the offer and is improved. '
-                                                           'Clear them before trying to sell!! Returning failure code.')
-                    return flag_config_dict['failure_code']
+            # if color is monopolized by player, check if there are improvements on the other properties of the color
+            # group (asset itself is unimproved, so the group is improved only if some other property is)
+            if asset.improvement_levels.highest > (0, 0):
+                logger.debug('A property of the same color group as %s is improved. Clear them before trying to sell!! Returning failure code.', asset.name)
+                return flag_config_dict['failure_code']
 
         logger.debug('Trying to transfer property to bank')
         cash_due = asset.transfer_property_to_bank(player, current_gameboard)
@@ -99,25 +97,25 @@ def sell_property(player, asset, current_gameboard):
             return flag_config_dict['failure_code']
         else:
             # add to game history
-            current_gameboard['history']['function'].append(asset.transfer_property_to_bank)
+            current_gameboard.history['function'].append(asset.transfer_property_to_bank)
             params = dict()
             params['self'] = asset
             params['player'] = player
             params['current_gameboard'] = current_gameboard
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(cash_due)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(cash_due)
 
             logger.debug('Transfer successful. Paying player what they are due for the property and returning successful action code...')
             code = player.receive_cash(cash_due, current_gameboard, bank_flag=True)
             # add to game history
             if code == flag_config_dict['successful_action']:
-                current_gameboard['history']['function'].append(player.receive_cash)
+                current_gameboard.history['function'].append(player.receive_cash)
                 params = dict()
                 params['self'] = player
                 params['amount'] = cash_due
                 params['description'] = 'sell property'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(code)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
                 return flag_config_dict['successful_action']     # property has been successfully sold
             else:
                 logger.debug("Not sure what happened! Something broke although bank had sufficient funds !")
@@ -137,10 +135,10 @@ def sell_house_hotel(player, asset, current_gameboard, sell_house=True, sell_hot
     """
 
     if asset.owned_by != player:
-        logger.debug(player.player_name+' does not own this property and cannot make an offer. Returning failure code')
+        logger.debug('%s does not own this property and cannot make an offer. Returning failure code', player.player_name)
         return flag_config_dict['failure_code']
     elif asset.loc_class != 'real_estate':
-        logger.debug(asset.name+' is not real estate. Returning failure code')
+        logger.debug('%s is not real estate. Returning failure code', asset.name)
         return flag_config_dict['failure_code']
     elif asset.num_hotels == 0 and sell_hotel:
         logger.debug('There are no hotels to sell. Returning failure code')
@@ -150,43 +148,39 @@ def sell_house_hotel(player, asset, current_gameboard, sell_house=True, sell_hot
         return flag_config_dict['failure_code']
 
     if sell_hotel: # this is the simpler case
-        logger.debug('Looking to sell hotel on '+asset.name)
-        flag = True
-        for same_colored_asset in current_gameboard['color_assets'][asset.color]:
-            if same_colored_asset == asset:
-                continue
-            if asset.num_hotels == 1 and not (same_colored_asset.num_hotels == 1 or (same_colored_asset.num_hotels == 0 and
-                                    same_colored_asset.num_houses == 0)) : # if there are no hotels on other properties,
-                # there must not be houses either, otherwise  the uniform improvement rule gets broken. The not on the
-                # outside enforces this rule.
-                flag = False
-                break
-            elif asset.num_hotels < same_colored_asset.num_hotels:    # need to follow uniform improvement rule
-                flag = False
-                break
+        logger.debug('Looking to sell hotel on %s', asset.name)
+        levels = asset.improvement_levels
+        if asset.num_hotels == 1:
+            # every other property must have a hotel too or be unimproved. If there are no hotels on other properties,
+            # there must not be houses either, otherwise the uniform improvement rule gets broken.
+            flag = levels.count(1, 0) + levels.count(0, 0) == levels.num_assets
+        else:
+            flag = levels.highest[0] <= asset.num_hotels    # need to follow uniform improvement rule
 
         if flag:
             logger.debug('Trying to sell a hotel to the bank')
-            code = player.receive_cash((asset.price_per_house*(current_gameboard['bank'].house_limit_before_hotel + 1))*current_gameboard['bank'].hotel_sell_percentage, current_gameboard, bank_flag=True) # player only gets half the initial cost back. Recall that you can sell the entire hotel or not at all.
+            code = player.receive_cash((asset.price_per_house*(current_gameboard.bank.house_limit_before_hotel + 1))*current_gameboard.bank.hotel_sell_percentage, current_gameboard, bank_flag=True) # player only gets half the initial cost back. Recall that you can sell the entire hotel or not at all.
             if code == flag_config_dict['successful_action']:
                 logger.debug('Bank Paid player for sale of hotel.')
                 logger.debug('Transferring hotel to bank and updating num_total_hotels and num_total_houses.')
                 player.num_total_hotels -= 1
-                logger.debug(player.player_name+' now has num_total_hotels '+str(player.num_total_hotels)+' and num_total_houses '+str(player.num_total_houses))
+                logger.debug('%s now has num_total_hotels %s and num_total_houses %s', player.player_name, player.num_total_hotels, player.num_total_houses)
 
-                current_gameboard['bank'].total_hotels += 1   #incrementing the bank's total_hotels number since a hotel has been returned.
+                current_gameboard.bank.total_hotels += 1   #incrementing the bank's total_hotels number since a hotel has been returned.
                 # add to game history
-                current_gameboard['history']['function'].append(player.receive_cash)
+                current_gameboard.history['function'].append(player.receive_cash)
                 params = dict()
                 params['self'] = player
-                params['amount'] = (asset.price_per_house*(current_gameboard['bank'].house_limit_before_hotel + 1))*current_gameboard['bank'].hotel_sell_percentage   # changed hardcoded value to a bank parameter
+                params['amount'] = (asset.price_per_house*(current_gameboard.bank.house_limit_before_hotel + 1))*current_gameboard.bank.hotel_sell_percentage   # changed hardcoded value to a bank parameter
                 params['description'] = 'sell improvements'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(code)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
 
                 logger.debug('Updating houses and hotels on the asset')
                 asset.num_houses = 0 # this should already be 0 but just in case
                 asset.num_hotels -= 1
+                asset.update_improvement_level()
+                player.update_asset_values(asset)
                 logger.debug('Player has successfully sold hotel. Returning 1')
                 return flag_config_dict['successful_action']
 
@@ -200,37 +194,33 @@ def sell_house_hotel(player, asset, current_gameboard, sell_house=True, sell_hot
             return flag_config_dict['failure_code']
 
     elif sell_house:
-        logger.debug('Looking to sell house on '+ asset.name)
-        flag = True
-        current_asset_num_houses = asset.num_houses
-        for same_colored_asset in current_gameboard['color_assets'][asset.color]:
-            if same_colored_asset == asset:
-                continue
-            if same_colored_asset.num_houses > current_asset_num_houses or same_colored_asset.num_hotels == 1:
-                flag = False
-                break
+        logger.debug('Looking to sell house on %s', asset.name)
+        # no other property may have more houses, or a hotel
+        levels = asset.improvement_levels
+        flag = levels.most_houses <= asset.num_houses and levels.count(1, 0) == 0
         if flag:
             logger.debug('Trying to sell a house to the bank')
-            code = player.receive_cash(asset.price_per_house*current_gameboard['bank'].house_sell_percentage, current_gameboard, bank_flag=True)
+            code = player.receive_cash(asset.price_per_house*current_gameboard.bank.house_sell_percentage, current_gameboard, bank_flag=True)
             if code == flag_config_dict['successful_action']:
                 logger.debug('Bank Paid player for sale of house.')
                 logger.debug('Transferring house to bank and updating num_total_houses.')
                 player.num_total_houses -= 1
-                logger.debug(player.player_name+ ' now has num_total_hotels '+ str(
-                    player.num_total_hotels)+ ' and num_total_houses '+ str(player.num_total_houses))
+                logger.debug('%s now has num_total_hotels %s and num_total_houses %s', player.player_name, player.num_total_hotels, player.num_total_houses)
 
-                current_gameboard['bank'].total_houses += 1   #incrementing the bank's total_houses number since a house has been returned.
+                current_gameboard.bank.total_houses += 1   #incrementing the bank's total_houses number since a house has been returned.
                 # add to game history
-                current_gameboard['history']['function'].append(player.receive_cash)
+                current_gameboard.history['function'].append(player.receive_cash)
                 params = dict()
                 params['self'] = player
-                params['amount'] = asset.price_per_house * current_gameboard['bank'].house_sell_percentage    # changed hardcoded value to a bank parameter
+                params['amount'] = asset.price_per_house * current_gameboard.bank.house_sell_percentage    # changed hardcoded value to a bank parameter
                 params['description'] = 'sell improvements'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(code)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
 
                 logger.debug('Updating houses and hotels on the asset')
                 asset.num_houses -= 1
+                asset.update_improvement_level()
+                player.update_asset_values(asset)
                 logger.debug('Player has successfully sold house. Returning successful action code')
                 return flag_config_dict['successful_action']
 
@@ -258,10 +248,10 @@ def accept_sell_property_offer(player, current_gameboard):
     :return: successful action code if the property offer is accepted and property is successfully transferred, otherwise failure code.
     """
     if not player.is_property_offer_outstanding:
-        logger.debug(player.player_name+' does not have outstanding property offers to accept. Returning failure code')
+        logger.debug('%s does not have outstanding property offers to accept. Returning failure code', player.player_name)
         return flag_config_dict['failure_code']
     elif player.current_cash <= player.outstanding_property_offer['price']:
-        logger.debug(player.player_name+' does not have the cash necessary to accept. Nulling outstanding property offers data structures and returning failure code')
+        logger.debug('%s does not have the cash necessary to accept. Nulling outstanding property offers data structures and returning failure code', player.player_name)
         player.is_property_offer_outstanding = False
         player.outstanding_property_offer['from_player'] = None
         player.outstanding_property_offer['asset'] = None
@@ -274,36 +264,36 @@ def accept_sell_property_offer(player, current_gameboard):
         func(player.outstanding_property_offer['from_player'],
                            player, current_gameboard)
         # add to game history
-        current_gameboard['history']['function'].append(func)
+        current_gameboard.history['function'].append(func)
         params = dict()
         params['self'] = func_asset
         params['from_player'] = player.outstanding_property_offer['from_player']
         params['to_player'] = player
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         logger.debug('Initiating cash transfer from one player to another')
         player.charge_player(player.outstanding_property_offer['price'], current_gameboard, bank_flag=False)
         # add to game history
-        current_gameboard['history']['function'].append(player.charge_player)
+        current_gameboard.history['function'].append(player.charge_player)
         params = dict()
         params['self'] = player
         params['amount'] = player.outstanding_property_offer['price']
         params['description'] = 'accept sell property offer'
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         code = player.outstanding_property_offer['from_player'].receive_cash(player.outstanding_property_offer['price'], current_gameboard, bank_flag=False)
         # add to game history
         if code == flag_config_dict['successful_action']:
-            current_gameboard['history']['function'].append(player.outstanding_property_offer['from_player'].receive_cash)
+            current_gameboard.history['function'].append(player.outstanding_property_offer['from_player'].receive_cash)
             params = dict()
             params['self'] = player.outstanding_property_offer['from_player']
             params['amount'] = player.outstanding_property_offer['price']
             params['description'] = 'sell property'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(code)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(code)
         else:
             logger.debug("Not sure what happened! Something broke!")
             logger.error("Exception")
@@ -345,29 +335,30 @@ def mortgage_property(player, asset, current_gameboard):
     :return: successful action code if the mortgage has gone through, failure code otherwise.
     """
     if asset.owned_by != player:
-        logger.debug(player.player_name+' is trying to mortgage property that is not theirs. Returning failure code')
+        logger.debug('%s is trying to mortgage property that is not theirs. Returning failure code', player.player_name)
         return flag_config_dict['failure_code']
     elif asset.is_mortgaged is True or asset in player.mortgaged_assets: # the or is unnecessary but serves as a check
-        logger.debug(asset.name+' is already mortgaged to begin with...Returning failure code')
+        logger.debug('%s is already mortgaged to begin with...Returning failure code', asset.name)
         return flag_config_dict['failure_code']
     elif asset.loc_class == 'real_estate' and (asset.num_houses > 0 or asset.num_hotels > 0):
-        logger.debug(asset.name+' has improvements. Remove improvements before attempting mortgage. Returning failure code')
+        logger.debug('%s has improvements. Remove improvements before attempting mortgage. Returning failure code', asset.name)
         return flag_config_dict['failure_code']
     else:
-        if current_gameboard['bank'].total_cash_with_bank >= asset.mortgage:   # i.e. bank has enough money to the player mortgage
+        if current_gameboard.bank.total_cash_with_bank >= asset.mortgage:   # i.e. bank has enough money to the player mortgage
             logger.debug("Setting asset to mortgage status and adding to player's mortgaged assets")
             asset.is_mortgaged = True
             player.mortgaged_assets.add(asset)
+            player.update_asset_values(asset)
             code = player.receive_cash(asset.mortgage, current_gameboard, bank_flag=True)
             # add to game history
             if code == flag_config_dict['successful_action']:
-                current_gameboard['history']['function'].append(player.receive_cash)
+                current_gameboard.history['function'].append(player.receive_cash)
                 params = dict()
                 params['self'] = player
                 params['amount'] = asset.mortgage
                 params['description'] = 'mortgage property'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(code)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
 
                 logger.debug("Property has been mortgaged and player has received cash. Returning successful action code")
                 return flag_config_dict['successful_action'] # property has been successfully mortgaged
@@ -396,63 +387,59 @@ def improve_property(player, asset, current_gameboard, add_house=True, add_hotel
     """
     if asset.owned_by != player or asset.is_mortgaged:
         # these are the usual conditions that we verify before allowing any improvement to proceed
-        logger.debug(player.player_name+' does not own this property, or it is mortgaged. Returning failure code')
+        logger.debug('%s does not own this property, or it is mortgaged. Returning failure code', player.player_name)
         return flag_config_dict['failure_code']
     elif asset.loc_class != 'real_estate':
-        logger.debug(asset.name+' is not real estate and cannot be improved. Returning failure code')
+        logger.debug('%s is not real estate and cannot be improved. Returning failure code', asset.name)
         return flag_config_dict['failure_code']
     elif asset.color not in player.full_color_sets_possessed:
         # these are the usual conditions that we verify before allowing any improvement to proceed
-        logger.debug(player.player_name+' does not own all properties of this color, hence it cannot be improved. Returning failure code')
+        logger.debug('%s does not own all properties of this color, hence it cannot be improved. Returning failure code', player.player_name)
         return flag_config_dict['failure_code']
     elif player.current_cash <= asset.price_per_house:
-        logger.debug(player.player_name+ ' cannot afford this improvement. Returning failure code')
+        logger.debug('%s cannot afford this improvement. Returning failure code', player.player_name)
         return flag_config_dict['failure_code']
 
     if add_hotel: # this is the simpler case
-        logger.debug('Looking to improve '+asset.name+' by adding a hotel.')
-        if asset.num_hotels == current_gameboard['bank'].hotel_limit:
-            logger.debug('There is already ' + str(current_gameboard['bank'].hotel_limit) + ' hotel(s) here. You cannot exceed this limit. Returning failure code')
+        logger.debug('Looking to improve %s by adding a hotel.', asset.name)
+        if asset.num_hotels == current_gameboard.bank.hotel_limit:
+            logger.debug('There is already %s hotel(s) here. You cannot exceed this limit. Returning failure code', current_gameboard.bank.hotel_limit)
             return flag_config_dict['failure_code']
-        elif asset.num_hotels == 0 and asset.num_houses != current_gameboard['bank'].house_limit_before_hotel:
-            logger.debug('You need to have ' + str(current_gameboard['bank'].house_limit_before_hotel)
-                         + ' houses before you can build a hotel...Returning failure code')
+        elif asset.num_hotels == 0 and asset.num_houses != current_gameboard.bank.house_limit_before_hotel:
+            logger.debug('You need to have %s houses before you can build a hotel...Returning failure code', current_gameboard.bank.house_limit_before_hotel)
             return flag_config_dict['failure_code']
-        flag = True
-        for same_colored_asset in current_gameboard['color_assets'][asset.color]:
-            if same_colored_asset == asset:
-                continue
-            if asset.num_hotels == 0 and not (same_colored_asset.num_houses == current_gameboard['bank'].house_limit_before_hotel
-                    or same_colored_asset.num_hotels == 1): # as long as all other houses
-                # of that color have either max limit of houses before hotel can be built or a hotel, we can build a hotel on this asset. (Uniform improvement rule)
-                flag = False
-                break
-            elif same_colored_asset.num_hotels < asset.num_hotels:
-                flag = False
-                break
+        levels = asset.improvement_levels
+        if asset.num_hotels == 0:
+            # as long as all other houses of that color have either max limit of houses before hotel can be built or a
+            # hotel, we can build a hotel on this asset. (Uniform improvement rule)
+            flag = levels.count(0, current_gameboard.bank.house_limit_before_hotel) + levels.count(1, 0) == levels.num_assets
+        else:
+            flag = levels.lowest[0] >= asset.num_hotels
         if flag:
-            if current_gameboard['bank'].improvement_possible(player, asset, current_gameboard, add_house=False, add_hotel=True):
-                logger.debug('Improving asset and updating num_total_hotels and num_total_houses. Currently property has ' + str(asset.num_hotels))
+            if current_gameboard.bank.improvement_possible(player, asset, current_gameboard, add_house=False, add_hotel=True):
+                logger.debug('Improving asset and updating num_total_hotels and num_total_houses. Currently property has %s', asset.num_hotels)
                 player.num_total_hotels += 1
                 player.num_total_houses -= asset.num_houses
-                logger.debug(player.player_name+' now has num_total_hotels '+str(player.num_total_hotels)+' and num_total_houses '+str(player.num_total_houses))
+                logger.debug('%s now has num_total_hotels %s and num_total_houses %s', player.player_name, player.num_total_hotels, player.num_total_houses)
                 logger.debug('Charging player for improvements.')
                 player.charge_player(asset.price_per_house, current_gameboard, bank_flag=True)
-                current_gameboard['bank'].total_hotels -= 1
-                current_gameboard['bank'].total_houses += asset.num_houses
-                logger.debug('Bank now has ' + str(current_gameboard['bank'].total_houses) + ' houses and ' + str(current_gameboard['bank'].total_hotels) + ' hotels left.')
+                current_gameboard.bank.total_hotels -= 1
+                current_gameboard.bank.total_houses += asset.num_houses
+                logger.debug('Bank now has %s houses and %s hotels left.', current_gameboard.bank.total_houses, current_gameboard.bank.total_hotels)
                 # add to game history
-                current_gameboard['history']['function'].append(player.charge_player)
+                current_gameboard.history['function'].append(player.charge_player)
                 params = dict()
                 params['self'] = player
                 params['amount'] = asset.price_per_house
                 params['description'] = 'improvements'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(None)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(None)
 
                 logger.debug('Updating houses and hotels on the asset')
                 asset.num_houses = 0
                 asset.num_hotels += 1
+                asset.update_improvement_level()
+                player.update_asset_values(asset)
                 logger.debug('Player has successfully improved property. Returning successful action code')
                 return flag_config_dict['successful_action']
 
@@ -465,40 +452,36 @@ def improve_property(player, asset, current_gameboard, add_house=True, add_hotel
             return flag_config_dict['failure_code']
 
     elif add_house:
-        logger.debug('Looking to improve '+asset.name+' by adding a house. Currently property has ' + str(asset.num_houses))
-        if asset.num_hotels > 0 or asset.num_houses == current_gameboard['bank'].house_limit_before_hotel:
+        logger.debug('Looking to improve %s by adding a house. Currently property has %s', asset.name, asset.num_houses)
+        if asset.num_hotels > 0 or asset.num_houses == current_gameboard.bank.house_limit_before_hotel:
             logger.debug('There is already a hotel here or you have built the max number of houses that you can on a property. '
                          'You are not permitted another house. Returning failure code')
             return flag_config_dict['failure_code']
-        flag = True
-        current_asset_num_houses = asset.num_houses
-        for same_colored_asset in current_gameboard['color_assets'][asset.color]:
-            if same_colored_asset == asset:
-                continue
-            if same_colored_asset.num_houses < current_asset_num_houses or same_colored_asset.num_hotels > 0:
-                flag = False
-                break
+        # no other property may have fewer houses, or a hotel
+        levels = asset.improvement_levels
+        flag = levels.lowest >= (0, asset.num_houses) and levels.highest[0] == 0
         if flag:
-            if current_gameboard['bank'].improvement_possible(player, asset, current_gameboard, add_house=True, add_hotel=False):
+            if current_gameboard.bank.improvement_possible(player, asset, current_gameboard, add_house=True, add_hotel=False):
                 logger.debug('Improving asset and updating num_total_houses.')
                 player.num_total_houses += 1
-                logger.debug(player.player_name+ ' now has num_total_hotels '+ str(
-                    player.num_total_hotels)+ ' and num_total_houses '+ str(player.num_total_houses))
+                logger.debug('%s now has num_total_hotels %s and num_total_houses %s', player.player_name, player.num_total_hotels, player.num_total_houses)
                 logger.debug('Charging player for improvements.')
                 player.charge_player(asset.price_per_house, current_gameboard, bank_flag=True)
-                current_gameboard['bank'].total_houses -= 1
-                logger.debug('Bank now has ' + str(current_gameboard['bank'].total_houses) + ' houses and ' + str(current_gameboard['bank'].total_hotels) + ' hotels left.')
+                current_gameboard.bank.total_houses -= 1
+                logger.debug('Bank now has %s houses and %s hotels left.', current_gameboard.bank.total_houses, current_gameboard.bank.total_hotels)
                 # add to game history
-                current_gameboard['history']['function'].append(player.charge_player)
+                current_gameboard.history['function'].append(player.charge_player)
                 params = dict()
                 params['self'] = player
                 params['amount'] = asset.price_per_house
                 params['description'] = 'improvements'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(None)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(None)
 
                 logger.debug('Updating houses and hotels on the asset')
                 asset.num_houses += 1
+                asset.update_improvement_level()
+                player.update_asset_values(asset)
                 logger.debug('Player has successfully improved property. Returning successful action code')
                 return flag_config_dict['successful_action']
 
@@ -534,7 +517,7 @@ def use_get_out_of_jail_card(player, current_gameboard):
         player.has_get_out_of_jail_chance_card = False
         player.currently_in_jail = False
         logger.debug('Adding the card back again to the chance pack.')
-        current_gameboard['chance_cards'].add(
+        current_gameboard.chance_cards.add(
             copy.deepcopy(current_gameboard['chance_card_objects']['get_out_of_jail_free']))
         logger.debug('Returning successful action code')
         return flag_config_dict['successful_action']
@@ -543,7 +526,7 @@ def use_get_out_of_jail_card(player, current_gameboard):
         player.has_get_out_of_jail_community_chest_card = False
         player.currently_in_jail = False
         logger.debug('Adding the card back again to the community chest pack.')
-        current_gameboard['community_chest_cards'].add(
+        current_gameboard.community_chest_cards.add(
             copy.deepcopy(current_gameboard['community_chest_card_objects']['get_out_of_jail_free']))
         logger.debug('Returning successful action code')
         return flag_config_dict['successful_action']
@@ -558,16 +541,16 @@ def pay_jail_fine(player, current_gameboard):
     :param player: Player instance.
     :return: successful action code if the fine payment succeeds, otherwise failure code
     """
-    if player.current_cash >= current_gameboard['bank'].jail_fine and player.currently_in_jail:
-        player.charge_player(current_gameboard['bank'].jail_fine, current_gameboard, bank_flag=True)
+    if player.current_cash >= current_gameboard.bank.jail_fine and player.currently_in_jail:
+        player.charge_player(current_gameboard.bank.jail_fine, current_gameboard, bank_flag=True)
         # add to game history
-        current_gameboard['history']['function'].append(player.charge_player)
+        current_gameboard.history['function'].append(player.charge_player)
         params = dict()
         params['self'] = player
-        params['amount'] = current_gameboard['bank'].jail_fine
+        params['amount'] = current_gameboard.bank.jail_fine
         params['description'] = 'jail fine'
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         logger.debug('Player has been charged the fine. Setting currently_in_status to False and returning successful action code')
         player.currently_in_jail = False
@@ -609,73 +592,73 @@ def buy_property(player, asset, current_gameboard):
     :return: successful action code if player has succeeded in buying the property, failure code if either the player has failed OR if the property ended
     up going to auction (in the latter case, the player may still succeed in obtaining the asset!)
     """
-    if asset.owned_by != current_gameboard['bank']:
-        logger.debug(asset.name+' is not owned by Bank! Resetting option_to_buy for player and returning code failure code')
+    if asset.owned_by != current_gameboard.bank:
+        logger.debug('%s is not owned by Bank! Resetting option_to_buy for player and returning code failure code', asset.name)
         player.reset_option_to_buy()
         # add to game history
-        current_gameboard['history']['function'].append(player.reset_option_to_buy)
+        current_gameboard.history['function'].append(player.reset_option_to_buy)
         params = dict()
         params['self'] = player
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         return flag_config_dict['failure_code']
 
     if player.current_cash < asset.price:
         # property has to go up for auction.
-        index_current_player = current_gameboard['players'].index(player)  # in players, find the index of the current player
-        starting_player_index = (index_current_player + 1) % len(current_gameboard['players'])  # the next player's index. this player will start the auction
+        index_current_player = current_gameboard.players.index(player)  # in players, find the index of the current player
+        starting_player_index = (index_current_player + 1) % len(current_gameboard.players)  # the next player's index. this player will start the auction
         player.reset_option_to_buy()
         # add to game history
-        current_gameboard['history']['function'].append(player.reset_option_to_buy)
+        current_gameboard.history['function'].append(player.reset_option_to_buy)
         params = dict()
         params['self'] = player
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
-        logger.debug(asset.name+ ' is going up for auction since '+ player.player_name+ ' does not have enough cash to purchase this property. Conducting auction and returning failure code')
+        logger.debug('%s is going up for auction since %s does not have enough cash to purchase this property. Conducting auction and returning failure code', asset.name, player.player_name)
         Bank.auction(starting_player_index, current_gameboard, asset)
         # add to game history
-        current_gameboard['history']['function'].append(Bank.auction)
+        current_gameboard.history['function'].append(Bank.auction)
         params = dict()
-        params['self'] = current_gameboard['bank']
+        params['self'] = current_gameboard.bank
         params['starting_player_index'] = starting_player_index
         params['current_gameboard'] = current_gameboard
         params['asset'] = asset
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         return flag_config_dict['failure_code'] # this is a failure code even though you may still succeed in buying the property at auction
     else:
-        logger.debug('Charging '+player.player_name+ ' amount '+str(asset.price)+' for asset '+asset.name)
+        logger.debug('Charging %s amount %s for asset %s', player.player_name, asset.price, asset.name)
         player.charge_player(asset.price, current_gameboard, bank_flag=True)
         # add to game history
-        current_gameboard['history']['function'].append(player.charge_player)
+        current_gameboard.history['function'].append(player.charge_player)
         params = dict()
         params['self'] = player
         params['amount'] = asset.price
         params['description'] = 'buy property'
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         asset.update_asset_owner(player, current_gameboard)
         # add to game history
-        current_gameboard['history']['function'].append(asset.update_asset_owner)
+        current_gameboard.history['function'].append(asset.update_asset_owner)
         params = dict()
         params['self'] = asset
         params['player'] = player
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
-        logger.debug(asset.name+ ' ownership has been updated! Resetting option_to_buy for player and returning code successful action code')
+        logger.debug('%s ownership has been updated! Resetting option_to_buy for player and returning code successful action code', asset.name)
         player.reset_option_to_buy()
         # add to game history
-        current_gameboard['history']['function'].append(player.reset_option_to_buy)
+        current_gameboard.history['function'].append(player.reset_option_to_buy)
         params = dict()
         params['self'] = player
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         return flag_config_dict['successful_action']
 
@@ -701,7 +684,7 @@ def make_trade_offer(from_player, offer, to_player):
         return flag_config_dict['failure_code']
 
     if to_player.is_trade_offer_outstanding:
-        logger.debug(to_player.player_name+' already has a trade offer. You must wait. Returning failure code')
+        logger.debug('%s already has a trade offer. You must wait. Returning failure code', to_player.player_name)
         return flag_config_dict['failure_code']
 
     elif offer['cash_offered']<0 or offer['cash_wanted']<0:
@@ -709,43 +692,43 @@ def make_trade_offer(from_player, offer, to_player):
         return flag_config_dict['failure_code']
 
     else:
-        logger.debug('Instantiating data structures outstanding_trade_offer and setting is_trade_offer_outstanding to True to enable trade offer to '+to_player.player_name)
+        logger.debug('Instantiating data structures outstanding_trade_offer and setting is_trade_offer_outstanding to True to enable trade offer to %s', to_player.player_name)
         offer_prop_set = set()
         if len(offer['property_set_offered'])==0:
-            logger.debug(from_player.player_name + ' has no properties to offer to ' + to_player.player_name)
+            logger.debug('%s has no properties to offer to %s', from_player.player_name, to_player.player_name)
         else:
             for item in offer['property_set_offered']:
                 if item.owned_by != from_player:
-                    logger.debug(from_player.player_name+' player does not own ' + item.name +' . Hence cannot make an offer on this property. Returning failure code.')
+                    logger.debug('%s player does not own %s . Hence cannot make an offer on this property. Returning failure code.', from_player.player_name, item.name)
                     return flag_config_dict['failure_code']
                 elif item.loc_class == 'real_estate' and (item.num_houses > 0 or item.num_hotels > 0):
-                    logger.debug(item.name+' has improvements. Clear them before making an offer! Returning failure code.')
+                    logger.debug('%s has improvements. Clear them before making an offer! Returning failure code.', item.name)
                     return flag_config_dict['failure_code']
                 elif (item.loc_class == 'real_estate' or item.loc_class == 'railroad' or item.loc_class == 'utility') and item.is_mortgaged:
-                    logger.debug(item.name+' is mortgaged. Cannot make an offer on mortgaged properties! Returning failure code.')
+                    logger.debug('%s is mortgaged. Cannot make an offer on mortgaged properties! Returning failure code.', item.name)
                     return flag_config_dict['failure_code']
                 else:
                     offer_prop_set.add(item)
-            logger.debug(from_player.player_name + ' wants to offer properties to ' + to_player.player_name + ' for cash = ' + str(offer['cash_wanted']))
+            logger.debug('%s wants to offer properties to %s for cash = %s', from_player.player_name, to_player.player_name, offer['cash_wanted'])
         to_player.outstanding_trade_offer['property_set_offered'] = offer_prop_set
 
         want_prop_set = set()
         if len(offer['property_set_wanted'])==0:
-            logger.debug(from_player.player_name + ' wants no properties from ' + to_player.player_name)
+            logger.debug('%s wants no properties from %s', from_player.player_name, to_player.player_name)
         else:
             for item in offer['property_set_wanted']:
                 if item.owned_by != to_player:
-                    logger.debug(to_player.player_name+' player does not own ' + item.name +'. Invalid property requested. Returning failure code.')
+                    logger.debug('%s player does not own %s. Invalid property requested. Returning failure code.', to_player.player_name, item.name)
                     return flag_config_dict['failure_code']
                 elif item.loc_class == 'real_estate' and (item.num_houses > 0 or item.num_hotels > 0):
-                    logger.debug(item.name+' has improvements. Can request for unimproved properties only. Returning failure code.')
+                    logger.debug('%s has improvements. Can request for unimproved properties only. Returning failure code.', item.name)
                     return flag_config_dict['failure_code']
                 elif (item.loc_class == 'real_estate' or item.loc_class == 'railroad' or item.loc_class == 'utility') and item.is_mortgaged:
-                    logger.debug(item.name+' is mortgaged. Cannot request mortgaged properties from other players! Returning failure code.')
+                    logger.debug('%s is mortgaged. Cannot request mortgaged properties from other players! Returning failure code.', item.name)
                     return flag_config_dict['failure_code']
                 else:
                     want_prop_set.add(item)
-            logger.debug(from_player.player_name + ' wants properties from ' + to_player.player_name + ' by offering cash = ' + str(offer['cash_offered']))
+            logger.debug('%s wants properties from %s by offering cash = %s', from_player.player_name, to_player.player_name, offer['cash_offered'])
         to_player.outstanding_trade_offer['property_set_wanted'] = want_prop_set
 
         to_player.outstanding_trade_offer['cash_offered'] = offer['cash_offered']
@@ -779,7 +762,7 @@ def accept_trade_offer(player, current_gameboard):
         return flag_config_dict['failure_code']
 
     if not player.is_trade_offer_outstanding:
-        logger.debug(player.player_name+' does not have outstanding trade offers to accept. Returning failure code')
+        logger.debug('%s does not have outstanding trade offers to accept. Returning failure code', player.player_name)
         return flag_config_dict['failure_code']
 
     else:
@@ -792,47 +775,45 @@ def accept_trade_offer(player, current_gameboard):
         for item in player.outstanding_trade_offer['property_set_wanted']:
             if item.owned_by != player:
                 flag_properties_wanted = 0
-                logger.debug(player.player_name+ ' doesnot own ' + item.name + '. Cannot accept sell trade offer.')
+                logger.debug('%s doesnot own %s. Cannot accept sell trade offer.', player.player_name, item.name)
                 break
             elif item.loc_class == 'real_estate' and (item.num_houses > 0 or item.num_hotels > 0):
-                logger.debug(item.name+' has improvements. Cannot accept sell trade offer. Returning failure code.')
+                logger.debug('%s has improvements. Cannot accept sell trade offer. Returning failure code.', item.name)
                 flag_properties_wanted = 0
                 break
             elif (item.loc_class == 'real_estate' or item.loc_class == 'railroad' or item.loc_class == 'utility') and item.is_mortgaged:
-                logger.debug(item.name+' is mortgaged. Cannot accept sell trade offer! Returning failure code.')
+                logger.debug('%s is mortgaged. Cannot accept sell trade offer! Returning failure code.', item.name)
                 flag_properties_wanted = 0
                 break
             elif item.color in player.full_color_sets_possessed:
                 # if color is monopolized by player, check if there are improvements on the other properties of the color group
-                for same_colored_asset in current_gameboard['color_assets'][item.color]:
+                for same_colored_asset in current_gameboard.color_assets[item.color]:
                     if same_colored_asset == item:
                         continue
                     elif same_colored_asset.num_houses > 0 or same_colored_asset.num_hotels > 0:
-                        logger.debug(same_colored_asset.name + ' belongs to same color group as the property involved in trade and is improved. '
-                                                               'Declining accept sell trade offer! Returning failure code.')
+                        logger.debug('%s belongs to same color group as the property involved in trade and is improved. Declining accept sell trade offer! Returning failure code.', same_colored_asset.name)
                         flag_properties_wanted = 0
                         break
         for item in player.outstanding_trade_offer['property_set_offered']:
             if item.owned_by != player.outstanding_trade_offer['from_player']:
                 flag_properties_offered = 0
-                logger.debug(player.outstanding_trade_offer['from_player'].player_name+ ' doesnot own ' + item.name + '. Cannot accept sell trade offer.')
+                logger.debug('%s doesnot own %s. Cannot accept sell trade offer.', player.outstanding_trade_offer['from_player'].player_name, item.name)
                 break
             elif item.loc_class == 'real_estate' and (item.num_houses > 0 or item.num_hotels > 0):
-                logger.debug(item.name+' has improvements. Cannot accept sell trade offer. Returning failure code.')
+                logger.debug('%s has improvements. Cannot accept sell trade offer. Returning failure code.', item.name)
                 flag_properties_offered = 0
                 break
             elif (item.loc_class == 'real_estate' or item.loc_class == 'railroad' or item.loc_class == 'utility') and item.is_mortgaged:
-                logger.debug(item.name+' is mortgaged. Cannot accept sell trade offer! Returning failure code.')
+                logger.debug('%s is mortgaged. Cannot accept sell trade offer! Returning failure code.', item.name)
                 flag_properties_offered = 0
                 break
             elif item.color in player.outstanding_trade_offer['from_player'].full_color_sets_possessed:
                 # if color is monopolized by from_player, check if there are improvements on the other properties of the color group
-                for same_colored_asset in current_gameboard['color_assets'][item.color]:
+                for same_colored_asset in current_gameboard.color_assets[item.color]:
                     if same_colored_asset == item:
                         continue
                     elif same_colored_asset.num_houses > 0 or same_colored_asset.num_hotels > 0:
-                        logger.debug(same_colored_asset.name + ' belongs to same color group as the property involved in trade and is improved. '
-                                                               'Declining accept sell trade offer! Returning failure code.')
+                        logger.debug('%s belongs to same color group as the property involved in trade and is improved. Declining accept sell trade offer! Returning failure code.', same_colored_asset.name)
                         flag_properties_offered = 0
                         break
         if flag_cash_offered and flag_cash_wanted and flag_properties_offered and flag_properties_wanted:
@@ -842,47 +823,47 @@ def accept_trade_offer(player, current_gameboard):
                 func = func_asset.transfer_property_between_players
                 func(player.outstanding_trade_offer['from_player'], player, current_gameboard)
                 # add to game history
-                current_gameboard['history']['function'].append(func)
+                current_gameboard.history['function'].append(func)
                 params = dict()
                 params['self'] = func_asset
                 params['from_player'] = player.outstanding_trade_offer['from_player']
                 params['to_player'] = player
                 params['current_gameboard'] = current_gameboard
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(None)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(None)
 
             for item in player.outstanding_trade_offer['property_set_wanted']:
                 func_asset = item
                 func = func_asset.transfer_property_between_players
                 func(player, player.outstanding_trade_offer['from_player'], current_gameboard)
                 # add to game history
-                current_gameboard['history']['function'].append(func)
+                current_gameboard.history['function'].append(func)
                 params = dict()
                 params['self'] = func_asset
                 params['from_player'] = player
                 params['to_player'] = player.outstanding_trade_offer['from_player']
                 params['current_gameboard'] = current_gameboard
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(None)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(None)
 
             player.charge_player(player.outstanding_trade_offer['cash_wanted'], current_gameboard, bank_flag=False)
-            current_gameboard['history']['function'].append(player.charge_player)
+            current_gameboard.history['function'].append(player.charge_player)
             params = dict()
             params['self'] = player
             params['amount'] = player.outstanding_trade_offer['cash_wanted']
             params['description'] = 'trade'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
             code = player.outstanding_trade_offer['from_player'].receive_cash(player.outstanding_trade_offer['cash_wanted'], current_gameboard, bank_flag=False)
             if code == flag_config_dict['successful_action']:
-                current_gameboard['history']['function'].append(player.outstanding_trade_offer['from_player'].receive_cash)
+                current_gameboard.history['function'].append(player.outstanding_trade_offer['from_player'].receive_cash)
                 params = dict()
                 params['self'] = player.outstanding_trade_offer['from_player']
                 params['amount'] = player.outstanding_trade_offer['cash_wanted']
                 params['description'] = 'trade'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(code)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
             else:
                 logger.debug("Not sure what happened! Something broke!")
                 logger.error("Exception")
@@ -890,26 +871,26 @@ def accept_trade_offer(player, current_gameboard):
 
             code = player.receive_cash(player.outstanding_trade_offer['cash_offered'], current_gameboard, bank_flag=False)
             if code == flag_config_dict['successful_action']:
-                current_gameboard['history']['function'].append(player.receive_cash)
+                current_gameboard.history['function'].append(player.receive_cash)
                 params = dict()
                 params['self'] = player
                 params['amount'] = player.outstanding_trade_offer['cash_offered']
                 params['description'] = 'trade'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(code)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
             else:
                 logger.debug("Not sure what happened! Something broke!")
                 logger.error("Exception")
                 raise Exception
 
             player.outstanding_trade_offer['from_player'].charge_player(player.outstanding_trade_offer['cash_offered'], current_gameboard, bank_flag=False)
-            current_gameboard['history']['function'].append(player.outstanding_trade_offer['from_player'].charge_player)
+            current_gameboard.history['function'].append(player.outstanding_trade_offer['from_player'].charge_player)
             params = dict()
             params['self'] = player.outstanding_trade_offer['from_player']
             params['amount'] = player.outstanding_trade_offer['cash_offered']
             params['description'] = 'trade'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
             logger.debug('Transaction successful. Nulling outstanding trade offers data structures and returning successful action code')
             player.is_trade_offer_outstanding = False
@@ -24,6 +24,8 @@ def will_property_complete_set(player, asset, current_gameboard):
         else:
             logger.error('This asset does not have a color and is neither utility nor railroad')
             logger.error("Exception")
+    elif player.color_ownership is not None:
+        return player.color_ownership.completes_color_set(player, asset)
     else:
         c = asset.color
         c_assets = current_gameboard['color_assets'][c]
@@ -114,6 +116,8 @@ def is_property_lone(player, asset):
         else:
             logger.error('This asset does not have a color and is neither utility nor railroad')
             logger.error("Exception")
+    elif player.color_ownership is not None:
+        return player.color_ownership.is_lone(player, asset)
     else:
         c = asset.color
         for c_asset in player.assets:
@@ -221,6 +225,12 @@ def can_asset_be_improved(asset, same_color_assets):
         return False # we can't improve any further
     if asset.num_houses == 0:
         return True
+    levels = asset.improvement_levels
+    if levels is not None:
+        # some other asset of the color has more houses or (if we can build a hotel) a hotel, or all have as many houses
+        # as asset
+        return levels.most_houses > asset.num_houses or (asset.num_houses == 4 and levels.highest[0] > 0) or \
+            levels.count(0, asset.num_houses) == levels.num_assets
     count = 0
     for c_asset in same_color_assets:
         if c_asset.color != asset.color:
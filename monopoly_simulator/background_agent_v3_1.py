@@ -72,18 +72,17 @@ def make_pre_roll_move(player, current_gameboard, allowable_moves, code):
 
     if code == flag_config_dict['failure_code']:
         player.agent._agent_memory['count_unsuccessful_tries'] += 1
-        logger.debug(player.player_name + ' has executed an unsuccessful preroll action, incrementing unsuccessful_tries ' +
-                                          'counter to ' + str(player.agent._agent_memory['count_unsuccessful_tries']))
+        logger.debug('%s has executed an unsuccessful preroll action, incrementing unsuccessful_tries counter to %s', player.player_name, player.agent._agent_memory['count_unsuccessful_tries'])
 
     if player.agent._agent_memory['count_unsuccessful_tries'] >= UNSUCCESSFUL_LIMIT:
-        logger.debug(player.player_name + ' has reached preroll unsuccessful action limits.')
+        logger.debug('%s has reached preroll unsuccessful action limits.', player.player_name)
         if "skip_turn" in allowable_moves:
-            logger.debug(player.player_name+ ': I am skipping turn since I have crossed unsuccessful limits.')
+            logger.debug('%s: I am skipping turn since I have crossed unsuccessful limits.', player.player_name)
             player.agent._agent_memory['previous_action'] = "skip_turn"
             return ("skip_turn", dict())
         elif "concluded_actions" in allowable_moves:
             # player.agent._agent_memory['previous_action'] = action_choices.concluded_actions
-            logger.debug(player.player_name+ ': I am concluding actions since I have crossed unsuccessful limits.')
+            logger.debug('%s: I am concluding actions since I have crossed unsuccessful limits.', player.player_name)
             return ("concluded_actions", dict())
         else:
             logger.error("Exception")
@@ -94,11 +93,11 @@ def make_pre_roll_move(player, current_gameboard, allowable_moves, code):
         param['player'] = player.player_name
         param['current_gameboard'] = "current_gameboard"
         if "use_get_out_of_jail_card" in allowable_moves:
-            logger.debug(player.player_name+': I am using get out of jail card.')
+            logger.debug('%s: I am using get out of jail card.', player.player_name)
             player.agent._agent_memory['previous_action'] = "use_get_out_of_jail_card"
             return ("use_get_out_of_jail_card", param)
         elif "pay_jail_fine" in allowable_moves:
-            logger.debug(player.player_name+': I am going to pay jail fine.')
+            logger.debug('%s: I am going to pay jail fine.', player.player_name)
             player.agent._agent_memory['previous_action'] = "pay_jail_fine"
             return ("pay_jail_fine", param)
 
@@ -121,12 +120,12 @@ def make_pre_roll_move(player, current_gameboard, allowable_moves, code):
         #     logger.debug(diagnostics.logger.debug_player_cash_balances(alternate_univ))
         # else:
         #     logger.debug(hypothetical_winner.player_name)
-        logger.debug(player.player_name+ ': I am skipping turn')
+        logger.debug('%s: I am skipping turn', player.player_name)
         player.agent._agent_memory['previous_action'] = "skip_turn"
         return ("skip_turn", dict())
     elif "concluded_actions" in allowable_moves:
         # player.agent._agent_memory['previous_action'] = action_choices.concluded_actions
-        logger.debug(player.player_name+ ': I am concluding actions')
+        logger.debug('%s: I am concluding actions', player.player_name)
         return ("concluded_actions", dict())
     else:
         logger.error("Exception")
@@ -203,22 +202,20 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
                 break
         if code_flag:
             player.agent._agent_memory['count_unsuccessful_tries'] += 1
-            logger.debug(player.player_name + ' has executed an unsuccessful out of turn action, incrementing unsuccessful_tries ' +
-                                          'counter to ' + str(player.agent._agent_memory['count_unsuccessful_tries']))
+            logger.debug('%s has executed an unsuccessful out of turn action, incrementing unsuccessful_tries counter to %s', player.player_name, player.agent._agent_memory['count_unsuccessful_tries'])
     elif code == flag_config_dict['failure_code']:
         player.agent._agent_memory['count_unsuccessful_tries'] += 1
-        logger.debug(player.player_name + ' has executed an unsuccessful out of turn action, incrementing unsuccessful_tries ' +
-                                          'counter to ' + str(player.agent._agent_memory['count_unsuccessful_tries']))
+        logger.debug('%s has executed an unsuccessful out of turn action, incrementing unsuccessful_tries counter to %s', player.player_name, player.agent._agent_memory['count_unsuccessful_tries'])
 
     if player.agent._agent_memory['count_unsuccessful_tries'] >= UNSUCCESSFUL_LIMIT:
-        logger.debug(player.player_name + ' has reached out of turn unsuccessful action limits.')
+        logger.debug('%s has reached out of turn unsuccessful action limits.', player.player_name)
         if "skip_turn" in allowable_moves:
-            logger.debug(player.player_name+ ': I am skipping turn since I have crossed unsuccessful limits.')
+            logger.debug('%s: I am skipping turn since I have crossed unsuccessful limits.', player.player_name)
             player.agent._agent_memory['previous_action'] = "skip_turn"
             return ("skip_turn", dict())
         elif "concluded_actions" in allowable_moves:
             # player.agent._agent_memory['previous_action'] = action_choices.concluded_actions
-            logger.debug(player.player_name+ ': I am concluding actions since I have crossed unsuccessful limits.')
+            logger.debug('%s: I am concluding actions since I have crossed unsuccessful limits.', player.player_name)
             return ("concluded_actions", dict())
         else:
             logger.error("Exception")
@@ -228,18 +225,18 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
         param = dict()
         param['player'] = player.player_name
         param['current_gameboard'] = "current_gameboard"
-        logger.debug(player.player_name+ ': Should I accept the trade offer by '+player.outstanding_trade_offer['from_player'].player_name+'?')
-        logger.debug('('+player.player_name+' currently has cash balance of '+str(player.current_cash)+')')
+        logger.debug('%s: Should I accept the trade offer by %s?', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
+        logger.debug('(%s currently has cash balance of %s)', player.player_name, player.current_cash)
 
         if (player.outstanding_trade_offer['cash_offered'] <= 0 and len(player.outstanding_trade_offer['property_set_offered'])==0) and \
                 (player.outstanding_trade_offer['cash_wanted'] > 0 or len(player.outstanding_trade_offer['property_set_wanted']) > 0):
             logger.debug('Asking for free money or property without money or property in return.')
-            logger.debug(player.player_name + " rejected trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
+            logger.debug('%s rejected trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
             pass   #asking for free money or property without anything in return(ie no money and no property offered), -->reject the trade offer
 
         elif player.outstanding_trade_offer['cash_wanted'] - player.outstanding_trade_offer['cash_offered'] > player.current_cash:
             logger.debug('Cash wanted from me in the trade offer is more than the cash in hand with me or I am near bankruptcy situation and need to play safe.')
-            logger.debug(player.player_name + " rejected trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
+            logger.debug('%s rejected trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
             pass  #cash wanted is more than that offered and the net difference exceeds the cash that the player has --> then reject the tade offer
 
         else:
@@ -250,7 +247,7 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
                 if prop.is_mortgaged:
                     reject_flag = 1  #cannot trade mortgaged properties, reject trade offer
                     logger.debug('Trade offer invovlves mortgaged properties.')
-                    logger.debug(player.player_name + " rejected trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
+                    logger.debug('%s rejected trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
                     break
                 else:
                     wanted_properties_net_worth += prop.price
@@ -260,7 +257,7 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
                     if prop.is_mortgaged:
                         reject_flag = 1  #from_player cannot offer mortgaged properties, reject trade offer
                         logger.debug('Trade offer invovlves mortgaged properties.')
-                        logger.debug(player.player_name + " rejected trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
+                        logger.debug('%s rejected trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
                         break
                     else:
                         offered_properties_net_worth += prop.price
@@ -286,7 +283,7 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
                 #if you end up losing more monopolies than gaining monopolies (although this condition should never come up) then reject trade offer
                 if count_lose_existing_monopoly - count_create_new_monopoly > 0:
                     logger.debug('Player loses more monopolies than he gains.')
-                    logger.debug(player.player_name + " rejected trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
+                    logger.debug('%s rejected trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
                     reject_flag = 1
 
                 #if you end up losing the same number of monopolies as you gain, then accept the offer based on the following multiple conditions.
@@ -295,16 +292,16 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
                 elif count_lose_existing_monopoly - count_create_new_monopoly == 0:
                     if (player.outstanding_trade_offer['cash_wanted'] - player.outstanding_trade_offer['cash_offered']) >= player.current_cash:
                         logger.debug('Cash wanted from me in the trade offer is more than the cash in hand with me or I am near bankruptcy situation and need to play safe.')
-                        logger.debug(player.player_name + " rejected trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
+                        logger.debug('%s rejected trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
                         reject_flag = 1  ##just double checking although this condition was verified before getting here.
                     elif player.current_cash - (player.outstanding_trade_offer['cash_wanted'] - player.outstanding_trade_offer['cash_offered']) < current_gameboard['go_increment']/2:
                         logger.debug('Cash wanted from me in the trade offer is more than the cash in hand with me or I am near bankruptcy situation and need to play safe.')
-                        logger.debug(player.player_name + " rejected trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
+                        logger.debug('%s rejected trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
                         reject_flag = 1  ##too risky if players cash after transaction drops below half of go_increment value --> hence reject trade offer
                     elif (player.current_cash - (player.outstanding_trade_offer['cash_wanted'] - player.outstanding_trade_offer['cash_offered']) < current_gameboard['go_increment']) \
                             and net_offer_worth <= 0:
                         logger.debug('No gain from accepting trade offer.')
-                        logger.debug(player.player_name + " rejected trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
+                        logger.debug('%s rejected trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
                         reject_flag =1  ##if player has cash > go_increement/2 and < go_increement but net worth of total transaction is negative --> reject trade offer
                     else:
                         reject_flag =0  ##accept only if you end up getting a higher net worth by accepting the trade although you get no new monopolies
@@ -314,15 +311,14 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
                 elif count_create_new_monopoly - count_lose_existing_monopoly > 0:
                     if (player.outstanding_trade_offer['cash_wanted'] - player.outstanding_trade_offer['cash_offered']) >= player.current_cash:
                         logger.debug('Cash wanted from me in the trade offer is more than the cash in hand with me or I am near bankruptcy situation and need to play safe.')
-                        logger.debug(player.player_name + " rejected trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
+                        logger.debug('%s rejected trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
                         reject_flag = 1  ##just double checking although this condition was verified before getting here.
                     else:
                         reject_flag = 0
 
             if reject_flag == 0:
-                logger.debug(player.player_name + " accepted trade offer from " + player.outstanding_trade_offer['from_player'].player_name)
-                logger.debug(player.player_name + " recieved amount = " + str(player.outstanding_trade_offer['cash_offered']) + " and offered amount = " +
-                             str(player.outstanding_trade_offer['cash_wanted']) + " during trade")
+                logger.debug('%s accepted trade offer from %s', player.player_name, player.outstanding_trade_offer['from_player'].player_name)
+                logger.debug('%s recieved amount = %s and offered amount = %s during trade', player.player_name, player.outstanding_trade_offer['cash_offered'], player.outstanding_trade_offer['cash_wanted'])
                 player.agent._agent_memory['previous_action'] = "accept_trade_offer"
                 return ("accept_trade_offer", param)
             elif reject_flag == 1:
@@ -338,24 +334,20 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
         param['player'] = player.player_name
         param['current_gameboard'] = "current_gameboard"
         # we accept an offer under one of two conditions:
-        logger.debug(player.player_name+ ': Should I accept the offer by '+player.outstanding_property_offer['from_player'].player_name+' to buy '+\
-            player.outstanding_property_offer['asset'].name+' for '+str(player.outstanding_property_offer['price'])+'?')
-        logger.debug('('+player.player_name+' currently has cash balance of '+str(player.current_cash)+')')
+        logger.debug('%s: Should I accept the offer by %s to buy %s for %s?', player.player_name, player.outstanding_property_offer['from_player'].player_name, player.outstanding_property_offer['asset'].name, player.outstanding_property_offer['price'])
+        logger.debug('(%s currently has cash balance of %s)', player.player_name, player.current_cash)
         if player.outstanding_property_offer['asset'].is_mortgaged or player.outstanding_property_offer['price']>player.current_cash:
             pass # ignore the offer if the property is mortgaged or will result in insolvency. This pass doesn't require 'filling' in.
         elif player.current_cash-player.outstanding_property_offer['price'] >= current_gameboard['go_increment'] and \
             player.outstanding_property_offer['price']<=player.outstanding_property_offer['asset'].price:
             # 1. we can afford it, and it's at or below market rate so let's buy it
-            logger.debug(player.player_name+ ': I am accepting the offer to buy '+player.outstanding_property_offer['asset'].name+' since I can afford' \
-                                                    'it and it is being offered at or below market rate.')
+            logger.debug('%s: I am accepting the offer to buy %s since I can affordit and it is being offered at or below market rate.', player.player_name, player.outstanding_property_offer['asset'].name)
             player.agent._agent_memory['previous_action'] = "accept_sell_property_offer"
             return ("accept_sell_property_offer", param)
         elif agent_helper_functions.will_property_complete_set(player, player.outstanding_property_offer['asset'],current_gameboard):
             # 2. less affordable, but we stand to gain by monopoly
             if player.current_cash - player.outstanding_property_offer['price'] >= current_gameboard['go_increment']/2: # risky, but worth it
-                logger.debug(player.player_name+ ': I am accepting the offer to buy '+ player.outstanding_property_offer[
-                    'asset'].name+ ' since I can afford ' \
-                                   'it (albeit barely so) and it will let me complete my color set.')
+                logger.debug('%s: I am accepting the offer to buy %s since I can afford it (albeit barely so) and it will let me complete my color set.', player.player_name, player.outstanding_property_offer['asset'].name)
                 player.agent._agent_memory['previous_action'] = "accept_sell_property_offer"
                 return ("accept_sell_property_offer", param)
 
@@ -364,9 +356,9 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
             param = agent_helper_functions.identify_improvement_opportunity(player, current_gameboard)
             if param:
                 if player.agent._agent_memory['previous_action'] == "improve_property" and code == flag_config_dict['failure_code']:
-                    logger.debug(player.player_name+ ': I want to improve property '+param['asset'].name+ ' but I cannot, due to reasons I do not understand. Aborting improvement attempt...')
+                    logger.debug('%s: I want to improve property %s but I cannot, due to reasons I do not understand. Aborting improvement attempt...', player.player_name, param['asset'].name)
                 else:
-                    logger.debug(player.player_name+ ': I am going to improve property '+param['asset'].name)
+                    logger.debug('%s: I am going to improve property %s', player.player_name, param['asset'].name)
                     player.agent._agent_memory['previous_action'] = "improve_property"
                     param['player'] = param['player'].player_name
                     param['asset'] = param['asset'].name
@@ -383,7 +375,7 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
                 param['player'] = player.player_name
                 param['asset'] = m.name
                 param['current_gameboard'] = "current_gameboard"
-                logger.debug(player.player_name+ ': I am going to free mortgage on '+ m.name)
+                logger.debug('%s: I am going to free mortgage on %s', player.player_name, m.name)
                 player.agent._agent_memory['previous_action'] = "free_mortgage"
                 return ("free_mortgage", param)
 
@@ -404,10 +396,9 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
             if param_list and player.agent._agent_memory['previous_action'] != "make_trade_offer": # we only make one offer per turn. Otherwise we'd
                 # be stuck in a loop
                 if len(param_list)>1:
-                    logger.debug(player.player_name + ": I am going to make trade offers to multiple players, ie " + str(len(param_list)) + " players.")
+                    logger.debug('%s: I am going to make trade offers to multiple players, ie %s players.', player.player_name, len(param_list))
                 for param in param_list:
-                    logger.debug(player.player_name+ ': I am making an offer to trade '+list(param['offer']['property_set_offered'])[0].name+' to '+
-                                 param['to_player'].player_name+' for '+str(param['offer']['cash_wanted'])+' dollars')
+                    logger.debug('%s: I am making an offer to trade %s to %s for %s dollars', player.player_name, list(param['offer']['property_set_offered'])[0].name, param['to_player'].player_name, param['offer']['cash_wanted'])
 
                     param['from_player'] = param['from_player'].player_name
                     param['to_player'] = param['to_player'].player_name
@@ -437,9 +428,9 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
             if param_list and player.agent._agent_memory['previous_action'] != "make_trade_offer":  # we only make one offer per turn. Otherwise we'd
                 # be stuck in a loop
                 if len(param_list)>1:
-                    logger.debug(player.player_name + ": I am going to make trade offers to multiple players, ie " + str(len(param_list)) + " players.")
+                    logger.debug('%s: I am going to make trade offers to multiple players, ie %s players.', player.player_name, len(param_list))
                 for param in param_list:
-                    logger.debug(player.player_name+ ': I am making a trade offer with '+ param['to_player'].player_name)
+                    logger.debug('%s: I am making a trade offer with %s', player.player_name, param['to_player'].player_name)
 
                     param['from_player'] = param['from_player'].player_name
                     param['to_player'] = param['to_player'].player_name
@@ -460,11 +451,11 @@ def make_out_of_turn_move(player, current_gameboard, allowable_moves, code):
 
     # if we ran the gamut, and did not return, then it's time to skip turn or conclude actions
     if "skip_turn" in allowable_moves:
-        logger.debug(player.player_name+ ': I am skipping turn')
+        logger.debug('%s: I am skipping turn', player.player_name)
         player.agent._agent_memory['previous_action'] = "skip_turn"
         return ("skip_turn", dict())
     elif "concluded_actions" in allowable_moves:
-        logger.debug(player.player_name+ ': I am concluding actions')
+        logger.debug('%s: I am concluding actions', player.player_name)
         # player.agent._agent_memory['previous_action'] = action_choices.concluded_actions
         return ("concluded_actions", dict())
     else:
@@ -526,14 +517,13 @@ def make_post_roll_move(player, current_gameboard, allowable_moves, code):
 
     if code == flag_config_dict['failure_code']:
         player.agent._agent_memory['count_unsuccessful_tries'] += 1
-        logger.debug(player.player_name + ' has executed an unsuccessful postroll action, incrementing unsuccessful_tries ' +
-                                          'counter to ' + str(player.agent._agent_memory['count_unsuccessful_tries']))
+        logger.debug('%s has executed an unsuccessful postroll action, incrementing unsuccessful_tries counter to %s', player.player_name, player.agent._agent_memory['count_unsuccessful_tries'])
 
     if player.agent._agent_memory['count_unsuccessful_tries'] >= UNSUCCESSFUL_LIMIT:
-        logger.debug(player.player_name + ' has reached postroll unsuccessful action limits.')
+        logger.debug('%s has reached postroll unsuccessful action limits.', player.player_name)
         if "concluded_actions" in allowable_moves:
             # player.agent._agent_memory['previous_action'] = action_choices.concluded_actions
-            logger.debug(player.player_name+ ': I am concluding actions since I have crossed unsuccessful limits.')
+            logger.debug('%s: I am concluding actions since I have crossed unsuccessful limits.', player.player_name)
             return ("concluded_actions", dict())
         else:
             logger.error("Exception")
@@ -542,7 +532,7 @@ def make_post_roll_move(player, current_gameboard, allowable_moves, code):
     current_location = current_gameboard['location_sequence'][player.current_position]
     if "buy_property" in allowable_moves:
         if code == flag_config_dict['failure_code']:
-            logger.debug(player.player_name+': I did not succeed the last time in buying this property. Concluding actions...')
+            logger.debug('%s: I did not succeed the last time in buying this property. Concluding actions...', player.player_name)
             return ("concluded_actions", dict())
 
         params = dict()
@@ -551,7 +541,7 @@ def make_post_roll_move(player, current_gameboard, allowable_moves, code):
         params['current_gameboard'] = "current_gameboard"
 
         if make_buy_property_decision(player, current_gameboard, current_location):
-            logger.debug(player.player_name+ ': I am attempting to buy property '+current_location.name)
+            logger.debug('%s: I am attempting to buy property %s', player.player_name, current_location.name)
             player.agent._agent_memory['previous_action'] = "buy_property"
             return ("buy_property", params)
         else:
@@ -561,7 +551,7 @@ def make_post_roll_move(player, current_gameboard, allowable_moves, code):
                 to_mortgage = agent_helper_functions.identify_potential_mortgage(player,current_location.price,True)
                 if to_mortgage:
                     params['asset'] = to_mortgage.name
-                    logger.debug(player.player_name+ ': I am attempting to mortgage property '+ params['asset'])
+                    logger.debug('%s: I am attempting to mortgage property %s', player.player_name, params['asset'])
                     player.agent._agent_memory['previous_action'] = "mortgage_property"
                     return ("mortgage_property", params)
 
@@ -569,7 +559,7 @@ def make_post_roll_move(player, current_gameboard, allowable_moves, code):
                     to_sell = agent_helper_functions.identify_potential_sale(player, current_gameboard, current_location.price,True)
                     if to_sell:
                         params['asset'] = to_sell.name
-                        logger.debug(player.player_name+ ': I am attempting to sell property '+ current_location.name+' to the bank')
+                        logger.debug('%s: I am attempting to sell property %s to the bank', player.player_name, current_location.name)
                         player.agent._agent_memory['previous_action'] = "sell_property"
                         return ("sell_property", params)
 
@@ -600,11 +590,11 @@ def make_buy_property_decision(player, current_gameboard, asset):
     """
     decision = False
     if player.current_cash - asset.price >= current_gameboard['go_increment']:  # case 1: can we afford it?
-        logger.debug(player.player_name+ ': I will attempt to buy '+ asset.name+ ' from the bank.')
+        logger.debug('%s: I will attempt to buy %s from the bank.', player.player_name, asset.name)
         decision = True
     elif asset.price <= player.current_cash and \
             agent_helper_functions.will_property_complete_set(player,asset,current_gameboard):
-        logger.debug(player.player_name+ ': I will attempt to buy '+ asset.name+ ' from the bank.')
+        logger.debug('%s: I will attempt to buy %s from the bank.', player.player_name, asset.name)
         decision = True
 
     return decision
@@ -664,17 +654,16 @@ def handle_negative_cash_balance(player, current_gameboard):
         return (None, flag_config_dict['successful_action'])
 
     mortgage_potentials = list()
-    max_sum = 0
-    sorted_player_assets_list = _set_to_sorted_list_assets(player.assets)
-    for a in sorted_player_assets_list:
-        if a.is_mortgaged:
-            continue
-        elif a.loc_class=='real_estate' and (a.num_houses>0 or a.num_hotels>0):
-            continue
-        else:
-            mortgage_potentials.append((a,a.mortgage))
-            max_sum += a.mortgage
-    if mortgage_potentials and max_sum+player.current_cash >= 0: # if the second condition is not met, no point in mortgaging
+    if player.compute_cash_obtainable_by_mortgaging()+player.current_cash >= 0: # if this is not met, no point in mortgaging
+        sorted_player_assets_list = _set_to_sorted_list_assets(player.assets)
+        for a in sorted_player_assets_list:
+            if a.is_mortgaged:
+                continue
+            elif a.loc_class=='real_estate' and (a.num_houses>0 or a.num_hotels>0):
+                continue
+            else:
+                mortgage_potentials.append((a,a.mortgage))
+    if mortgage_potentials:
         sorted_potentials = sorted(mortgage_potentials, key=lambda x: x[1])  # sort by mortgage in ascending order
         for p in sorted_potentials:
             if player.current_cash >= 0:
@@ -684,7 +673,7 @@ def handle_negative_cash_balance(player, current_gameboard):
             params['player'] = player.player_name
             params['asset'] = p[0].name
             params['current_gameboard'] = "current_gameboard"
-            logger.debug(player.player_name+ ': I am attempting to mortgage property '+ params['asset'])
+            logger.debug('%s: I am attempting to mortgage property %s', player.player_name, params['asset'])
             player.agent._agent_memory['previous_action'] = "mortgage_property"
             return ("mortgage_property", params)
 
@@ -715,7 +704,7 @@ def handle_negative_cash_balance(player, current_gameboard):
             params['player'] = player.player_name
             params['asset'] = p[0].name
             params['current_gameboard'] = "current_gameboard"
-            logger.debug(player.player_name + ': I am attempting to sell property '+ p[0].name + ' to the bank')
+            logger.debug('%s: I am attempting to sell property %s to the bank', player.player_name, p[0].name)
             player.agent._agent_memory['previous_action'] = "sell_property"
             return ("sell_property", params)
 
@@ -753,7 +742,7 @@ def handle_negative_cash_balance(player, current_gameboard):
                         params['current_gameboard'] = "current_gameboard"
                         params['sell_house'] = False
                         params['sell_hotel'] = True
-                        logger.debug(player.player_name+ ': I am attempting to sell hotel on '+ prop.name + ' to the bank')
+                        logger.debug('%s: I am attempting to sell hotel on %s to the bank', player.player_name, prop.name)
                         player.agent._agent_memory['previous_action'] = "sell_house_hotel"
                         return ("sell_house_hotel", params)
 
@@ -766,7 +755,7 @@ def handle_negative_cash_balance(player, current_gameboard):
                         params['current_gameboard'] = "current_gameboard"
                         params['sell_house'] = True
                         params['sell_hotel'] = False
-                        logger.debug(player.player_name+ ': I am attempting to sell house on '+ prop.name + ' to the bank')
+                        logger.debug('%s: I am attempting to sell house on %s to the bank', player.player_name, prop.name)
                         player.agent._agent_memory['previous_action'] = "sell_house_hotel"
                         return ("sell_house_hotel", params)
                     else:
@@ -776,7 +765,7 @@ def handle_negative_cash_balance(player, current_gameboard):
             params['player'] = player.player_name
             params['asset'] = p[0].name
             params['current_gameboard'] = "current_gameboard"
-            logger.debug(player.player_name + ': I am attempting to sell property '+ p[0].name + ' to the bank')
+            logger.debug('%s: I am attempting to sell property %s to the bank', player.player_name, p[0].name)
             player.agent._agent_memory['previous_action'] = "sell_property"
             return ("sell_property", params)
 
@@ -786,17 +775,16 @@ def handle_negative_cash_balance(player, current_gameboard):
     #Hence we have to go through the process of looping through these properties once again to decide on the potential properties that can be mortgaged or sold.
 
     mortgage_potentials = list()
-    max_sum = 0
-    sorted_player_assets_list = _set_to_sorted_list_assets(player.assets)
-    for a in sorted_player_assets_list:
-        if a.is_mortgaged:
-            continue
-        elif a.loc_class=='real_estate' and (a.num_houses>0 or a.num_hotels>0):
-            continue
-        else:
-            mortgage_potentials.append((a,a.mortgage))
-            max_sum += a.mortgage
-    if mortgage_potentials and max_sum+player.current_cash >= 0: # if the second condition is not met, no point in mortgaging
+    if player.compute_cash_obtainable_by_mortgaging()+player.current_cash >= 0: # if this is not met, no point in mortgaging
+        sorted_player_assets_list = _set_to_sorted_list_assets(player.assets)
+        for a in sorted_player_assets_list:
+            if a.is_mortgaged:
+                continue
+            elif a.loc_class=='real_estate' and (a.num_houses>0 or a.num_hotels>0):
+                continue
+            else:
+                mortgage_potentials.append((a,a.mortgage))
+    if mortgage_potentials:
         sorted_potentials = sorted(mortgage_potentials, key=lambda x: x[1])  # sort by mortgage in ascending order
         for p in sorted_potentials:
             if player.current_cash >= 0:
@@ -806,7 +794,7 @@ def handle_negative_cash_balance(player, current_gameboard):
             params['player'] = player.player_name
             params['asset'] = p[0].name
             params['current_gameboard'] = "current_gameboard"
-            logger.debug(player.player_name+ ': I am attempting to mortgage property '+ params['asset'])
+            logger.debug('%s: I am attempting to mortgage property %s', player.player_name, params['asset'])
             player.agent._agent_memory['previous_action'] = "mortgage_property"
             return ("mortgage_property", params)
 
@@ -834,7 +822,7 @@ def handle_negative_cash_balance(player, current_gameboard):
             params['player'] = player.player_name
             params['asset'] = p[0].name
             params['current_gameboard'] = "current_gameboard"
-            logger.debug(player.player_name + ': I am attempting to sell property '+ p[0].name + ' to the bank')
+            logger.debug('%s: I am attempting to sell property %s to the bank', player.player_name, p[0].name)
             player.agent._agent_memory['previous_action'] = "sell_property"
             return ("sell_property", params)
 
@@ -857,7 +845,7 @@ def handle_negative_cash_balance(player, current_gameboard):
                 params['current_gameboard'] = "current_gameboard"
                 params['sell_house'] = True
                 params['sell_hotel'] = False
-                logger.debug(player.player_name+ ': I am attempting to sell house on '+ a.name + ' to the bank')
+                logger.debug('%s: I am attempting to sell house on %s to the bank', player.player_name, a.name)
                 player.agent._agent_memory['previous_action'] = "sell_house_hotel"
                 return ("sell_house_hotel", params)
 
@@ -870,7 +858,7 @@ def handle_negative_cash_balance(player, current_gameboard):
                 params['current_gameboard'] = "current_gameboard"
                 params['sell_house'] = False
                 params['sell_hotel'] = True
-                logger.debug(player.player_name+ ': I am attempting to sell house on '+ a.name + ' to the bank')
+                logger.debug('%s: I am attempting to sell house on %s to the bank', player.player_name, a.name)
                 player.agent._agent_memory['previous_action'] = "sell_house_hotel"
                 return ("sell_house_hotel", params)
 
@@ -884,7 +872,7 @@ def handle_negative_cash_balance(player, current_gameboard):
         params['player'] = player.player_name
         params['asset'] = a.name
         params['current_gameboard'] = "current_gameboard"
-        logger.debug(player.player_name + ': I am attempting to sell property '+ a.name + ' to the bank')
+        logger.debug('%s: I am attempting to sell property %s to the bank', player.player_name, a.name)
         player.agent._agent_memory['previous_action'] = "sell_property"
         return ("sell_property", params)
 
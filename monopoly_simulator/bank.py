@@ -2,6 +2,11 @@ import logging
 logger = logging.getLogger('monopoly_simulator.logging_info.bank')
 
 class Bank(object):
+    # attributes are held in slots rather than a per-instance __dict__, to keep game boards compact
+    __slots__ = ('mortgage_percentage', 'total_mortgage_rule', 'total_houses', 'total_hotels', 'total_cash_with_bank',
+                 'property_sell_percentage', 'house_sell_percentage', 'hotel_sell_percentage', 'jail_fine',
+                 'monopolized_property_rent_factor', 'house_limit_before_hotel', 'hotel_limit', 'runaway_cash_limit')
+
     def __init__(self):
         """
         :param mortgage_percentage: a float. % of the property mortgage amount that the player owes the bank in addition to the mortgage amount.
@@ -20,6 +25,8 @@ class Bank(object):
         :param house_limit_before_hotel: an int. The max number of houses that a player can build on a property. Once the num of houses has reached this limit on
         all the properties in that color group (Uniform improvement rule), the player may set up a hotel.
         :param hotel_limit: The max number of hotel(s) that a player can build on a property
+        :param runaway_cash_limit: a float. The game is terminated (see check_for_game_termination) once a player has more
+        cash than this. This is our limit for runaway cash, for testing purposes only.
         """
         self.mortgage_percentage = 0.1
         self.total_mortgage_rule = False
@@ -33,19 +40,20 @@ class Bank(object):
         self.monopolized_property_rent_factor = float(2)
         self.house_limit_before_hotel = 4
         self.hotel_limit = 1
+        self.runaway_cash_limit = float(10000)
 
     @staticmethod
     def auction(starting_player_index, current_gameboard, asset):
         """
         This function will be called when a player lands on a purchaseable property (real estate, railroad or utility)
         but decides not to make the purchase. 
-        :param starting_player_index:  An integer. The index of the player in current_gameboard['players'] who will be starting the auction
+        :param starting_player_index:  An integer. The index of the player in current_gameboard.players who will be starting the auction
         :param current_gameboard: A dict. Specifies the global game board data structure
         :param asset: A purchaseable instance of Location (i.e. RealEstateLocation, UtilityLocation or RailroadLocation)
         :return: None
         """
 
-        logger.debug('Entering auctioning for asset '+asset.name)
+        logger.debug('Entering auctioning for asset %s', asset.name)
 
         current_bid = 0
         players_out_of_auction = set()
@@ -53,17 +61,17 @@ class Bank(object):
         bidding_player_index = None
 
         # Since the starting player may be out of the game, we first check if we should update the starting player
-        for p in current_gameboard['players']:
+        for p in current_gameboard.players:
             if p.status == 'lost':
                 players_out_of_auction.add(p)
             else:
-                logger.debug(p.player_name+' is an auction participant.')
+                logger.debug('%s is an auction participant.', p.player_name)
 
         count = 0
-        while count < len(current_gameboard['players']):
-            if current_gameboard['players'][starting_player_index] in players_out_of_auction:
+        while count < len(current_gameboard.players):
+            if current_gameboard.players[starting_player_index] in players_out_of_auction:
                 count += 1
-                starting_player_index = (starting_player_index+1)%len(current_gameboard['players'])
+                starting_player_index = (starting_player_index+1)%len(current_gameboard.players)
             else:
                 bidding_player_index = starting_player_index
                 break
@@ -72,66 +80,66 @@ class Bank(object):
             logger.debug('No one is left in the game that can participate in the auction! Why are we here?')
             return
         else:
-            logger.debug(current_gameboard['players'][bidding_player_index].player_name+' will place the first bid')
+            logger.debug('%s will place the first bid', current_gameboard.players[bidding_player_index].player_name)
 
-        while len(players_out_of_auction) < len(current_gameboard['players']): # we iterate and bid till just one player remains
-            if winning_player is not None and len(players_out_of_auction) == len(current_gameboard['players']) - 1:
+        while len(players_out_of_auction) < len(current_gameboard.players): # we iterate and bid till just one player remains
+            if winning_player is not None and len(players_out_of_auction) == len(current_gameboard.players) - 1:
                 logger.debug("Current highest bid player is the last man standing in the auction, hence breaking out of auction loop.")
                 break
-            bidding_player = current_gameboard['players'][bidding_player_index]
+            bidding_player = current_gameboard.players[bidding_player_index]
             if bidding_player in players_out_of_auction:
-                bidding_player_index = (bidding_player_index+1)%len(current_gameboard['players']) # next player
+                bidding_player_index = (bidding_player_index+1)%len(current_gameboard.players) # next player
                 continue
             proposed_bid = bidding_player.agent.make_bid(bidding_player, current_gameboard,
                                 asset, current_bid)
             # add to game history
-            current_gameboard['history']['function'].append(bidding_player.agent.make_bid)
+            current_gameboard.history['function'].append(bidding_player.agent.make_bid)
             params = dict()
             params['player'] = bidding_player
             params['current_gameboard'] = current_gameboard
             params['asset'] = asset
             params['current_bid'] = current_bid
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(proposed_bid)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(proposed_bid)
 
-            logger.debug(bidding_player.player_name+' proposed bid '+str(proposed_bid))
+            logger.debug('%s proposed bid %s', bidding_player.player_name, proposed_bid)
 
             if proposed_bid == 0:
                 players_out_of_auction.add(bidding_player)
-                logger.debug(bidding_player.player_name+' is out of the auction.')
-                bidding_player_index = (bidding_player_index + 1) % len(current_gameboard['players'])
+                logger.debug('%s is out of the auction.', bidding_player.player_name)
+                bidding_player_index = (bidding_player_index + 1) % len(current_gameboard.players)
                 continue
             elif proposed_bid <= current_bid: # the <= serves as a forcing function to ensure the proposed bid must be non-zero
                 players_out_of_auction.add(bidding_player)
-                logger.debug(bidding_player.player_name+ ' is out of the auction.')
-                bidding_player_index = (bidding_player_index + 1) % len(current_gameboard['players'])
+                logger.debug('%s is out of the auction.', bidding_player.player_name)
+                bidding_player_index = (bidding_player_index + 1) % len(current_gameboard.players)
                 continue
 
             current_bid = proposed_bid
-            logger.debug('The current highest bid is '+str(current_bid)+ ' and is held with '+bidding_player.player_name)
+            logger.debug('The current highest bid is %s and is held with %s', current_bid, bidding_player.player_name)
             winning_player = bidding_player
-            bidding_player_index = (bidding_player_index + 1) % len(current_gameboard['players'])
+            bidding_player_index = (bidding_player_index + 1) % len(current_gameboard.players)
 
         if winning_player:
             winning_player.charge_player(current_bid, current_gameboard, bank_flag=True) # if it got here then current_bid is non-zero.
             # add to game history
-            current_gameboard['history']['function'].append(winning_player.charge_player)
+            current_gameboard.history['function'].append(winning_player.charge_player)
             params = dict()
             params['self'] = winning_player
             params['amount'] = current_bid
             params['description'] = 'auction'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
             asset.update_asset_owner(winning_player, current_gameboard)
             # add to game history
-            current_gameboard['history']['function'].append(asset.update_asset_owner)
+            current_gameboard.history['function'].append(asset.update_asset_owner)
             params = dict()
             params['self'] = asset
             params['player'] = winning_player
             params['current_gameboard'] = current_gameboard
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
         else:
             logger.debug('Auction did not succeed in a sale.')
         return
@@ -150,15 +158,15 @@ class Bank(object):
             logger.error("Exception")
             raise Exception
         else:
-            if current_gameboard['bank'].total_mortgage_rule is False:
-                return (1.0+current_gameboard['bank'].mortgage_percentage) * mortgaged_property.mortgage
+            if current_gameboard.bank.total_mortgage_rule is False:
+                return (1.0+current_gameboard.bank.mortgage_percentage) * mortgaged_property.mortgage
             else:
                 # to avoid passing in a player object, I am going to use the owner of the mortgaged_property as the player whose
                 # total debt outstanding we have to compute the mortgage against.
                 player = mortgaged_property.owned_by
                 total = 0
                 for a in player.mortgaged_assets:
-                    total += ((1.0+current_gameboard['bank'].mortgage_percentage)*a.mortgage)
+                    total += ((1.0+current_gameboard.bank.mortgage_percentage)*a.mortgage)
                 return total
 
 
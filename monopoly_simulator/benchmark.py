@@ -0,0 +1,48 @@
+"""
+Simple throughput benchmarks for the simulator. Run this file from within the monopoly_simulator folder (like
+test_harness.py), since the game schema is read in from a relative path.
+"""
+import time
+import shutil
+import tempfile
+from monopoly_simulator import tournament_helper
+from monopoly_simulator.logging_info import set_gameplay_logging
+
+
+def games_per_second(game_seeds, log_folder):
+    """
+    Play one tournament game (with background agents) per seed, logging each game into its own file, and time it.
+    :param game_seeds: A list of integers. One game is played per seed.
+    :param log_folder: A string. Path of the folder into which the game logs are written.
+    :return: A float. The number of games played per second.
+    """
+    start_time = time.time()
+    for game_seed in game_seeds:
+        tournament_helper.play_logged_game(game_seed, log_folder + '/seed_' + str(game_seed) + '.log')
+    return len(game_seeds) / (time.time() - start_time)
+
+
+def benchmark_gameplay_logging(num_games=50):
+    """
+    Compare game throughput with gameplay logging on (the default, every debug line is written to the game log file)
+    and off (see logging_info.set_gameplay_logging).
+    :param num_games: An integer. Number of games played in each mode.
+    :return: A dict with the mode as key and games/sec as value.
+    """
+    game_seeds = list(range(1, num_games + 1))
+    log_folder = tempfile.mkdtemp()
+    results = dict()
+    try:
+        games_per_second(game_seeds[0:2], log_folder)  # warm-up (imports, board template)
+        for mode, enabled in [('logging on', True), ('logging off', False)]:
+            set_gameplay_logging(enabled)
+            results[mode] = games_per_second(game_seeds, log_folder)
+            print(mode + ': ' + str(round(results[mode], 2)) + ' games/sec')
+    finally:
+        set_gameplay_logging(True)
+        shutil.rmtree(log_folder)
+    return results
+
+
+if __name__ == '__main__':
+    benchmark_gameplay_logging()
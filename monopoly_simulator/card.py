@@ -1,4 +1,9 @@
+import bisect
+
+
 class Card(object):
+    __slots__ = ('action', 'card_type', 'name')
+
     def __init__(self, action, card_type, name):
         """
 
@@ -14,6 +19,7 @@ class Card(object):
 
 
 class MovementCard(Card):
+    __slots__ = ('destination',)
 
     def __init__(self, action, card_type, name, destination):
         """
@@ -33,6 +39,8 @@ class MovementCard(Card):
 
 
 class MovementPaymentCard(Card):
+    __slots__ = ()
+
     def __init__(self, action, card_type, name):
         """
         A card of card_type 'movement_payment'. Generally, this card involves moving to a utility or railroad
@@ -48,6 +56,8 @@ class MovementPaymentCard(Card):
 
 
 class ContingentMovementCard(Card):
+    __slots__ = ()
+
     def __init__(self, action, card_type, name):
         """
         A card of card_type 'contingent_movement'. In the default game, this is usually a get_out_jail_free card.
@@ -61,6 +71,8 @@ class ContingentMovementCard(Card):
 
 
 class MovementRelativeCard(Card):
+    __slots__ = ('new_relative_position',)
+
     def __init__(self, action, card_type, name, new_relative_position):
         """
         A card of card_type 'movement_relative'. The picking player will be moved by new_relative_position steps
@@ -79,6 +91,8 @@ class MovementRelativeCard(Card):
 
 
 class CashFromBankCard(Card):
+    __slots__ = ('amount',)
+
     def __init__(self, action, card_type, name, amount):
         """
         A card of card_type either 'positive_cash_from_bank' or 'negative_cash_from_bank' (in which case the amount
@@ -96,6 +110,8 @@ class CashFromBankCard(Card):
 
 
 class ContingentCashFromBankCard(Card):
+    __slots__ = ('contingency',)
+
     def __init__(self, action, card_type, name, contingency):
         """
         A card of card_type 'contingent_cash_from_bank'. The reason it is called this is because the actual payment
@@ -113,6 +129,8 @@ class ContingentCashFromBankCard(Card):
 
 
 class CashFromPlayersCard(Card):
+    __slots__ = ('amount_per_player',)
+
     def __init__(self, action, card_type, name, amount_per_player):
         """
         A card of card_type either 'positive_cash_from_players' or 'negative_cash_from_players' (in which case the amount
@@ -127,3 +145,116 @@ class CashFromPlayersCard(Card):
         """
         super().__init__(action, card_type, name)
         self.amount_per_player = float(amount_per_player)
+
+
+class CardDeck(set):
+    def __init__(self, cards=()):
+        """
+        A pack of cards (community chest or chance). It is a set of Card instances, so it can be used wherever the set of
+        cards of a pack used to be expected, but it additionally maintains an index of its cards sorted by card name.
+        The index is updated incrementally when cards leave the pack or return to it (e.g., get_out_of_jail_free), so that
+        picking the card at a given position of the sorted pack (see card_at) is O(1), without copying and re-sorting
+        the pack on every draw. Cards with the same name are kept in the order in which they were added.
+        :param cards: An iterable of Card instances.
+        """
+        super().__init__()
+        self._sorted_names = list() # the (string) names of the cards in the pack, in sorted order
+        self._sorted_cards = list() # the cards in the pack, aligned with _sorted_names
+        for card in cards:
+            self.add(card)
+
+    def add(self, card):
+        if card in self:
+            return
+        super().add(card)
+        index = bisect.bisect_right(self._sorted_names, str(card.name))
+        self._sorted_names.insert(index, str(card.name))
+        self._sorted_cards.insert(index, card)
+
+    def remove(self, card):
+        super().remove(card)
+        index = bisect.bisect_left(self._sorted_names, str(card.name))
+        while self._sorted_cards[index] is not card:
+            index += 1
+        del self._sorted_names[index]
+        del self._sorted_cards[index]
+
+    def discard(self, card):
+        if card in self:
+            self.remove(card)
+
+    def pop(self):
+        card = self._sorted_cards[-1]
+        self.remove(card)
+        return card
+
+    def clear(self):
+        super().clear()
+        self._sorted_names = list()
+        self._sorted_cards = list()
+
+    def update(self, *iterables):
+        for iterable in iterables:
+            for card in iterable:
+                self.add(card)
+
+    def difference_update(self, *iterables):
+        for iterable in iterables:
+            for card in list(iterable): # a list, since iterable may be the pack itself
+                self.discard(card)
+
+    def intersection_update(self, *iterables):
+        kept = set(self).intersection(*iterables)
+        for card in list(self._sorted_cards):
+            if card not in kept:
+                self.remove(card)
+
+    def symmetric_difference_update(self, iterable):
+        for card in set(iterable):
+            if card in self:
+                self.remove(card)
+            else:
+                self.add(card)
+
+    # the in-place operators of set would bypass the index, so they go through the methods above
+    def __ior__(self, other):
+        if not isinstance(other, (set, frozenset)):
+            return NotImplemented
+        self.update(other)
+        return self
+
+    def __isub__(self, other):
+        if not isinstance(other, (set, frozenset)):
+            return NotImplemented
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other):
+        if not isinstance(other, (set, frozenset)):
+            return NotImplemented
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other):
+        if not isinstance(other, (set, frozenset)):
+            return NotImplemented
+        self.symmetric_difference_update(other)
+        return self
+
+    def copy(self):
+        return CardDeck(self._sorted_cards)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __reduce__(self):
+        # pickled (and deep copied) as its cards, from which the index is built again
+        return CardDeck, (list(self._sorted_cards),)
+
+    def card_at(self, index):
+        """
+        Return the card at the given position of the pack, when the pack is sorted by card name.
+        :param index: An integer between 0 and len(self)-1
+        :return: A Card instance.
+        """
+        return self._sorted_cards[index]
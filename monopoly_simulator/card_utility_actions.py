@@ -1,7 +1,9 @@
 import numpy as np
 from monopoly_simulator.location import RailroadLocation
+from monopoly_simulator.bank import Bank
+from monopoly_simulator.card import CardDeck
 from monopoly_simulator.flag_config import flag_config_dict
-from monopoly_simulator import diagnostics
+from monopoly_simulator import game_budget
 import logging
 logger = logging.getLogger('monopoly_simulator.logging_info.card_utility_actions')
 
@@ -30,31 +32,38 @@ def go_to_jail(player, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug('execute go_to_jail action for '+player.player_name)
+    logger.debug('execute go_to_jail action for %s', player.player_name)
     player.send_to_jail(current_gameboard)
     # add to game history
-    current_gameboard['history']['function'].append(player.send_to_jail)
+    current_gameboard.history['function'].append(player.send_to_jail)
     params = dict()
     params['self'] = player
     params['current_gameboard'] = current_gameboard
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
 
-def _set_to_sorted_list_func(set_cards):
-    cc_card_dict = dict()
-    while len(set_cards) != 0:
-        popped_card = set_cards.pop()
-        try:
-            cc_card_dict[str(popped_card.name)].append(popped_card)
-        except:
-            cc_card_dict[str(popped_card.name)] = [popped_card]
-    list_cards = []
-
-    for sorted_key in sorted(cc_card_dict):   #sorts dictionary based on dict keys
-        for j in range(len(cc_card_dict[sorted_key])):
-            list_cards.append(cc_card_dict[sorted_key][j])
-    return list_cards
+def _draw_card(current_gameboard, pack):
+    """
+    Internal function that picks a card (without removing it) from a card pack. Cards are picked uniformly at random from
+    the pack sorted by card name, using the card random number stream of the game (current_gameboard['card_rng']). If
+    current_gameboard['legacy_card_draws'] is True, the card is instead picked the way older versions of the simulator
+    did it (with a fresh RandomState seeded with current_gameboard['card_seed'], which is incremented after every draw),
+    so that old seeds reproduce their old card sequences.
+    :param current_gameboard: A dict. The global gameboard data structure
+    :param pack: A string. 'community_chest' or 'chance'
+    :return: A Card instance.
+    """
+    card_deck = current_gameboard[pack+'_cards']
+    if not isinstance(card_deck, CardDeck): # e.g., the pack was replaced by a plain set of cards
+        card_deck = CardDeck(card_deck)
+        current_gameboard[pack+'_cards'] = card_deck
+    if current_gameboard['legacy_card_draws']:
+        index = np.random.RandomState(current_gameboard['card_seed']).choice(len(card_deck))
+        current_gameboard['card_seed'] += 1
+    else:
+        index = current_gameboard['card_rng'].integers(len(card_deck))
+    return card_deck.card_at(index)
 
 
 def pick_card_from_community_chest(player, current_gameboard):
@@ -65,37 +74,33 @@ def pick_card_from_community_chest(player, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug(player.player_name+' is picking card from community chest.')
-    card_rand = np.random.RandomState(current_gameboard['card_seed'])
-    set_cc_cards_copy = current_gameboard['community_chest_cards'].copy()
-    list_community_chest_cards = _set_to_sorted_list_func(set_cc_cards_copy)
-    card = card_rand.choice(list_community_chest_cards)
+    logger.debug('%s is picking card from community chest.', player.player_name)
+    card = _draw_card(current_gameboard, 'community_chest')
     current_gameboard['picked_community_chest_cards'].append(current_gameboard['community_chest_card_objects'][card.name])
-    # card = card_rand.choice(list(current_gameboard['community_chest_cards']))
-    current_gameboard['card_seed'] += 1
-    logger.debug(player.player_name+' picked card '+card.name)
+    # card = card_rand.choice(list(current_gameboard.community_chest_cards))
+    logger.debug('%s picked card %s', player.player_name, card.name)
     if card.name == 'get_out_of_jail_free':
         logger.debug('removing get_out_of_jail card from community chest pack')
-        current_gameboard['community_chest_cards'].remove(card)
+        current_gameboard.community_chest_cards.remove(card)
         card.action(player, card, current_gameboard, pack='community_chest')
-        current_gameboard['history']['function'].append(card.action)
+        current_gameboard.history['function'].append(card.action)
         params = dict()
         params['player'] = player
         params['card'] = card
         params['current_gameboard'] = current_gameboard
         params['pack'] = 'community_chest'
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
     else:
         card.action(player, card, current_gameboard) # all card actions except get out of jail free must take this signature
         # add to game history
-        current_gameboard['history']['function'].append(card.action)
+        current_gameboard.history['function'].append(card.action)
         params = dict()
         params['player'] = player
         params['card'] = card
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
 
 def pick_card_from_chance(player, current_gameboard):
@@ -106,37 +111,33 @@ def pick_card_from_chance(player, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug(player.player_name+ ' is picking card from chance.')
-    card_rand = np.random.RandomState(current_gameboard['card_seed'])
-    set_chance_cards_copy = current_gameboard['chance_cards'].copy()
-    list_chance_cards = _set_to_sorted_list_func(set_chance_cards_copy)
-    card = card_rand.choice(list_chance_cards)
+    logger.debug('%s is picking card from chance.', player.player_name)
+    card = _draw_card(current_gameboard, 'chance')
     current_gameboard['picked_chance_cards'].append(current_gameboard['chance_card_objects'][card.name])
-    # card = card_rand.choice(list(current_gameboard['chance_cards']))
-    current_gameboard['card_seed'] += 1
-    logger.debug(player.player_name+ ' picked card '+ card.name)
+    # card = card_rand.choice(list(current_gameboard.chance_cards))
+    logger.debug('%s picked card %s', player.player_name, card.name)
     if card.name == 'get_out_of_jail_free':
         logger.debug('removing get_out_of_jail card from chance pack')
-        current_gameboard['chance_cards'].remove(card)
+        current_gameboard.chance_cards.remove(card)
         card.action(player, card, current_gameboard, pack='chance')
-        current_gameboard['history']['function'].append(card.action)
+        current_gameboard.history['function'].append(card.action)
         params = dict()
         params['player'] = player
         params['card'] = card
         params['current_gameboard'] = current_gameboard
         params['pack'] = 'chance'
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
     else:
         card.action(player, card, current_gameboard) # all card actions except get out of jail free must take this signature
         # add to game history
-        current_gameboard['history']['function'].append(card.action)
+        current_gameboard.history['function'].append(card.action)
         params = dict()
         params['player'] = player
         params['card'] = card
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
 
 def move_player(player, card, current_gameboard):
@@ -147,19 +148,19 @@ def move_player(player, card, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug('executing move_player for '+player.player_name)
-    logger.debug('destination specified on card is '+card.destination.name)
+    logger.debug('executing move_player for %s', player.player_name)
+    logger.debug('destination specified on card is %s', card.destination.name)
     new_position = card.destination.start_position
-    jail_position = current_gameboard['jail_position']
+    jail_position = current_gameboard.jail_position
     if new_position == jail_position:
         player.send_to_jail(current_gameboard)
         # add to game history
-        current_gameboard['history']['function'].append(player.send_to_jail)
+        current_gameboard.history['function'].append(player.send_to_jail)
         params = dict()
         params['self'] = player
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
     else:
         _move_player__check_for_go(player, new_position, current_gameboard)
 
@@ -172,13 +173,13 @@ def set_get_out_of_jail_card_status(player, card, current_gameboard, pack):
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug('executing set_get_out_of_jail_card_status for '+player.player_name)
+    logger.debug('executing set_get_out_of_jail_card_status for %s', player.player_name)
     if pack == 'community_chest' and card.name == 'get_out_of_jail_free': # remember, this is an object equality test
         player.has_get_out_of_jail_community_chest_card = True
-        logger.debug(player.player_name+' now has get_out_of_jail community_chest card')
+        logger.debug('%s now has get_out_of_jail community_chest card', player.player_name)
     elif pack == 'chance' and card.name == 'get_out_of_jail_free': # remember, this is an object equality test
         player.has_get_out_of_jail_chance_card = True
-        logger.debug(player.player_name+ ' now has get_out_of_jail chance card')
+        logger.debug('%s now has get_out_of_jail chance card', player.player_name)
     else: # if we arrive here, it means that the card we have is either not get out of jail free, or something else has gone wrong.
         logger.debug('something has gone wrong in set_get_out_of_jail_card_status. That is all I know.')
         logger.error("Exception")
@@ -193,28 +194,28 @@ def bank_cash_transaction(player, card, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure. In this function it is unused.
     :return: None
     """
-    logger.debug('executing bank_cash_transaction for '+ player.player_name)
+    logger.debug('executing bank_cash_transaction for %s', player.player_name)
     if card.amount < 0:
         player.charge_player(-1*card.amount, current_gameboard, bank_flag=True)
         # add to game history
-        current_gameboard['history']['function'].append(player.charge_player)
+        current_gameboard.history['function'].append(player.charge_player)
         params = dict()
         params['self'] = player
         params['amount'] = -1*card.amount
         params['description'] = 'bank cash transaction'
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
     elif card.amount > 0:
         code = player.receive_cash(card.amount, current_gameboard, bank_flag=True)
         # add to game history
         if code == flag_config_dict['successful_action']:
-            current_gameboard['history']['function'].append(player.receive_cash)
+            current_gameboard.history['function'].append(player.receive_cash)
             params = dict()
             params['self'] = player
             params['amount'] = card.amount
             params['description'] = 'bank cash transaction'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(code)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(code)
         elif code == flag_config_dict['failure_code']:
             logger.debug('Transaction broke due to insufficient funds. Player does not receive the stated funds.')
     else:
@@ -231,22 +232,22 @@ def player_cash_transaction(player, card, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug('executing player_cash_transaction for '+ player.player_name)
+    logger.debug('executing player_cash_transaction for %s', player.player_name)
     if card.amount_per_player < 0:
-        for p in current_gameboard['players']:
+        for p in current_gameboard.players:
             if p == player or p.status == 'lost':
                 continue
 
             code = p.receive_cash(-1*card.amount_per_player, current_gameboard, bank_flag=False)
             # add to game history
             if code == flag_config_dict['successful_action']:
-                current_gameboard['history']['function'].append(p.receive_cash)
+                current_gameboard.history['function'].append(p.receive_cash)
                 params = dict()
                 params['self'] = p
                 params['amount'] = -1*card.amount_per_player
                 params['description'] = 'player cash transaction'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(code)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
             else:
                 logger.debug("Not sure what happened! Something broke!")
                 logger.error("Exception")
@@ -254,29 +255,29 @@ def player_cash_transaction(player, card, current_gameboard):
 
             player.charge_player(-1*card.amount_per_player, current_gameboard, bank_flag=False)
             # add to game history
-            current_gameboard['history']['function'].append(player.charge_player)
+            current_gameboard.history['function'].append(player.charge_player)
             params = dict()
             params['self'] = player
             params['amount'] = -1*card.amount_per_player
             params['description'] = 'player cash transaction'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
     elif card.amount_per_player > 0:
-        for p in current_gameboard['players']:
+        for p in current_gameboard.players:
             if p == player or p.status == 'lost':
                 continue
 
             code = player.receive_cash(card.amount_per_player, current_gameboard, bank_flag=False)
             # add to game history
             if code == flag_config_dict['successful_action']:
-                current_gameboard['history']['function'].append(player.receive_cash)
+                current_gameboard.history['function'].append(player.receive_cash)
                 params = dict()
                 params['self'] = player
                 params['amount'] = card.amount_per_player
                 params['description'] = 'player cash transaction'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(code)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
             else:
                 logger.debug("Not sure what happened! Something broke!")
                 logger.error("Exception")
@@ -284,13 +285,13 @@ def player_cash_transaction(player, card, current_gameboard):
 
             p.charge_player(card.amount_per_player, current_gameboard, bank_flag=False)
             # add to game history
-            current_gameboard['history']['function'].append(p.charge_player)
+            current_gameboard.history['function'].append(p.charge_player)
             params = dict()
             params['self'] = p
             params['amount'] = card.amount_per_player
             params['description'] = 'player cash transaction'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
 
 def contingent_bank_cash_transaction(player, card, current_gameboard):
@@ -302,16 +303,16 @@ def contingent_bank_cash_transaction(player, card, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug('executing contingent_bank_cash_transaction for '+ player.player_name)
+    logger.debug('executing contingent_bank_cash_transaction for %s', player.player_name)
     card.contingency(player, card, current_gameboard)
     # add to game history
-    current_gameboard['history']['function'].append(card.contingency)
+    current_gameboard.history['function'].append(card.contingency)
     params = dict()
     params['player'] = player
     params['card'] = card
     params['current_gameboard'] = current_gameboard
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
 
 def calculate_street_repair_cost(player, card, current_gameboard): # assesses, not just calculates
@@ -322,19 +323,19 @@ def calculate_street_repair_cost(player, card, current_gameboard): # assesses, n
     :param current_gameboard: A dict. The global gameboard data structure. In this function it is unused.
     :return: None
     """
-    logger.debug('executing calculate_street_repair_cost for '+player.player_name)
+    logger.debug('executing calculate_street_repair_cost for %s', player.player_name)
     cost_per_house = 40
     cost_per_hotel = 115
     cost = player.num_total_houses*cost_per_house+player.num_total_hotels*cost_per_hotel
     player.charge_player(cost, current_gameboard, bank_flag=True)
     # add to game history
-    current_gameboard['history']['function'].append(player.charge_player)
+    current_gameboard.history['function'].append(player.charge_player)
     params = dict()
     params['self'] = player
     params['amount'] = cost
     params['description'] = 'street repair'
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
 
 def move_player__check_for_go(player, card, current_gameboard):
@@ -345,8 +346,8 @@ def move_player__check_for_go(player, card, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug('executing move_player__check_for_go for '+player.player_name)
-    logger.debug('destination specified on card is '+ card.destination.name)
+    logger.debug('executing move_player__check_for_go for %s', player.player_name)
+    logger.debug('destination specified on card is %s', card.destination.name)
     new_position = card.destination.start_position
     _move_player__check_for_go(player, new_position, current_gameboard)
 
@@ -362,8 +363,8 @@ def move_to_nearest_utility__pay_or_buy__check_for_go(player, card, current_game
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug('executing move_to_nearest_utility__pay_or_buy__check_for_go '+ player.player_name)
-    utility_positions = current_gameboard['utility_positions']
+    logger.debug('executing move_to_nearest_utility__pay_or_buy__check_for_go %s', player.player_name)
+    utility_positions = current_gameboard.utility_positions
     min_utility_position = utility_positions[0]
     min_utility_distance = _calculate_board_distance(player.current_position, min_utility_position)
     for u in utility_positions:
@@ -372,85 +373,84 @@ def move_to_nearest_utility__pay_or_buy__check_for_go(player, card, current_game
             min_utility_distance = dist
             min_utility_position = u
 
-    logger.debug('The utility position that player is being moved to is '+current_gameboard['location_sequence'][min_utility_position].name)
+    logger.debug('The utility position that player is being moved to is %s', current_gameboard.location_sequence[min_utility_position].name)
 
-    go_position = current_gameboard['go_position']
-    go_increment = current_gameboard['go_increment']
+    go_position = current_gameboard.go_position
+    go_increment = current_gameboard.go_increment
 
-    if 'auxiliary_check' in current_gameboard:
-        current_gameboard['auxiliary_check'](player, min_utility_position, current_gameboard)
+    if current_gameboard.auxiliary_check is not None:
+        current_gameboard.auxiliary_check(player, min_utility_position, current_gameboard)
 
     if _has_player_passed_go(player.current_position, min_utility_position, go_position):
-        if 'auxiliary_check_for_go' in current_gameboard:
-            current_gameboard['auxiliary_check_for_go'](player, min_utility_position, current_gameboard)
+        if current_gameboard.auxiliary_check_for_go is not None:
+            current_gameboard.auxiliary_check_for_go(player, min_utility_position, current_gameboard)
         code = player.receive_cash(go_increment, current_gameboard, bank_flag=True)
         # add to game history
         if code == flag_config_dict['successful_action']:
-            current_gameboard['history']['function'].append(player.receive_cash)
+            current_gameboard.history['function'].append(player.receive_cash)
             params = dict()
             params['self'] = player
             params['amount'] = go_increment
             params['description'] = 'go increment'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(code)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(code)
         else:
-            logger.debug('Current cash balance with the bank = '+ str(current_gameboard['bank'].total_cash_with_bank))
-            logger.debug("Player supposed to receive go increment, but bank has no sufficient funds, hence unable to pay player." +
-                         "Player will have to pass GO position without receiving go increment!")
+            logger.debug('Current cash balance with the bank = %s', current_gameboard.bank.total_cash_with_bank)
+            logger.debug("Player supposed to receive go increment, but bank has no sufficient funds, hence unable to pay player.Player will have to pass GO position without receiving go increment!")
 
     player.update_player_position(min_utility_position, current_gameboard) # update this only after checking for go
     # add to game history
-    current_gameboard['history']['function'].append(player.update_player_position)
+    current_gameboard.history['function'].append(player.update_player_position)
     params = dict()
     params['self'] = player
     params['new_position'] = min_utility_position
     params['current_gameboard'] = current_gameboard
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
-    current_loc = current_gameboard['location_sequence'][player.current_position]
+    current_loc = current_gameboard.location_sequence[player.current_position]
 
     if current_loc.loc_class != 'utility':  # simple check
         logger.debug('location is supposed to be a utility...what happened?')
         logger.error("Exception")
         raise Exception
 
-    if 'bank.Bank' in str(type(current_loc.owned_by)): # we're forced to use this hack to avoid an import.
+    if isinstance(current_loc.owned_by, Bank):
         logger.debug('utility is owned by bank. Player will have option to purchase.')
         player.process_move_consequences(current_gameboard)
         # add to game history
-        current_gameboard['history']['function'].append(player.process_move_consequences)
+        current_gameboard.history['function'].append(player.process_move_consequences)
         params = dict()
         params['self'] = player
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
         return
     else:
-        amount_due = current_gameboard['current_die_total']*10
+        amount_due = current_gameboard.current_die_total*10
         player.charge_player(amount_due, current_gameboard, bank_flag=False)
         # add to game history
-        current_gameboard['history']['function'].append(player.charge_player)
+        current_gameboard.history['function'].append(player.charge_player)
         params = dict()
         params['self'] = player
         params['amount'] = amount_due
         params['number of utilities'] = current_loc.owned_by.num_utilities_possessed
         params['description'] = 'utility dues'
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         current_owner = current_loc.owned_by
         code = current_owner.receive_cash(amount_due, current_gameboard, bank_flag=False)
         if code == flag_config_dict['successful_action']:
             # add to game history
-            current_gameboard['history']['function'].append(current_owner.receive_cash)
+            current_gameboard.history['function'].append(current_owner.receive_cash)
             params = dict()
             params['self'] = current_owner
             params['amount'] = amount_due
             params['number of utilities'] = current_loc.owned_by.num_utilities_possessed
             params['description'] = 'utility dues'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(code)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(code)
         else:
             logger.debug("Not sure what happened! Something broke!")
             logger.error("Exception")
@@ -468,8 +468,8 @@ def move_to_nearest_railroad__pay_double_or_buy__check_for_go(player, card, curr
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug('executing move_to_nearest_railroad__pay_double_or_buy__check_for_go for '+ player.player_name)
-    railroad_positions = current_gameboard['railroad_positions']
+    logger.debug('executing move_to_nearest_railroad__pay_double_or_buy__check_for_go for %s', player.player_name)
+    railroad_positions = current_gameboard.railroad_positions
     min_railroad_position = railroad_positions[0]
     min_railroad_distance = _calculate_board_distance(player.current_position, railroad_positions[0])
     for u in railroad_positions:
@@ -478,86 +478,84 @@ def move_to_nearest_railroad__pay_double_or_buy__check_for_go(player, card, curr
             min_railroad_distance = dist
             min_railroad_position = u
 
-    logger.debug('The railroad position that player is being moved to is '+ current_gameboard['location_sequence'][
-        min_railroad_position].name)
+    logger.debug('The railroad position that player is being moved to is %s', current_gameboard.location_sequence[ min_railroad_position].name)
 
-    go_position = current_gameboard['go_position']
-    go_increment = current_gameboard['go_increment']
+    go_position = current_gameboard.go_position
+    go_increment = current_gameboard.go_increment
 
-    if 'auxiliary_check' in current_gameboard:
-        current_gameboard['auxiliary_check'](player, min_railroad_position, current_gameboard)
+    if current_gameboard.auxiliary_check is not None:
+        current_gameboard.auxiliary_check(player, min_railroad_position, current_gameboard)
 
     if _has_player_passed_go(player.current_position, min_railroad_position, go_position):
-        if 'auxiliary_check_for_go' in current_gameboard:
-            current_gameboard['auxiliary_check_for_go'](player, min_railroad_position, current_gameboard)
+        if current_gameboard.auxiliary_check_for_go is not None:
+            current_gameboard.auxiliary_check_for_go(player, min_railroad_position, current_gameboard)
         code = player.receive_cash(go_increment, current_gameboard, bank_flag=True)
         # add to game history
         if code == flag_config_dict['successful_action']:
-            current_gameboard['history']['function'].append(player.receive_cash)
+            current_gameboard.history['function'].append(player.receive_cash)
             params = dict()
             params['self'] = player
             params['amount'] = go_increment
             params['description'] = 'go increment'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(code)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(code)
         else:
-            logger.debug('Current cash balance with the bank = '+ str(current_gameboard['bank'].total_cash_with_bank))
-            logger.debug("Player supposed to receive go increment, but bank has no sufficient funds, hence unable to pay player." +
-                         "Player will have to pass GO position without receiving go increment!")
+            logger.debug('Current cash balance with the bank = %s', current_gameboard.bank.total_cash_with_bank)
+            logger.debug("Player supposed to receive go increment, but bank has no sufficient funds, hence unable to pay player.Player will have to pass GO position without receiving go increment!")
 
     player.update_player_position(min_railroad_position, current_gameboard) # update this only after checking for go
     # add to game history
-    current_gameboard['history']['function'].append(player.update_player_position)
+    current_gameboard.history['function'].append(player.update_player_position)
     params = dict()
     params['self'] = player
     params['new_position'] = min_railroad_position
     params['current_gameboard'] = current_gameboard
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
-    current_loc = current_gameboard['location_sequence'][player.current_position]
+    current_loc = current_gameboard.location_sequence[player.current_position]
 
     if current_loc.loc_class != 'railroad': # simple check
         logger.debug('location is supposed to be a railroad...what happened?')
         logger.error("Exception")
         raise Exception
 
-    if 'bank.Bank' in str(type(current_loc.owned_by)):  # we're forced to use this hack to avoid an import.
+    if isinstance(current_loc.owned_by, Bank):
         logger.debug('railroad is owned by bank. Player will have option to purchase.')
         player.process_move_consequences(current_gameboard)
         # add to game history
-        current_gameboard['history']['function'].append(player.process_move_consequences)
+        current_gameboard.history['function'].append(player.process_move_consequences)
         params = dict()
         params['self'] = player
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
         return
     else:
         amount_due = 2 * RailroadLocation.calculate_railroad_dues(current_loc, current_gameboard)
         player.charge_player(amount_due, current_gameboard, bank_flag=False)
         # add to game history
-        current_gameboard['history']['function'].append(player.charge_player)
+        current_gameboard.history['function'].append(player.charge_player)
         params = dict()
         params['self'] = player
         params['amount'] = amount_due
         params['number of railroads'] = current_loc.owned_by.num_railroads_possessed
         params['description'] = 'railroad dues'
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         current_owner = current_loc.owned_by
         code = current_owner.receive_cash(amount_due, current_gameboard, bank_flag=False)
         if code == flag_config_dict['successful_action']:
             # add to game history
-            current_gameboard['history']['function'].append(current_owner.receive_cash)
+            current_gameboard.history['function'].append(current_owner.receive_cash)
             params = dict()
             params['self'] = current_owner
             params['amount'] = amount_due
             params['number of railroads'] = current_loc.owned_by.num_railroads_possessed
             params['description'] = 'railroad dues'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(code)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(code)
         else:
             logger.debug("Not sure what happened! Something broke!")
             logger.error("Exception")
@@ -572,19 +570,19 @@ def calculate_general_repair_cost(player, card, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure. In this function it is unused.
     :return: None
     """
-    logger.debug('executing calculate_general_repair_cost action for '+ player.player_name)
+    logger.debug('executing calculate_general_repair_cost action for %s', player.player_name)
     cost_per_house = 25
     cost_per_hotel = 100
     cost = player.num_total_houses * cost_per_house + player.num_total_hotels * cost_per_hotel
     player.charge_player(cost, current_gameboard, bank_flag=True)
     # add to game history
-    current_gameboard['history']['function'].append(player.charge_player)
+    current_gameboard.history['function'].append(player.charge_player)
     params = dict()
     params['self'] = player
     params['amount'] = cost
     params['description'] = 'general repair'
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
 
 def move_player_relative(player, card, current_gameboard):
@@ -595,17 +593,17 @@ def move_player_relative(player, card, current_gameboard):
     :param current_gameboard: A dict. The global gameboard data structure
     :return: None
     """
-    logger.debug('executing move_player_relative action for '+player.player_name)
+    logger.debug('executing move_player_relative action for %s', player.player_name)
     move_player_after_die_roll(player, card.new_relative_position, current_gameboard, True)
     # add to game history
-    current_gameboard['history']['function'].append(move_player_after_die_roll)
+    current_gameboard.history['function'].append(move_player_after_die_roll)
     params = dict()
     params['player'] = player
     params['rel_move'] = card.new_relative_position
     params['current_gameboard'] = current_gameboard
     params['check_for_go'] = True
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
 
 def move_player_after_die_roll(player, rel_move, current_gameboard, check_for_go=True):
@@ -622,45 +620,44 @@ def move_player_after_die_roll(player, rel_move, current_gameboard, check_for_go
     go_increment if we land on go or pass it.
     :return:  None
     """
-    logger.debug('executing move_player_after_die_roll for '+player.player_name+' by '+str(rel_move)+' relative steps forward.')
-    num_locations = len(current_gameboard['location_sequence'])
-    go_position = current_gameboard['go_position']
-    go_increment = current_gameboard['go_increment']
+    logger.debug('executing move_player_after_die_roll for %s by %s relative steps forward.', player.player_name, rel_move)
+    num_locations = len(current_gameboard.location_sequence)
+    go_position = current_gameboard.go_position
+    go_increment = current_gameboard.go_increment
 
     new_position = (player.current_position+rel_move) % num_locations
 
-    if 'auxiliary_check' in current_gameboard:
-        current_gameboard['auxiliary_check'](player, new_position, current_gameboard)
+    if current_gameboard.auxiliary_check is not None:
+        current_gameboard.auxiliary_check(player, new_position, current_gameboard)
 
     if check_for_go:
         if _has_player_passed_go(player.current_position, new_position, go_position):
-            if 'auxiliary_check_for_go' in current_gameboard:
-                current_gameboard['auxiliary_check_for_go'](player, new_position, current_gameboard)
-            logger.debug(player.player_name+' passes Go.')
+            if current_gameboard.auxiliary_check_for_go is not None:
+                current_gameboard.auxiliary_check_for_go(player, new_position, current_gameboard)
+            logger.debug('%s passes Go.', player.player_name)
             code = player.receive_cash(go_increment, current_gameboard, bank_flag=True)
             # add to game history
             if code == flag_config_dict['successful_action']:
-                current_gameboard['history']['function'].append(player.receive_cash)
+                current_gameboard.history['function'].append(player.receive_cash)
                 params = dict()
                 params['self'] = player
                 params['amount'] = go_increment
                 params['description'] = 'go increment'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(code)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
             else:
-                logger.debug('Current cash balance with the bank = '+ str(current_gameboard['bank'].total_cash_with_bank))
-                logger.debug("Player supposed to receive go increment, but bank has no sufficient funds, hence unable to pay player." +
-                             "Player will have to pass GO position without receiving go increment!")
+                logger.debug('Current cash balance with the bank = %s', current_gameboard.bank.total_cash_with_bank)
+                logger.debug("Player supposed to receive go increment, but bank has no sufficient funds, hence unable to pay player.Player will have to pass GO position without receiving go increment!")
 
     player.update_player_position(new_position, current_gameboard)  # update this only after checking for go
     # add to game history
-    current_gameboard['history']['function'].append(player.update_player_position)
+    current_gameboard.history['function'].append(player.update_player_position)
     params = dict()
     params['self'] = player
     params['new_position'] = new_position
     params['current_gameboard'] = current_gameboard
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
 
 """
@@ -714,62 +711,67 @@ def _move_player__check_for_go(player, new_position, current_gameboard):
     :return: None
     """
     # the private version
-    go_position = current_gameboard['go_position']
-    go_increment = current_gameboard['go_increment']
+    go_position = current_gameboard.go_position
+    go_increment = current_gameboard.go_increment
 
-    if 'auxiliary_check' in current_gameboard:
-        current_gameboard['auxiliary_check'](player, new_position, current_gameboard)
+    if current_gameboard.auxiliary_check is not None:
+        current_gameboard.auxiliary_check(player, new_position, current_gameboard)
 
     if _has_player_passed_go(player.current_position, new_position, go_position):
-        if 'auxiliary_check_for_go' in current_gameboard:
-            current_gameboard['auxiliary_check_for_go'](player, new_position, current_gameboard)
+        if current_gameboard.auxiliary_check_for_go is not None:
+            current_gameboard.auxiliary_check_for_go(player, new_position, current_gameboard)
         code = player.receive_cash(go_increment, current_gameboard, bank_flag=True)
         # add to game history
         if code == flag_config_dict['successful_action']:
-            current_gameboard['history']['function'].append(player.receive_cash)
+            current_gameboard.history['function'].append(player.receive_cash)
             params = dict()
             params['self'] = player
             params['amount'] = go_increment
             params['description'] = 'go increment'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(code)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(code)
         else:
-            logger.debug('Current cash balance with the bank = '+ str(current_gameboard['bank'].total_cash_with_bank))
-            logger.debug("Player supposed to receive go increment, but bank has no sufficient funds, hence unable to pay player." +
-                         "Player will have to pass GO position without receiving go increment!")
+            logger.debug('Current cash balance with the bank = %s', current_gameboard.bank.total_cash_with_bank)
+            logger.debug("Player supposed to receive go increment, but bank has no sufficient funds, hence unable to pay player.Player will have to pass GO position without receiving go increment!")
 
     player.update_player_position(new_position, current_gameboard) # update this only after checking for go
     # add to game history
-    current_gameboard['history']['function'].append(player.update_player_position)
+    current_gameboard.history['function'].append(player.update_player_position)
     params = dict()
     params['self'] = player
     params['new_position'] = new_position
     params['current_gameboard'] = current_gameboard
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
     player.process_move_consequences(current_gameboard)
     # add to game history
-    current_gameboard['history']['function'].append(player.process_move_consequences)
+    current_gameboard.history['function'].append(player.process_move_consequences)
     params = dict()
     params['self'] = player
     params['current_gameboard'] = current_gameboard
-    current_gameboard['history']['param'].append(params)
-    current_gameboard['history']['return'].append(None)
+    current_gameboard.history['param'].append(params)
+    current_gameboard.history['return'].append(None)
 
 
 def check_for_game_termination(current_gameboard, tot_time):
     """
     checks for game termination conditions, eg: runaway cash limit for player current cash, or to keep a tab on max time limit for a game
+    (or any other budget of the game, see game_budget.py). If the game terminates because its budget ran out, the budget is
+    recorded in current_gameboard['truncated'].
     :param current_gameboard: global gameboard data structure
     :param tot_time: total time the game has taken until this function was called
     :return: bool, true if game termination condition is met, else false
     """
-    if diagnostics.max_cash_balance(current_gameboard) > 10000:   # this is our limit for runaway cash for testing purposes only.
+    if current_gameboard.players_over_cash_limit:   # i.e. some player has more cash than the runaway cash limit of the bank (maintained by Player)
         logger.debug("Game terminated since max cash balance exceeded limit.")
         return True
-    else:
-        return False
+    budget = game_budget.exhausted_budget(current_gameboard, tot_time)
+    if budget is not None:
+        logger.debug("Game terminated since its budget ran out: %s", budget)
+        current_gameboard['truncated'] = budget
+        return True
+    return False
 
 
 def check_for_winner(current_gameboard):
@@ -784,23 +786,12 @@ def check_for_winner(current_gameboard):
     """
     winner = None
     max_global_networth = 0
-    for pl in current_gameboard['players']:
+    for pl in current_gameboard.players:
         if pl.status == 'win':                  # in case the game entered game termination condition right after the winner was found, return original winner
             return winner
-    for pl in current_gameboard['players']:   # in case there are no winners, we find the winner as the player with highest networth
+    for pl in current_gameboard.players:   # in case there are no winners, we find the winner as the player with highest networth
         if pl.status != 'lost':
-            networth_player = 0
-            networth_player += pl.current_cash
-            if pl.assets:
-                for prop in pl.assets:
-                    if prop.loc_class == 'real_estate':
-                        networth_player += prop.price
-                        networth_player += prop.num_houses*prop.price_per_house
-                        networth_player += prop.num_hotels*prop.price_per_house*(current_gameboard['bank'].house_limit_before_hotel + 1)
-                    elif prop.loc_class == 'railroad':
-                        networth_player += prop.price
-                    elif prop.loc_class == 'utility':
-                        networth_player += prop.price
+            networth_player = pl.compute_net_worth(current_gameboard)
             if networth_player > max_global_networth:
                 winner = pl
                 max_global_networth = networth_player
@@ -0,0 +1,250 @@
+"""
+Checks that the uniform improvement rule, as action_choices and agent_helper_functions check it with the improvement
+level index (see improvement_levels.py), gives the same answers as the loops over the properties of a color that were
+used before the index. Since the index is only right if every change to num_houses or num_hotels is followed by a call
+to RealEstateLocation.update_improvement_level, run this after any change to the code that builds or sells improvements.
+
+For every combination of houses and hotels on the properties of a color (with one three property and one two property
+color), under several bank limits (house_limit_before_hotel and hotel_limit, set after the board is built, as a novelty
+would), every property is improved, sold off and checked with can_asset_be_improved, and the outcome is compared with
+the reference functions below, which are the checks as they were before the index. After every action, and after the
+owner goes bankrupt, the index of every color is also compared with an index built from scratch.
+
+Run this file from within the monopoly_simulator folder (like test_harness.py), since the game schema is read in from a
+relative path. It prints every mismatch it finds, and exits with status 1 if there was any.
+"""
+import itertools
+import sys
+from monopoly_simulator import gameplay
+from monopoly_simulator import initialize_game_elements
+from monopoly_simulator import background_agent_v3_1
+from monopoly_simulator import action_choices
+from monopoly_simulator import agent_helper_functions
+from monopoly_simulator.agent import Agent
+from monopoly_simulator.improvement_levels import ImprovementLevels
+from monopoly_simulator.flag_config import flag_config_dict
+from monopoly_simulator.logging_info import set_gameplay_logging
+
+_property_states = [(num_houses, 0) for num_houses in range(6)] + [(0, 1), (0, 2)]   # (num_houses, num_hotels)
+_bank_limits = [(4, 1), (3, 1), (5, 1), (2, 2), (4, 2)]   # (house_limit_before_hotel, hotel_limit)
+_colors = ['Orange', 'Brown']
+_actions = ['add house', 'add hotel', 'sell house', 'sell hotel', 'sell property', 'can be improved']
+
+
+def reference_improve_property(player, asset, current_gameboard, add_house=True, add_hotel=False):
+    """
+    :return: A boolean. Whether action_choices.improve_property would succeed, as checked before the index.
+    """
+    if asset.owned_by != player or asset.is_mortgaged or asset.loc_class != 'real_estate':
+        return False
+    elif asset.color not in player.full_color_sets_possessed or player.current_cash <= asset.price_per_house:
+        return False
+    bank = current_gameboard.bank
+    if add_hotel:
+        if asset.num_hotels == bank.hotel_limit:
+            return False
+        elif asset.num_hotels == 0 and asset.num_houses != bank.house_limit_before_hotel:
+            return False
+        for same_colored_asset in current_gameboard.color_assets[asset.color]:
+            if same_colored_asset == asset:
+                continue
+            if asset.num_hotels == 0 and not (same_colored_asset.num_houses == bank.house_limit_before_hotel
+                                              or same_colored_asset.num_hotels == 1):
+                return False
+            elif same_colored_asset.num_hotels < asset.num_hotels:
+                return False
+        return bank.improvement_possible(player, asset, current_gameboard, add_house=False, add_hotel=True)
+    elif add_house:
+        if asset.num_hotels > 0 or asset.num_houses == bank.house_limit_before_hotel:
+            return False
+        for same_colored_asset in current_gameboard.color_assets[asset.color]:
+            if same_colored_asset == asset:
+                continue
+            if same_colored_asset.num_houses < asset.num_houses or same_colored_asset.num_hotels > 0:
+                return False
+        return bank.improvement_possible(player, asset, current_gameboard, add_house=True, add_hotel=False)
+    return False
+
+
+def reference_sell_house_hotel(player, asset, current_gameboard, sell_house=True, sell_hotel=False):
+    """
+    :return: A boolean. Whether action_choices.sell_house_hotel would succeed, as checked before the index.
+    """
+    if asset.owned_by != player or asset.loc_class != 'real_estate':
+        return False
+    elif asset.num_hotels == 0 and sell_hotel:
+        return False
+    elif asset.num_houses == 0 and sell_house:
+        return False
+    for same_colored_asset in current_gameboard.color_assets[asset.color]:
+        if same_colored_asset == asset:
+            continue
+        if sell_hotel:
+            if asset.num_hotels == 1 and not (same_colored_asset.num_hotels == 1 or
+                                              (same_colored_asset.num_hotels == 0 and same_colored_asset.num_houses == 0)):
+                return False
+            elif asset.num_hotels < same_colored_asset.num_hotels:
+                return False
+        elif same_colored_asset.num_houses > asset.num_houses or same_colored_asset.num_hotels == 1:
+            return False
+    return sell_hotel or sell_house
+
+
+def reference_sell_property(player, asset, current_gameboard):
+    """
+    :return: A boolean. Whether action_choices.sell_property would succeed, as checked before the index.
+    """
+    if asset.owned_by != player:
+        return False
+    elif asset.loc_class == 'real_estate' and (asset.num_houses > 0 or asset.num_hotels > 0):
+        return False
+    if asset.color in player.full_color_sets_possessed:
+        for same_colored_asset in current_gameboard.color_assets[asset.color]:
+            if same_colored_asset == asset:
+                continue
+            elif same_colored_asset.num_houses > 0 or same_colored_asset.num_hotels > 0:
+                return False
+    return True
+
+
+def reference_can_asset_be_improved(asset, same_color_assets):
+    """
+    :return: A boolean. What agent_helper_functions.can_asset_be_improved returned before the index.
+    """
+    if asset.loc_class != 'real_estate' or asset.is_mortgaged:
+        return False
+    if asset.num_hotels > 0:
+        return False
+    if asset.num_houses == 0:
+        return True
+    count = 0
+    for c_asset in same_color_assets:
+        if c_asset == asset:
+            continue
+        if c_asset.num_hotels > 0 and asset.num_houses == 4:
+            return True
+        if c_asset.num_houses > asset.num_houses:
+            return True
+        if c_asset.num_houses == asset.num_houses:
+            count += 1
+    return count == len(same_color_assets) - 1
+
+
+def _set_up_board(board_template, color, property_states, house_limit_before_hotel, hotel_limit):
+    """
+    Internal function that builds a board on which player_1 owns all properties of color, with the given houses and
+    hotels on them, and then changes the bank limits.
+    :return: A tuple (game board, player, the properties of color sorted by name).
+    """
+    agents = dict([(player_name, Agent(**background_agent_v3_1.decision_agent_methods))
+                   for player_name in ['player_1', 'player_2', 'player_3', 'player_4']])
+    game_elements = initialize_game_elements.initialize_board_from_template(board_template, agents)
+    game_elements.bank.house_limit_before_hotel = house_limit_before_hotel
+    game_elements.bank.hotel_limit = hotel_limit
+    player = game_elements.players[0]
+    player.current_cash = 1000000
+    assets = sorted(game_elements.color_assets[color], key=lambda asset: asset.name)
+    for asset, (num_houses, num_hotels) in zip(assets, property_states):
+        asset.update_asset_owner(player, game_elements)
+        asset.num_houses = num_houses
+        asset.num_hotels = num_hotels
+        asset.update_improvement_level()
+    return game_elements, player, assets
+
+
+def _act(action, player, asset, game_elements, reference):
+    """
+    Internal function that performs action on asset, with the reference functions if reference is True.
+    :return: A boolean. Whether the action succeeded (or, for 'can be improved', its answer).
+    """
+    if action == 'can be improved':
+        function = reference_can_asset_be_improved if reference else agent_helper_functions.can_asset_be_improved
+        return function(asset, game_elements.color_assets[asset.color])
+    elif action == 'sell property':
+        function = reference_sell_property if reference else action_choices.sell_property
+        result = function(player, asset, game_elements)
+    elif action.startswith('sell'):
+        function = reference_sell_house_hotel if reference else action_choices.sell_house_hotel
+        result = function(player, asset, game_elements, action == 'sell house', action == 'sell hotel')
+    else:
+        function = reference_improve_property if reference else action_choices.improve_property
+        result = function(player, asset, game_elements, action == 'add house', action == 'add hotel')
+    return result is True or result == flag_config_dict['successful_action']
+
+
+def _index_mismatches(game_elements):
+    """
+    Internal function that compares the improvement level index of every color with an index built from scratch.
+    :return: A list of strings, one per color whose index is out of date.
+    """
+    mismatches = list()
+    for color, assets in game_elements.color_assets.items():
+        real_estate = set([asset for asset in assets if asset.loc_class == 'real_estate'])
+        if not real_estate:
+            continue
+        levels = next(iter(real_estate)).improvement_levels
+        expected = ImprovementLevels(real_estate)
+        if (levels.lowest, levels.highest, levels.most_houses) != \
+                (expected.lowest, expected.highest, expected.most_houses) or \
+                any(levels.count(*expected.level(asset)) != expected.count(*expected.level(asset)) for asset in real_estate):
+            mismatches.append('index of ' + color + ' is out of date')
+    return mismatches
+
+
+def check_improvement_levels():
+    """
+    Run all the checks.
+    :return: A tuple (number of checks, list of mismatches as strings).
+    """
+    board_template = gameplay.set_up_board_template('../monopoly_game_schema_v1-2.json')
+    num_checks = 0
+    mismatches = list()
+    for house_limit_before_hotel, hotel_limit in _bank_limits:
+        for color in _colors:
+            num_assets = len(board_template['color_assets'][color])
+            for property_states in itertools.product(_property_states, repeat=num_assets):
+                setting = '%s %s limits %s/%s' % (color, property_states, house_limit_before_hotel, hotel_limit)
+                for i in range(num_assets):
+                    game_elements = None
+                    for action in _actions:
+                        if game_elements is None:   # the board is set up again once an action has changed it
+                            game_elements, player, assets = _set_up_board(board_template, color, property_states,
+                                                                          house_limit_before_hotel, hotel_limit)
+                        expected = _act(action, player, assets[i], game_elements, reference=True)
+                        result = _act(action, player, assets[i], game_elements, reference=False)
+                        num_checks += 1
+                        if result != expected:
+                            mismatches.append('%s: %s on property %d gives %s, expected %s'
+                                              % (setting, action, i, result, expected))
+                        mismatches.extend([setting + ': after ' + action + ', ' + m
+                                           for m in _index_mismatches(game_elements)])
+                        if result and action != 'can be improved':
+                            game_elements = None
+                game_elements, player, assets = _set_up_board(board_template, color, property_states,
+                                                              house_limit_before_hotel, hotel_limit)
+                player.discharge_assets_to_bank(game_elements)
+                mismatches.extend([setting + ': after bankruptcy, ' + m for m in _index_mismatches(game_elements)])
+
+    # the houses limit is lowered on a monopoly, three houses are built on each property and then a hotel on each
+    game_elements, player, assets = _set_up_board(board_template, 'Brown', [(0, 0), (0, 0)], 3, 1)
+    for action, asset in [('add house', asset) for k in range(3) for asset in assets] + \
+                         [('add hotel', asset) for asset in assets]:
+        expected = _act(action, player, asset, game_elements, reference=True)
+        result = _act(action, player, asset, game_elements, reference=False)
+        num_checks += 1
+        if result != expected:
+            mismatches.append('Brown building sequence: %s on %s gives %s, expected %s'
+                              % (action, asset.name, result, expected))
+            break   # the rest of the sequence would start from a different board
+        mismatches.extend(['Brown building sequence: after ' + action + ', ' + m
+                           for m in _index_mismatches(game_elements)])
+    return num_checks, mismatches
+
+
+if __name__ == '__main__':
+    set_gameplay_logging(False)
+    num_checks, mismatches = check_improvement_levels()
+    for mismatch in mismatches:
+        print(mismatch)
+    print(str(num_checks) + ' checks, ' + str(len(mismatches)) + ' mismatches')
+    sys.exit(1 if mismatches else 0)
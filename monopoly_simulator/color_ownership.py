@@ -0,0 +1,132 @@
+"""
+An index of which player owns how many assets of every color, so that monopoly and lone-property questions (does the
+player own the full color set? is this the player's only asset of its color? would this asset complete the color set?)
+are answered without scanning the assets of the players or the color group.
+
+The index of a game board is current_gameboard['color_ownership'] (see set_up_color_ownership), and every player of the
+board holds it as player.color_ownership. It is kept up to date by Player.add_asset and Player.remove_asset (through
+which every change of ownership passes, e.g. Location.update_asset_owner) and by Player.discharge_assets_to_bank. A
+novelty that changes the colors of locations must call rebuild (see
+novelty_generator.InanimateAttributeNovelty.map_property_set_to_color).
+"""
+import logging
+logger = logging.getLogger('monopoly_simulator.logging_info.color_ownership')
+
+
+class ColorOwnership(object):
+    def __init__(self, players, color_assets):
+        """
+        A players x colors matrix of ownership counts (counts[row of player][column of color] is the number of assets of
+        that color the player owns), along with the set of players that own at least one asset of each color (holders).
+        :param players: A list of Player instances. Each gets a row of the matrix.
+        :param color_assets: A dict. The color_assets of the game board, with a color as key and the set of locations of
+        that color as value. It is kept by reference, so that the size of a color group is always the current one.
+        """
+        self.players = list(players)
+        self._color_assets = color_assets
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        Recount the matrix from the current colors and owners of the assets of the players. Needed after the colors of
+        locations have changed.
+        :return: None
+        """
+        self.colors = sorted(self._color_assets)
+        self._columns = dict([(color, column) for column, color in enumerate(self.colors)])
+        self.counts = [[0] * len(self.colors) for p in self.players]
+        self._rows = dict([(p, row) for p, row in zip(self.players, self.counts)])
+        self.holders = dict([(color, set()) for color in self.colors])
+        for p in self.players:
+            if p.assets:
+                for asset in p.assets:
+                    self.add(p, asset)
+
+    def add(self, player, asset):
+        """
+        Record that player now owns asset. Assets without a color are ignored.
+        :param player: A Player instance.
+        :param asset: A purchaseable Location instance.
+        :return: None
+        """
+        if asset.color is None:
+            return
+        self._rows[player][self._columns[asset.color]] += 1
+        self.holders[asset.color].add(player)
+
+    def remove(self, player, asset):
+        """
+        Record that player no longer owns asset. Assets without a color are ignored.
+        :param player: A Player instance.
+        :param asset: A purchaseable Location instance.
+        :return: None
+        """
+        if asset.color is None:
+            return
+        row = self._rows[player]
+        column = self._columns[asset.color]
+        row[column] -= 1
+        if row[column] == 0:
+            self.holders[asset.color].discard(player)
+
+    def remove_all(self, player):
+        """
+        Record that player no longer owns any asset (e.g., after discharging its assets to the bank).
+        :param player: A Player instance.
+        :return: None
+        """
+        row = self._rows[player]
+        for column, color in enumerate(self.colors):
+            row[column] = 0
+            self.holders[color].discard(player)
+
+    def count(self, player, color):
+        """
+        :param player: A Player instance.
+        :param color: A string.
+        :return: An integer. The number of assets of the color that player owns.
+        """
+        return self._rows[player][self._columns[color]]
+
+    def owns_color_set(self, player, color):
+        """
+        :param player: A Player instance.
+        :param color: A string.
+        :return: A boolean. True if player owns every asset of the color.
+        """
+        return self._rows[player][self._columns[color]] == len(self._color_assets[color])
+
+    def is_lone(self, player, asset):
+        """
+        :param player: A Player instance.
+        :param asset: A Location instance with a color.
+        :return: A boolean. True if player owns no asset of the color of asset other than asset itself.
+        """
+        others = self._rows[player][self._columns[asset.color]]
+        if asset.owned_by == player:
+            others -= 1
+        return others == 0
+
+    def completes_color_set(self, player, asset):
+        """
+        :param player: A Player instance.
+        :param asset: A Location instance with a color.
+        :return: A boolean. True if player owns every asset of the color of asset other than asset itself.
+        """
+        others = self._rows[player][self._columns[asset.color]]
+        if asset.owned_by == player:
+            others -= 1
+        return others == len(self._color_assets[asset.color]) - 1
+
+
+def set_up_color_ownership(game_elements):
+    """
+    Build the color ownership index of a game board from the assets its players currently own, and hand it to the
+    players.
+    :param game_elements: A dict. The global gameboard data structure
+    :return: None
+    """
+    color_ownership = ColorOwnership(game_elements['players'], game_elements['color_assets'])
+    game_elements['color_ownership'] = color_ownership
+    for p in game_elements['players']:
+        p.color_ownership = color_ownership
@@ -3,20 +3,54 @@ logger = logging.getLogger('monopoly_simulator.logging_info.diagnostics')
 """
 This file is imported into gameplay and primarily used for printing diagnostics. Expand as necessary for your own
 use cases.
+
+How much gets printed during a game is controlled by the diagnostics level (see set_diagnostics_level):
+'per_turn' prints net worths and cash balances on every turn (the default), 'end_of_game' only prints diagnostics when
+a player goes bankrupt and when the game ends, and 'off' prints nothing. The print_* functions do not compute anything
+when debug logging is disabled.
 """
 
+diagnostics_levels = {'off': 0, 'end_of_game': 1, 'per_turn': 2}
+_diagnostics_level = 'per_turn'
+
+
+def set_diagnostics_level(level):
+    """
+    Set the diagnostics level of the simulator.
+    :param level: A string. One of the keys of diagnostics_levels ('off', 'end_of_game' or 'per_turn')
+    :return: None
+    """
+    global _diagnostics_level
+    if level not in diagnostics_levels:
+        logger.error('Unknown diagnostics level %s', level)
+        logger.error("Exception")
+        raise Exception
+    _diagnostics_level = level
+
+
+def diagnostics_enabled(level):
+    """
+    Check if diagnostics of the given level should be printed, i.e. if the diagnostics level is at least level and the
+    diagnostics would actually get logged.
+    :param level: A string. One of the keys of diagnostics_levels.
+    :return: A boolean.
+    """
+    return diagnostics_levels[_diagnostics_level] >= diagnostics_levels[level] and logger.isEnabledFor(logging.DEBUG)
+
 def print_asset_owners(game_elements):
     """
     Print a list of all purchaseable assets, and who owns them.
     :param game_elements: A dict. Specifies global gameboard data structure
     :return: None
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     for k,v in game_elements['location_objects'].items():
         if v.loc_class == 'railroad' or v.loc_class == 'utility' or v.loc_class == 'real_estate':
             if v.owned_by == game_elements['bank']:
-                logger.debug('Owner of '+ k+ ' is bank')
+                logger.debug('Owner of %s is bank', k)
             else:
-                logger.debug('Owner of '+ k+ ' is '+v.owned_by.player_name)
+                logger.debug('Owner of %s is %s', k, v.owned_by.player_name)
 
 
 def print_player_cash_balances(game_elements):
@@ -26,9 +60,11 @@ def print_player_cash_balances(game_elements):
     :param game_elements: A dict. Specifies global gameboard data structure
     :return: None
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
 
     for p in game_elements['players']:
-        logger.debug(p.player_name+ ' has cash balance '+str(p.current_cash))
+        logger.debug('%s has cash balance %s', p.player_name, p.current_cash)
 
 
 def max_cash_balance(game_elements):
@@ -50,20 +86,11 @@ def print_player_net_worths_and_cash_bal(game_elements):
     :param game_elements: A dict. Specifies global gameboard data structure
     :return: None
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     for pl in game_elements['players']:
-        networth_p1ayer = 0
-        networth_p1ayer += pl.current_cash
-        if pl.assets:
-            for prop in pl.assets:
-                if prop.loc_class == 'real_estate':
-                    networth_p1ayer += prop.price
-                    networth_p1ayer += prop.num_houses*prop.price_per_house
-                    networth_p1ayer += prop.num_hotels*prop.price_per_house*(game_elements['bank'].house_limit_before_hotel + 1)
-                elif prop.loc_class == 'railroad':
-                    networth_p1ayer += prop.price
-                elif prop.loc_class == 'utility':
-                    networth_p1ayer += prop.price
-        logger.debug(pl.player_name + ' has a cash balance of $' + str(pl.current_cash) + ' and a net worth of $' + str(networth_p1ayer))
+        networth_p1ayer = pl.compute_net_worth(game_elements)
+        logger.debug('%s has a cash balance of $%s and a net worth of $%s', pl.player_name, pl.current_cash, networth_p1ayer)
 
 
 def print_player_net_worths(game_elements):
@@ -72,17 +99,8 @@ def print_player_net_worths(game_elements):
     :param game_elements: A dict. Specifies global gameboard data structure
     :return: None
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     for pl in game_elements['players']:
-        networth_p1ayer = 0
-        networth_p1ayer += pl.current_cash
-        if pl.assets:
-            for prop in pl.assets:
-                if prop.loc_class == 'real_estate':
-                    networth_p1ayer += prop.price
-                    networth_p1ayer += prop.num_houses*prop.price_per_house
-                    networth_p1ayer += prop.num_hotels*prop.price_per_house*(game_elements['bank'].house_limit_before_hotel + 1)
-                elif prop.loc_class == 'railroad':
-                    networth_p1ayer += prop.price
-                elif prop.loc_class == 'utility':
-                    networth_p1ayer += prop.price
-        logger.debug(pl.player_name + ' has a net worth of ' + str(networth_p1ayer))
+        networth_p1ayer = pl.compute_net_worth(game_elements)
+        logger.debug('%s has a net worth of %s', pl.player_name, networth_p1ayer)
@@ -1,4 +1,5 @@
 class Dice(object):
+    __slots__ = ('die_state', 'die_state_distribution', 'die_type')
 
     def __init__(self, die_state):
         """
@@ -0,0 +1,173 @@
+"""
+An experiment manifest declares a grid of game configurations x agents x seeds, which test_harness.play_experiment_grid
+plays out. A manifest is a json file like ../example_experiment_manifest.json, with the keys
+
+    name: the name of the experiment. Its games are logged in ../tournament_logs/<name>/
+    configurations: a dict from a configuration name to a list of steps, applied to the game board in order before the
+    game starts. An empty list is the unmodified game. A step is one of
+        {"bank": {"jail_fine": 100, ...}}: set attributes of the Bank (see bank.py)
+        {"gameboard": {"go_increment": 300, ...}}: set entries of the game board
+        {"novelty": "InanimateAttributeNovelty.rent_novelty", "args": {...}}: call a novelty_generator method. Arguments
+        that take locations (see _location_arguments) are given as location names; current_gameboard is passed in
+        automatically if the method takes it.
+    agents: a dict from an agent set name to either the name of an agent module (used by all players) or a dict from
+    player name to agent module name
+    seeds: a list of game seeds, or instead
+    meta_seed and num_seeds: the seeds are generated as in the tournaments of test_harness.py (see
+    tournament_helper.tournament_seeds)
+    novelty_info (optional, default false): whether the agents are notified of novelty in the configured games
+    budget (optional): the budget of every game (see game_budget.py)
+    hang_timeout (optional): seconds after which a game is taken to hang (see tournament_helper.play_games_in_pool)
+
+Every combination of a configuration, an agent set and a seed is a cell of the grid. Cells that are the same game (e.g.,
+two configurations with the same steps, such as the baseline listed under two names) are only played once.
+"""
+import csv
+import inspect
+import json
+from monopoly_simulator import tournament_helper
+from monopoly_simulator import novelty_generator
+from monopoly_simulator.bank import Bank
+import logging
+logger = logging.getLogger('monopoly_simulator.logging_info.experiment_grid')
+
+_location_arguments = ['location', 'tax_location', 'property', 'property_1', 'property_2', 'property_set']
+
+results_table_columns = ['configuration', 'agents', 'seed', 'player', 'agent', 'seat', 'rank', 'won', 'final_cash',
+                         'num_turns', 'forced_termination', 'truncated', 'log_file']
+
+
+class ExperimentConfiguration(object):
+    def __init__(self, steps):
+        """
+        A game configuration of an experiment manifest, callable as a novelty injection function.
+        :param steps: A list of steps (see the module docstring).
+        """
+        self.steps = steps
+
+    def __call__(self, current_gameboard):
+        for step in self.steps:
+            if 'bank' in step:
+                for attribute, value in step['bank'].items():
+                    setattr(current_gameboard['bank'], attribute, value)
+            elif 'gameboard' in step:
+                current_gameboard.update(step['gameboard'])
+            else:
+                class_name, method_name = step['novelty'].split('.')
+                novelty_method = getattr(getattr(novelty_generator, class_name)(), method_name)
+                kwargs = dict(step.get('args', dict()))
+                for argument in _location_arguments:
+                    if isinstance(kwargs.get(argument), str):
+                        kwargs[argument] = current_gameboard['location_objects'][kwargs[argument]]
+                    elif isinstance(kwargs.get(argument), list):
+                        kwargs[argument] = [current_gameboard['location_objects'][l] for l in kwargs[argument]]
+                if 'current_gameboard' in inspect.signature(novelty_method).parameters:
+                    kwargs['current_gameboard'] = current_gameboard
+                novelty_method(**kwargs)
+
+    def __repr__(self):
+        # two configurations with the same steps are the same game, whatever they are called
+        return json.dumps(self.steps, sort_keys=True)
+
+
+def read_manifest(manifest_file):
+    """
+    Read an experiment manifest and check it, so that a mistake in it is reported before any game is played.
+    :param manifest_file: A string. Path of the manifest json file.
+    :return: A dict. The manifest, with the agent sets expanded to dicts from player name to agent module name, and the
+    seeds generated if they were given as meta_seed and num_seeds.
+    """
+    with open(manifest_file, 'r') as infile:
+        manifest = json.load(infile)
+    for key in ['name', 'configurations', 'agents']:
+        if key not in manifest:
+            logger.error('The experiment manifest has no %s', key)
+            logger.error("Exception")
+            raise Exception
+
+    bank = Bank()
+    for configuration_name, steps in manifest['configurations'].items():
+        for step in steps:
+            if 'bank' in step:
+                for attribute in step['bank']:
+                    if not hasattr(bank, attribute):
+                        logger.error('Configuration %s sets %s, which is not a Bank attribute', configuration_name,
+                                     attribute)
+                        logger.error("Exception")
+                        raise Exception
+            elif 'novelty' in step:
+                class_name, method_name = step['novelty'].split('.')
+                if not hasattr(getattr(novelty_generator, class_name, None), method_name):
+                    logger.error('Configuration %s uses %s, which is not a novelty_generator method', configuration_name,
+                                 step['novelty'])
+                    logger.error("Exception")
+                    raise Exception
+            elif 'gameboard' not in step:
+                logger.error('Configuration %s has a step that is not a bank, gameboard or novelty step',
+                             configuration_name)
+                logger.error("Exception")
+                raise Exception
+
+    player_names = ['player_1', 'player_2', 'player_3', 'player_4']
+    for agents_name, agents in list(manifest['agents'].items()):
+        if isinstance(agents, str):
+            manifest['agents'][agents_name] = dict([(player_name, agents) for player_name in player_names])
+
+    if 'seeds' not in manifest:
+        manifest['seeds'] = tournament_helper.tournament_seeds(manifest['meta_seed'], manifest['num_seeds'])
+    manifest['novelty_info'] = manifest.get('novelty_info', False)
+    manifest['budget'] = manifest.get('budget')
+    manifest['hang_timeout'] = manifest.get('hang_timeout')
+    return manifest
+
+
+def experiment_cells(manifest):
+    """
+    :param manifest: A dict. The output of read_manifest.
+    :return: A tuple (cells, games). cells is a list of tuples (configuration name, agent set name, seed, game index),
+    one per cell of the grid, and games is a list of the distinct games, as tuples (seed, configuration, agent modules)
+    where configuration is an ExperimentConfiguration or None (for the unmodified game). game index is the index of
+    the game of a cell in games.
+    """
+    cells = list()
+    games = list()
+    game_indexes = dict()   # key is a tuple identifying a game, and value is its index in games
+    for configuration_name in sorted(manifest['configurations']):
+        steps = manifest['configurations'][configuration_name]
+        for agents_name in sorted(manifest['agents']):
+            agent_modules = manifest['agents'][agents_name]
+            for seed in manifest['seeds']:
+                key = (json.dumps(steps, sort_keys=True), json.dumps(agent_modules, sort_keys=True), seed)
+                if key not in game_indexes:
+                    game_indexes[key] = len(games)
+                    configuration = ExperimentConfiguration(steps) if steps else None
+                    games.append((seed, configuration, agent_modules))
+                cells.append((configuration_name, agents_name, seed, game_indexes[key]))
+    return cells, games
+
+
+def write_results_table(filename, manifest, cells, summaries, log_filenames):
+    """
+    Write the results of an experiment as a tidy csv table, with one row per cell and player and the columns in
+    results_table_columns.
+    :param filename: A string. Path of the csv file.
+    :param manifest: A dict. The output of read_manifest.
+    :param cells: A list of cells, see experiment_cells.
+    :param summaries: A list of game summaries (see game_summary.py), one per game of experiment_cells.
+    :param log_filenames: A list of log file paths, one per game of experiment_cells.
+    :return: None
+    """
+    with open(filename, 'w', newline='') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(results_table_columns)
+        for configuration_name, agents_name, seed, game_index in cells:
+            summary = summaries[game_index]
+            hung = summary['truncated'] == 'hung'   # a game that never finished has no seats, ranks or cash
+            for player_name in sorted(manifest['agents'][agents_name]):
+                writer.writerow([configuration_name, agents_name, seed, player_name,
+                                 manifest['agents'][agents_name][player_name],
+                                 '' if hung else summary['seat_order'].index(player_name) + 1,
+                                 '' if hung else summary['rank_order'].index(player_name) + 1,
+                                 int(summary['winner'] == player_name), summary['final_cash'].get(player_name, ''),
+                                 summary['num_turns'], int(summary['forced_termination']), summary['truncated'] or '',
+                                 log_filenames[game_index]])
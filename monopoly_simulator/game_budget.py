@@ -0,0 +1,110 @@
+"""
+Per-game budgets, so that a single game (e.g., one with an agent stuck in a loop of useless moves) cannot stall a
+tournament. A game budget is a dict with any of the keys
+
+    max_seconds: wall clock time the game may take
+    max_turns: number of turns the game may last
+    max_agent_calls: number of calls the game may make to the decision functions of the agents (summed over all players)
+
+Keys that are missing (or None) are not limited. The budget is checked by card_utility_actions.check_for_game_termination
+at the end of every turn, and once it runs out, the game terminates like it does when a player exceeds the runaway cash
+limit: the winner is found by card_utility_actions.check_for_winner, and the game summary records which budget ran out
+in 'truncated'.
+
+Budgets are checked between turns, so they cannot interrupt an agent that never returns from a decision. For tournaments
+over a pool of workers, tournament_helper.play_games_in_pool takes a hang_timeout for that, after which the worker
+playing the game is killed and replaced.
+"""
+import functools
+import logging
+logger = logging.getLogger('monopoly_simulator.logging_info.game_budget')
+
+budget_keys = ['max_seconds', 'max_turns', 'max_agent_calls']
+
+_agent_decision_functions = ['handle_negative_cash_balance', 'make_pre_roll_move', 'make_out_of_turn_move',
+                             'make_post_roll_move', 'make_buy_property_decision', 'make_bid']
+
+
+def start_game_budget(game_elements, game_budget):
+    """
+    Set up the budget of a game that is about to start. If the number of agent calls is limited, the decision functions
+    of the agents are wrapped to count their calls, until end_game_budget restores them.
+    :param game_elements: A dict. The global gameboard data structure
+    :param game_budget: A dict or None. The game budget (see the module docstring). None means no limits.
+    :return: None
+    """
+    if game_budget:
+        for key in game_budget:
+            if key not in budget_keys:
+                logger.error('Unknown game budget %s', key)
+                logger.error("Exception")
+                raise Exception
+    game_elements.game_budget = game_budget
+    game_elements.budget_usage = {'turns': 0, 'agent_calls': 0}
+    game_elements['truncated'] = None
+    if game_budget and game_budget.get('max_agent_calls') is not None:
+        agents = dict()
+        for p in game_elements.players:
+            agents[id(p.agent)] = p.agent   # players may share an agent, which must only be wrapped once
+        for agent in agents.values():
+            for function_name in _agent_decision_functions:
+                decision_function = _uncounted(getattr(agent, function_name))
+                setattr(agent, function_name, _count_calls(decision_function, game_elements.budget_usage))
+
+
+def end_game_budget(game_elements):
+    """
+    Restore the decision functions of the agents that start_game_budget wrapped, so that agents reused in another game
+    do not keep counting their calls into the budget usage of this one.
+    :param game_elements: A dict. The global gameboard data structure
+    :return: None
+    """
+    for p in game_elements.players:
+        for function_name in _agent_decision_functions:
+            decision_function = getattr(p.agent, function_name)
+            if hasattr(decision_function, 'budget_usage'):
+                setattr(p.agent, function_name, _uncounted(decision_function))
+
+
+def _count_calls(decision_function, budget_usage):
+    """
+    :param decision_function: A decision function of an agent.
+    :param budget_usage: A dict. The budget usage of the game, whose 'agent_calls' gets incremented on every call.
+    :return: A function that counts its calls and otherwise behaves (and gets recorded in the game history) like
+    decision_function.
+    """
+    @functools.wraps(decision_function)
+    def counted_decision_function(*args, **kwargs):
+        budget_usage['agent_calls'] += 1
+        return decision_function(*args, **kwargs)
+    counted_decision_function.budget_usage = budget_usage
+    return counted_decision_function
+
+
+def _uncounted(decision_function):
+    """
+    :param decision_function: A decision function of an agent, possibly wrapped by _count_calls (once or more).
+    :return: The decision function without any of the wrappers of _count_calls.
+    """
+    while hasattr(decision_function, 'budget_usage'):
+        decision_function = decision_function.__wrapped__
+    return decision_function
+
+
+def exhausted_budget(current_gameboard, tot_time):
+    """
+    :param current_gameboard: A dict. The global gameboard data structure
+    :param tot_time: A float. The time the game has taken so far, in seconds.
+    :return: A string. The key of the budget that has run out, or None if the game is within its budget (or has none).
+    """
+    game_budget = current_gameboard.game_budget
+    if not game_budget:
+        return None
+    budget_usage = current_gameboard.budget_usage
+    if game_budget.get('max_seconds') is not None and tot_time >= game_budget['max_seconds']:
+        return 'max_seconds'
+    if game_budget.get('max_turns') is not None and budget_usage['turns'] >= game_budget['max_turns']:
+        return 'max_turns'
+    if game_budget.get('max_agent_calls') is not None and budget_usage['agent_calls'] >= game_budget['max_agent_calls']:
+        return 'max_agent_calls'
+    return None
@@ -0,0 +1,92 @@
+"""
+The global game board data structure (game_elements, or current_gameboard as most functions call it). It used to be a
+plain dict with string keys, and it still is one: GameState is a dict, so agents and any other code that index it
+(current_gameboard['bank'], 'auxiliary_check' in current_gameboard etc.) keep working unchanged. In addition, the core
+fields (see core_fields) that the simulator reads many times per move are also held in slots, so the simulator itself
+reads current_gameboard.bank, current_gameboard.history etc. instead of looking them up by key.
+
+A core field is kept in sync whichever way it is set (current_gameboard['bank'] = ... or current_gameboard.bank = ...)
+or removed. A core field that the game board does not have reads as None through its attribute; this is how optional
+fields such as the auxiliary checks (that some novelties install) are tested for. Fields that are not core fields can
+only be set as items.
+"""
+import logging
+logger = logging.getLogger('monopoly_simulator.logging_info.game_state')
+
+core_fields = ('bank', 'players', 'location_sequence', 'location_objects', 'history', 'dies', 'color_assets',
+               'go_position', 'go_increment', 'jail_position', 'railroad_positions', 'utility_positions',
+               'current_die_total', 'die_sequence', 'dice_rng', 'move_player_after_die_roll', 'chance_cards',
+               'community_chest_cards', 'landing_table', 'player_objects', 'players_over_cash_limit', 'game_budget',
+               'budget_usage', 'color_ownership', 'auxiliary_check', 'auxiliary_check_for_go',
+               'auxiliary_before_pre_roll_check', 'auxiliary_after_pre_roll_check', 'auxiliary_before_out_of_turn_check', 'auxiliary_after_out_of_turn_check',
+               'auxiliary_before_post_roll_check', 'auxiliary_after_post_roll_check')
+
+_core_field_set = frozenset(core_fields)
+
+
+class GameState(dict):
+    __slots__ = core_fields
+
+    def __init__(self, *args, **kwargs):
+        """
+        A game board. It takes the same arguments as dict.
+        """
+        super().__init__()
+        for name in core_fields:
+            object.__setattr__(self, name, None)
+        self.update(*args, **kwargs)
+
+    def __setattr__(self, name, value):
+        if name not in _core_field_set:
+            logger.debug('%s is not a core field of the game board. Set it as current_gameboard[%s] instead.', name, name)
+            logger.error("Exception")
+            raise AttributeError(name)
+        dict.__setitem__(self, name, value)
+        object.__setattr__(self, name, value)
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        if key in _core_field_set:
+            object.__setattr__(self, key, value)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        if key in _core_field_set:
+            object.__setattr__(self, key, None)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        value = dict.pop(self, key, *default)
+        if key in _core_field_set:
+            object.__setattr__(self, key, None)
+        return value
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        if key in _core_field_set:
+            object.__setattr__(self, key, None)
+        return key, value
+
+    def clear(self):
+        dict.clear(self)
+        for name in core_fields:
+            object.__setattr__(self, name, None)
+
+    def copy(self):
+        return GameState(self)
+
+    def __reduce__(self):
+        # pickled (and deep copied) as its items, from which the slots are set again
+        return GameState, (dict(self),)
@@ -0,0 +1,107 @@
+"""
+A game summary is a small dict that records the outcome of a game as it ends, so that tournament metrics (see
+metrics_helper.py) can be computed without reading the gameplay logs. A summary has the following keys:
+
+    game_seed: the seed the game was played with
+    winner: name of the winning player (None if there was no winner)
+    rank_order: all player names, from first to last. Players still in the game at the end come first (the winner, and then
+    by decreasing net worth), followed by the bankrupt players, the last one to go bankrupt first.
+    bankruptcies: names of the players that went bankrupt, in the order in which they did
+    seat_order: all player names, in the order in which they took their turns
+    num_turns: the number of turns played
+    num_die_rolls: the number of times the dice were rolled
+    forced_termination: True if the game was ended by a game termination condition rather than by all but one player
+    going bankrupt
+    truncated: None, or the budget (see game_budget.py) that ran out if the game was terminated because of it. 'hung' if
+    the game never finished and its worker process was killed (see tournament_helper.play_games_in_pool); such a game
+    has no winner and its rank_order, seat_order and final_cash are empty.
+    final_cash: a dict with player names as keys and their cash at the end of the game as values
+
+Summaries are written as (compact) json, one file per game, next to the game's log file (see summary_filename).
+"""
+import json
+import os
+
+
+def build_game_summary(game_elements, winner, bankruptcies, num_turns, num_die_rolls, forced_termination):
+    """
+    :param game_elements: A dict. The game board at the end of the game.
+    :param winner: A Player instance or None.
+    :param bankruptcies: A list of Player instances, in the order in which they went bankrupt.
+    :param num_turns: An integer.
+    :param num_die_rolls: An integer.
+    :param forced_termination: A boolean.
+    :return: A dict. The game summary.
+    """
+    bankrupt_names = [p.player_name for p in bankruptcies]
+    remaining_players = [p for p in game_elements['players'] if p.player_name not in bankrupt_names and p is not winner]
+    remaining_players.sort(key=lambda p: (p.compute_net_worth(game_elements), p.current_cash), reverse=True)
+    rank_order = [p.player_name for p in remaining_players]
+    if winner is not None:
+        rank_order.insert(0, winner.player_name)
+    rank_order.extend(reversed(bankrupt_names))
+
+    summary = dict()
+    summary['game_seed'] = game_elements['seed']
+    summary['winner'] = winner.player_name if winner is not None else None
+    summary['rank_order'] = rank_order
+    summary['bankruptcies'] = bankrupt_names
+    summary['seat_order'] = [p.player_name for p in game_elements['players']]
+    summary['num_turns'] = num_turns
+    summary['num_die_rolls'] = num_die_rolls
+    summary['forced_termination'] = forced_termination
+    summary['truncated'] = game_elements.get('truncated')
+    summary['final_cash'] = dict([(p.player_name, p.current_cash) for p in game_elements['players']])
+    return summary
+
+
+def summary_filename(log_filename):
+    """
+    :param log_filename: A string. Path of a game log file, e.g. '../tournament_logs/t/seed_5.log'
+    :return: A string. Path of the corresponding summary file, e.g. '../tournament_logs/t/seed_5.summary.json'
+    """
+    if log_filename.endswith('.log'):
+        log_filename = log_filename[:-len('.log')]
+    return log_filename + '.summary.json'
+
+
+def write_game_summary(summary, filename):
+    """
+    Write the summary to file. The summary is first written to a temporary file that is then renamed, so a summary file
+    that exists is always complete.
+    :param summary: A dict. The game summary.
+    :param filename: A string. Path of the summary file.
+    :return: None
+    """
+    temp_filename = filename + '.tmp'
+    with open(temp_filename, 'w') as outfile:
+        json.dump(summary, outfile, separators=(',', ':'))
+    os.replace(temp_filename, filename)
+
+
+def read_game_summary(filename):
+    """
+    :param filename: A string. Path of the summary file.
+    :return: A dict. The game summary.
+    """
+    with open(filename, 'r') as infile:
+        return json.load(infile)
+
+
+def build_hung_game_summary(game_seed):
+    """
+    :param game_seed: An integer. The seed of a game that never finished.
+    :return: A dict. The game summary of the game, marked as truncated with 'hung'.
+    """
+    summary = dict()
+    summary['game_seed'] = game_seed
+    summary['winner'] = None
+    summary['rank_order'] = []
+    summary['bankruptcies'] = []
+    summary['seat_order'] = []
+    summary['num_turns'] = None
+    summary['num_die_rolls'] = None
+    summary['forced_termination'] = True
+    summary['truncated'] = 'hung'
+    summary['final_cash'] = dict()
+    return summary
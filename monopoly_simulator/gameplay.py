@@ -1,6 +1,5 @@
 from monopoly_simulator import initialize_game_elements
 from monopoly_simulator.action_choices import roll_die
-import numpy as np
 from monopoly_simulator import card_utility_actions
 from monopoly_simulator import background_agent_v3_1
 from monopoly_simulator import read_write_current_state
@@ -8,268 +7,272 @@ import json
 from monopoly_simulator import novelty_generator
 from monopoly_simulator import diagnostics
 from monopoly_simulator.agent import Agent
-import xlsxwriter
+from monopoly_simulator import history_sink
+from monopoly_simulator import game_summary
+from monopoly_simulator import outcome_cache
+from monopoly_simulator import game_budget
 from monopoly_simulator.flag_config import flag_config_dict
 from monopoly_simulator.logging_info import log_file_create
 import os
 import time
+import importlib
 import logging
 logger = logging.getLogger('monopoly_simulator.logging_info')
 
 
-def write_history_to_file(game_board, workbook):
-    worksheet = workbook.add_worksheet()
-    col = 0
-    for key in game_board['history']:
-        if key == 'param':
-            col += 1
-            row = 0
-            worksheet.write(row, col, key)
-            worksheet.write(row, col + 1, 'current_player')
-            for item in game_board['history'][key]:
-                worksheet.write(row + 1, col, str(item))
-                try:
-                    worksheet.write(row + 1, col + 1, item['player'].player_name)
-                except:
-                    pass
-                row += 1
-            col += 1
-        else:
-            col += 1
-            row = 0
-            worksheet.write(row, col, key)
-            for item in game_board['history'][key]:
-                worksheet.write(row + 1, col, str(item))
-                row += 1
-    workbook.close()
-    print("History logged into history_log.xlsx file.")
-
-
 def disable_history(game_elements):
-    game_elements['history'] = dict()
-    game_elements['history']['function'] = list()
-    game_elements['history']['param'] = list()
-    game_elements['history']['return'] = list()
+    game_elements.history.clear()
 
 
-def simulate_game_instance(game_elements, history_log_file=None, np_seed=2):
+def simulate_game_instance(game_elements, history_log_file=None, np_seed=2, legacy_card_draws=False, summary_file=None,
+                           seat_order=None, budget=None):
     """
     Simulate a game instance.
     :param game_elements: The dict output by set_up_board
-    :param np_seed: The numpy seed to use to control randomness.
-    :return: None
+    :param history_log_file: A string or None. If specified, the game history is written to this file as the game is
+    played. The format is determined by the file name (.jsonl, .csv or .xlsx, see history_sink.open_history_sink).
+    :param np_seed: The numpy seed to use to control randomness. It seeds the per-game generators set up by
+    initialize_game_elements.initialize_random_generators; the global numpy random state is not touched.
+    :param legacy_card_draws: If True, cards are drawn exactly the way older versions of the simulator drew them, so that
+    the card sequence of an old seed is reproduced.
+    :param summary_file: A string or None. If specified, a summary of the game (see game_summary.py) is written to this
+    file when the game ends. The summary is also stored in game_elements['game_summary'] either way.
+    :param seat_order: A list of player names or None. If specified, the players take their turns in this order instead
+    of a shuffled one. The dice and card streams of np_seed do not depend on the order, so playing a seed under
+    different seat orders gives every order the same dice rolls and card draws (see
+    test_harness.play_seat_rotation_tournament).
+    :param budget: A dict or None. The wall clock, turn and agent call budget of the game (see game_budget.py). If it
+    runs out, the game is terminated, the winner is decided by net worth and the summary records the game as truncated.
+    :return: String. The name of the winner, or None
     """
-    logger.debug("size of board " + str(len(game_elements['location_sequence'])))
-    np.random.seed(np_seed)
-    np.random.shuffle(game_elements['players'])
-    game_elements['seed'] = np_seed
-    game_elements['card_seed'] = np_seed
-    game_elements['choice_function'] = np.random.choice
+    logger.debug("size of board %s", len(game_elements.location_sequence))
+    initialize_game_elements.initialize_random_generators(game_elements, np_seed, legacy_card_draws)
+    if seat_order:
+        seat_index = dict([(player_name, i) for i, player_name in enumerate(seat_order)])
+        game_elements.players.sort(key=lambda p: seat_index[p.player_name])
+    else:
+        game_elements['player_shuffle_rng'].shuffle(game_elements.players)
+    game_budget.start_game_budget(game_elements, budget)
     count_json = 0   # a counter to keep track of how many rounds the game has to be played before storing the current_state of gameboard to file.
     num_die_rolls = 0
+    num_turns = 0
+    bankruptcies = list()
+    forced_termination = False
     tot_time = 0
-    # game_elements['go_increment'] = 100 # we should not be modifying this here. It is only for testing purposes.
+    # game_elements.go_increment = 100 # we should not be modifying this here. It is only for testing purposes.
     # One reason to modify go_increment is if your decision agent is not aggressively trying to monopolize. Since go_increment
     # by default is 200 it can lead to runaway cash increases for simple agents like ours.
 
     logger.debug(
-        'players will play in the following order: ' + '->'.join([p.player_name for p in game_elements['players']]))
+        'players will play in the following order: %s', '->'.join([p.player_name for p in game_elements.players]))
     logger.debug('Beginning play. Rolling first die...')
     current_player_index = 0
     num_active_players = 4
     winner = None
-    workbook = None
     if history_log_file:
-        workbook = xlsxwriter.Workbook(history_log_file)
+        game_elements.history.sink = history_sink.open_history_sink(history_log_file)
     game_elements['start_time'] = time.time()
-    while num_active_players > 1:
-        disable_history(
-            game_elements)  # comment this out when you want history to stay. Currently, it has high memory consumption, we are working to solve the problem (most likely due to deep copy run-off).
-        current_player = game_elements['players'][current_player_index]
-        while current_player.status == 'lost':
-            current_player_index += 1
-            current_player_index = current_player_index % len(game_elements['players'])
-            current_player = game_elements['players'][current_player_index]
-        current_player.status = 'current_move'
-
-        # pre-roll for current player + out-of-turn moves for everybody else,
-        # till we get num_active_players skip turns in a row.
-
-        skip_turn = 0
-        if current_player.make_pre_roll_moves(game_elements) == 2:  # 2 is the special skip-turn code
-            skip_turn += 1
-        out_of_turn_player_index = current_player_index + 1
-        out_of_turn_count = 0
-        while skip_turn != num_active_players and out_of_turn_count <= 5:  ##oot count reduced to 20 from 200 to keep the game short
-            out_of_turn_count += 1
-            # print('checkpoint 1')
-            out_of_turn_player = game_elements['players'][out_of_turn_player_index % len(game_elements['players'])]
-            if out_of_turn_player.status == 'lost':
+    try:
+        while num_active_players > 1:
+            num_turns += 1
+            game_elements.budget_usage['turns'] = num_turns
+            current_player = game_elements.players[current_player_index]
+            while current_player.status == 'lost':
+                current_player_index += 1
+                current_player_index = current_player_index % len(game_elements.players)
+                current_player = game_elements.players[current_player_index]
+            current_player.status = 'current_move'
+
+            # pre-roll for current player + out-of-turn moves for everybody else,
+            # till we get num_active_players skip turns in a row.
+
+            skip_turn = 0
+            if current_player.make_pre_roll_moves(game_elements) == 2:  # 2 is the special skip-turn code
+                skip_turn += 1
+            out_of_turn_player_index = current_player_index + 1
+            out_of_turn_count = 0
+            while skip_turn != num_active_players and out_of_turn_count <= 5:  ##oot count reduced to 20 from 200 to keep the game short
+                out_of_turn_count += 1
+                # print('checkpoint 1')
+                out_of_turn_player = game_elements.players[out_of_turn_player_index % len(game_elements.players)]
+                if out_of_turn_player.status == 'lost':
+                    out_of_turn_player_index += 1
+                    continue
+
+                oot_code = out_of_turn_player.make_out_of_turn_moves(game_elements)
+                # add to game history
+                game_elements.history['function'].append(out_of_turn_player.make_out_of_turn_moves)
+                params = dict()
+                params['self'] = out_of_turn_player
+                params['current_gameboard'] = game_elements
+                game_elements.history['param'].append(params)
+                game_elements.history['return'].append(oot_code)
+
+                if oot_code == 2:
+                    skip_turn += 1
+                else:
+                    skip_turn = 0
                 out_of_turn_player_index += 1
-                continue
 
-            oot_code = out_of_turn_player.make_out_of_turn_moves(game_elements)
-            # add to game history
-            game_elements['history']['function'].append(out_of_turn_player.make_out_of_turn_moves)
-            params = dict()
-            params['self'] = out_of_turn_player
-            params['current_gameboard'] = game_elements
-            game_elements['history']['param'].append(params)
-            game_elements['history']['return'].append(oot_code)
+            # now we roll the dice and get into the post_roll phase,
+            # but only if we're not in jail.
+            # but only if we're not in jail.
 
-            if oot_code == 2:
-                skip_turn += 1
-            else:
-                skip_turn = 0
-            out_of_turn_player_index += 1
-
-        # now we roll the dice and get into the post_roll phase,
-        # but only if we're not in jail.
-        # but only if we're not in jail.
-
-        logger.debug("Printing cash balance and net worth of each player: ")
-        diagnostics.print_player_net_worths_and_cash_bal(game_elements)
-
-        r = roll_die(game_elements['dies'], np.random.choice)
-        for i in range(len(r)):
-            game_elements['die_sequence'][i].append(r[i])
-
-        # add to game history
-        game_elements['history']['function'].append(roll_die)
-        params = dict()
-        params['die_objects'] = game_elements['dies']
-        params['choice'] = np.random.choice
-        game_elements['history']['param'].append(params)
-        game_elements['history']['return'].append(r)
-
-        num_die_rolls += 1
-        game_elements['current_die_total'] = sum(r)
-        logger.debug('dies have come up ' + str(r))
-        if not current_player.currently_in_jail:
-            check_for_go = True
-            game_elements['move_player_after_die_roll'](current_player, sum(r), game_elements, check_for_go)
-            # add to game history
-            game_elements['history']['function'].append(game_elements['move_player_after_die_roll'])
-            params = dict()
-            params['player'] = current_player
-            params['rel_move'] = sum(r)
-            params['current_gameboard'] = game_elements
-            params['check_for_go'] = check_for_go
-            game_elements['history']['param'].append(params)
-            game_elements['history']['return'].append(None)
-
-            current_player.process_move_consequences(game_elements)
-            # add to game history
-            game_elements['history']['function'].append(current_player.process_move_consequences)
-            params = dict()
-            params['self'] = current_player
-            params['current_gameboard'] = game_elements
-            game_elements['history']['param'].append(params)
-            game_elements['history']['return'].append(None)
+            if diagnostics.diagnostics_enabled('per_turn'):
+                logger.debug("Printing cash balance and net worth of each player: ")
+                diagnostics.print_player_net_worths_and_cash_bal(game_elements)
+
+            r = roll_die(game_elements.dies, game_elements.dice_rng.choice)
+            for i in range(len(r)):
+                game_elements.die_sequence[i].append(r[i])
 
-            # post-roll for current player. No out-of-turn moves allowed at this point.
-            current_player.make_post_roll_moves(game_elements)
             # add to game history
-            game_elements['history']['function'].append(current_player.make_post_roll_moves)
+            game_elements.history['function'].append(roll_die)
             params = dict()
-            params['self'] = current_player
-            params['current_gameboard'] = game_elements
-            game_elements['history']['param'].append(params)
-            game_elements['history']['param'].append(params)
-            game_elements['history']['return'].append(None)
+            params['die_objects'] = game_elements.dies
+            params['choice'] = game_elements.dice_rng.choice
+            game_elements.history['param'].append(params)
+            game_elements.history['return'].append(r)
+
+            num_die_rolls += 1
+            game_elements.current_die_total = sum(r)
+            logger.debug('dies have come up %s', r)
+            if not current_player.currently_in_jail:
+                check_for_go = True
+                game_elements.move_player_after_die_roll(current_player, sum(r), game_elements, check_for_go)
+                # add to game history
+                game_elements.history['function'].append(game_elements.move_player_after_die_roll)
+                params = dict()
+                params['player'] = current_player
+                params['rel_move'] = sum(r)
+                params['current_gameboard'] = game_elements
+                params['check_for_go'] = check_for_go
+                game_elements.history['param'].append(params)
+                game_elements.history['return'].append(None)
 
-        else:
-            current_player.currently_in_jail = False  # the player is only allowed to skip one turn (i.e. this one)
+                current_player.process_move_consequences(game_elements)
+                # add to game history
+                game_elements.history['function'].append(current_player.process_move_consequences)
+                params = dict()
+                params['self'] = current_player
+                params['current_gameboard'] = game_elements
+                game_elements.history['param'].append(params)
+                game_elements.history['return'].append(None)
 
-        if current_player.current_cash < 0:
-            code = current_player.handle_negative_cash_balance(game_elements)
-            # add to game history
-            game_elements['history']['function'].append(current_player.handle_negative_cash_balance)
-            params = dict()
-            params['self'] = current_player
-            params['current_gameboard'] = game_elements
-            game_elements['history']['param'].append(params)
-            game_elements['history']['return'].append(code)
-            if code == flag_config_dict['failure_code'] or current_player.current_cash < 0:
-                current_player.begin_bankruptcy_proceedings(game_elements)
+                # post-roll for current player. No out-of-turn moves allowed at this point.
+                current_player.make_post_roll_moves(game_elements)
                 # add to game history
-                game_elements['history']['function'].append(current_player.begin_bankruptcy_proceedings)
+                game_elements.history['function'].append(current_player.make_post_roll_moves)
                 params = dict()
                 params['self'] = current_player
                 params['current_gameboard'] = game_elements
-                game_elements['history']['param'].append(params)
-                game_elements['history']['return'].append(None)
-
-                num_active_players -= 1
-                diagnostics.print_asset_owners(game_elements)
-                diagnostics.print_player_cash_balances(game_elements)
-
-                if num_active_players == 1:
-                    for p in game_elements['players']:
-                        if p.status != 'lost':
-                            winner = p
-                            p.status = 'won'
+                game_elements.history['param'].append(params)
+                game_elements.history['return'].append(None)
+
             else:
-                current_player.status = 'waiting_for_move'
-        else:
-            current_player.status = 'waiting_for_move'
-
-        current_player_index = (current_player_index + 1) % len(game_elements['players'])
-        tot_time = time.time() - game_elements['start_time']
-
-        if card_utility_actions.check_for_game_termination(game_elements, tot_time):
-            # game terminates if check_for_game_termination returns true.
-            # We print some diagnostics and return if any player exceeds this.
-            diagnostics.print_asset_owners(game_elements)
-            diagnostics.print_player_cash_balances(game_elements)
-            logger.debug("Game ran for " + str(tot_time) + " seconds.")
-            break
-
-        #This is an example of how you may want to write out gameboard state to file.
-        #Uncomment the following piece of code to write out the gameboard current_state to file at the "count_json" iteration.
-        #All the data from game_elements will be written to a .json file which can be read back to intialize a new game with
-        #those gameboard values to start the game from that point onwards.
-        '''
-        if count_json == 50:
-            outfile = '../current_gameboard_state.json'
-            oot_code = read_write_current_state.write_out_current_state_to_file(game_elements, outfile)
-            if oot_code == 1:
-                print("Successfully written gameboard current state to file.")
-                logger.debug("Successfully written gameboard current state to file.")
-                print("Cash in hand with players when writing gameboard state to file: ")
-                for player in game_elements['players']:
-                    print(player.player_name, " current cash=", player.current_cash)
+                current_player.currently_in_jail = False  # the player is only allowed to skip one turn (i.e. this one)
+
+            if current_player.current_cash < 0:
+                code = current_player.handle_negative_cash_balance(game_elements)
+                # add to game history
+                game_elements.history['function'].append(current_player.handle_negative_cash_balance)
+                params = dict()
+                params['self'] = current_player
+                params['current_gameboard'] = game_elements
+                game_elements.history['param'].append(params)
+                game_elements.history['return'].append(code)
+                if code == flag_config_dict['failure_code'] or current_player.current_cash < 0:
+                    current_player.begin_bankruptcy_proceedings(game_elements)
+                    # add to game history
+                    game_elements.history['function'].append(current_player.begin_bankruptcy_proceedings)
+                    params = dict()
+                    params['self'] = current_player
+                    params['current_gameboard'] = game_elements
+                    game_elements.history['param'].append(params)
+                    game_elements.history['return'].append(None)
+
+                    bankruptcies.append(current_player)
+                    num_active_players -= 1
+                    if diagnostics.diagnostics_enabled('end_of_game'):
+                        diagnostics.print_asset_owners(game_elements)
+                        diagnostics.print_player_cash_balances(game_elements)
+
+                    if num_active_players == 1:
+                        for p in game_elements.players:
+                            if p.status != 'lost':
+                                winner = p
+                                p.status = 'won'
+                else:
+                    current_player.status = 'waiting_for_move'
             else:
-                print("Something went wrong when trying to write gameboard state to file. "
-                      "Rest of the game will be played as normal but will not log state to file.")
-        '''
-        count_json += 1
+                current_player.status = 'waiting_for_move'
 
-    logger.debug('Liquid Cash remaining with Bank = ' + str(game_elements['bank'].total_cash_with_bank))
+            current_player_index = (current_player_index + 1) % len(game_elements.players)
+            tot_time = time.time() - game_elements['start_time']
+
+            if card_utility_actions.check_for_game_termination(game_elements, tot_time):
+                # game terminates if check_for_game_termination returns true.
+                # We print some diagnostics and return if any player exceeds this.
+                if diagnostics.diagnostics_enabled('end_of_game'):
+                    diagnostics.print_asset_owners(game_elements)
+                    diagnostics.print_player_cash_balances(game_elements)
+                logger.debug("Game ran for %s seconds.", tot_time)
+                forced_termination = True
+                break
+
+            #This is an example of how you may want to write out gameboard state to file.
+            #Uncomment the following piece of code to write out the gameboard current_state to file at the "count_json" iteration.
+            #All the data from game_elements will be written to a .json file which can be read back to intialize a new game with
+            #those gameboard values to start the game from that point onwards.
+            '''
+            if count_json == 50:
+                outfile = '../current_gameboard_state.json'
+                oot_code = read_write_current_state.write_out_current_state_to_file(game_elements, outfile)
+                if oot_code == 1:
+                    print("Successfully written gameboard current state to file.")
+                    logger.debug("Successfully written gameboard current state to file.")
+                    print("Cash in hand with players when writing gameboard state to file: ")
+                    for player in game_elements.players:
+                        print(player.player_name, " current cash=", player.current_cash)
+                else:
+                    print("Something went wrong when trying to write gameboard state to file. "
+                          "Rest of the game will be played as normal but will not log state to file.")
+            '''
+            count_json += 1
+    finally:
+        # close the sink even if the game ends with an exception, so that buffered records are written out and the
+        # file is finalized, and restore the decision functions of the agents
+        game_elements.history.close_sink()
+        game_budget.end_game_budget(game_elements)
+
+    logger.debug('Liquid Cash remaining with Bank = %s', game_elements.bank.total_cash_with_bank)
 
-    if workbook:
-        write_history_to_file(game_elements, workbook)
+    if history_log_file:
+        print("History logged into " + history_log_file + " file.")
     # let's print some numbers
-    logger.debug('printing final asset owners: ')
-    diagnostics.print_asset_owners(game_elements)
-    logger.debug('number of dice rolls: ' + str(num_die_rolls))
-    logger.debug('printing final cash balances: ')
-    diagnostics.print_player_cash_balances(game_elements)
-    logger.debug("printing net worth of each player: ")
-    diagnostics.print_player_net_worths(game_elements)
-    logger.debug("Game ran for " + str(tot_time) + " seconds.")
-
-    if winner:
-        logger.debug('We have a winner: ' + winner.player_name)
+    if diagnostics.diagnostics_enabled('end_of_game'):
+        logger.debug('printing final asset owners: ')
+        diagnostics.print_asset_owners(game_elements)
+        logger.debug('number of dice rolls: %s', num_die_rolls)
+        logger.debug('printing final cash balances: ')
+        diagnostics.print_player_cash_balances(game_elements)
+        logger.debug("printing net worth of each player: ")
+        diagnostics.print_player_net_worths(game_elements)
+    logger.debug("Game ran for %s seconds.", tot_time)
+
+    if not winner:
+        winner = card_utility_actions.check_for_winner(game_elements)
+    game_elements['game_summary'] = game_summary.build_game_summary(game_elements, winner, bankruptcies, num_turns,
+                                                                    num_die_rolls, forced_termination)
+    if summary_file:
+        game_summary.write_game_summary(game_elements['game_summary'], summary_file)
+
+    if winner is not None:
+        logger.debug('We have a winner: %s', winner.player_name)
         return winner.player_name
     else:
-        winner = card_utility_actions.check_for_winner(game_elements)
-        if winner is not None:
-            logger.debug('We have a winner: ' + winner.player_name)
-            return winner.player_name
-        else:
-            logger.debug('Game has no winner, do not know what went wrong!!!')
-            return None     # ideally should never get here
+        logger.debug('Game has no winner, do not know what went wrong!!!')
+        return None     # ideally should never get here
 
 
 def set_up_board(game_schema_file_path, player_decision_agents):
@@ -277,6 +280,17 @@ def set_up_board(game_schema_file_path, player_decision_agents):
     return initialize_game_elements.initialize_board(game_schema, player_decision_agents)
 
 
+def set_up_board_template(game_schema_file_path):
+    """
+    Read in the game schema and build a board template from it. The template can be passed to play_game_in_tournament
+    so that the schema is not re-read and the board is not rebuilt from scratch for every game.
+    :param game_schema_file_path: A string. Path to the game schema json file.
+    :return: A dict. The board template (see initialize_game_elements.build_board_template)
+    """
+    game_schema = json.load(open(game_schema_file_path, 'r'))
+    return initialize_game_elements.build_board_template(game_schema)
+
+
 def inject_novelty(current_gameboard, novelty_schema=None):
     """
     Function for illustrating how we inject novelty
@@ -320,25 +334,25 @@ def inject_novelty(current_gameboard, novelty_schema=None):
     # only on the ownership of all the 4 properties in this case.
     
     inanimateNovelty = novelty_generator.InanimateAttributeNovelty()
-    inanimateNovelty.map_property_set_to_color(current_gameboard, [current_gameboard['location_objects']['Park Place'], current_gameboard['location_objects']['Boardwalk']], 'Brown')
-    inanimateNovelty.map_property_to_color(current_gameboard, current_gameboard['location_objects']['Baltic Avenue'], 'Orchid')
+    inanimateNovelty.map_property_set_to_color(current_gameboard, [current_gameboard.location_objects['Park Place'], current_gameboard.location_objects['Boardwalk']], 'Brown')
+    inanimateNovelty.map_property_to_color(current_gameboard, current_gameboard.location_objects['Baltic Avenue'], 'Orchid')
 
     #setting new rents for Indiana Avenue
-    inanimateNovelty.rent_novelty(current_gameboard['location_objects']['Indiana Avenue'], {'rent': 50, 'rent_1_house': 150})
+    inanimateNovelty.rent_novelty(current_gameboard.location_objects['Indiana Avenue'], {'rent': 50, 'rent_1_house': 150})
     '''
 
     '''
     #Level 3 Novelty
 
     granularityNovelty = novelty_generator.GranularityRepresentationNovelty()
-    granularityNovelty.granularity_novelty(current_gameboard, current_gameboard['location_objects']['Baltic Avenue'], 6)
-    granularityNovelty.granularity_novelty(current_gameboard, current_gameboard['location_objects']['States Avenue'], 20)
-    granularityNovelty.granularity_novelty(current_gameboard, current_gameboard['location_objects']['Tennessee Avenue'], 27)
+    granularityNovelty.granularity_novelty(current_gameboard, current_gameboard.location_objects['Baltic Avenue'], 6)
+    granularityNovelty.granularity_novelty(current_gameboard, current_gameboard.location_objects['States Avenue'], 20)
+    granularityNovelty.granularity_novelty(current_gameboard, current_gameboard.location_objects['Tennessee Avenue'], 27)
 
     spatialNovelty = novelty_generator.SpatialRepresentationNovelty()
     spatialNovelty.color_reordering(current_gameboard, ['Boardwalk', 'Park Place'], 'Blue')
 
-    granularityNovelty.granularity_novelty(current_gameboard, current_gameboard['location_objects']['Park Place'], 52)
+    granularityNovelty.granularity_novelty(current_gameboard, current_gameboard.location_objects['Park Place'], 52)
     '''
 
 
@@ -414,8 +428,48 @@ def play_game():
             return winner
 
 
-def play_game_in_tournament(game_seed, novelty_info=False, inject_novelty_function=None):
-    logger.debug('seed used: ' + str(game_seed))
+def play_game_in_tournament(game_seed, novelty_info=False, inject_novelty_function=None, board_template=None,
+                            summary_file=None, outcome_cache_folder=None, seat_order=None,
+                            agent_modules=None, budget=None, return_summary=False):
+    """
+    Play a single game of a tournament with background agents.
+    :param game_seed: An integer. The seed of the game.
+    :param novelty_info: A boolean. Specifies if the agents will be notified when novelty is injected or not.
+    :param inject_novelty_function: A function or None. If specified, it is used to inject novelty into the gameboard.
+    :param board_template: A dict or None. The output of set_up_board_template. If specified, the game board is cloned
+    from it instead of being set up from the schema file.
+    :param summary_file: A string or None. If specified, a summary of the game (see game_summary.py) is written to it.
+    :param outcome_cache_folder: A string or None. If specified, the outcome cache (see outcome_cache.py) in this folder
+    is looked up first, and if the same game has been played before, its outcome is returned without simulating it.
+    Otherwise the outcome is added to the cache once the game has been played.
+    :param seat_order: A list of player names or None. The order in which the players take their turns (see
+    simulate_game_instance). If None, the order is shuffled with the seed.
+    :param agent_modules: A dict or None. If specified, it maps every player name to the name of the agent module (in
+    monopoly_simulator, e.g. 'background_agent_v3_1') whose decision_agent_methods that player uses. If None, all players
+    use background_agent_v3_1.
+    :param budget: A dict or None. The budget of the game (see simulate_game_instance and game_budget.py).
+    :param return_summary: A boolean. If True, the game summary is returned instead of the name of the winner, with the
+    additional key 'from_outcome_cache' telling whether the outcome was taken from the outcome cache.
+    :return: String. The name of the winner, or None. With return_summary, a dict (the game summary), or None if the
+    game could not be played.
+    """
+    logger.debug('seed used: %s', game_seed)
+    cache_key = None
+    if outcome_cache_folder:
+        if board_template:
+            game_schema = board_template['game_schema']
+        else:
+            game_schema = json.load(open('../monopoly_game_schema_v1-2.json', 'r'))
+        cache_key = outcome_cache.game_key(game_schema, game_seed, novelty_info, inject_novelty_function, seat_order,
+                                           agent_modules, budget)
+        cached_summary = outcome_cache.get_cached_summary(outcome_cache_folder, cache_key)
+        if cached_summary is not None:
+            logger.debug('This game has been played before, taking its outcome from the outcome cache.')
+            if summary_file:
+                game_summary.write_game_summary(cached_summary, summary_file)
+            if return_summary:
+                return dict(cached_summary, from_outcome_cache=True)
+            return cached_summary['winner']
     player_decision_agents = dict()
     # for p in ['player_1','player_3']:
     #     player_decision_agents[p] = simple_decision_agent_1.decision_agent_methods
@@ -423,9 +477,16 @@ def play_game_in_tournament(game_seed, novelty_info=False, inject_novelty_functi
     player_decision_agents['player_2'] = Agent(**background_agent_v3_1.decision_agent_methods)
     player_decision_agents['player_3'] = Agent(**background_agent_v3_1.decision_agent_methods)
     player_decision_agents['player_4'] = Agent(**background_agent_v3_1.decision_agent_methods)
+    if agent_modules:
+        for player_name, module_name in agent_modules.items():
+            agent_module = importlib.import_module('monopoly_simulator.' + module_name)
+            player_decision_agents[player_name] = Agent(**agent_module.decision_agent_methods)
 
-    game_elements = set_up_board('../monopoly_game_schema_v1-2.json',
-                                 player_decision_agents)
+    if board_template:
+        game_elements = initialize_game_elements.initialize_board_from_template(board_template, player_decision_agents)
+    else:
+        game_elements = set_up_board('../monopoly_game_schema_v1-2.json',
+                                     player_decision_agents)
     
     #Comment out the above line and uncomment the piece of code to read the gameboard state from an existing json file so that
     #the game starts from a particular game state instead of initializing the gameboard with default start values.
@@ -448,7 +509,8 @@ def play_game_in_tournament(game_seed, novelty_info=False, inject_novelty_functi
             return None
         else:
             logger.debug("Sucessfully initialized all player agents.")
-            winner = simulate_game_instance(game_elements, history_log_file=None, np_seed=game_seed)
+            winner = simulate_game_instance(game_elements, history_log_file=None, np_seed=game_seed, summary_file=summary_file,
+                                            seat_order=seat_order, budget=budget)
             if player_decision_agents['player_1'].shutdown() == flag_config_dict['failure_code'] or \
                     player_decision_agents['player_2'].shutdown() == flag_config_dict['failure_code'] or \
                     player_decision_agents['player_3'].shutdown() == flag_config_dict['failure_code'] or \
@@ -458,6 +520,10 @@ def play_game_in_tournament(game_seed, novelty_info=False, inject_novelty_functi
             else:
                 logger.debug("All player agents have been shutdown. ")
                 logger.debug("GAME OVER")
+                if cache_key:
+                    outcome_cache.store_summary(outcome_cache_folder, cache_key, game_elements['game_summary'])
+                if return_summary:
+                    return dict(game_elements['game_summary'], from_outcome_cache=False)
                 return winner
     else:
         if inject_novelty_function:
@@ -469,7 +535,8 @@ def play_game_in_tournament(game_seed, novelty_info=False, inject_novelty_functi
                 return None
             else:
                 logger.debug("Sucessfully initialized all player agents.")
-                winner = simulate_game_instance(game_elements, history_log_file=None, np_seed=game_seed)
+                winner = simulate_game_instance(game_elements, history_log_file=None, np_seed=game_seed, summary_file=summary_file,
+                                                seat_order=seat_order, budget=budget)
                 if player_decision_agents['player_1'].shutdown() == flag_config_dict['failure_code'] or \
                         player_decision_agents['player_2'].shutdown() == flag_config_dict['failure_code'] or \
                         player_decision_agents['player_3'].shutdown() == flag_config_dict['failure_code'] or \
@@ -479,6 +546,10 @@ def play_game_in_tournament(game_seed, novelty_info=False, inject_novelty_functi
                 else:
                     logger.debug("All player agents have been shutdown. ")
                     logger.debug("GAME OVER")
+                    if cache_key:
+                        outcome_cache.store_summary(outcome_cache_folder, cache_key, game_elements['game_summary'])
+                    if return_summary:
+                        return dict(game_elements['game_summary'], from_outcome_cache=False)
                     return winner
         else:
             if player_decision_agents['player_1'].startup(game_elements, indicator=False) == flag_config_dict['failure_code'] or \
@@ -489,7 +560,8 @@ def play_game_in_tournament(game_seed, novelty_info=False, inject_novelty_functi
                 return None
             else:
                 logger.debug("Sucessfully initialized all player agents.")
-                winner = simulate_game_instance(game_elements, history_log_file=None, np_seed=game_seed)
+                winner = simulate_game_instance(game_elements, history_log_file=None, np_seed=game_seed, summary_file=summary_file,
+                                                seat_order=seat_order, budget=budget)
                 if player_decision_agents['player_1'].shutdown() == flag_config_dict['failure_code'] or \
                         player_decision_agents['player_2'].shutdown() == flag_config_dict['failure_code'] or \
                         player_decision_agents['player_3'].shutdown() == flag_config_dict['failure_code'] or \
@@ -499,6 +571,10 @@ def play_game_in_tournament(game_seed, novelty_info=False, inject_novelty_functi
                 else:
                     logger.debug("All player agents have been shutdown. ")
                     logger.debug("GAME OVER")
+                    if cache_key:
+                        outcome_cache.store_summary(outcome_cache_folder, cache_key, game_elements['game_summary'])
+                    if return_summary:
+                        return dict(game_elements['game_summary'], from_outcome_cache=False)
                     return winner
 
 
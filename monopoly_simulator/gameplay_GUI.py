@@ -227,26 +227,22 @@ class CreateBoardWindow(Screen):
         :param np_seed: The numpy seed to use to control randomness.
         :return: None
         """
-        logger.debug("size of board "+ str(len(self.game_elem['location_sequence'])))
-        np.random.seed(np_seed)
-        np.random.shuffle(self.game_elem['players'])
-        self.game_elem['seed'] = np_seed
-        self.game_elem['card_seed'] = np_seed
-        self.game_elem['choice_function'] = np.random.choice
+        logger.debug("size of board %s", len(self.game_elem['location_sequence']))
+        initialize_game_elements.initialize_random_generators(self.game_elem, np_seed)
+        self.game_elem['player_shuffle_rng'].shuffle(self.game_elem['players'])
 
         num_die_rolls = 0
         # game_elements['go_increment'] = 100 # we should not be modifying this here. It is only for testing purposes.
         # One reason to modify go_increment is if your decision agent is not aggressively trying to monopolize. Since go_increment
         # by default is 200 it can lead to runaway cash increases for simple agents like ours.
 
-        logger.debug('players will play in the following order: '+'->'.join([p.player_name for p in self.game_elem['players']]))
+        logger.debug('players will play in the following order: %s', '->'.join([p.player_name for p in self.game_elem['players']]))
         logger.debug('Beginning play. Rolling first die...')
         current_player_index = 0
         num_active_players = 4
         winner = None
 
         while num_active_players > 1:
-            self.disable_history()
             if self.start_stop_flag==True:
                 current_player = self.game_elem['players'][current_player_index]
                 while current_player.status == 'lost':
@@ -289,7 +285,7 @@ class CreateBoardWindow(Screen):
                 # but only if we're not in jail.
 
 
-                r = roll_die(self.game_elem['dies'], np.random.choice)
+                r = roll_die(self.game_elem['dies'], self.game_elem['dice_rng'].choice)
                 self.dice_list = r
                 for i in range(len(r)):
                     self.game_elem['die_sequence'][i].append(r[i])
@@ -297,13 +293,13 @@ class CreateBoardWindow(Screen):
                 self.game_elem['history']['function'].append(roll_die)
                 params = dict()
                 params['die_objects'] = self.game_elem['dies']
-                params['choice'] = np.random.choice
+                params['choice'] = self.game_elem['dice_rng'].choice
                 self.game_elem['history']['param'].append(params)
                 self.game_elem['history']['return'].append(r)
 
                 num_die_rolls += 1
                 self.game_elem['current_die_total'] = sum(r)
-                logger.debug('dies have come up ' + str(r))
+                logger.debug('dies have come up %s', r)
                 if not current_player.currently_in_jail:
                     check_for_go = True
                     move_player_after_die_roll(current_player, sum(r), self.game_elem, check_for_go)
@@ -388,20 +384,17 @@ class CreateBoardWindow(Screen):
 
         logger.debug('printing final asset owners: ')
         diagnostics.print_asset_owners(self.game_elem)
-        logger.debug('number of dice rolls: '+ str(num_die_rolls))
+        logger.debug('number of dice rolls: %s', num_die_rolls)
         logger.debug('printing final cash balances: ')
         diagnostics.print_player_cash_balances(self.game_elem)
 
         if winner:
-            logger.debug('We have a winner: '+ winner.player_name)
+            logger.debug('We have a winner: %s', winner.player_name)
 
         return
 
     def disable_history(self):
-        self.game_elem['history'] = dict()
-        self.game_elem['history']['function'] = list()
-        self.game_elem['history']['param'] = list()
-        self.game_elem['history']['return'] = list()
+        self.game_elem['history'].clear()
 
     def update_board(self):
         self.canvas.after.clear()
@@ -0,0 +1,301 @@
+"""
+The game history store. Every record in the history has the same fixed schema: the function that was called, the
+parameters it was called with and what it returned. Records are kept column by column (game_elements['history']['function'],
+game_elements['history']['param'] and game_elements['history']['return']), so the usual way of adding to the history
+still works:
+
+    current_gameboard['history']['function'].append(...)
+    current_gameboard['history']['param'].append(params)
+    current_gameboard['history']['return'].append(...)
+
+No live references are kept. A value is stored as its identifier instead: a player by its name, a location or card by its
+name, a function by its (qualified) name and the game board itself as the string 'current_gameboard'. Function names and parameter
+keys are interned, so that a record takes up little space, and the history never keeps game objects alive.
+
+The history can be bounded to the last max_records records, acting as a ring buffer. The bound of the histories of new
+game boards is default_max_records, which can be changed with set_history_bound. If a sink is attached (see
+history_sink.py), every record is also written out to it as soon as it is complete, so that the full history of a game
+ends up on disk while memory use stays flat.
+
+Recording the history is not free (every parameter gets converted). If nothing is going to look at the history, e.g. in
+a large tournament, recording can be switched off with set_history_recording(False); histories created after that
+ignore whatever gets appended to them.
+"""
+import collections
+import numbers
+import sys
+
+history_columns = ['function', 'param', 'return']
+
+default_max_records = 50000   # the bound of new game histories, see set_history_bound
+
+_history_recording = True
+
+_default_bound = object()   # marks a GameHistory created without an explicit bound
+
+
+def set_history_recording(enabled):
+    """
+    Switch the recording of game history on or off for all game boards initialized from now on.
+    :param enabled: A boolean. If False, new game histories stay empty.
+    :return: None
+    """
+    global _history_recording
+    _history_recording = enabled
+
+
+def set_history_bound(max_records):
+    """
+    Set the bound of the game history for all game boards initialized from now on.
+    :param max_records: An integer or None. The number of most recent records kept in memory. If None, new game
+    histories are unbounded.
+    :return: None
+    """
+    global default_max_records
+    default_max_records = max_records
+
+
+class HistoryColumn(object):
+    def __init__(self, history, key):
+        """
+        One column of a GameHistory. Only meant to be created by GameHistory.
+        :param history: The GameHistory instance this column belongs to.
+        :param key: A string. One of history_columns.
+        """
+        self._history = history
+        self._key = key
+        self._values = collections.deque()
+        self._compact = getattr(history, '_compact_' + key)
+
+    def append(self, value):
+        """
+        Add the value to the column (after converting it to its compact, reference free form).
+        :param value: The function, param dict or return value that is being added to the history.
+        :return: None
+        """
+        self._values.append(self._compact(value))
+
+    def __iter__(self):
+        for value in self._values:
+            yield self._history._expand(self._key, value)
+
+    def __getitem__(self, index):
+        return self._history._expand(self._key, self._values[index])
+
+    def __len__(self):
+        return len(self._values)
+
+
+class IgnoredColumn(HistoryColumn):
+    def append(self, value):
+        """
+        Used instead of HistoryColumn when history recording is switched off.
+        :param value: Ignored.
+        :return: None
+        """
+        pass
+
+
+class ReturnColumn(HistoryColumn):
+    def append(self, value):
+        """
+        Add the return value to the column. A record is complete once its return value is in, so this is also where the
+        record is written to the sink (if any), and where we check if the history has grown past its bound.
+        :param value: The return value that is being added to the history.
+        :return: None
+        """
+        self._values.append(_to_id(value))
+        history = self._history
+        if history.sink is not None:
+            history.sink.write(history._record(-1))
+        if history.max_records is not None and len(self._values) > history.max_records:
+            history._drop_oldest_record()
+
+
+class GameHistory(object):
+    def __init__(self, max_records=_default_bound, sink=None):
+        """
+        A bounded, columnar store for the game history. It can be used like the dict of lists it replaces, i.e.
+        history['function'], history['param'] and history['return'] can be appended to and iterated over.
+        :param max_records: An integer or None. Only the most recent max_records records are kept in memory. If None,
+        the history is unbounded. Defaults to default_max_records at the time the history is created.
+        :param sink: A history sink (see history_sink.py) or None. If specified, every record is written to it as soon
+        as it is complete.
+        """
+        if max_records is _default_bound:
+            max_records = default_max_records
+        self.max_records = max_records
+        self.sink = sink
+        self._columns = dict()
+        if _history_recording:
+            self._columns['function'] = HistoryColumn(self, 'function')
+            self._columns['param'] = HistoryColumn(self, 'param')
+            self._columns['return'] = ReturnColumn(self, 'return')
+        else:
+            for key in history_columns:
+                self._columns[key] = IgnoredColumn(self, key)
+        self._names = list()  # interned function names; the function column holds indexes into this list
+        self._name_ids = dict()
+        self._function_ids = dict()  # key is a function, and value is the index of its name in self._names
+        self._param_schemas = list()  # each schema is a tuple of param keys; params are stored as (schema id, values)
+        self._param_schema_ids = dict()
+
+    def __getitem__(self, key):
+        return self._columns[key]
+
+    def __iter__(self):
+        return iter(history_columns)
+
+    def __len__(self):
+        """
+        :return: An integer. The number of complete records currently held in memory.
+        """
+        return len(self._columns['return'])
+
+    def keys(self):
+        return list(history_columns)
+
+    def clear(self):
+        """
+        Forget all the records held in memory (records that have already been written to the sink are left alone).
+        :return: None
+        """
+        for key in history_columns:
+            self._columns[key]._values.clear()
+
+    def records(self):
+        """
+        Iterate over the records held in memory, oldest first.
+        :return: A generator of dicts, each with the keys 'function', 'param' and 'return'.
+        """
+        for i in range(len(self)):
+            yield self._record(i)
+
+    def _record(self, index):
+        record = dict()
+        for key in history_columns:
+            record[key] = self._columns[key][index]
+        return record
+
+    def close_sink(self):
+        """
+        Close the sink (flushing whatever it still buffers to disk) and detach it from the history.
+        :return: None
+        """
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+
+    def _drop_oldest_record(self):
+        for key in history_columns:
+            if self._columns[key]._values:
+                self._columns[key]._values.popleft()
+
+    def _compact_function(self, function):
+        function = getattr(function, '__func__', function)  # the same function is recorded for every player's bound method
+        if function not in self._function_ids:
+            name = sys.intern(_function_name(function))
+            if name not in self._name_ids:
+                self._name_ids[name] = len(self._names)
+                self._names.append(name)
+            self._function_ids[function] = self._name_ids[name]
+        return self._function_ids[function]
+
+    def _compact_return(self, value):
+        return _to_id(value)
+
+    def _compact_param(self, param):
+        if not isinstance(param, dict):
+            return (None, _to_id(param))
+        keys = tuple(param.keys())
+        if keys not in self._param_schema_ids:
+            self._param_schema_ids[keys] = len(self._param_schemas)
+            self._param_schemas.append(tuple([sys.intern(k) if isinstance(k, str) else k for k in keys]))
+        return (self._param_schema_ids[keys], tuple(map(_to_id, param.values())))
+
+    def _expand(self, key, value):
+        if key == 'function':
+            return self._names[value]
+        elif key == 'param':
+            schema_id, values = value
+            if schema_id is None:
+                return values
+            return dict(zip(self._param_schemas[schema_id], values))
+        return value
+
+
+def _function_name(function):
+    """
+    :param function: A function or bound method (or, in rare cases, something else that was recorded as the function).
+    :return: A string. The qualified name of the function, e.g. 'Player.make_pre_roll_moves'.
+    """
+    if hasattr(function, '__qualname__'):
+        return function.__qualname__
+    return str(function)
+
+
+def _to_id(value):
+    """
+    Convert a value into the compact, reference free form that is stored in the history. The conversion is looked up
+    by the type of the value, since it gets called for every parameter and return value in the game.
+    :param value: Any value that shows up as a parameter or a return value in the game history.
+    :return: The value itself if it is a plain (immutable) value, otherwise an identifier for it. Containers are converted
+    element by element; lists, tuples and sets become tuples.
+    """
+    value_type = type(value)
+    if value_type in _plain_types:
+        return value
+    if value_type not in _id_functions:
+        _id_functions[value_type] = _id_function_for(value)
+    return _id_functions[value_type](value)
+
+
+def _id_function_for(value):
+    """
+    Work out how values of the same type as value are converted by _to_id.
+    :param value: An example value of the type.
+    :return: A function that takes a value of that type and returns its compact form.
+    """
+    if isinstance(value, numbers.Integral):  # e.g. numpy integers from the die rolls
+        return int
+    elif isinstance(value, dict):
+        return _dict_to_id
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return _container_to_id
+    elif hasattr(value, 'player_name'):
+        return _player_to_id
+    elif hasattr(value, 'name') and isinstance(value.name, str):  # locations and cards
+        return _named_object_to_id
+    elif callable(value):
+        return _function_name
+    return _type_name
+
+
+def _dict_to_id(value):
+    if value.get('type') == 'game_elements':
+        return 'current_gameboard'
+    ans = dict()
+    for k, v in value.items():
+        ans[k] = _to_id(v)
+    return ans
+
+
+def _container_to_id(value):
+    return tuple(map(_to_id, value))
+
+
+def _player_to_id(value):
+    return value.player_name
+
+
+def _named_object_to_id(value):
+    return value.name
+
+
+def _type_name(value):
+    return type(value).__name__
+
+
+_plain_types = set([type(None), bool, int, float, str])
+
+_id_functions = dict()  # key is a type, and value is the function that converts values of that type (see _to_id)
@@ -0,0 +1,139 @@
+"""
+History sinks write the game history out record by record, while the game is being played, instead of dumping it all at the
+end. A sink is attached to a game history (see history.py), which hands it every record as soon as the record is complete.
+All sinks have the same two methods: write(record) and close().
+
+The easiest way to get a sink is open_history_sink, which picks the format from the file name:
+    history.jsonl -> one json object per record
+    history.csv   -> one row per record
+    history.xlsx  -> one row per record, written by xlsxwriter in constant memory mode
+A '.gz', '.bz2' or '.xz' suffix on a jsonl or csv file name (e.g., history.jsonl.gz) compresses the file as it is written.
+"""
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import xlsxwriter
+import logging
+logger = logging.getLogger('monopoly_simulator.logging_info.history_sink')
+
+history_file_columns = ['function', 'param', 'current_player', 'return']
+
+_compressed_openers = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+def open_history_sink(filename):
+    """
+    Open a history sink writing to filename, with the format (and compression) determined by the file name.
+    :param filename: A string. Path of the history file. Must end with .jsonl, .csv or .xlsx, optionally followed by
+    .gz, .bz2 or .xz for jsonl and csv.
+    :return: A JsonLinesHistorySink, CsvHistorySink or XlsxHistorySink.
+    """
+    name = filename
+    for suffix in _compressed_openers:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    if name.endswith('.jsonl'):
+        return JsonLinesHistorySink(filename)
+    elif name.endswith('.csv'):
+        return CsvHistorySink(filename)
+    elif name.endswith('.xlsx') and name == filename:
+        return XlsxHistorySink(filename)
+    else:
+        logger.error('Unsupported history file name %s', filename)
+        logger.error("Exception")
+        raise Exception
+
+
+def _open_text_file(filename):
+    """
+    Open filename for writing text, compressing it if the file name ends with a compression suffix.
+    :param filename: A string.
+    :return: A file object.
+    """
+    for suffix, opener in _compressed_openers.items():
+        if filename.endswith(suffix):
+            return opener(filename, 'wt', newline='')
+    return open(filename, 'w', newline='')
+
+
+def _current_player(record):
+    """
+    :param record: A history record.
+    :return: A string. The name of the player that was passed in as 'player' (if any), otherwise an empty string.
+    """
+    if isinstance(record['param'], dict) and isinstance(record['param'].get('player'), str):
+        return record['param']['player']
+    return ''
+
+
+def _to_json(value):
+    return json.dumps(value, default=str)
+
+
+class JsonLinesHistorySink(object):
+    def __init__(self, filename):
+        """
+        Writes every record as a json object on its own line.
+        :param filename: A string. Path of the file (see open_history_sink for compression).
+        """
+        self.filename = filename
+        self._file = _open_text_file(filename)
+
+    def write(self, record):
+        self._file.write(_to_json(record) + '\n')
+
+    def close(self):
+        self._file.close()
+
+
+class CsvHistorySink(object):
+    def __init__(self, filename):
+        """
+        Writes every record as a csv row, with the columns in history_file_columns. The param and return values are
+        written as json.
+        :param filename: A string. Path of the file (see open_history_sink for compression).
+        """
+        self.filename = filename
+        self._file = _open_text_file(filename)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(history_file_columns)
+
+    def write(self, record):
+        self._writer.writerow([record['function'], _to_json(record['param']), _current_player(record),
+                               _to_json(record['return'])])
+
+    def close(self):
+        self._file.close()
+
+
+class XlsxHistorySink(object):
+    max_rows_per_worksheet = 1048576  # the xlsx format allows no more rows than this in a worksheet
+
+    def __init__(self, filename):
+        """
+        Writes every record as a row in an excel workbook, with the columns in history_file_columns. The workbook is
+        written in constant memory mode, i.e. each row is flushed to disk once the next one is started. When a worksheet
+        is full, writing continues on a new one.
+        :param filename: A string. Path of the .xlsx file.
+        """
+        self.filename = filename
+        self._workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        self._add_worksheet()
+
+    def _add_worksheet(self):
+        self._worksheet = self._workbook.add_worksheet()
+        self._worksheet.write_row(0, 0, history_file_columns)
+        self._row = 1
+
+    def write(self, record):
+        if self._row == XlsxHistorySink.max_rows_per_worksheet:
+            self._add_worksheet()
+        self._worksheet.write_row(self._row, 0, [record['function'], str(record['param']), _current_player(record),
+                                                 str(record['return'])])
+        self._row += 1
+
+    def close(self):
+        self._workbook.close()
@@ -0,0 +1,95 @@
+"""
+An index of how far the real estate of every color is improved, so that the uniform improvement rule (the houses and
+hotels on the properties of a color must be built and sold evenly) is checked without looking at every property of the
+color, as action_choices.improve_property, sell_house_hotel, sell_property and
+agent_helper_functions.can_asset_be_improved do.
+
+The improvement level of a property is the tuple (num_hotels, num_houses), so levels are ordered by hotels first and
+then by houses. Since building a hotel removes the houses of a property, a property with a hotel has no houses. Levels
+do not depend on the bank's house_limit_before_hotel, which a novelty may change at any time; the checks compare against
+the current limit of the bank instead.
+
+Every colored real estate location of a game board holds the index of its color as asset.improvement_levels (see
+set_up_improvement_levels), and the indexes of the board are current_gameboard['improvement_levels'], with colors as
+keys. Whenever num_houses or num_hotels of a property change, RealEstateLocation.update_improvement_level must be
+called. A novelty that changes the colors of locations must set the indexes up again (see
+novelty_generator.InanimateAttributeNovelty.map_property_set_to_color).
+"""
+import logging
+logger = logging.getLogger('monopoly_simulator.logging_info.improvement_levels')
+
+
+class ImprovementLevels(object):
+    def __init__(self, assets):
+        """
+        The improvement levels of the properties of one color. lowest and highest are the lowest and highest level of any
+        property of the color, and most_houses is the largest number of houses on any property of the color.
+        :param assets: A set of RealEstateLocation instances. The properties of the color.
+        """
+        self.num_assets = len(assets)
+        self._levels = dict()   # key is a property, and value is its level when it was last updated
+        self._counts = dict()   # key is a level, and value is the number of properties at that level
+        for asset in assets:
+            level = self.level(asset)
+            self._levels[asset] = level
+            self._counts[level] = self._counts.get(level, 0) + 1
+        self._update_bounds()
+
+    @staticmethod
+    def level(asset):
+        """
+        :param asset: A RealEstateLocation instance.
+        :return: A tuple (num_hotels, num_houses). The improvement level of asset given its current houses and hotels.
+        """
+        return asset.num_hotels, asset.num_houses
+
+    def count(self, num_hotels, num_houses):
+        """
+        :param num_hotels: An integer.
+        :param num_houses: An integer.
+        :return: An integer. The number of properties of the color with exactly these hotels and houses.
+        """
+        return self._counts.get((num_hotels, num_houses), 0)
+
+    def update(self, asset):
+        """
+        Move asset to the level of its current houses and hotels.
+        :param asset: A RealEstateLocation instance of the color.
+        :return: None
+        """
+        old_level = self._levels[asset]
+        new_level = self.level(asset)
+        if new_level == old_level:
+            return
+        self._levels[asset] = new_level
+        self._counts[old_level] -= 1
+        if self._counts[old_level] == 0:
+            del self._counts[old_level]
+        self._counts[new_level] = self._counts.get(new_level, 0) + 1
+        self._update_bounds()
+
+    def _update_bounds(self):
+        if self._counts:
+            self.lowest = min(self._counts)
+            self.highest = max(self._counts)
+            self.most_houses = max([num_houses for num_hotels, num_houses in self._counts])
+        else:
+            self.lowest = (0, 0)
+            self.highest = (0, 0)
+            self.most_houses = 0
+
+
+def set_up_improvement_levels(game_elements):
+    """
+    Build the improvement level index of every color of a game board from the houses and hotels currently on its
+    properties, and hand each index to the properties of its color.
+    :param game_elements: A dict. The global gameboard data structure
+    :return: None
+    """
+    improvement_levels = dict()
+    for color, assets in game_elements['color_assets'].items():
+        real_estate = set([asset for asset in assets if asset.loc_class == 'real_estate'])
+        improvement_levels[color] = ImprovementLevels(real_estate)
+        for asset in real_estate:
+            asset.improvement_levels = improvement_levels[color]
+    game_elements['improvement_levels'] = improvement_levels
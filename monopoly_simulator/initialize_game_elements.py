@@ -1,6 +1,9 @@
 """
-The only public facing function is initialize_board. All _initialize_* functions are only for internal use. If you
+The main public facing function is initialize_board. All _initialize_* functions are only for internal use. If you
 want to play around, you could always implement your _initialize functions and replace accordingly in initialize_board!
+
+When many games are played on the same board (e.g., in a tournament), build_board_template can be used to build the board
+once, and initialize_board_from_template to stamp out fresh, independent game boards from it.
 """
 
 from monopoly_simulator import location
@@ -9,15 +12,23 @@ from monopoly_simulator.bank import Bank
 from monopoly_simulator.card_utility_actions import * # functions from this module will be used in reflections in initialize_board,
                                     # and excluding this import will lead to run-time errors
 import sys
-from monopoly_simulator.player import Player
+from monopoly_simulator.player import Player, compile_landing_table
 from monopoly_simulator import card
+from monopoly_simulator.history import GameHistory
+from monopoly_simulator.game_state import GameState
+from monopoly_simulator.color_ownership import set_up_color_ownership
+from monopoly_simulator.improvement_levels import set_up_improvement_levels
 import copy
+import numpy as np
 import logging
 logger = logging.getLogger('monopoly_simulator.logging_info.init_game_elements')
 
+_shared_table_attributes = set(['_house_rent_dict', '_railroad_dues', '_die_multiples'])
+_slot_names_memo = dict() # key is a class, and value is the list of its slots (see _slot_names)
+
 def initialize_board(game_schema, player_decision_agents):
 
-    game_elements = dict()
+    game_elements = GameState()
     logger.debug('Beginning game set up...')
 
     # Step 0: initialize bank
@@ -26,6 +37,8 @@ def initialize_board(game_schema, player_decision_agents):
 
     # Step 1: set locations
     _initialize_locations(game_elements, game_schema)
+    compile_landing_table(game_elements)
+    set_up_improvement_levels(game_elements)
     logger.debug('Successfully instantiated and initialized all locations on board.')
 
     # Step 2: set dice
@@ -38,6 +51,7 @@ def initialize_board(game_schema, player_decision_agents):
 
     # Step 4: set players
     _initialize_players(game_elements, game_schema, player_decision_agents)
+    set_up_color_ownership(game_elements)
     logger.debug('Successfully instantiated and initialized players and decision agents')
 
     # Step 5: set history data structures
@@ -48,6 +62,152 @@ def initialize_board(game_schema, player_decision_agents):
     return game_elements
 
 
+def build_board_template(game_schema):
+    """
+    Build everything on the board that does not depend on the players (bank, locations, dies and cards) exactly once.
+    The returned template must not be used to play a game itself; it is only meant to be passed (repeatedly) to
+    initialize_board_from_template.
+    :param game_schema: A dict. The game schema (as read in from the game schema json file).
+    :return: A dict. The board template.
+    """
+    board_template = dict()
+    _initialize_bank(board_template)
+    _initialize_locations(board_template, game_schema)
+    _initialize_dies(board_template, game_schema)
+    _initialize_cards(board_template, game_schema)
+    board_template['game_schema'] = game_schema
+    board_template['type'] = "board_template"
+    return board_template
+
+
+def initialize_board_from_template(board_template, player_decision_agents):
+    """
+    The counterpart of initialize_board when a board template is available. Instead of re-reading the schema and
+    building every object through reflection, the bank, locations, dies and cards of the template are cloned (shallow
+    copies whose dict/list/set attributes are copied as well, with owners and card destinations rebound to the clone).
+    Players are then created afresh with the given decision agents. The template itself is never modified, and the
+    returned game board plays out exactly like one returned by initialize_board.
+    :param board_template: A dict. The output of build_board_template
+    :param player_decision_agents: A dict with player names as keys and Agent instances as values.
+    :return: A dict. The game board (game_elements).
+    """
+    if board_template['type'] != "board_template":
+        logger.debug('initialize_board_from_template expects the output of build_board_template')
+        logger.error("Exception")
+        raise Exception
+
+    game_elements = GameState()
+    logger.debug('Beginning game set up...')
+
+    game_elements['bank'] = _clone_board_object(board_template['bank'])
+    logger.debug('Successfully instantiated and initialized bank.')
+
+    location_objects = dict()
+    for name, loc in board_template['location_objects'].items():
+        location_objects[name] = _clone_board_object(loc, game_elements['bank'])
+    game_elements['location_objects'] = location_objects
+    game_elements['location_sequence'] = [location_objects[loc.name] for loc in board_template['location_sequence']]
+    game_elements['railroad_positions'] = list(board_template['railroad_positions'])
+    game_elements['utility_positions'] = list(board_template['utility_positions'])
+    game_elements['jail_position'] = board_template['jail_position']
+    game_elements['go_position'] = board_template['go_position']
+    game_elements['go_increment'] = board_template['go_increment']
+    color_assets = dict()
+    for color, asset_set in board_template['color_assets'].items():
+        color_assets[color] = set([location_objects[asset.name] for asset in asset_set])
+    game_elements['color_assets'] = color_assets
+    compile_landing_table(game_elements)
+    set_up_improvement_levels(game_elements)
+    logger.debug('Successfully instantiated and initialized all locations on board.')
+
+    game_elements['dies'] = [_clone_board_object(d) for d in board_template['dies']]
+    game_elements['current_die_total'] = 0
+    game_elements['die_sequence'] = [[] for d in game_elements['dies']]
+    game_elements['move_player_after_die_roll'] = board_template['move_player_after_die_roll']
+    logger.debug('Successfully instantiated and initialized dies')
+
+    for pack in ['chance', 'community_chest']:
+        game_elements[pack+'_cards'] = card.CardDeck([_clone_board_object(c, location_objects=location_objects)
+                                                      for c in board_template[pack+'_cards']])
+        card_objects = dict()
+        for card_name, c in board_template[pack+'_card_objects'].items():
+            card_objects[card_name] = _clone_board_object(c, location_objects=location_objects)
+        game_elements[pack+'_card_objects'] = card_objects
+        game_elements['picked_'+pack+'_cards'] = []
+    logger.debug('Successfully instantiated and initialized cards')
+
+    _initialize_players(game_elements, board_template['game_schema'], player_decision_agents)
+    set_up_color_ownership(game_elements)
+    logger.debug('Successfully instantiated and initialized players and decision agents')
+
+    _initialize_game_history_structs(game_elements)
+    logger.debug('Successfully instantiated game history data structures')
+
+    game_elements['type'] = "game_elements"
+    return game_elements
+
+
+def _clone_board_object(obj, bank=None, location_objects=None):
+    """
+    Internal function that clones a bank, location, dice or card object of a board template. Attributes holding a
+    dict, list or set (e.g., die_state) are copied so that novelties applied to the clone do not leak into the template.
+    Functions (e.g., card actions) and the rent and dues tables of locations are shared, since they are never modified
+    in place (see location.py).
+    :param obj: The object to clone.
+    :param bank: A Bank instance or None. If specified, the owned_by field of the clone is set to it.
+    :param location_objects: A dict or None. If specified, the destination of a (movement) card is rebound to the
+    location of the same name in this dict.
+    :return: The cloned object.
+    """
+    clone = obj.__class__.__new__(obj.__class__)
+    for attr in _slot_names(obj.__class__):
+        value = getattr(obj, attr)
+        if isinstance(value, (dict, list, set)) and attr not in _shared_table_attributes:
+            value = value.copy()
+        setattr(clone, attr, value)
+    if bank is not None and hasattr(clone, 'owned_by'):
+        clone.owned_by = bank
+    if location_objects is not None and hasattr(clone, 'destination'):
+        clone.destination = location_objects[clone.destination.name]
+    return clone
+
+
+def _slot_names(cls):
+    """
+    Internal function that lists the attributes of a (slotted) board object class, including those of its super-classes.
+    :param cls: A class.
+    :return: A list of attribute names.
+    """
+    if cls not in _slot_names_memo:
+        names = list()
+        for c in reversed(cls.__mro__):
+            names.extend(c.__dict__.get('__slots__', ()))
+        _slot_names_memo[cls] = names
+    return _slot_names_memo[cls]
+
+
+def initialize_random_generators(game_elements, np_seed, legacy_card_draws=False):
+    """
+    Set up the random number generators of a game. Instead of seeding the global numpy random state, a SeedSequence is
+    derived from np_seed and independent child streams are spawned for the player shuffle, the dice and the card draws.
+    Each stream is a numpy Generator carried on game_elements, so a seed reproduces the same game irrespective of how
+    many other games are being played alongside it (in other threads or in the same worker process).
+    :param game_elements: A dict. The global gameboard data structure
+    :param np_seed: An integer. The seed of the game.
+    :param legacy_card_draws: A boolean. If True, cards are not drawn with the card stream but the way older versions of
+    the simulator drew them (see card_utility_actions._draw_card), which reproduces the old card sequence of a seed.
+    :return: None
+    """
+    shuffle_seed, dice_seed, card_seed = np.random.SeedSequence(np_seed).spawn(3)
+    game_elements['seed'] = np_seed
+    game_elements['player_shuffle_rng'] = np.random.default_rng(shuffle_seed)
+    game_elements['dice_rng'] = np.random.default_rng(dice_seed)
+    game_elements['card_rng'] = np.random.default_rng(card_seed)
+    game_elements['legacy_card_draws'] = legacy_card_draws
+    game_elements['card_seed'] = np_seed # only used if legacy_card_draws is True
+    game_elements['choice_function'] = game_elements['dice_rng'].choice
+
+
 def _initialize_bank(game_elements):
     game_elements['bank'] = Bank()
 
@@ -94,7 +254,7 @@ def _initialize_locations(game_elements, game_schema):
             location_objects[l['name']] = location.UtilityLocation(**utility_args)
 
         else:
-            logger.debug('encountered unexpected location class: '+ l['loc_class'])
+            logger.debug('encountered unexpected location class: %s', l['loc_class'])
             logger.error("Exception")
             raise Exception
 
@@ -115,8 +275,7 @@ def _initialize_locations(game_elements, game_schema):
     game_elements['utility_positions'] = utility_positions
 
     if len(location_sequence) != game_schema['locations']['location_count']:
-        logger.debug('location count: '+ str(game_schema['locations']['location_count'])+ ', length of location sequence: '+
-        str(len(location_sequence))+ ' are unequal.')
+        logger.debug('location count: %s, length of location sequence: %s are unequal.', game_schema['locations']['location_count'], len(location_sequence))
         logger.error("Exception")
         raise Exception
 
@@ -165,8 +324,8 @@ def _initialize_dies(game_elements, game_schema):
 
 
 def _initialize_cards(game_elements, game_schema):
-    community_chest_cards = set() # community chest card objects
-    chance_cards = set() # chance card objects
+    community_chest_cards = card.CardDeck() # community chest card objects
+    chance_cards = card.CardDeck() # chance card objects
 
     community_chest_card_objects = dict() # key is a community chest card name and value is an object
     chance_card_objects = dict() # key is a chance card name and value is an object
@@ -227,7 +386,7 @@ def _initialize_cards(game_elements, game_schema):
                 community_chest_cards.add(card_obj)
         else:
 
-            logger.debug('community chest card type is not recognized: '+ specific_card['card_type'])
+            logger.debug('community chest card type is not recognized: %s', specific_card['card_type'])
             logger.error("Exception")
             raise Exception
 
@@ -298,7 +457,7 @@ def _initialize_cards(game_elements, game_schema):
                 card_obj = card.CashFromPlayersCard(**card_args)
                 chance_cards.add(card_obj)
         else:
-            logger.debug('chance card type is not recognized: '+ specific_card['card_type'])
+            logger.debug('chance card type is not recognized: %s', specific_card['card_type'])
             logger.error("Exception")
             raise Exception
 
@@ -336,10 +495,9 @@ def _initialize_players(game_elements, game_schema, player_decision_agents):
         players.append(Player(**player_args))
 
     game_elements['players'] = players
+    game_elements['player_objects'] = dict([(p.player_name, p) for p in players]) # key is a player name, and value is a Player object
+    game_elements['players_over_cash_limit'] = set([p for p in players if p.current_cash > game_elements['bank'].runaway_cash_limit])
 
 
 def _initialize_game_history_structs(game_elements):
-    game_elements['history'] = dict()
-    game_elements['history']['function'] = list()
-    game_elements['history']['param'] = list()
-    game_elements['history']['return'] = list()
+    game_elements['history'] = GameHistory()
@@ -3,7 +3,46 @@ from monopoly_simulator.bank import Bank
 import logging
 logger = logging.getLogger('monopoly_simulator.logging_info.location')
 
+
+class _ReadOnlyTable(dict):
+    """
+    A dict that cannot be modified, for the rent and dues tables below. Reading it is as fast as reading a dict. Copies
+    (shallow or deep) are the table itself, and it is pickled by value.
+    """
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        logger.debug('Rent and dues tables are shared by all game boards and cannot be modified.')
+        logger.error("Exception")
+        raise TypeError('read-only table')
+
+    __setitem__ = __delitem__ = __ior__ = update = setdefault = pop = popitem = clear = _read_only
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return _ReadOnlyTable, (dict(self),)
+
+
+# Rent and dues tables are shared by all locations (across all game boards) that have the same values in them, rather
+# than every location building its own dict. They are read-only (see _ReadOnlyTable), since changing one in place would
+# change it for every game board; a location whose rents change gets (see RealEstateLocation.update_house_rent_dict)
+# the shared table for its new rents instead.
+_house_rent_dicts = dict() # key is a tuple of the rents with 1, 2, 3 and 4 houses, and value is the shared table
+_railroad_dues = _ReadOnlyTable({1: 25, 2: 50, 3: 100, 4: 200}) # railroad dues by the number of railroads the owner possesses
+_die_multiples = _ReadOnlyTable({1: 4, 2: 10}) # utility dues (as multiples of the die total) by the number of utilities the owner possesses
+
+
 class Location(object):
+    # attributes are held in slots rather than a per-instance __dict__, to keep game boards compact. Every sub-class
+    # declares the slots of the attributes it adds.
+    __slots__ = ('loc_class', 'name', 'start_position', 'end_position', 'color')
+
+    calculate_mortgage_owed = staticmethod(Bank.calculate_mortgage_owed)
 
     def __init__(self, loc_class, name, start_position, end_position, color):
         """
@@ -25,8 +64,6 @@ class Location(object):
         else:
             self.color = color
 
-        self.calculate_mortgage_owed = Bank.calculate_mortgage_owed
-
     def transfer_property_to_bank(self, player, current_gameboard):
         """
         This function is called when the player is selling the property back to the bank. If the property is mortgaged
@@ -37,10 +74,10 @@ class Location(object):
         :return: An integer. Specifies the amount due to the player for selling this property to the bank
         """
 
-        cash_due = self.price * current_gameboard['bank'].property_sell_percentage   # changed hardcoded value to a bank parameter
+        cash_due = self.price * current_gameboard.bank.property_sell_percentage   # changed hardcoded value to a bank parameter
         cash_owed = 0
         if self.loc_class == 'real_estate' and (self.num_houses > 0 or self.num_hotels > 0):
-            logger.debug('Bank error!'+ self.name+' being sold has improvements on it. Raising Exception')
+            logger.debug('Bank error!%s being sold has improvements on it. Raising Exception', self.name)
             logger.error("Exception")
             raise Exception
 
@@ -48,7 +85,7 @@ class Location(object):
             cash_owed = self.calculate_mortgage_owed(self, current_gameboard)
 
         if cash_due >= cash_owed:
-            if current_gameboard['bank'].total_cash_with_bank < cash_due - cash_owed:    # i.e. bank does not have enough money to pay the player what is due
+            if current_gameboard.bank.total_cash_with_bank < cash_due - cash_owed:    # i.e. bank does not have enough money to pay the player what is due
                 logger.debug("Bank has insufficient funds!!!  Rejected Transaction!!")
                 return flag_config_dict['failure_code']
             else:
@@ -56,13 +93,13 @@ class Location(object):
                 if self.is_mortgaged:
                     self.is_mortgaged = False
                 # add to game history
-                current_gameboard['history']['function'].append(player.remove_asset)
+                current_gameboard.history['function'].append(player.remove_asset)
                 params = dict()
                 params['self'] = player
                 params['asset'] = self
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(None)
-                self.owned_by = current_gameboard['bank']
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(None)
+                self.owned_by = current_gameboard.bank
                 return cash_due - cash_owed
 
         else:
@@ -70,13 +107,13 @@ class Location(object):
             if self.is_mortgaged:
                 self.is_mortgaged = False
             # add to game history
-            current_gameboard['history']['function'].append(player.remove_asset)
+            current_gameboard.history['function'].append(player.remove_asset)
             params = dict()
             params['self'] = player
             params['asset'] = self
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
-            self.owned_by = current_gameboard['bank']
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
+            self.owned_by = current_gameboard.bank
             return 0 # foreclosure.
 
 
@@ -91,22 +128,22 @@ class Location(object):
         """
         # from_player.remove_asset(self)
         # # add to game history
-        # current_gameboard['history']['function'].append(from_player.remove_asset)
+        # current_gameboard.history['function'].append(from_player.remove_asset)
         # params = dict()
         # params['self'] = from_player
         # params['asset'] = self
-        # current_gameboard['history']['param'].append(params)
-        # current_gameboard['history']['return'].append(None)
+        # current_gameboard.history['param'].append(params)
+        # current_gameboard.history['return'].append(None)
 
         self.update_asset_owner(to_player, current_gameboard)
         # add to game history
-        current_gameboard['history']['function'].append(self.update_asset_owner)
+        current_gameboard.history['function'].append(self.update_asset_owner)
         params = dict()
         params['self'] = self
         params['player'] = to_player
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
     def update_asset_owner(self, player, current_gameboard):
         """
@@ -119,44 +156,46 @@ class Location(object):
         :param current_gameboard: A dict. The global gameboard data structure
         :return: None
         """
-        logger.debug('attempting to update asset '+ self.name+ ' to reflect new owner: '+ player.player_name)
+        logger.debug('attempting to update asset %s to reflect new owner: %s', self.name, player.player_name)
         if self.loc_class == 'real_estate' or self.loc_class == 'railroad' or self.loc_class == 'utility':
             if self.owned_by == player:
-                logger.debug(player.player_name+' already owns this asset! Raising exception...')
+                logger.debug('%s already owns this asset! Raising exception...', player.player_name)
                 logger.error("Exception")
                 raise Exception
             elif type(self.owned_by) != Bank: # not owned by this player or by the bank.
-                logger.debug('Asset is owned by '+self.owned_by.player_name+'. Attempting to remove...')
+                logger.debug('Asset is owned by %s. Attempting to remove...', self.owned_by.player_name)
                 self.owned_by.remove_asset(self)
                 # add to game history
-                current_gameboard['history']['function'].append(self.owned_by.remove_asset)
+                current_gameboard.history['function'].append(self.owned_by.remove_asset)
                 params = dict()
                 params['self'] = self.owned_by
                 params['asset'] = self
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(None)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(None)
 
-                self.owned_by = current_gameboard['bank'] # this is temporary, but we want to enforce safe behavior
+                self.owned_by = current_gameboard.bank # this is temporary, but we want to enforce safe behavior
 
             self.owned_by = player
             player.add_asset(self, current_gameboard) # if the property is mortgaged, this will get reflected in the new owner's portfolio
             # add to game history
-            current_gameboard['history']['function'].append(player.add_asset)
+            current_gameboard.history['function'].append(player.add_asset)
             params = dict()
             params['self'] = player
             params['asset'] = self
             params['current_gameboard'] = current_gameboard
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
             logger.debug('Asset ownership update succeeded.')
         else:
-            logger.debug('Asset ',self.name+' is non-purchaseable!')
+            logger.debug('Asset %s is non-purchaseable!', self.name)
             logger.error("Exception")
             raise Exception
 
 
 class DoNothingLocation(Location):
+    __slots__ = ()
+
     def __init__(self, loc_class, name, start_position, end_position, color):
         """
         This is a location (such as free parking) where nothing happens. It has loc_class 'do_nothing' in the game
@@ -173,6 +212,8 @@ class DoNothingLocation(Location):
 
 
 class ActionLocation(Location):
+    __slots__ = ('perform_action',)
+
     def __init__(self, loc_class, name, start_position, end_position, color, perform_action):
         """
         This is a location that is associated with a non tax-paying action such as
@@ -193,6 +234,9 @@ class ActionLocation(Location):
 
 
 class RealEstateLocation(Location):
+    __slots__ = ('rent_1_house', 'rent_2_houses', 'rent_3_houses', 'rent_4_houses', 'rent_hotel', 'rent', 'price',
+                 'price_per_house', 'mortgage', 'owned_by', 'num_houses', 'num_hotels', 'is_mortgaged', '_house_rent_dict',
+                 'improvement_levels')
 
     def __init__(self, loc_class, name, start_position, end_position, color, rent_1_house, rent_hotel,
                  price, rent_3_houses, rent, mortgage, price_per_house, rent_4_houses, rent_2_houses, owned_by,
@@ -235,13 +279,30 @@ class RealEstateLocation(Location):
         self.num_houses = num_houses
         self.num_hotels = num_hotels
         self.is_mortgaged = False
+        self.update_house_rent_dict()
+        # the improvement level index of the color (see improvement_levels.py), which is handed to the location once
+        # the game board is set up
+        self.improvement_levels = None
 
-        obj = dict()
-        obj[1] = self.rent_1_house
-        obj[2] = self.rent_2_houses
-        obj[3] = self.rent_3_houses
-        obj[4] = self.rent_4_houses
-        self._house_rent_dict = obj
+    def update_house_rent_dict(self):
+        """
+        Point _house_rent_dict (the rent by number of houses) at the shared table for the current rent_1_house,
+        rent_2_houses, rent_3_houses and rent_4_houses. This must be called whenever any of these change.
+        :return: None
+        """
+        rents = (self.rent_1_house, self.rent_2_houses, self.rent_3_houses, self.rent_4_houses)
+        if rents not in _house_rent_dicts:
+            _house_rent_dicts[rents] = _ReadOnlyTable(zip([1, 2, 3, 4], rents))
+        self._house_rent_dict = _house_rent_dicts[rents]
+
+    def update_improvement_level(self):
+        """
+        Bring the improvement level index of the color of this location (see improvement_levels.py) up to date with its
+        current num_houses and num_hotels. This must be called whenever either of these change.
+        :return: None
+        """
+        if self.improvement_levels is not None:
+            self.improvement_levels.update(self)
 
     @staticmethod
     def calculate_rent(asset, current_gameboard):
@@ -254,22 +315,24 @@ class RealEstateLocation(Location):
         :return: An integer. The rent due.
         """
 
-        logger.debug('calculating rent for '+asset.name)
+        logger.debug('calculating rent for %s', asset.name)
         ans = asset.rent # unimproved-non-monopolized rent (the default)
         if asset.num_hotels == 1:
             logger.debug('property has a hotel. Updating rent.')
             ans = asset.rent_hotel
         elif asset.num_houses > 0: # later we can replace these with reflections
-            logger.debug('property has '+str(asset.num_houses)+' houses. Updating rent.')
+            logger.debug('property has %s houses. Updating rent.', asset.num_houses)
             ans = asset._house_rent_dict[asset.num_houses] # if for some reason you have more than 4 houses, you'll get a key error
         elif asset.color in asset.owned_by.full_color_sets_possessed:
-            ans = asset.rent*current_gameboard['bank'].monopolized_property_rent_factor # charge twice the rent on unimproved monopolized properties.
-            logger.debug('property has color '+ asset.color+ ' which is monopolized by '+asset.owned_by.player_name+'. Updating rent.')
-        logger.debug('rent is calculated to be '+str(ans))
+            ans = asset.rent*current_gameboard.bank.monopolized_property_rent_factor # charge twice the rent on unimproved monopolized properties.
+            logger.debug('property has color %s which is monopolized by %s. Updating rent.', asset.color, asset.owned_by.player_name)
+        logger.debug('rent is calculated to be %s', ans)
         return ans
 
 
 class TaxLocation(Location):
+    __slots__ = ('amount_due',)
+
     def __init__(self, loc_class, name, start_position, end_position, color, amount_due):
         """
         This is a tax (luxury or income) location. It has loc_class 'tax' in the game
@@ -292,6 +355,8 @@ class TaxLocation(Location):
 
 
 class RailroadLocation(Location):
+    __slots__ = ('price', 'mortgage', 'owned_by', 'is_mortgaged', '_railroad_dues')
+
     def __init__(self, loc_class, name, start_position, end_position, color, price, mortgage, owned_by):
         """
         This is a railroad location. It has loc_class 'railroad' in the game
@@ -312,13 +377,7 @@ class RailroadLocation(Location):
         self.mortgage = float(mortgage)
         self.owned_by = owned_by
         self.is_mortgaged = False
-
-        obj = dict()
-        obj[1] = 25
-        obj[2] = 50
-        obj[3] = 100
-        obj[4] = 200
-        self._railroad_dues = obj
+        self._railroad_dues = _railroad_dues
 
     @staticmethod
     def calculate_railroad_dues(asset, current_gameboard):
@@ -326,20 +385,21 @@ class RailroadLocation(Location):
         Compute dues if a player lands on railroad owned by another player.
         :return: An integer. Specifies railroad dues
         """
-        logger.debug('calculating railroad dues for '+asset.name)
+        logger.debug('calculating railroad dues for %s', asset.name)
         if asset.owned_by.num_railroads_possessed > 4 or asset.owned_by.num_railroads_possessed < 0:
-            logger.debug('Error! num railroads possessed by '+ asset.owned_by.player_name+ ' is '+ \
-                str(asset.owned_by.num_railroads_possessed)+', which is impossible')
+            logger.debug('Error! num railroads possessed by %s is %s, which is impossible', asset.owned_by.player_name, asset.owned_by.num_railroads_possessed)
 
             logger.error("Exception")
             raise Exception
         dues = asset._railroad_dues[asset.owned_by.num_railroads_possessed]
 
-        logger.debug('railroad dues are '+str(dues))
+        logger.debug('railroad dues are %s', dues)
         return dues
 
 
 class UtilityLocation(Location):
+    __slots__ = ('price', 'mortgage', 'owned_by', 'is_mortgaged', '_die_multiples')
+
     def __init__(self, loc_class, name, start_position, end_position, color, price, mortgage, owned_by):
         """
         This is a utility location. It has loc_class 'utility' in the game
@@ -360,11 +420,7 @@ class UtilityLocation(Location):
         self.mortgage = float(mortgage)
         self.owned_by = owned_by
         self.is_mortgaged = False
-
-        obj = dict()
-        obj[1] = 4
-        obj[2] = 10
-        self._die_multiples = obj
+        self._die_multiples = _die_multiples
 
     @staticmethod
     def calculate_utility_dues(asset, current_gameboard, die_total):
@@ -373,14 +429,13 @@ class UtilityLocation(Location):
         :param die_total: An integer. The dice total (if there's more than 1 dice as there is in the default game)
         :return: An integer. Specifies utility dues.
         """
-        logger.debug('calculating utility dues for '+ asset.name)
+        logger.debug('calculating utility dues for %s', asset.name)
         if asset.owned_by.num_utilities_possessed > 2 or asset.owned_by.num_utilities_possessed < 0:
-                logger.debug('Error! num utilities possessed by '+asset.owned_by.player_name+' is '+ \
-                    str(asset.owned_by.num_utilities_possessed)+ ', which is impossible')
+                logger.debug('Error! num utilities possessed by %s is %s, which is impossible', asset.owned_by.player_name, asset.owned_by.num_utilities_possessed)
 
                 logger.error("Exception")
                 raise Exception
 
         dues = die_total*asset._die_multiples[asset.owned_by.num_utilities_possessed]
-        logger.debug('utility dues are '+ str(dues))
+        logger.debug('utility dues are %s', dues)
         return dues
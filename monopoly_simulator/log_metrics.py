@@ -2,12 +2,13 @@ import os
 from monopoly_simulator.metrics_helper import generate_rank_matrix, generate_win_matrix
 
 
-def compute_win_loss_ratio(mypath, player_name=None):
+def compute_win_loss_ratio(mypath, player_name=None, num_workers=None):
     """
     This function calculates the win-ratio of the players who played the tournament.
     :param mypath: path to the all tournament_logs folder or to the individual tournament folder. This function checks if the path is directly to the
     parent tournament logs folder where win-ratio has to be calculated for all the tournaments or directly to an individual tournament folder.
     :param player_name: specific player whose win-ratio has to be calculated. If None, then the win-ratio of all players are printed.
+    :param num_workers: number of worker processes used to scan game logs that have no game summary (see metrics_helper). Defaults to the number of CPUs.
     :return: None. Prints out the win ratios of the different players in winners via the print_win_ratio function call.
     """
     flag = 0
@@ -16,7 +17,7 @@ def compute_win_loss_ratio(mypath, player_name=None):
             flag = 1
 
     if flag==1:
-        win_matrix = generate_win_matrix(mypath)
+        win_matrix = generate_win_matrix(mypath, num_workers)
         if isinstance(win_matrix, list):
             print_win_ratio(win_matrix, player_name)
         else:
@@ -32,7 +33,7 @@ def compute_win_loss_ratio(mypath, player_name=None):
 
         for folder in folders:
             path = mypath + '/' + folder
-            win_matrix = generate_win_matrix(path)
+            win_matrix = generate_win_matrix(path, num_workers)
             if isinstance(win_matrix, list):
                 print_win_ratio(win_matrix, player_name)
             else:
@@ -42,12 +43,13 @@ def compute_win_loss_ratio(mypath, player_name=None):
                 print_win_ratio(win_matrix['without_novelty'], player_name)
 
 
-def compute_average_rank_of_player(mypath, player_name=None):
+def compute_average_rank_of_player(mypath, player_name=None, num_workers=None):
     """
     This function calculates the average rank of the players who played the tournament.
     :param mypath: path to the all tournament_logs folder or to the individual tournament folder. This function checks if the path is directly to the
     parent tournament folder where average rank has to be calculated for all the tournaments or directly to an individual tournament folder.
     :param player_name: specific player whose average rank has to be calculated. If None, then the average rank of all players are printed.
+    :param num_workers: number of worker processes used to scan game logs that have no game summary (see metrics_helper). Defaults to the number of CPUs.
     :return: None. Prints out the average rank of the different players across all tournaments via the print_avg_rank function call.
     """
     flag = 0
@@ -56,7 +58,7 @@ def compute_average_rank_of_player(mypath, player_name=None):
             flag = 1
 
     if flag==1:
-        rank_matrix = generate_rank_matrix(mypath)
+        rank_matrix = generate_rank_matrix(mypath, num_workers)
         if isinstance(rank_matrix, list):
             print_avg_rank(rank_matrix, player_name)
         else:
@@ -72,7 +74,7 @@ def compute_average_rank_of_player(mypath, player_name=None):
 
         for folder in folders:
             path = mypath + '/' + folder
-            rank_matrix = generate_rank_matrix(path)
+            rank_matrix = generate_rank_matrix(path, num_workers)
             if isinstance(rank_matrix, list):
                 print_avg_rank(rank_matrix, player_name)
             else:
@@ -152,6 +154,7 @@ If no player name is specified, then statistics of all the players will be print
 '''
 
 
-compute_win_loss_ratio("../tournament_logs/")
-#compute_average_rank_of_player("../tournament_logs/tournament_without_novelty_4")
-#compute_average_rank_of_player("../tournament_logs/", 'player_1')
+if __name__ == '__main__':
+    compute_win_loss_ratio("../tournament_logs/")
+    #compute_average_rank_of_player("../tournament_logs/tournament_without_novelty_4")
+    #compute_average_rank_of_player("../tournament_logs/", 'player_1')
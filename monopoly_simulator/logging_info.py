@@ -1,9 +1,39 @@
+"""
+All simulator modules log through children of the 'monopoly_simulator.logging_info' logger, and pass their arguments
+lazily (logger.debug('... %s ...', arg)) so that messages are only formatted when they are actually going to be logged.
+Gameplay (debug) logging can be switched off simulator-wide with set_gameplay_logging(False), in which case the debug
+calls return right away without formatting anything; errors are still logged.
+"""
 import logging
 
+_gameplay_logging = True
+
+
+def set_gameplay_logging(enabled):
+    """
+    Switch gameplay (debug) logging on or off for all simulator modules. This also applies to log files created later
+    with log_file_create.
+    :param enabled: A boolean. If False, only errors get logged.
+    :return: None
+    """
+    global _gameplay_logging
+    _gameplay_logging = enabled
+    logging.getLogger(__name__).setLevel(_gameplay_log_level())
+
+
+def _gameplay_log_level():
+    """
+    Internal function that returns the level of the simulator logger, given the current gameplay logging mode.
+    :return: An integer. A logging level.
+    """
+    if _gameplay_logging:
+        return logging.DEBUG
+    return logging.ERROR
+
 
 def log_file_create(filename):
     logger = logging.getLogger(__name__)
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(_gameplay_log_level())
 
     formatter = logging.Formatter('%(asctime)s:%(name)s:%(levelname)s:%(message)s')
 
@@ -22,5 +52,3 @@ def log_file_create(filename):
     #logger.addHandler(stream_handler)
 
     return logger
-
-
@@ -1,143 +1,224 @@
+"""
+The win and rank matrices are computed from the game summaries written at the end of each game (see game_summary.py).
+Games played before summaries existed only have their text logs, and for those the logs are scanned instead. Scanning is
+made as cheap as possible: each log is memory mapped and searched with precompiled patterns (instead of running a regex
+on every line), the logs of a folder are scanned in parallel by a pool of worker processes, and the outcome of every
+scanned log is cached, keyed on the path, size and modification time of the log. The cache is kept in memory and in a
+file in the tournament folder (see _scan_cache_filename), so computing metrics again on an unchanged folder does not
+scan anything.
+"""
 import os
 import re
+import mmap
+import json
+import multiprocessing
+from monopoly_simulator import game_summary
 
+_winner_pattern = re.compile(b"We have a winner[^\\r\\n]*")
+_bankruptcy_pattern = re.compile(b"Discharging assets of[^\\r\\n]*")
 
-def generate_win_matrix(path):
+_scan_cache = dict()  # key is the absolute path of a log file, and value is [size, mtime_ns, winner, bankruptcies]
+_loaded_scan_cache_files = set()
+
+
+def generate_win_matrix(path, num_workers=None):
     """
     This function generates a matrix of tournaments with its respective winner-loser lists. It will be of size number_of_tournaments * number_of_players.
     For each tournament a list of the size of the number of players is generated. 0 indicates that the respective player lost that game.
     1 indicates that the respective player won the game.
     :param path: path to the folder that contains the tournament gameplay log files from which a matrix of tournaments vs winner-loser list is generated.
+    :param num_workers: number of worker processes used to scan logs (of games without a summary). Defaults to the number of CPUs.
     :return: the matrix of tournaments vs winner-loser lists is returned. It will be of size number_of_tournaments * number_of_players
     """
     print("\nGenerating tournament win matrix for tournament: " + path)
-    flag = 0
+    return _generate_matrix(path, _win_list, num_workers)
 
-    for files in os.listdir(path):
-        if "with_novelty_num_games" in files:
-            flag = 1
 
-    if not flag:
-        tournament_winners_matrix = []
-        for r, d, f in os.walk(path):
-            for file in f:
-                if not(file.endswith('log')):
-                    continue
-                winner_list = [0]*4
-                filenm = path+ '/' + file
-                with open(filenm, "r") as fileread:
-                    for line in fileread:
-                        winner = re.findall("We have a winner.*$", line, re.MULTILINE)
-                        if (len(winner)!=0):
-                            winner = winner[0].split("_")[1]
-                            winner_list[int(winner)-1] = 1
-                tournament_winners_matrix.append(winner_list)
-        return tournament_winners_matrix
-
-    else:
-        tournament_with_novelty_winners_matrix = []
-        tournament_without_novelty_winners_matrix = []
-        for r, d, f in os.walk(path):
-            for file in f:
-                if not(file.endswith('log')):
-                    continue
-                winner_list = [0]*4
-                filenm = path+ '/' + file
-                with open(filenm, "r") as fileread:
-                    for line in fileread:
-                        winner = re.findall("We have a winner.*$", line, re.MULTILINE)
-                        if (len(winner)!=0):
-                            winner = winner[0].split("_")[1]
-                            winner_list[int(winner)-1] = 1
-                if "with_novelty_num_games" in filenm:
-                    tournament_with_novelty_winners_matrix.append(winner_list)
-                else:
-                    tournament_without_novelty_winners_matrix.append(winner_list)
-        ret_dict = dict()
-        ret_dict['with_novelty'] = tournament_with_novelty_winners_matrix
-        ret_dict['without_novelty'] = tournament_without_novelty_winners_matrix
-        return ret_dict
-
-
-def generate_rank_matrix(path):
+def generate_rank_matrix(path, num_workers=None):
     """
     This function generates a matrix of tournaments with its respective player rank lists. It will be of size number_of_tournaments * number_of_players.
     For each tournament a list of the size of the number of players is generated. 1 indicates that the respective player won the game.
     2-4 indicates that the respective players came 2nd, 3rd or 4th respectively in the game.
     :param path: path to the folder that contains the tournament gameplay log files from which a matrix of tournaments vs player rank list is generated.
+    :param num_workers: number of worker processes used to scan logs (of games without a summary). Defaults to the number of CPUs.
     :return: the matrix of tournaments vs player rank lists is returned. It will be of size number_of_tournaments * number_of_players
     """
     print("\nGenerating tournament rank matrix for tournament: " + path)
+    return _generate_matrix(path, _rank_list, num_workers)
+
+
+def _generate_matrix(path, outcome_to_list, num_workers=None):
+    """
+    Internal function that builds a win or rank matrix with one row per game logged in the folder. If the folder holds
+    the games of a tournament with novelty, the games before and after novelty injection are split into two matrices.
+    :param path: path to the tournament folder.
+    :param outcome_to_list: _win_list or _rank_list, turning the outcome of a game into a row of the matrix.
+    :param num_workers: number of worker processes used to scan logs, see _game_outcomes.
+    :return: A list of lists, or a dict with the keys 'with_novelty' and 'without_novelty' and a list of lists as values.
+    """
     flag = 0
     for files in os.listdir(path):
         if "with_novelty_num_games" in files:
             flag = 1
 
+    log_filenames = []
+    for r, d, f in os.walk(path):
+        for file in f:
+            if file.endswith('log'):
+                log_filenames.append(path + '/' + file)
+
+    tournament_matrix = []
+    tournament_with_novelty_matrix = []
+    tournament_without_novelty_matrix = []
+    for filenm, (winner, bankruptcies) in zip(log_filenames, _game_outcomes(path, log_filenames, num_workers)):
+        row = outcome_to_list(winner, bankruptcies)
+        if not flag:
+            tournament_matrix.append(row)
+        elif "with_novelty_num_games" in filenm:
+            tournament_with_novelty_matrix.append(row)
+        else:
+            tournament_without_novelty_matrix.append(row)
+
     if not flag:
-        tournament_rank_matrix = []
-        for r, d, f in os.walk(path):
-            for file in f:
-                if not(file.endswith('log')):
-                    continue
-                game_terminate_flag = 0
-                winner_list = [0]*4
-                filenm = path+ '/' + file
-                with open(filenm, "r") as fileread:
-                    losers_l = []
-                    for line in fileread:
-                        winner = re.findall("We have a winner.*$", line, re.MULTILINE)
-                        if (len(winner)!=0):
-                            game_terminate_flag = 1
-                            winner = winner[0].split("_")[1]
-                            winner_list[int(winner)-1] = 1
-                        loser = re.findall("Discharging assets of.*$", line, re.MULTILINE)
-                        if (len(loser)!=0):
-                            loser = loser[0].split("_")[1]
-                            loser = loser[0].split(" ")[0]
-                            losers_l.append(loser)
-                if game_terminate_flag:
-                    count = 2
-                    for l in losers_l:
-                        winner_list[int(l)-1] = count
-                        count += 1
-
-                tournament_rank_matrix.append(winner_list)
-        return tournament_rank_matrix
-
-    else:
-        tournament_with_novelty_rank_matrix = []
-        tournament_without_novelty_rank_matrix = []
-        for r, d, f in os.walk(path):
-            for file in f:
-                if not(file.endswith('log')):
-                    continue
-                game_terminate_flag = 0
-                winner_list = [0]*4
-                filenm = path+ '/' + file
-                with open(filenm, "r") as fileread:
-                    losers_l = []
-                    for line in fileread:
-                        winner = re.findall("We have a winner.*$", line, re.MULTILINE)
-                        if (len(winner)!=0):
-                            game_terminate_flag = 1
-                            winner = winner[0].split("_")[1]
-                            winner_list[int(winner)-1] = 1
-                        loser = re.findall("Discharging assets of.*$", line, re.MULTILINE)
-                        if (len(loser)!=0):
-                            loser = loser[0].split("_")[1]
-                            loser = loser[0].split(" ")[0]
-                            losers_l.append(loser)
-                if game_terminate_flag:
-                    count = 2
-                    for l in losers_l:
-                        winner_list[int(l)-1] = count
-                        count += 1
-                if "with_novelty_num_games" in filenm:
-                    tournament_with_novelty_rank_matrix.append(winner_list)
-                else:
-                    tournament_without_novelty_rank_matrix.append(winner_list)
-        ret_dict = dict()
-        ret_dict['with_novelty'] = tournament_with_novelty_rank_matrix
-        ret_dict['without_novelty'] = tournament_without_novelty_rank_matrix
-        return ret_dict
+        return tournament_matrix
+    ret_dict = dict()
+    ret_dict['with_novelty'] = tournament_with_novelty_matrix
+    ret_dict['without_novelty'] = tournament_without_novelty_matrix
+    return ret_dict
+
+
+def _win_list(winner, bankruptcies):
+    winner_list = [0]*4
+    if winner is not None:
+        winner_list[_player_index(winner)] = 1
+    return winner_list
 
+
+def _rank_list(winner, bankruptcies):
+    # the winner is ranked 1, and the bankrupt players are ranked from 2 onwards in the order in which they went bankrupt
+    winner_list = [0]*4
+    if winner is not None:
+        winner_list[_player_index(winner)] = 1
+        count = 2
+        for l in bankruptcies:
+            winner_list[_player_index(l)] = count
+            count += 1
+    return winner_list
+
+
+def _player_index(player_name):
+    """
+    :param player_name: A string, e.g. 'player_3'
+    :return: An integer. The index of the player in a row of the win/rank matrix, e.g. 2
+    """
+    return int(player_name.split("_")[1]) - 1
+
+
+def _game_outcomes(path, log_filenames, num_workers=None):
+    """
+    Internal function that returns the outcome of every game logged in log_filenames. The outcome is read from the summary
+    written at the end of the game (see game_summary.py) if there is one. Otherwise it is taken from the scan cache, and
+    only logs that are not in the cache (or that have changed since they were cached) get scanned, over a pool of
+    num_workers processes.
+    :param path: path to the tournament folder, in which the scan cache file is kept.
+    :param log_filenames: A list of paths to game log files.
+    :param num_workers: An integer or None. Number of worker processes used to scan logs. Defaults to the number of CPUs.
+    :return: A list of tuples (winner, bankruptcies), in the same order as log_filenames. winner is a player name or
+    None, bankruptcies is a list of player names in the order in which they went bankrupt.
+    """
+    _load_scan_cache(path)
+    outcomes = [None]*len(log_filenames)
+    logs_to_scan = []
+    for index, log_filename in enumerate(log_filenames):
+        summary_filename = game_summary.summary_filename(log_filename)
+        if os.path.exists(summary_filename):
+            summary = game_summary.read_game_summary(summary_filename)
+            outcomes[index] = (summary['winner'], summary['bankruptcies'])
+            continue
+        log_key = os.path.abspath(log_filename)
+        stat = os.stat(log_filename)
+        cached = _scan_cache.get(log_key)
+        if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            outcomes[index] = (cached[2], cached[3])
+        else:
+            logs_to_scan.append((index, log_key, stat))
+
+    if logs_to_scan:
+        scan_filenames = [log_key for index, log_key, stat in logs_to_scan]
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
+        if num_workers > 1 and len(scan_filenames) > 1:
+            pool = multiprocessing.Pool(processes=min(num_workers, len(scan_filenames)))
+            try:
+                scanned = pool.map(_game_outcome_from_log, scan_filenames, chunksize=16)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            scanned = [_game_outcome_from_log(f) for f in scan_filenames]
+        for (index, log_key, stat), (winner, bankruptcies) in zip(logs_to_scan, scanned):
+            outcomes[index] = (winner, bankruptcies)
+            _scan_cache[log_key] = [stat.st_size, stat.st_mtime_ns, winner, bankruptcies]
+        _save_scan_cache(path)
+    return outcomes
+
+
+def _game_outcome_from_log(log_filename):
+    """
+    Internal function that scans a game log for the outcome of the game. The log is memory mapped and searched for the
+    winner and bankruptcy lines directly, rather than being read in line by line.
+    :param log_filename: A string. Path to the game log file.
+    :return: A tuple (winner, bankruptcies), as in _game_outcomes.
+    """
+    winner = None
+    bankruptcies = []
+    if os.path.getsize(log_filename) == 0:  # an empty file cannot be memory mapped
+        return winner, bankruptcies
+    with open(log_filename, "rb") as fileread:
+        with mmap.mmap(fileread.fileno(), 0, access=mmap.ACCESS_READ) as log:
+            for match in _winner_pattern.finditer(log):
+                winner = 'player_' + match.group(0).decode().split("_")[1]
+            for match in _bankruptcy_pattern.finditer(log):
+                loser = match.group(0).decode().split("_")[1]
+                bankruptcies.append('player_' + loser.split(" ")[0])
+    return winner, bankruptcies
+
+
+def _scan_cache_filename(path):
+    return os.path.join(path, '.metrics_scan_cache.json')
+
+
+def _load_scan_cache(path):
+    """
+    Internal function that adds the scan cache file of the tournament folder (if there is one) to the in-memory cache.
+    :param path: path to the tournament folder.
+    :return: None
+    """
+    cache_filename = os.path.abspath(_scan_cache_filename(path))
+    if cache_filename in _loaded_scan_cache_files:
+        return
+    _loaded_scan_cache_files.add(cache_filename)
+    if os.path.exists(cache_filename):
+        try:
+            with open(cache_filename, 'r') as infile:
+                _scan_cache.update(json.load(infile))
+        except ValueError:   # a damaged cache file is simply ignored, and the logs are scanned again
+            pass
+
+
+def _save_scan_cache(path):
+    """
+    Internal function that writes the cached outcomes of the logs in the tournament folder to its scan cache file. If the
+    folder is not writable (e.g. an archived tournament), the cache is only kept in memory.
+    :param path: path to the tournament folder.
+    :return: None
+    """
+    folder = os.path.abspath(path) + os.sep
+    entries = dict([(k, v) for k, v in _scan_cache.items() if k.startswith(folder)])
+    cache_filename = _scan_cache_filename(path)
+    try:
+        with open(cache_filename + '.tmp', 'w') as outfile:
+            json.dump(entries, outfile, separators=(',', ':'))
+        os.replace(cache_filename + '.tmp', cache_filename)
+    except OSError:
+        pass
@@ -10,7 +10,7 @@ def alternate_contingency_function_1(player, card, current_gameboard):
     undergo changes (but the syntax and function it substitutes will not change).
     :return:
     """
-    logger.debug('calculating alternative street repair cost for '+ player.player_name)
+    logger.debug('calculating alternative street repair cost for %s', player.player_name)
     cost_per_house = 70
     cost_per_hotel = 145
     cost = player.num_total_houses * cost_per_house + player.num_total_hotels * cost_per_hotel
@@ -1,4 +1,7 @@
 from monopoly_simulator.dice import Dice
+from monopoly_simulator.player import Player, compile_landing_table
+from monopoly_simulator.improvement_levels import set_up_improvement_levels
+from monopoly_simulator.card import CardDeck
 from monopoly_simulator.novelty_functions import *
 import copy
 import sys
@@ -61,6 +64,10 @@ class InanimateAttributeNovelty(AttributeNovelty):
                     loc_set.remove(loc)
                 current_gameboard['color_assets'][loc.color].add(loc)
 
+        # and the color ownership and improvement level indexes, which are kept by color
+        if 'color_ownership' in current_gameboard:
+            current_gameboard['color_ownership'].rebuild()
+        set_up_improvement_levels(current_gameboard)
 
     def map_property_to_color(self, current_gameboard, property, new_color):
         """
@@ -116,10 +123,7 @@ class InanimateAttributeNovelty(AttributeNovelty):
             setattr(location, k, v)
 
         if location.loc_class == 'real_estate':
-            location._house_rent_dict[1] = location.rent_1_house
-            location._house_rent_dict[2] = location.rent_2_houses
-            location._house_rent_dict[3] = location.rent_3_houses
-            location._house_rent_dict[4] = location.rent_4_houses
+            location.update_house_rent_dict()
 
 
     def mortgage_novelty(self, location, new_mortgage):
@@ -131,6 +135,8 @@ class InanimateAttributeNovelty(AttributeNovelty):
         :return: None
         """
         location.mortgage = new_mortgage
+        if isinstance(location.owned_by, Player):
+            location.owned_by.update_asset_values(location)
 
     def price_novelty(self, location, new_price):
         """
@@ -141,6 +147,8 @@ class InanimateAttributeNovelty(AttributeNovelty):
         :return: None
         """
         location.price = new_price
+        if isinstance(location.owned_by, Player):
+            location.owned_by.update_asset_values(location)
 
     def price_per_house_novelty(self, location, new_price_per_house):
         """
@@ -151,6 +159,8 @@ class InanimateAttributeNovelty(AttributeNovelty):
         :return: None
         """
         location.price_per_house = new_price_per_house
+        if isinstance(location.owned_by, Player):
+            location.owned_by.update_asset_values(location)
 
 
     def card_amount_novelty(self, current_gameboard, community_chest_card_amounts=None, chance_card_amounts=None):
@@ -255,13 +265,13 @@ class NumberClassNovelty(ClassNovelty):
         :return: None
         """
 
-        current_gameboard['community_chest_cards'] = set()
+        current_gameboard['community_chest_cards'] = CardDeck()
         for card_name, num in community_chest_cards_num.items():
             card = current_gameboard['community_chest_card_objects'][card_name]
             for i in range(0, num):
                 current_gameboard['community_chest_cards'].add(copy.deepcopy(card))
 
-        current_gameboard['chance_cards'] = set()
+        current_gameboard['chance_cards'] = CardDeck()
         for card_name, num in chance_cards_num.items():
             card = current_gameboard['chance_card_objects'][card_name]
             for i in range(0, num):
@@ -371,7 +381,8 @@ class SpatialRepresentationNovelty(RepresentationNovelty):
 
         :param current_gameboard: current_gameboard['location_sequence'], current_gameboard['location_objects'], current_gameboard['go_position'],
         current_gameboard['jail_position'], current_gameboard['railroad_positions']
-        and current_gameboard['utility_positions'] may all potentially get modified.
+        and current_gameboard['utility_positions'] may all potentially get modified. Location objects are moved around in place
+        and keep their names, so current_gameboard['location_objects'] (used to resolve location names) remains valid.
         :param new_location_sequence: a list of location names. Note that this is not a list of location objects
         :return: None
         """
@@ -398,6 +409,8 @@ class SpatialRepresentationNovelty(RepresentationNovelty):
             if current_gameboard['location_objects'][loc_name].name == 'Go':
                 current_gameboard['go_position'] = index
 
+        compile_landing_table(current_gameboard) # locations have been moved around in place
+
 
 class GranularityRepresentationNovelty(RepresentationNovelty):
     def __init__(self):
@@ -408,7 +421,8 @@ class GranularityRepresentationNovelty(RepresentationNovelty):
         current_gameboard['location_sequence'], current_gameboard['location_objects'], current_gameboard['go_position'],
         current_gameboard['jail_position'], current_gameboard['railroad_positions']
         and current_gameboard['utility_positions'] may all potentially get modified. current_gameboard['location_objects']
-        gets modified not only via location, which will change its end_position field but also via the start
+        gets modified not only via location, which will change its end_position field but also via the start. Since no
+        location gets renamed or replaced, current_gameboard['location_objects'] remains a valid name index.
         :param current_gameboard:
         :param location:
         :param new_end_position:
@@ -449,4 +463,5 @@ class GranularityRepresentationNovelty(RepresentationNovelty):
             loc.end_position = new_end_position
             forbidden_loc_names.add(loc.name)
         current_gameboard['location_sequence'] = new_location_sequence
+        compile_landing_table(current_gameboard)
 
@@ -0,0 +1,175 @@
+"""
+A content-addressed, on-disk cache of game outcomes. A tournament game is fully determined by the game schema, the code
+of the simulator and the agents, the novelty that is injected (if any), whether the agents are told about the novelty,
+the seed, the seat order (if it is fixed rather than drawn with the seed), the agent of every player and the game
+budget. game_key hashes all of these, and the summary of the game (see game_summary.py) is stored under that key, so
+that a game that has been played before (e.g., the pre-novelty games that every novelty experiment with the same
+meta_seed starts with) does not need to be simulated again.
+
+Cached summaries are stored as <cache_folder>/<first two characters of the key>/<key>.json. Files are written under a
+temporary name and then renamed, so several processes can share a cache folder.
+
+Since the source files of the simulator core (see core_modules) and of the agents that play the game are part of the
+key, any change to the code that decides the outcome of a game starts a fresh set of keys; stale entries are simply
+never hit again. Tournament drivers, scripts and other modules that do not take part in a game (test_harness.py,
+benchmark.py etc.) are not part of the key, so editing them keeps the cache.
+"""
+import hashlib
+import inspect
+import json
+import os
+import numpy as np
+
+# the modules of this package that decide the outcome of a game, apart from the agent modules (see game_key)
+core_modules = ['action_choices', 'agent', 'agent_helper_functions', 'bank', 'card', 'card_utility_actions',
+                'color_ownership', 'diagnostics', 'dice', 'flag_config', 'game_budget', 'game_state', 'game_summary',
+                'gameplay', 'history', 'improvement_levels', 'initialize_game_elements', 'location', 'novelty_functions',
+                'novelty_generator', 'player']
+
+default_agent_module = 'background_agent_v3_1'   # the agent module of the players not in agent_modules
+
+_code_hash = None
+_module_hashes = dict()   # agent module name -> hash of its source
+_schema_hash_memo = (None, None)  # (schema, hash) of the last schema that was hashed
+
+
+def _get_code_hash():
+    """
+    Internal function that hashes the source of the simulator core (see core_modules), along with the numpy version
+    (which determines the random number streams). Computed once per process.
+    :return: A string. A hex digest.
+    """
+    global _code_hash
+    if _code_hash is None:
+        sha = hashlib.sha256()
+        for module_name in core_modules:
+            sha.update(module_name.encode())
+            sha.update(_read_module_source(module_name))
+        sha.update(np.__version__.encode())
+        _code_hash = sha.hexdigest()
+    return _code_hash
+
+
+def _get_module_hash(module_name):
+    """
+    Internal function that hashes the source of an agent module of this package. Computed once per process and module.
+    :param module_name: A string. The name of the module in monopoly_simulator, e.g. 'background_agent_v3_1'.
+    :return: A string. A hex digest.
+    """
+    if module_name not in _module_hashes:
+        _module_hashes[module_name] = hashlib.sha256(_read_module_source(module_name)).hexdigest()
+    return _module_hashes[module_name]
+
+
+def _read_module_source(module_name):
+    """
+    :param module_name: A string. The name of a module in monopoly_simulator.
+    :return: Bytes. The source file of the module.
+    """
+    package_folder = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(package_folder, module_name + '.py'), 'rb') as infile:
+        return infile.read()
+
+
+def _get_schema_hash(game_schema):
+    """
+    :param game_schema: A dict. The game schema.
+    :return: A string. A hex digest of the schema.
+    """
+    global _schema_hash_memo
+    if _schema_hash_memo[0] is not game_schema:
+        schema_hash = hashlib.sha256(json.dumps(game_schema, sort_keys=True).encode()).hexdigest()
+        _schema_hash_memo = (game_schema, schema_hash)
+    return _schema_hash_memo[1]
+
+
+def _function_fingerprint(function):
+    """
+    :param function: A function, another callable object, or None.
+    :return: A string identifying the function by its module, name and source code. Callable objects that are not
+    functions (e.g. an experiment_grid.ExperimentConfiguration) are identified by their class, the source code of the
+    class and their repr instead.
+    """
+    if function is None:
+        return 'None'
+    if not inspect.isfunction(function):
+        return type(function).__module__ + '.' + type(function).__qualname__ + '\n' + _source(type(function)) + '\n' + \
+               repr(function)
+    return function.__module__ + '.' + function.__qualname__ + '\n' + _source(function)
+
+
+def _source(function):
+    """
+    :param function: A function or a class.
+    :return: A string. Its source code, or '' if the source is not available.
+    """
+    try:
+        return inspect.getsource(function)
+    except (OSError, TypeError):
+        return ''
+
+
+def game_key(game_schema, game_seed, novelty_info=False, inject_novelty_function=None, seat_order=None,
+             agent_modules=None, budget=None):
+    """
+    :param game_schema: A dict. The game schema the game is played with.
+    :param game_seed: An integer. The seed of the game.
+    :param novelty_info: A boolean. Whether the agents are notified of novelty.
+    :param inject_novelty_function: A function or None. The function that injects novelty into the game board.
+    :param seat_order: A list of player names or None. The order in which the players take their turns, if it is not
+    left to the seed.
+    :param agent_modules: A dict or None. The agent module of every player, if not the default one.
+    :param budget: A dict or None. The game budget (see game_budget.py).
+    :return: A string. The cache key of the game.
+    """
+    module_names = set([default_agent_module])
+    if agent_modules:
+        module_names.update(agent_modules.values())
+    parts = [_get_code_hash()] + [_get_module_hash(module_name) for module_name in sorted(module_names)]
+    parts += [_get_schema_hash(game_schema), _function_fingerprint(inject_novelty_function), str(bool(novelty_info)),
+              str(game_seed), json.dumps(seat_order), json.dumps(agent_modules, sort_keys=True),
+              json.dumps(budget, sort_keys=True)]
+    sha = hashlib.sha256()
+    for part in parts:
+        sha.update(part.encode())
+        sha.update(b'\0')
+    return sha.hexdigest()
+
+
+def _cache_filename(cache_folder, key):
+    return os.path.join(cache_folder, key[0:2], key + '.json')
+
+
+def get_cached_summary(cache_folder, key):
+    """
+    :param cache_folder: A string. Path of the cache folder.
+    :param key: A string. The cache key of the game (see game_key).
+    :return: A dict. The game summary stored under key, or None if the game is not in the cache.
+    """
+    filename = _cache_filename(cache_folder, key)
+    if not os.path.exists(filename):
+        return None
+    try:
+        with open(filename, 'r') as infile:
+            return json.load(infile)
+    except ValueError:   # a damaged entry counts as a miss (and gets overwritten once the game has been played)
+        return None
+
+
+def store_summary(cache_folder, key, summary):
+    """
+    Store the game summary under key. The summary of a game that was cut short by its wall clock budget is not stored,
+    since its outcome depends on how fast the game was played.
+    :param cache_folder: A string. Path of the cache folder.
+    :param key: A string. The cache key of the game (see game_key).
+    :param summary: A dict. The game summary.
+    :return: None
+    """
+    if summary.get('truncated') == 'max_seconds':
+        return
+    filename = _cache_filename(cache_folder, key)
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    temp_filename = filename + '.' + str(os.getpid()) + '.tmp'
+    with open(temp_filename, 'w') as outfile:
+        json.dump(summary, outfile, separators=(',', ':'))
+    os.replace(temp_filename, filename)
@@ -5,8 +5,33 @@ from monopoly_simulator.bank import Bank
 import logging
 logger = logging.getLogger('monopoly_simulator.logging_info.player')
 
+# key is the name of an action that a decision agent may return, and value is the corresponding function in action_choices
+_action_function_pointers = {
+    'skip_turn': action_choices.skip_turn,
+    'concluded_actions': action_choices.concluded_actions,
+    'make_trade_offer': action_choices.make_trade_offer,
+    'accept_trade_offer': action_choices.accept_trade_offer,
+    'buy_property': action_choices.buy_property,
+    'sell_property': action_choices.sell_property,
+    'mortgage_property': action_choices.mortgage_property,
+    'free_mortgage': action_choices.free_mortgage,
+    'improve_property': action_choices.improve_property,
+    'sell_house_hotel': action_choices.sell_house_hotel,
+    'pay_jail_fine': action_choices.pay_jail_fine,
+    'use_get_out_of_jail_card': action_choices.use_get_out_of_jail_card,
+}
+
 
 class Player(object):
+    # attributes are held in slots rather than a per-instance __dict__, to keep game boards compact
+    __slots__ = ('current_position', 'status', 'has_get_out_of_jail_chance_card', 'has_get_out_of_jail_community_chest_card',
+                 'current_cash', 'num_railroads_possessed', 'player_name', 'assets', 'full_color_sets_possessed',
+                 'currently_in_jail', 'num_utilities_possessed', 'agent', 'num_total_houses', 'num_total_hotels',
+                 'outstanding_property_offer', 'is_property_offer_outstanding', 'outstanding_trade_offer',
+                 'is_trade_offer_outstanding', 'mortgaged_assets', '_option_to_buy', '_asset_values', '_total_asset_price',
+                 '_total_house_cost', '_total_hotel_cost', '_total_mortgage_taken', '_total_mortgage_available',
+                 'color_ownership')
+
     def __init__(self, current_position, status, has_get_out_of_jail_community_chest_card, has_get_out_of_jail_chance_card,
                  current_cash, num_railroads_possessed, player_name, assets,full_color_sets_possessed, currently_in_jail,
                  num_utilities_possessed,
@@ -74,6 +99,21 @@ class Player(object):
         self._option_to_buy = False # this option will turn true when  the player lands on a property that could be bought.
         # We always set it to false again at the end of the post_roll phase. It is an internal variable.
 
+        # running totals over the assets of the player, kept up to date by update_asset_values so that net worth,
+        # mortgage outstanding and the cash obtainable by mortgaging or selling can be read off without looping over assets.
+        # They do not depend on any bank parameters (these are only applied when the totals are read, see compute_net_worth etc.)
+        self._asset_values = dict() # key is an asset, value is the tuple of its contributions to the totals below
+        self._total_asset_price = 0 # sum of the prices of all assets
+        self._total_house_cost = 0 # sum of num_houses*price_per_house over all assets
+        self._total_hotel_cost = 0 # sum of num_hotels*price_per_house over all assets
+        self._total_mortgage_taken = 0 # sum of the mortgage amounts of all mortgaged assets
+        self._total_mortgage_available = 0 # sum of the mortgage amounts of all assets that are unmortgaged and unimproved
+        self.recompute_asset_values()
+
+        # the color ownership index of the game board (see color_ownership.py), which is handed to the player once the
+        # board is set up. Until then, ownership of color sets is found by looking at the assets.
+        self.color_ownership = None
+
     def change_decision_agent(self, agent):
         self.agent = agent
 
@@ -86,18 +126,19 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: None
         """
-        logger.debug('Beginning bankruptcy proceedings for '+self.player_name)
+        logger.debug('Beginning bankruptcy proceedings for %s', self.player_name)
         self.current_position = None
         self.status = 'lost'
         self.current_cash = 0
+        self._update_runaway_cash_status(current_gameboard)
         self.discharge_assets_to_bank(current_gameboard)
         # add to game history
-        current_gameboard['history']['function'].append(self.discharge_assets_to_bank)
+        current_gameboard.history['function'].append(self.discharge_assets_to_bank)
         params = dict()
         params['self'] = self
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         self.num_total_houses = 0
         self.num_total_hotels = 0
@@ -116,20 +157,20 @@ class Player(object):
         self.outstanding_trade_offer['from_player'] = None
 
         if self._option_to_buy:
-            logger.debug('Warning! option to buy is set to true for '+self.player_name+' even in bankruptcy proceedings.')
+            logger.debug('Warning! option to buy is set to true for %s even in bankruptcy proceedings.', self.player_name)
         self._option_to_buy = False
         self.is_property_offer_outstanding = False
         self.is_trade_offer_outstanding = False
 
         if self.has_get_out_of_jail_chance_card:  # we give first preference to chance, then community chest
             self.has_get_out_of_jail_chance_card = False
-            logger.debug('releasing get_out_of_jail_chance_card for '+self.player_name)
-            current_gameboard['chance_cards'].add(current_gameboard['chance_card_objects']['get_out_of_jail_free'])
+            logger.debug('releasing get_out_of_jail_chance_card for %s', self.player_name)
+            current_gameboard.chance_cards.add(current_gameboard['chance_card_objects']['get_out_of_jail_free'])
 
         if self.has_get_out_of_jail_community_chest_card:
             self.has_get_out_of_jail_community_chest_card = False
-            logger.debug('releasing get_out_of_jail_community_chest_card for '+self.player_name)
-            current_gameboard['community_chest_cards'].add(current_gameboard['community_chest_card_objects']['get_out_of_jail_free'])
+            logger.debug('releasing get_out_of_jail_community_chest_card for %s', self.player_name)
+            current_gameboard.community_chest_cards.add(current_gameboard['community_chest_card_objects']['get_out_of_jail_free'])
 
     def add_asset(self, asset, current_gameboard):
         """
@@ -141,49 +182,156 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: None
         """
-        logger.debug('Looking to add asset '+asset.name+' to portfolio of '+self.player_name)
+        logger.debug('Looking to add asset %s to portfolio of %s', asset.name, self.player_name)
         if asset in self.assets:
             logger.error('Error! Player already owns asset!')
             logger.error("Exception")
             raise Exception
 
         self.assets.add(asset)
-        logger.debug('total no. of assets now owned by player: '+str(len(self.assets)))
+        logger.debug('total no. of assets now owned by player: %s', len(self.assets))
+        if self.color_ownership is not None:
+            self.color_ownership.add(self, asset)
 
         if type(asset) == UtilityLocation:
             self.num_utilities_possessed += 1
-            logger.debug('incrementing '+self.player_name+ "'s utility count by 1, total utilities owned by player now is "+str(self.num_utilities_possessed))
+            logger.debug("incrementing %s's utility count by 1, total utilities owned by player now is %s", self.player_name, self.num_utilities_possessed)
         elif type(asset) == RailroadLocation:
             self.num_railroads_possessed += 1
-            logger.debug('incrementing '+ self.player_name+ "'s railroad count by 1, total railroads owned by player now is "+ str(self.num_railroads_possessed))
+            logger.debug("incrementing %s's railroad count by 1, total railroads owned by player now is %s", self.player_name, self.num_railroads_possessed)
         elif type(asset) == RealEstateLocation:
-            flag = True
-            for o in current_gameboard['color_assets'][asset.color]:
-                if o not in self.assets:
-                    flag = False
-                    break
-            if flag: # if this is still True, then that means we now possess all the properties with this asset's color
+            if self.color_ownership is not None:
+                flag = self.color_ownership.owns_color_set(self, asset.color)
+            else:
+                flag = True
+                for o in current_gameboard.color_assets[asset.color]:
+                    if o not in self.assets:
+                        flag = False
+                        break
+            if flag: # if this is True, then that means we now possess all the properties with this asset's color
                 self.full_color_sets_possessed.add(asset.color)
 
             if asset.num_houses > 0:
                 self.num_total_houses += asset.num_houses
-                logger.debug('incrementing '+self.player_name+ "'s num_total_houses count by "+ str(asset.num_houses)+
-                    ". Total houses now owned by player now is "+ str(self.num_total_houses))
+                logger.debug("incrementing %s's num_total_houses count by %s. Total houses now owned by player now is %s", self.player_name, asset.num_houses, self.num_total_houses)
                 # note that technically, the property should not have been transferred to player
                 # if there were improvements on it. But we include this code just in case, and to flag errors later.
             elif asset.num_hotels > 0:
                 self.num_total_hotels += asset.num_hotels
-                logger.debug('incrementing '+ self.player_name+ "'s num_total_hotels coadd_assunt by "+str(asset.num_hotels)+
-                    ". Total hotels now owned by player now is "+ str(self.num_total_hotels))
+                logger.debug("incrementing %s's num_total_hotels coadd_assunt by %s. Total hotels now owned by player now is %s", self.player_name, asset.num_hotels, self.num_total_hotels)
         else:
             logger.error('You are attempting to add non-purchaseable asset to player\'s portfolio!')
             logger.error("Exception")
             raise Exception
 
         if asset.is_mortgaged:
-            logger.debug('asset ',asset.name," is mortgaged. Adding to player's mortgaged assets.")
+            logger.debug("asset %s is mortgaged. Adding to player's mortgaged assets.", asset.name)
             self.mortgaged_assets.add(asset)
-            logger.debug('Total number of mortgaged assets owned by player is '+str(len(self.mortgaged_assets)))
+            logger.debug('Total number of mortgaged assets owned by player is %s', len(self.mortgaged_assets))
+
+        self.update_asset_values(asset)
+
+    @staticmethod
+    def _compute_asset_values(asset):
+        """
+        Internal function that computes the contributions of asset to the running totals over the assets of a player.
+        :param asset: A purchaseable Location instance (railroad, utility or real estate)
+        :return: A tuple (price, house cost, hotel cost, mortgage taken, mortgage available)
+        """
+        house_cost = 0
+        hotel_cost = 0
+        improved = False
+        if asset.loc_class == 'real_estate':
+            house_cost = asset.num_houses*asset.price_per_house
+            hotel_cost = asset.num_hotels*asset.price_per_house
+            improved = asset.num_houses > 0 or asset.num_hotels > 0
+        if asset.is_mortgaged:
+            return (asset.price, house_cost, hotel_cost, asset.mortgage, 0)
+        elif improved:
+            return (asset.price, house_cost, hotel_cost, 0, 0)
+        else:
+            return (asset.price, house_cost, hotel_cost, 0, asset.mortgage)
+
+    def _add_to_asset_totals(self, values, sign):
+        """
+        Internal function that adds (sign=1) or subtracts (sign=-1) the contributions of an asset to/from the running totals.
+        :param values: A tuple, as returned by _compute_asset_values
+        :param sign: An integer, 1 or -1
+        :return: None
+        """
+        self._total_asset_price += sign*values[0]
+        self._total_house_cost += sign*values[1]
+        self._total_hotel_cost += sign*values[2]
+        self._total_mortgage_taken += sign*values[3]
+        self._total_mortgage_available += sign*values[4]
+
+    def update_asset_values(self, asset):
+        """
+        Bring the running totals over the player's assets up to date for asset. This must be called whenever an asset
+        enters or leaves the portfolio, or an owned asset changes in a way that affects its value: it gets mortgaged or
+        freed, houses/hotels are set up or sold on it, or a novelty changes its price, price_per_house or mortgage.
+        :param asset: A purchaseable Location instance (railroad, utility or real estate)
+        :return: None
+        """
+        if asset in self._asset_values:
+            self._add_to_asset_totals(self._asset_values.pop(asset), -1)
+        if self.assets and asset in self.assets:
+            values = self._compute_asset_values(asset)
+            self._asset_values[asset] = values
+            self._add_to_asset_totals(values, 1)
+
+    def recompute_asset_values(self):
+        """
+        Recompute the running totals over the player's assets from scratch. Only needed if the assets were modified
+        directly rather than through add_asset/remove_asset (e.g., when the game state is read in from file).
+        :return: None
+        """
+        self._asset_values = dict()
+        self._total_asset_price = 0
+        self._total_house_cost = 0
+        self._total_hotel_cost = 0
+        self._total_mortgage_taken = 0
+        self._total_mortgage_available = 0
+        if self.assets:
+            for asset in self.assets:
+                self.update_asset_values(asset)
+
+    def compute_net_worth(self, current_gameboard):
+        """
+        The net worth of the player: current cash plus the price of every asset and the cost of the improvements on it
+        (a hotel costs house_limit_before_hotel+1 houses). Mortgages are not deducted. This does not loop over the assets.
+        :param current_gameboard: A dict. The global data structure representing the current game board.
+        :return: A float. The net worth of the player.
+        """
+        return self.current_cash + self._total_asset_price + self._total_house_cost + \
+               self._total_hotel_cost*(current_gameboard.bank.house_limit_before_hotel + 1)
+
+    def compute_mortgage_outstanding(self, current_gameboard):
+        """
+        The total amount (including interest) the player would have to pay to free all of its mortgaged assets.
+        :param current_gameboard: A dict. The global data structure representing the current game board.
+        :return: A float.
+        """
+        return (1.0 + current_gameboard.bank.mortgage_percentage)*self._total_mortgage_taken
+
+    def compute_cash_obtainable_by_mortgaging(self):
+        """
+        The cash the player could raise by mortgaging all of its unmortgaged assets that have no improvements on them.
+        :return: A float.
+        """
+        return self._total_mortgage_available
+
+    def compute_cash_obtainable_by_selling(self, current_gameboard):
+        """
+        The cash the player could raise by selling all improvements and then all assets back to the bank, net of the
+        mortgage owed on mortgaged assets.
+        :param current_gameboard: A dict. The global data structure representing the current game board.
+        :return: A float.
+        """
+        bank = current_gameboard.bank
+        return self._total_asset_price*bank.property_sell_percentage + self._total_house_cost*bank.house_sell_percentage + \
+               self._total_hotel_cost*(bank.house_limit_before_hotel + 1)*bank.hotel_sell_percentage - \
+               self.compute_mortgage_outstanding(current_gameboard)
 
     def remove_asset(self, asset):
         """
@@ -199,44 +347,48 @@ class Player(object):
         :param asset: A purchaseable Location instance (railroad, utility or real estate)
         :return: None
         """
-        logger.debug('Attempting to remove asset '+asset.name+' from ownership of '+self.player_name)
+        logger.debug('Attempting to remove asset %s from ownership of %s', asset.name, self.player_name)
         if asset not in self.assets:
             logger.error('Error! Player does not own asset!')
             logger.error("Exception")
             raise Exception
 
         self.assets.remove(asset)
-        logger.debug('total no. of assets now owned by player: '+str(len(self.assets)))
+        logger.debug('total no. of assets now owned by player: %s', len(self.assets))
+        if self.color_ownership is not None:
+            self.color_ownership.remove(self, asset)
 
         if type(asset) == UtilityLocation:
             self.num_utilities_possessed -= 1
-            logger.debug('Decrementing '+self.player_name+ "'s utility count by 1, total utilities owned by player now is "+str(self.num_utilities_possessed))
+            logger.debug("Decrementing %s's utility count by 1, total utilities owned by player now is %s", self.player_name, self.num_utilities_possessed)
         elif type(asset) == RailroadLocation:
             self.num_railroads_possessed -= 1
-            logger.debug('Decrementing '+ self.player_name+ "'s railroad count by 1, total railroads owned by player now is "+ str(self.num_railroads_possessed))
+            logger.debug("Decrementing %s's railroad count by 1, total railroads owned by player now is %s", self.player_name, self.num_railroads_possessed)
         elif type(asset) == RealEstateLocation:
             if asset.color in self.full_color_sets_possessed:
                 self.full_color_sets_possessed.remove(asset.color)
 
             if asset.num_houses > 0:
                 self.num_total_houses -= asset.num_houses
-                logger.debug('Decrementing '+self.player_name+ "'s num_total_houses count by "+ str(asset.num_houses),
-                    ". Total houses now owned by player now is ", str(self.num_total_houses))
+                logger.debug("Decrementing %s's num_total_houses count by %s. Total houses now owned by player now is %s",
+                             self.player_name, asset.num_houses, self.num_total_houses)
                 # note that technically, the property should not have been removed
                 # if there were improvements on it. But we include this code just in case, and to flag errors later.
             elif asset.num_hotels > 0:
                 self.num_total_hotels -= asset.num_hotels
-                logger.debug('Decrementing '+ self.player_name+ "'s num_total_hotels count by "+ str(asset.num_hotels),
-                    ". Total hotels now owned by player now is ", str(self.num_total_hotels))
+                logger.debug("Decrementing %s's num_total_hotels count by %s. Total hotels now owned by player now is %s",
+                             self.player_name, asset.num_hotels, self.num_total_hotels)
         else:
             logger.error('The property to be removed from the portfolio is not purchaseable. How did it get here?')
             logger.error("Exception")
             raise Exception
 
         if asset.is_mortgaged: # the asset is still mortgaged after we remove it from the player's portfolio. The next player must free it up.
-            logger.debug('asset '+asset.name+" is mortgaged. Removing from player's mortgaged assets.")
+            logger.debug("asset %s is mortgaged. Removing from player's mortgaged assets.", asset.name)
             self.mortgaged_assets.remove(asset)
-            logger.debug('Total number of mortgaged assets owned by player is '+str(len(self.mortgaged_assets)))
+            logger.debug('Total number of mortgaged assets owned by player is %s', len(self.mortgaged_assets))
+
+        self.update_asset_values(asset)
 
     def charge_player(self, amount, current_gameboard, bank_flag=False):
         """
@@ -249,14 +401,15 @@ class Player(object):
             logger.error('You cannot charge player negative amount of cash.')
             logger.error("Exception")
             raise Exception
-        logger.debug(self.player_name+ ' is being charged amount: '+str(amount))
-        logger.debug('Before charge, player has cash '+str(self.current_cash))
+        logger.debug('%s is being charged amount: %s', self.player_name, amount)
+        logger.debug('Before charge, player has cash %s', self.current_cash)
         self.current_cash -= amount
-        logger.debug(self.player_name+ ' now has cash: '+str(self.current_cash))
+        self._update_runaway_cash_status(current_gameboard)
+        logger.debug('%s now has cash: %s', self.player_name, self.current_cash)
         if bank_flag:
-            current_gameboard['bank'].total_cash_with_bank += amount
-            logger.debug('Bank received amount ' + str(amount) + ' due to transaction from ' + self.player_name)
-            logger.debug('Liquid Cash remaining with Bank = ' + str(current_gameboard['bank'].total_cash_with_bank))
+            current_gameboard.bank.total_cash_with_bank += amount
+            logger.debug('Bank received amount %s due to transaction from %s', amount, self.player_name)
+            logger.debug('Liquid Cash remaining with Bank = %s', current_gameboard.bank.total_cash_with_bank)
 
 
     def discharge_assets_to_bank(self, current_gameboard): # discharge assets to bank
@@ -266,21 +419,22 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: None
         """
-        logger.debug('Discharging assets of '+self.player_name+' to bank.')
+        logger.debug('Discharging assets of %s to bank.', self.player_name)
         if self.assets:
             for asset in self.assets: # since asset is returning to bank, we can set its mortgage status to False regardless.
-                logger.debug('discharging asset '+asset.name)
+                logger.debug('discharging asset %s', asset.name)
                 asset.is_mortgaged = False
                 if asset.loc_class == 'real_estate':
-                    asset.owned_by = current_gameboard['bank']
-                    logger.debug("Discharging " + str(asset.num_houses) + " houses and " + str(asset.num_hotels) + " hotels to the bank.")
-                    current_gameboard['bank'].total_houses += asset.num_houses
+                    asset.owned_by = current_gameboard.bank
+                    logger.debug("Discharging %s houses and %s hotels to the bank.", asset.num_houses, asset.num_hotels)
+                    current_gameboard.bank.total_houses += asset.num_houses
                     asset.num_houses = 0
-                    current_gameboard['bank'].total_hotels += asset.num_hotels
+                    current_gameboard.bank.total_hotels += asset.num_hotels
                     asset.num_hotels = 0
-                    logger.debug('Bank now has ' + str(current_gameboard['bank'].total_houses) + ' houses and ' + str(current_gameboard['bank'].total_hotels) + ' hotels left.')
+                    asset.update_improvement_level()
+                    logger.debug('Bank now has %s houses and %s hotels left.', current_gameboard.bank.total_houses, current_gameboard.bank.total_hotels)
                 elif asset.loc_class == 'utility' or asset.loc_class == 'railroad':
-                    asset.owned_by = current_gameboard['bank']
+                    asset.owned_by = current_gameboard.bank
                 else:
                     logger.error('player owns asset that is not real estate, railroad or utility') # unnecessary, since an
                     # exception will be raised if is_mortgaged does not exist. But we like an extra check.
@@ -289,181 +443,192 @@ class Player(object):
 
         self.num_railroads_possessed = 0 # now we formally discharge assets on the player's side
         self.assets = None
+        if self.color_ownership is not None:
+            self.color_ownership.remove_all(self)
         self.full_color_sets_possessed = None
         self.num_utilities_possessed = 0
         self.mortgaged_assets = None
+        self.recompute_asset_values()
 
     def process_move_consequences(self, current_gameboard):
         """
         Given the current position of the player (e.g., after the dice has rolled and the player has been moved), what
         are the consequences of being on that location? This function provides the main logic, in particular, whether
-        the player has the right to purchase a property or has to pay rent on that property etc.
+        the player has the right to purchase a property or has to pay rent on that property etc. The location and the
+        method that handles it (one per location class, see _landing_handlers) are looked up in the landing table of the
+        board (see compile_landing_table), which is rebuilt if the board has been replaced since it was compiled.
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: None
         """
-        current_location = current_gameboard['location_sequence'][self.current_position] # get the Location object corresponding to player's current position
-        if current_location.loc_class == 'do_nothing': # we now look at each location class case by case
-            logger.debug(self.player_name+' is on a do_nothing location, namely '+current_location.name+'. Nothing to process. Returning...')
+        landing_table = current_gameboard.landing_table
+        if landing_table is None or landing_table[0] is not current_gameboard.location_sequence:
+            landing_table = compile_landing_table(current_gameboard)
+        current_location, handler = landing_table[1][self.current_position] # the Location object corresponding to player's current position, and its handler
+        handler(self, current_location, current_gameboard)
+
+    def _process_do_nothing_location(self, current_location, current_gameboard):
+        logger.debug('%s is on a do_nothing location, namely %s. Nothing to process. Returning...', self.player_name, current_location.name)
+
+    def _process_real_estate_location(self, current_location, current_gameboard):
+        logger.debug('%s is on a real estate location, namely %s', self.player_name, current_location.name)
+        if isinstance(current_location.owned_by, Bank):
+            logger.debug('%s is owned by Bank. Setting _option_to_buy to true for %s', current_location.name, self.player_name)
+            self._option_to_buy = True
             return
-        elif current_location.loc_class == 'real_estate':
-            logger.debug(self.player_name+ ' is on a real estate location, namely '+ current_location.name)
-            if 'bank.Bank' in str(type(current_location.owned_by)):
-                logger.debug(current_location.name+' is owned by Bank. Setting _option_to_buy to true for '+self.player_name)
-                self._option_to_buy = True
-                return
-            elif current_location.owned_by == self:
-                logger.debug(current_location.name+' is owned by current player. Player does not need to do anything.')
-                return
-            elif current_location.is_mortgaged is True:
-                logger.debug(current_location.name+ ' is mortgaged. Player does not have to do or pay anything. Returning...')
-                return
-            else:
-                logger.debug(current_location.name+ ' is owned by '+current_location.owned_by.player_name+' and is not mortgaged. Proceeding to calculate and pay rent.')
-                self.calculate_and_pay_rent_dues(current_gameboard)
-                # add to game history
-                current_gameboard['history']['function'].append(self.calculate_and_pay_rent_dues)
-                params = dict()
-                params['self'] = self
-                params['current_gameboard'] = current_gameboard
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(None)
-
-                return
-        elif current_location.loc_class == 'tax':
-            logger.debug(self.player_name+ ' is on a tax location, namely '+ current_location.name+ '. Deducting tax...')
-            tax_due = TaxLocation.calculate_tax(current_location, self, current_gameboard)
-            self.charge_player(tax_due, current_gameboard, bank_flag=True)
+        elif current_location.owned_by == self:
+            logger.debug('%s is owned by current player. Player does not need to do anything.', current_location.name)
+            return
+        elif current_location.is_mortgaged is True:
+            logger.debug('%s is mortgaged. Player does not have to do or pay anything. Returning...', current_location.name)
+            return
+        else:
+            logger.debug('%s is owned by %s and is not mortgaged. Proceeding to calculate and pay rent.', current_location.name, current_location.owned_by.player_name)
+            self.calculate_and_pay_rent_dues(current_gameboard)
             # add to game history
-            current_gameboard['history']['function'].append(self.charge_player)
+            current_gameboard.history['function'].append(self.calculate_and_pay_rent_dues)
             params = dict()
             params['self'] = self
-            params['amount'] = tax_due
-            params['description'] = 'tax'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            params['current_gameboard'] = current_gameboard
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
             return
-        elif current_location.loc_class == 'railroad':
-            logger.debug(self.player_name+ ' is on a railroad location, namely '+ current_location.name)
-            if 'bank.Bank' in str(type(current_location.owned_by)):
-                logger.debug(current_location.name+ ' is owned by Bank. Setting _option_to_buy to true for '+ self.player_name)
-                self._option_to_buy = True
-                return
-            elif current_location.owned_by == self:
-                logger.debug(current_location.name+' is owned by current player. Player does not need to do anything.')
-                return
-            elif current_location.is_mortgaged is True:
-                logger.debug(current_location.name+ ' is mortgaged. Player does not have to do or pay anything. Returning...')
-                return
-            else:
-                logger.debug(current_location.name+ ' is owned by '+ current_location.owned_by.player_name+ ' and is not mortgaged. Proceeding to calculate and pay dues.')
-                dues = RailroadLocation.calculate_railroad_dues(current_location, current_gameboard)
-                # add to game history
-                current_gameboard['history']['function'].append(RailroadLocation.calculate_railroad_dues)
-                params = dict()
-                params['asset'] = current_location
-                params['current_gameboard'] = current_gameboard
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(dues)
 
-                recipient = current_location.owned_by
-                code = recipient.receive_cash(dues, current_gameboard, bank_flag=False)
-                # add to game history
-                if code == action_choices.flag_config_dict['successful_action']:
-                    current_gameboard['history']['function'].append(recipient.receive_cash)
-                    params = dict()
-                    params['self'] = recipient
-                    params['amount'] = dues
-                    params['number of railroads'] = recipient.num_railroads_possessed
-                    params['description'] = 'railroad dues'
-                    current_gameboard['history']['param'].append(params)
-                    current_gameboard['history']['return'].append(code)
-                else:
-                    logger.debug("Not sure what happened! Something broke!")
-                    logger.error("Exception")
-                    raise Exception
+    def _process_tax_location(self, current_location, current_gameboard):
+        logger.debug('%s is on a tax location, namely %s. Deducting tax...', self.player_name, current_location.name)
+        tax_due = TaxLocation.calculate_tax(current_location, self, current_gameboard)
+        self.charge_player(tax_due, current_gameboard, bank_flag=True)
+        # add to game history
+        current_gameboard.history['function'].append(self.charge_player)
+        params = dict()
+        params['self'] = self
+        params['amount'] = tax_due
+        params['description'] = 'tax'
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
+
+    def _process_railroad_location(self, current_location, current_gameboard):
+        logger.debug('%s is on a railroad location, namely %s', self.player_name, current_location.name)
+        if isinstance(current_location.owned_by, Bank):
+            logger.debug('%s is owned by Bank. Setting _option_to_buy to true for %s', current_location.name, self.player_name)
+            self._option_to_buy = True
+            return
+        elif current_location.owned_by == self:
+            logger.debug('%s is owned by current player. Player does not need to do anything.', current_location.name)
+            return
+        elif current_location.is_mortgaged is True:
+            logger.debug('%s is mortgaged. Player does not have to do or pay anything. Returning...', current_location.name)
+            return
+        else:
+            logger.debug('%s is owned by %s and is not mortgaged. Proceeding to calculate and pay dues.', current_location.name, current_location.owned_by.player_name)
+            dues = RailroadLocation.calculate_railroad_dues(current_location, current_gameboard)
+            # add to game history
+            current_gameboard.history['function'].append(RailroadLocation.calculate_railroad_dues)
+            params = dict()
+            params['asset'] = current_location
+            params['current_gameboard'] = current_gameboard
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(dues)
 
-                self.charge_player(dues, current_gameboard, bank_flag=False)
-                # add to game history
-                current_gameboard['history']['function'].append(self.charge_player)
+            recipient = current_location.owned_by
+            code = recipient.receive_cash(dues, current_gameboard, bank_flag=False)
+            # add to game history
+            if code == action_choices.flag_config_dict['successful_action']:
+                current_gameboard.history['function'].append(recipient.receive_cash)
                 params = dict()
-                params['self'] = self
+                params['self'] = recipient
                 params['amount'] = dues
                 params['number of railroads'] = recipient.num_railroads_possessed
                 params['description'] = 'railroad dues'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(None)
-
-                return
-        elif current_location.loc_class == 'utility':
-            logger.debug(self.player_name+ ' is on a utility location, namely '+ current_location.name)
-            if 'bank.Bank' in str(type(current_location.owned_by)):
-                logger.debug(current_location.name+ ' is owned by Bank. Setting _option_to_buy to true for '+ self.player_name)
-                self._option_to_buy = True
-                return
-            elif current_location.owned_by == self:
-                logger.debug(current_location.name+' is owned by current player. Player does not need to do anything.')
-                return
-            elif current_location.is_mortgaged is True:
-                logger.debug(current_location.name+ ' is mortgaged. Player does not have to do or pay anything. Returning...')
-                return
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
             else:
-                logger.debug(current_location.name+ ' is owned by '+ current_location.owned_by.player_name+ ' and is not mortgaged. Proceeding to calculate and pay dues.')
-                dues = UtilityLocation.calculate_utility_dues(current_location, current_gameboard, current_gameboard['current_die_total'])
-                # add to game history
-                current_gameboard['history']['function'].append(UtilityLocation.calculate_utility_dues)
-                params = dict()
-                params['asset'] = current_location
-                params['current_gameboard'] = current_gameboard
-                params['die_total'] = current_gameboard['current_die_total']
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(dues)
+                logger.debug("Not sure what happened! Something broke!")
+                logger.error("Exception")
+                raise Exception
 
-                recipient = current_location.owned_by
-                code = recipient.receive_cash(dues, current_gameboard, bank_flag=False)
-                # add to game history
-                if code == action_choices.flag_config_dict['successful_action']:
-                    current_gameboard['history']['function'].append(recipient.receive_cash)
-                    params = dict()
-                    params['self'] = recipient
-                    params['amount'] = dues
-                    params['number of utilities'] = recipient.num_utilities_possessed
-                    params['description'] = 'utility dues'
-                    current_gameboard['history']['param'].append(params)
-                    current_gameboard['history']['return'].append(code)
-                else:
-                    logger.debug("Not sure what happened! Something broke!")
-                    logger.error("Exception")
-                    raise Exception
+            self.charge_player(dues, current_gameboard, bank_flag=False)
+            # add to game history
+            current_gameboard.history['function'].append(self.charge_player)
+            params = dict()
+            params['self'] = self
+            params['amount'] = dues
+            params['number of railroads'] = recipient.num_railroads_possessed
+            params['description'] = 'railroad dues'
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
-                self.charge_player(dues, current_gameboard, bank_flag=False)
-                # add to game history
-                current_gameboard['history']['function'].append(self.charge_player)
+            return
+
+    def _process_utility_location(self, current_location, current_gameboard):
+        logger.debug('%s is on a utility location, namely %s', self.player_name, current_location.name)
+        if isinstance(current_location.owned_by, Bank):
+            logger.debug('%s is owned by Bank. Setting _option_to_buy to true for %s', current_location.name, self.player_name)
+            self._option_to_buy = True
+            return
+        elif current_location.owned_by == self:
+            logger.debug('%s is owned by current player. Player does not need to do anything.', current_location.name)
+            return
+        elif current_location.is_mortgaged is True:
+            logger.debug('%s is mortgaged. Player does not have to do or pay anything. Returning...', current_location.name)
+            return
+        else:
+            logger.debug('%s is owned by %s and is not mortgaged. Proceeding to calculate and pay dues.', current_location.name, current_location.owned_by.player_name)
+            dues = UtilityLocation.calculate_utility_dues(current_location, current_gameboard, current_gameboard.current_die_total)
+            # add to game history
+            current_gameboard.history['function'].append(UtilityLocation.calculate_utility_dues)
+            params = dict()
+            params['asset'] = current_location
+            params['current_gameboard'] = current_gameboard
+            params['die_total'] = current_gameboard.current_die_total
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(dues)
+
+            recipient = current_location.owned_by
+            code = recipient.receive_cash(dues, current_gameboard, bank_flag=False)
+            # add to game history
+            if code == action_choices.flag_config_dict['successful_action']:
+                current_gameboard.history['function'].append(recipient.receive_cash)
                 params = dict()
-                params['self'] = self
+                params['self'] = recipient
                 params['amount'] = dues
                 params['number of utilities'] = recipient.num_utilities_possessed
                 params['description'] = 'utility dues'
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(None)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(code)
+            else:
+                logger.debug("Not sure what happened! Something broke!")
+                logger.error("Exception")
+                raise Exception
 
-                return
-        elif current_location.loc_class == 'action':
-            logger.debug(self.player_name+ ' is on an action location, namely '+ current_location.name+ '. Performing action...')
-            current_location.perform_action(self, current_gameboard)
+            self.charge_player(dues, current_gameboard, bank_flag=False)
             # add to game history
-            current_gameboard['history']['function'].append(current_location.perform_action)
+            current_gameboard.history['function'].append(self.charge_player)
             params = dict()
-            params['player'] = self
-            params['current_gameboard'] = current_gameboard
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            params['self'] = self
+            params['amount'] = dues
+            params['number of utilities'] = recipient.num_utilities_possessed
+            params['description'] = 'utility dues'
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
             return
-        else:
-            logger.error(self.player_name+' is on an unidentified location type. Raising exception.')
-            logger.error("Exception")
-            raise Exception
+
+    def _process_action_location(self, current_location, current_gameboard):
+        logger.debug('%s is on an action location, namely %s. Performing action...', self.player_name, current_location.name)
+        current_location.perform_action(self, current_gameboard)
+        # add to game history
+        current_gameboard.history['function'].append(current_location.perform_action)
+        params = dict()
+        params['player'] = self
+        params['current_gameboard'] = current_gameboard
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
+
+    def _process_unidentified_location(self, current_location, current_gameboard):
+        logger.error('%s is on an unidentified location type. Raising exception.', self.player_name)
+        logger.error("Exception")
+        raise Exception
 
     def update_player_position(self, new_position, current_gameboard):
         """
@@ -472,8 +637,8 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: None
         """
-        logger.debug('Player is currently in position '+current_gameboard['location_sequence'][self.current_position].name)
-        logger.debug(' and is moving to position '+current_gameboard['location_sequence'][new_position].name)
+        logger.debug('Player is currently in position %s', current_gameboard.location_sequence[self.current_position].name)
+        logger.debug(' and is moving to position %s', current_gameboard.location_sequence[new_position].name)
         self.current_position = new_position
 
     def send_to_jail(self, current_gameboard):
@@ -482,8 +647,8 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: None
         """
-        logger.debug(self.player_name+' is being sent to jail.')
-        jail_position = current_gameboard['jail_position']
+        logger.debug('%s is being sent to jail.', self.player_name)
+        jail_position = current_gameboard.jail_position
         card_utility_actions._set_send_to_jail(self, current_gameboard)
         self.current_position = jail_position
 
@@ -493,28 +658,28 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: None
         """
-        current_loc = current_gameboard['location_sequence'][self.current_position]
-        logger.debug('calculating and paying rent dues for '+ self.player_name+ ' who is in property '+current_loc.name+' which is owned by '+current_loc.owned_by.player_name)
+        current_loc = current_gameboard.location_sequence[self.current_position]
+        logger.debug('calculating and paying rent dues for %s who is in property %s which is owned by %s', self.player_name, current_loc.name, current_loc.owned_by.player_name)
         rent = RealEstateLocation.calculate_rent(current_loc, current_gameboard)
         # add to game history
-        current_gameboard['history']['function'].append(RealEstateLocation.calculate_rent)
+        current_gameboard.history['function'].append(RealEstateLocation.calculate_rent)
         params = dict()
         params['asset'] = current_loc
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(rent)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(rent)
 
         recipient = current_loc.owned_by
         code = recipient.receive_cash(rent, current_gameboard, bank_flag=False)
         # add to game history
         if code == action_choices.flag_config_dict['successful_action']:
-            current_gameboard['history']['function'].append(recipient.receive_cash)
+            current_gameboard.history['function'].append(recipient.receive_cash)
             params = dict()
             params['self'] = recipient
             params['amount'] = rent
             params['description'] = 'rent'
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
         else:
             logger.debug("Not sure what happened! Something broke!")
             logger.error("Exception")
@@ -522,13 +687,13 @@ class Player(object):
 
         self.charge_player(rent, current_gameboard, bank_flag=False)
         # add to game history
-        current_gameboard['history']['function'].append(self.charge_player)
+        current_gameboard.history['function'].append(self.charge_player)
         params = dict()
         params['self'] = self
         params['amount'] = rent
         params['description'] = 'rent'
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
     def receive_cash(self, amount, current_gameboard, bank_flag=False):
         """
@@ -537,37 +702,52 @@ class Player(object):
         :return: None
         """
         if amount < 0:
-            logger.error(self.player_name+' is receiving negative cash: '+str(amount)+'. This is an unintended use of this function')
+            logger.error('%s is receiving negative cash: %s. This is an unintended use of this function', self.player_name, amount)
             logger.error("Exception")
             raise Exception
 
         if bank_flag:
-            if current_gameboard['bank'].total_cash_with_bank - amount >= 0:
-                logger.debug(self.player_name+ ' is receiving amount: '+ str(amount))
-                logger.debug('Before receipt, player has cash '+ str(self.current_cash))
+            if current_gameboard.bank.total_cash_with_bank - amount >= 0:
+                logger.debug('%s is receiving amount: %s', self.player_name, amount)
+                logger.debug('Before receipt, player has cash %s', self.current_cash)
                 self.current_cash += amount
-                logger.debug(self.player_name+ ' now has cash: '+ str(self.current_cash))
-                current_gameboard['bank'].total_cash_with_bank -= amount
-                logger.debug('Bank paid amount ' + str(amount) + ' to ' + self.player_name)
-                logger.debug('Liquid Cash remaining with Bank = ' + str(current_gameboard['bank'].total_cash_with_bank))
+                self._update_runaway_cash_status(current_gameboard)
+                logger.debug('%s now has cash: %s', self.player_name, self.current_cash)
+                current_gameboard.bank.total_cash_with_bank -= amount
+                logger.debug('Bank paid amount %s to %s', amount, self.player_name)
+                logger.debug('Liquid Cash remaining with Bank = %s', current_gameboard.bank.total_cash_with_bank)
                 return action_choices.flag_config_dict['successful_action']
             else:
-                logger.debug('Current cash balance with the bank = ' + str(current_gameboard['bank'].total_cash_with_bank))
-                logger.debug("Bank has no sufficient liquid cash to pay " + self.player_name + '. Returning failure code.')
+                logger.debug('Current cash balance with the bank = %s', current_gameboard.bank.total_cash_with_bank)
+                logger.debug("Bank has no sufficient liquid cash to pay %s. Returning failure code.", self.player_name)
                 return action_choices.flag_config_dict['failure_code']
         else:
-            logger.debug(self.player_name+ ' is receiving amount: '+ str(amount))
-            logger.debug('Before receipt, player has cash '+ str(self.current_cash))
+            logger.debug('%s is receiving amount: %s', self.player_name, amount)
+            logger.debug('Before receipt, player has cash %s', self.current_cash)
             self.current_cash += amount
-            logger.debug(self.player_name+ ' now has cash: '+ str(self.current_cash))
+            self._update_runaway_cash_status(current_gameboard)
+            logger.debug('%s now has cash: %s', self.player_name, self.current_cash)
             return action_choices.flag_config_dict['successful_action']
 
+    def _update_runaway_cash_status(self, current_gameboard):
+        """
+        Internal function that must be called whenever current_cash changes. It keeps the set of players whose cash is
+        above the runaway cash limit of the bank (current_gameboard.players_over_cash_limit) up to date, so that
+        check_for_game_termination does not have to look at every player.
+        :param current_gameboard: A dict. The global data structure representing the current game board.
+        :return: None
+        """
+        if self.current_cash > current_gameboard.bank.runaway_cash_limit:
+            current_gameboard.players_over_cash_limit.add(self)
+        else:
+            current_gameboard.players_over_cash_limit.discard(self)
+
     def reset_option_to_buy(self):
         """
         Sets the _option_to_buy attribute back to False
         :return: None
         """
-        logger.debug('Executing reset_option_to_buy for '+ self.player_name)
+        logger.debug('Executing reset_option_to_buy for %s', self.player_name)
         self._option_to_buy = False
 
     def compute_allowable_pre_roll_actions(self, current_gameboard):
@@ -583,7 +763,7 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: The set of allowable actions (each item in the set is a function from action_choices)
         """
-        logger.debug('computing allowable pre-roll actions for '+self.player_name)
+        logger.debug('computing allowable pre-roll actions for %s', self.player_name)
         allowable_actions = set()
         allowable_actions.add("concluded_actions")
 
@@ -608,7 +788,7 @@ class Player(object):
         if (self.has_get_out_of_jail_chance_card or self.has_get_out_of_jail_community_chest_card) and self.currently_in_jail:
             allowable_actions.add("use_get_out_of_jail_card")
 
-        if self.currently_in_jail and self.current_cash >= current_gameboard['bank'].jail_fine:
+        if self.currently_in_jail and self.current_cash >= current_gameboard.bank.jail_fine:
             allowable_actions.add("pay_jail_fine")
 
         if len(self.full_color_sets_possessed) > 0 :
@@ -631,7 +811,7 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: The set of allowable actions (each item in the set is a function from action_choices)
         """
-        logger.debug('computing allowable out-of-turn actions for '+ self.player_name)
+        logger.debug('computing allowable out-of-turn actions for %s', self.player_name)
         allowable_actions = set()
         allowable_actions.add("concluded_actions")
 
@@ -674,7 +854,7 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: The set of allowable actions (each item in the set is a function from action_choices)
         """
-        logger.debug('computing allowable post-roll actions for '+ self.player_name)
+        logger.debug('computing allowable post-roll actions for %s', self.player_name)
         allowable_actions = set()
         allowable_actions.add("concluded_actions")
 
@@ -701,19 +881,16 @@ class Player(object):
         if 'current_gameboard' in param_dict:
             param_dict['current_gameboard'] = current_gameboard
         if 'asset' in param_dict:
-            for loc in current_gameboard['location_sequence']:
-                if loc.name == param_dict['asset']:
-                    param_dict['asset'] = loc
+            if isinstance(param_dict['asset'], str) and param_dict['asset'] in current_gameboard.location_objects:
+                param_dict['asset'] = current_gameboard.location_objects[param_dict['asset']]
 
         # following keys are mostly relevant to trading
         if 'from_player' in param_dict:
-            for p in current_gameboard['players']:
-                if p.player_name == param_dict['from_player']:
-                    param_dict['from_player'] = p
+            if isinstance(param_dict['from_player'], str) and param_dict['from_player'] in current_gameboard.player_objects:
+                param_dict['from_player'] = current_gameboard.player_objects[param_dict['from_player']]
         if 'to_player' in param_dict:
-            for p in current_gameboard['players']:
-                if p.player_name == param_dict['to_player']:
-                    param_dict['to_player'] = p
+            if isinstance(param_dict['to_player'], str) and param_dict['to_player'] in current_gameboard.player_objects:
+                param_dict['to_player'] = current_gameboard.player_objects[param_dict['to_player']]
         if 'offer' in param_dict:
             property_set_offered = param_dict['offer']['property_set_offered']   # set of property names (not list and does not involve pointers)
             property_set_wanted = param_dict['offer']['property_set_wanted']    # set of property names (not list and does not involve pointers)
@@ -724,19 +901,15 @@ class Player(object):
 
             property_set_offered_ptr = set()
             for prop in property_set_offered:
-                for loc in current_gameboard['location_sequence']:
-                    if isinstance(prop, str) and loc.name == prop:
-                        flag_replacement_offer = True
-                        property_set_offered_ptr.add(loc)
-                        break
+                if isinstance(prop, str) and prop in current_gameboard.location_objects:
+                    flag_replacement_offer = True
+                    property_set_offered_ptr.add(current_gameboard.location_objects[prop])
 
             property_set_wanted_ptr = set()
             for prop in property_set_wanted:
-                for loc in current_gameboard['location_sequence']:
-                    if isinstance(prop, str) and loc.name == prop:
-                        flag_replacement_wanted = True
-                        property_set_wanted_ptr.add(loc)
-                        break
+                if isinstance(prop, str) and prop in current_gameboard.location_objects:
+                    flag_replacement_wanted = True
+                    property_set_wanted_ptr.add(current_gameboard.location_objects[prop])
 
             if flag_replacement_offer:
                 param_dict['offer']['property_set_offered'] = property_set_offered_ptr
@@ -746,30 +919,8 @@ class Player(object):
 
     @staticmethod
     def _resolve_function_names_to_pointers(function_name, player, current_gameboard):
-        if function_name == 'skip_turn':
-            return action_choices.skip_turn
-        elif function_name == 'concluded_actions':
-            return action_choices.concluded_actions
-        elif function_name == 'make_trade_offer':
-            return action_choices.make_trade_offer
-        elif function_name == 'accept_trade_offer':
-            return action_choices.accept_trade_offer
-        elif function_name == 'buy_property':
-            return action_choices.buy_property
-        elif function_name == 'sell_property':
-            return action_choices.sell_property
-        elif function_name == 'mortgage_property':
-            return action_choices.mortgage_property
-        elif function_name == 'free_mortgage':
-            return action_choices.free_mortgage
-        elif function_name == 'improve_property':
-            return action_choices.improve_property
-        elif function_name == 'sell_house_hotel':
-            return action_choices.sell_house_hotel
-        elif function_name == 'pay_jail_fine':
-            return action_choices.pay_jail_fine
-        elif function_name == 'use_get_out_of_jail_card':
-            return action_choices.use_get_out_of_jail_card
+        if function_name in _action_function_pointers:
+            return _action_function_pointers[function_name]
 
     def make_pre_roll_moves(self, current_gameboard):
         """
@@ -780,17 +931,17 @@ class Player(object):
         :return: An integer. 2 if the turn is skipped or 1 for concluded actions. No other code should safely
         be returned.
         """
-        logger.debug('We are in the pre-roll phase for '+self.player_name)
+        logger.debug('We are in the pre-roll phase for %s', self.player_name)
         allowable_actions = self.compute_allowable_pre_roll_actions(current_gameboard)
         allowable_actions.remove("concluded_actions")
         allowable_actions.add("skip_turn")
         code = 0
 
-        if 'auxiliary_before_pre_roll_check' in current_gameboard:
-            current_gameboard['auxiliary_before_pre_roll_check'](self, current_gameboard, allowable_actions, code)
+        if current_gameboard.auxiliary_before_pre_roll_check is not None:
+            current_gameboard.auxiliary_before_pre_roll_check(self, current_gameboard, allowable_actions, code)
         action_to_execute, parameters = self.agent.make_pre_roll_move(self, current_gameboard, allowable_actions, code)
-        if 'auxiliary_after_pre_roll_check' in current_gameboard:
-            current_gameboard['auxiliary_after_pre_roll_check'](self, current_gameboard, allowable_actions, code)
+        if current_gameboard.auxiliary_after_pre_roll_check is not None:
+            current_gameboard.auxiliary_after_pre_roll_check(self, current_gameboard, allowable_actions, code)
 
         action_to_execute_temp = None
         parameters_temp = None
@@ -807,7 +958,7 @@ class Player(object):
 
         t = (action_to_execute, parameters_temp)
         # add to game history
-        current_gameboard['history']['function'].append(self.agent.make_pre_roll_move)
+        current_gameboard.history['function'].append(self.agent.make_pre_roll_move)
         params = dict()
         params['player'] = self
         params['current_gameboard'] = current_gameboard
@@ -815,8 +966,8 @@ class Player(object):
         if isinstance(code, int):
             code = [code]
         params['code'] = code
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(t)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(t)
 
         if action_to_execute == 'skip_turn':
             if self.is_property_offer_outstanding:
@@ -836,7 +987,7 @@ class Player(object):
             return self._execute_action(action_to_execute_temp, parameters_temp, current_gameboard)
 
         allowable_actions.add("concluded_actions")
-        allowable_actions.remove("skip_turn") # from this time on, skip turn is not allowed.current_gameboard['bank'].total_houses += asset.num_houses
+        allowable_actions.remove("skip_turn") # from this time on, skip turn is not allowed.current_gameboard.bank.total_houses += asset.num_houses
         count = 0
         while count < 4: # the player is allowed up to 4 actions before we force conclude actions.
             count += 1
@@ -865,18 +1016,18 @@ class Player(object):
                     code = []
                     for i in range(len(action_to_execute)):
                         code_ret = self._execute_action(action_to_execute_temp[i], parameters_temp[i], current_gameboard)
-                        logger.debug('Received code '+ str(code_ret)+ '. Continuing iteration...')
+                        logger.debug('Received code %s. Continuing iteration...', code_ret)
                         code.append(code_ret)
                 else:
                     code = self._execute_action(action_to_execute_temp, parameters_temp, current_gameboard)
-                    logger.debug('Received code '+ str(code)+ '. Continuing iteration...')
+                    logger.debug('Received code %s. Continuing iteration...', code)
                     allowable_actions = self.compute_allowable_pre_roll_actions(current_gameboard)
 
-                if 'auxiliary_before_pre_roll_check' in current_gameboard:
-                    current_gameboard['auxiliary_before_pre_roll_check'](self, current_gameboard, allowable_actions, code)
+                if current_gameboard.auxiliary_before_pre_roll_check is not None:
+                    current_gameboard.auxiliary_before_pre_roll_check(self, current_gameboard, allowable_actions, code)
                 action_to_execute, parameters = self.agent.make_pre_roll_move(self, current_gameboard, allowable_actions, code)
-                if 'auxiliary_after_pre_roll_check' in current_gameboard:
-                    current_gameboard['auxiliary_after_pre_roll_check'](self, current_gameboard, allowable_actions, code)
+                if current_gameboard.auxiliary_after_pre_roll_check is not None:
+                    current_gameboard.auxiliary_after_pre_roll_check(self, current_gameboard, allowable_actions, code)
 
                 if isinstance(action_to_execute, list):
                     action_to_execute_temp = list()
@@ -890,7 +1041,7 @@ class Player(object):
 
                 t = (action_to_execute, parameters_temp)
                 # add to game history
-                current_gameboard['history']['function'].append(self.agent.make_pre_roll_move)
+                current_gameboard.history['function'].append(self.agent.make_pre_roll_move)
                 params = dict()
                 params['player'] = self
                 params['current_gameboard'] = current_gameboard
@@ -898,8 +1049,8 @@ class Player(object):
                 if isinstance(code, int):
                     code = [code]
                 params['code'] = code
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(t)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(t)
 
         # if we got here, we resolve property offers and move on.
         if self.is_property_offer_outstanding:
@@ -928,17 +1079,17 @@ class Player(object):
         :return: An integer. 2 if the turn is skipped or 1 for concluded actions. No other code should safely
         be returned.
         """
-        logger.debug('We are in the out-of-turn phase for '+ self.player_name)
+        logger.debug('We are in the out-of-turn phase for %s', self.player_name)
         allowable_actions = self.compute_allowable_out_of_turn_actions(current_gameboard)
         allowable_actions.remove("concluded_actions")
         allowable_actions.add("skip_turn")
         code = 0
 
-        if 'auxiliary_before_out_of_turn_check' in current_gameboard:
-            current_gameboard['auxiliary_before_out_of_turn_check'](self, current_gameboard, allowable_actions, code)
+        if current_gameboard.auxiliary_before_out_of_turn_check is not None:
+            current_gameboard.auxiliary_before_out_of_turn_check(self, current_gameboard, allowable_actions, code)
         action_to_execute, parameters = self.agent.make_out_of_turn_move(self, current_gameboard, allowable_actions, code)
-        if 'auxiliary_after_out_of_turn_check' in current_gameboard:
-            current_gameboard['auxiliary_after_out_of_turn_check'](self, current_gameboard, allowable_actions, code)
+        if current_gameboard.auxiliary_after_out_of_turn_check is not None:
+            current_gameboard.auxiliary_after_out_of_turn_check(self, current_gameboard, allowable_actions, code)
 
         action_to_execute_temp = None
         parameters_temp = None
@@ -955,7 +1106,7 @@ class Player(object):
 
         t = (action_to_execute, parameters_temp)
         # add to game history
-        current_gameboard['history']['function'].append(self.agent.make_out_of_turn_move)
+        current_gameboard.history['function'].append(self.agent.make_out_of_turn_move)
         params = dict()
         params['player'] = self
         params['current_gameboard'] = current_gameboard
@@ -963,8 +1114,8 @@ class Player(object):
         if isinstance(code, int):
             code = [code]
         params['code'] = code
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(t)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(t)
 
         if action_to_execute == "skip_turn":
             if self.is_property_offer_outstanding:
@@ -1013,18 +1164,18 @@ class Player(object):
                     code = []
                     for i in range(len(action_to_execute)):
                         code_ret = self._execute_action(action_to_execute_temp[i], parameters_temp[i], current_gameboard)
-                        logger.debug('Received code '+ str(code_ret)+ '. Continuing iteration...')
+                        logger.debug('Received code %s. Continuing iteration...', code_ret)
                         code.append(code_ret)
                 else:
                     code = self._execute_action(action_to_execute_temp, parameters_temp, current_gameboard)
-                    logger.debug('Received code '+ str(code)+ '. Continuing iteration...')
+                    logger.debug('Received code %s. Continuing iteration...', code)
 
                 allowable_actions = self.compute_allowable_out_of_turn_actions(current_gameboard)
-                if 'auxiliary_before_out_of_turn_check' in current_gameboard:
-                    current_gameboard['auxiliary_before_out_of_turn_check'](self, current_gameboard, allowable_actions, code)
+                if current_gameboard.auxiliary_before_out_of_turn_check is not None:
+                    current_gameboard.auxiliary_before_out_of_turn_check(self, current_gameboard, allowable_actions, code)
                 action_to_execute, parameters = self.agent.make_out_of_turn_move(self, current_gameboard, allowable_actions, code)
-                if 'auxiliary_after_out_of_turn_check' in current_gameboard:
-                    current_gameboard['auxiliary_after_out_of_turn_check'](self, current_gameboard, allowable_actions, code)
+                if current_gameboard.auxiliary_after_out_of_turn_check is not None:
+                    current_gameboard.auxiliary_after_out_of_turn_check(self, current_gameboard, allowable_actions, code)
 
                 if isinstance(action_to_execute, list):
                     action_to_execute_temp = list()
@@ -1038,7 +1189,7 @@ class Player(object):
 
                 t = (action_to_execute, parameters_temp)
                 # add to game history
-                current_gameboard['history']['function'].append(self.agent.make_out_of_turn_move)
+                current_gameboard.history['function'].append(self.agent.make_out_of_turn_move)
                 params = dict()
                 params['player'] = self
                 params['current_gameboard'] = current_gameboard
@@ -1046,8 +1197,8 @@ class Player(object):
                 if isinstance(code, int):
                     code = [code]
                 params['code'] = code
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(t)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(t)
 
         # if we got here, we resolve property offers and move on.
         if self.is_property_offer_outstanding:
@@ -1079,22 +1230,22 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: An integer. Only 1 (for concluded actions) should be safely returned.
         """
-        logger.debug('We are in the post-roll phase for '+ self.player_name)
+        logger.debug('We are in the post-roll phase for %s', self.player_name)
         allowable_actions = self.compute_allowable_post_roll_actions(current_gameboard)
         code = 0
 
-        if 'auxiliary_before_post_roll_check' in current_gameboard:
-            current_gameboard['auxiliary_before_post_roll_check'](self, current_gameboard, allowable_actions, code)
+        if current_gameboard.auxiliary_before_post_roll_check is not None:
+            current_gameboard.auxiliary_before_post_roll_check(self, current_gameboard, allowable_actions, code)
         action_to_execute, parameters = self.agent.make_post_roll_move(self, current_gameboard, allowable_actions, code)
-        if 'auxiliary_after_post_roll_check' in current_gameboard:
-            current_gameboard['auxiliary_after_post_roll_check'](self, current_gameboard, allowable_actions, code)
+        if current_gameboard.auxiliary_after_post_roll_check is not None:
+            current_gameboard.auxiliary_after_post_roll_check(self, current_gameboard, allowable_actions, code)
 
         action_to_execute_temp = Player._resolve_function_names_to_pointers(action_to_execute, self, current_gameboard)
         parameters_temp = Player._populate_param_dict(parameters, self, current_gameboard)
 
         t = (action_to_execute, parameters_temp)
         # add to game history
-        current_gameboard['history']['function'].append(self.agent.make_post_roll_move)
+        current_gameboard.history['function'].append(self.agent.make_post_roll_move)
         params = dict()
         params['player'] = self
         params['current_gameboard'] = current_gameboard
@@ -1102,8 +1253,8 @@ class Player(object):
         if isinstance(code, int):
             code = [code]
         params['code'] = code
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(t)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(t)
 
         if action_to_execute == "concluded_actions":
             self._force_buy_outcome(current_gameboard) # if option to buy is not set, this will make no difference.
@@ -1117,21 +1268,21 @@ class Player(object):
                 return self._execute_action(action_to_execute_temp, parameters_temp, current_gameboard)  # now we can conclude actions
             else:
                 code = self._execute_action(action_to_execute_temp, parameters_temp, current_gameboard)
-                logger.debug('Received code '+ str(code)+ '. Continuing iteration...')
+                logger.debug('Received code %s. Continuing iteration...', code)
                 allowable_actions = self.compute_allowable_post_roll_actions(current_gameboard)
 
-                if 'auxiliary_before_post_roll_check' in current_gameboard:
-                    current_gameboard['auxiliary_before_post_roll_check'](self, current_gameboard, allowable_actions, code)
+                if current_gameboard.auxiliary_before_post_roll_check is not None:
+                    current_gameboard.auxiliary_before_post_roll_check(self, current_gameboard, allowable_actions, code)
                 action_to_execute, parameters = self.agent.make_post_roll_move(self, current_gameboard, allowable_actions, code)
-                if 'auxiliary_after_post_roll_check' in current_gameboard:
-                    current_gameboard['auxiliary_after_post_roll_check'](self, current_gameboard, allowable_actions, code)
+                if current_gameboard.auxiliary_after_post_roll_check is not None:
+                    current_gameboard.auxiliary_after_post_roll_check(self, current_gameboard, allowable_actions, code)
 
                 action_to_execute_temp = Player._resolve_function_names_to_pointers(action_to_execute, self, current_gameboard)
                 parameters_temp = Player._populate_param_dict(parameters, self, current_gameboard)
 
                 t = (action_to_execute, parameters_temp)
                 # add to game history
-                current_gameboard['history']['function'].append(self.agent.make_post_roll_move)
+                current_gameboard.history['function'].append(self.agent.make_post_roll_move)
                 params = dict()
                 params['player'] = self
                 params['current_gameboard'] = current_gameboard
@@ -1139,8 +1290,8 @@ class Player(object):
                 if isinstance(code, int):
                     code = [code]
                 params['code'] = code
-                current_gameboard['history']['param'].append(params)
-                current_gameboard['history']['return'].append(t)
+                current_gameboard.history['param'].append(params)
+                current_gameboard.history['return'].append(t)
                 # logger.debug(action_to_execute)
 
         self._force_buy_outcome(current_gameboard) # if we got here, we need to conclude actions
@@ -1166,28 +1317,28 @@ class Player(object):
         - failure code if the player tried to save player by taking unsuccessful actions consecutively till the "unsuccessful_tries" counter runs out.
         """
 
-        logger.debug("We are trying to relieve " + self.player_name + " from negative cash balance.")
+        logger.debug("We are trying to relieve %s from negative cash balance.", self.player_name)
         code = 0
         unsuccessful_tries = 3
         successful_tries = 10
 
         if self.current_cash > 0:
-            logger.debug(self.player_name + " didnot have negative cash balance, don't know why this function was called!! Raising exception..")
+            logger.debug("%s didnot have negative cash balance, don't know why this function was called!! Raising exception..", self.player_name)
             raise Exception
 
         while successful_tries > 0:
             action_to_execute, parameters = self.agent.handle_negative_cash_balance(self, current_gameboard)
             t = (action_to_execute, parameters)
             # add to game history
-            current_gameboard['history']['function'].append(self.agent.handle_negative_cash_balance)
+            current_gameboard.history['function'].append(self.agent.handle_negative_cash_balance)
             params = dict()
             params['player'] = self
             params['current_gameboard'] = current_gameboard
             if isinstance(code, int):
                 code = [code]
             params['code'] = code
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(t)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(t)
 
             if action_to_execute is None:
                 return parameters    # done handling negative cash balance, parameters will be an int (successful action code or failure code
@@ -1200,17 +1351,17 @@ class Player(object):
                     action_to_execute_temp = Player._resolve_function_names_to_pointers(action_to_execute, self, current_gameboard)
                     parameters_temp = Player._populate_param_dict(parameters, self, current_gameboard)
                     code = self._execute_action(action_to_execute_temp, parameters_temp, current_gameboard)
-                    logger.debug('Received code '+ str(code)+ '. Continuing iteration...')
+                    logger.debug('Received code %s. Continuing iteration...', code)
 
                 successful_tries -= 1
                 if code == action_choices.flag_config_dict['failure_code']:
                     successful_tries += 1
                     unsuccessful_tries -= 1
-                    logger.debug(self.player_name + ' has executed an unsuccessful handle negative cash balance action.')
+                    logger.debug('%s has executed an unsuccessful handle negative cash balance action.', self.player_name)
                 if unsuccessful_tries == 0:
                     if self.current_cash > 0:    # should never enter this 'if loop' since action was unsuccessful, but just in case....
                         return action_choices.flag_config_dict['successful_action']
-                    logger.debug(self.player_name + " has exceeded unsuccessful action limits to handle negative cash balance. Returning failure code.")
+                    logger.debug('%s has exceeded unsuccessful action limits to handle negative cash balance. Returning failure code.', self.player_name)
                     return action_choices.flag_config_dict['failure_code']
 
         # reaches here only after 10 successful tries and the player still has negative cash balance.
@@ -1228,17 +1379,17 @@ class Player(object):
         :param current_gameboard: A dict. The global data structure representing the current game board.
         :return: None
         """
-        logger.debug('Executing _force_buy_outcome for '+self.player_name)
+        logger.debug('Executing _force_buy_outcome for %s', self.player_name)
         if self._option_to_buy is True:
-            self._own_or_auction(current_gameboard, current_gameboard['location_sequence'][self.current_position])
+            self._own_or_auction(current_gameboard, current_gameboard.location_sequence[self.current_position])
 
         self.reset_option_to_buy()
         # add to game history
-        current_gameboard['history']['function'].append(self.reset_option_to_buy)
+        current_gameboard.history['function'].append(self.reset_option_to_buy)
         params = dict()
         params['self'] = self
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(None)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(None)
 
         return
 
@@ -1250,47 +1401,47 @@ class Player(object):
         :param asset: A purchaseable Location instance. If the player does not buy it, we will invoke auction proceedings.
         :return: None
         """
-        logger.debug('Executing _own_or_auction for '+self.player_name)
+        logger.debug('Executing _own_or_auction for %s', self.player_name)
 
         dec = self.agent.make_buy_property_decision(self, current_gameboard, asset) # your agent has to make a decision here
         # add to game history
-        current_gameboard['history']['function'].append(self.agent.make_buy_property_decision)
+        current_gameboard.history['function'].append(self.agent.make_buy_property_decision)
         params = dict()
         params['asset'] = asset
         params['player'] = self
         params['current_gameboard'] = current_gameboard
-        current_gameboard['history']['param'].append(params)
-        current_gameboard['history']['return'].append(dec)
+        current_gameboard.history['param'].append(params)
+        current_gameboard.history['return'].append(dec)
 
-        logger.debug(self.player_name+' decides to purchase? '+str(dec))
+        logger.debug('%s decides to purchase? %s', self.player_name, dec)
         if dec is True:
             asset.update_asset_owner(self, current_gameboard)
             # add to game history
-            current_gameboard['history']['function'].append(asset.update_asset_owner)
+            current_gameboard.history['function'].append(asset.update_asset_owner)
             params = dict()
             params['self'] = asset
             params['player'] = self
             params['current_gameboard'] = current_gameboard
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
             return
         else:
-            logger.debug('Since '+self.player_name+' decided not to purchase, we are invoking auction proceedings for asset '+asset.name)
-            index_current_player = current_gameboard['players'].index(self)  # in players, find the index of the current player
-            starting_player_index = (index_current_player + 1) % len(current_gameboard['players'])  # the next player's index. this player will start the auction
+            logger.debug('Since %s decided not to purchase, we are invoking auction proceedings for asset %s', self.player_name, asset.name)
+            index_current_player = current_gameboard.players.index(self)  # in players, find the index of the current player
+            starting_player_index = (index_current_player + 1) % len(current_gameboard.players)  # the next player's index. this player will start the auction
             # the auction function will automatically check whether the player is still active or not etc. We don't need to
             # worry about conducting a valid auction in this function.
             Bank.auction(starting_player_index, current_gameboard, asset)
             # add to game history
-            current_gameboard['history']['function'].append(Bank.auction)
+            current_gameboard.history['function'].append(Bank.auction)
             params = dict()
-            params['self'] = current_gameboard['bank']
+            params['self'] = current_gameboard.bank
             params['starting_player_index'] = starting_player_index
             params['current_gameboard'] = current_gameboard
             params['asset'] = asset
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(None)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(None)
 
             return
 
@@ -1306,22 +1457,49 @@ class Player(object):
         :param parameters: a dictionary of parameters. These will be unrolled inside the action to execute.
         :return: An integer code that is returned by the executed action.
         """
-        logger.debug('Executing _execute_action for '+ self.player_name)
+        logger.debug('Executing _execute_action for %s', self.player_name)
         if parameters:
             p = action_to_execute(**parameters)
             # add to game history
-            current_gameboard['history']['function'].append(action_to_execute)
+            current_gameboard.history['function'].append(action_to_execute)
             params = parameters.copy()
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(p)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(p)
 
             return p
         else:
             p = action_to_execute()
             # add to game history
-            current_gameboard['history']['function'].append(action_to_execute)
+            current_gameboard.history['function'].append(action_to_execute)
             params = dict()
-            current_gameboard['history']['param'].append(params)
-            current_gameboard['history']['return'].append(p)
+            current_gameboard.history['param'].append(params)
+            current_gameboard.history['return'].append(p)
 
             return p
+
+
+# the method of Player that processes landing on a location, by location class
+_landing_handlers = {'do_nothing': Player._process_do_nothing_location,
+                     'real_estate': Player._process_real_estate_location,
+                     'tax': Player._process_tax_location,
+                     'railroad': Player._process_railroad_location,
+                     'utility': Player._process_utility_location,
+                     'action': Player._process_action_location}
+
+
+def compile_landing_table(current_gameboard):
+    """
+    Build the landing table of the board, which holds the location at every position of current_gameboard.location_sequence
+    along with the method of Player that processes landing on it, so that Player.process_move_consequences does not
+    need to compare location classes on every move. It is built when the board is set up, and has to be rebuilt by
+    whatever changes the locations of the board in place (see novelty_generator.RepresentationNovelty.global_reordering).
+    A board whose location_sequence is replaced by a new list gets its table rebuilt the next time a player lands.
+    :param current_gameboard: A dict. The global data structure representing the current game board.
+    :return: A tuple (location_sequence, list of tuples (location, handler), one per position), which is also stored in
+    current_gameboard.landing_table.
+    """
+    location_sequence = current_gameboard.location_sequence
+    landing_table = (location_sequence, [(loc, _landing_handlers.get(loc.loc_class, Player._process_unidentified_location))
+                                         for loc in location_sequence])
+    current_gameboard.landing_table = landing_table
+    return landing_table
@@ -11,6 +11,10 @@ from monopoly_simulator.player import Player
 from monopoly_simulator import card
 from monopoly_simulator import action_choices
 from monopoly_simulator.flag_config import flag_config_dict
+from monopoly_simulator.history import GameHistory
+from monopoly_simulator.game_state import GameState
+from monopoly_simulator.color_ownership import set_up_color_ownership
+from monopoly_simulator.improvement_levels import set_up_improvement_levels
 
 
 def read_in_current_state_from_file(infile, player_decision_agents):
@@ -25,15 +29,17 @@ def read_in_current_state_from_file(infile, player_decision_agents):
     :return: returns the initialized current_gameboard which will be passed to simulate_game_instance.
     """
     file = open(infile, 'r+')
-    current_gameboard = dict()
+    current_gameboard = GameState()
 
     game_schema = json.load(file)
     _initialize_bank(current_gameboard, game_schema)
     _initialize_players(current_gameboard, game_schema, player_decision_agents)
     _initialize_locations(current_gameboard, game_schema)
+    set_up_improvement_levels(current_gameboard)
     _initialize_dies(current_gameboard, game_schema)
     _initialize_cards(current_gameboard, game_schema)
     _initialize_game_history_structs(current_gameboard)
+    set_up_color_ownership(current_gameboard)  # the players' assets are only known once the locations are read in
     current_gameboard['type'] = "current_gameboard"
     return current_gameboard
 
@@ -383,6 +389,8 @@ def _initialize_players(current_gameboard, game_schema, player_decision_agents):
         players.append(player_obj)
 
     current_gameboard['players'] = players
+    current_gameboard['player_objects'] = dict([(p.player_name, p) for p in players]) # key is a player name, and value is a Player object
+    current_gameboard['players_over_cash_limit'] = set([p for p in players if p.current_cash > current_gameboard['bank'].runaway_cash_limit])
 
 
 def _initialize_locations(current_gameboard, game_schema):
@@ -466,7 +474,7 @@ def _initialize_locations(current_gameboard, game_schema):
                         player.assets.add(location_objects[l['name']])
 
         else:
-            logger.debug('encountered unexpected location class: '+ l['loc_class'])
+            logger.debug('encountered unexpected location class: %s', l['loc_class'])
             logger.error("Exception")
             raise Exception
 
@@ -487,8 +495,7 @@ def _initialize_locations(current_gameboard, game_schema):
     current_gameboard['utility_positions'] = utility_positions
 
     if len(location_sequence) != game_schema['locations']['location_count']:
-        logger.debug('location count: '+ str(game_schema['locations']['location_count'])+ ', length of location sequence: '+
-        str(len(location_sequence))+ ' are unequal.')
+        logger.debug('location count: %s, length of location sequence: %s are unequal.', game_schema['locations']['location_count'], len(location_sequence))
         logger.error("Exception")
         raise Exception
 
@@ -517,6 +524,9 @@ def _initialize_locations(current_gameboard, game_schema):
 
     current_gameboard['color_assets'] = color_assets
 
+    for player in current_gameboard['players']:
+        player.recompute_asset_values()   # the assets of the players were populated directly above
+
     for item in game_schema['players']:
         for player in current_gameboard['players']:
             if item['player_name'] == player.player_name:
@@ -571,8 +581,8 @@ def _initialize_dies(current_gameboard, game_schema):
 
 
 def _initialize_cards(current_gameboard, game_schema):
-    community_chest_cards = set() # community chest card objects
-    chance_cards = set() # chance card objects
+    community_chest_cards = card.CardDeck() # community chest card objects
+    chance_cards = card.CardDeck() # chance card objects
 
     community_chest_card_objects = dict() # key is a community chest card name and value is an object
     chance_card_objects = dict() # key is a chance card name and value is an object
@@ -628,7 +638,7 @@ def _initialize_cards(current_gameboard, game_schema):
                 card_obj = card.CashFromPlayersCard(**card_args)
                 community_chest_cards.add(card_obj)
         else:
-            logger.debug('community chest card type is not recognized: '+ specific_card['card_type'])
+            logger.debug('community chest card type is not recognized: %s', specific_card['card_type'])
             logger.error("Exception")
             raise Exception
 
@@ -702,7 +712,7 @@ def _initialize_cards(current_gameboard, game_schema):
                 card_obj = card.CashFromPlayersCard(**card_args)
                 chance_cards.add(card_obj)
         else:
-            logger.debug('chance card type is not recognized: '+ specific_card['card_type'])
+            logger.debug('chance card type is not recognized: %s', specific_card['card_type'])
             logger.error("Exception")
             raise Exception
 
@@ -726,7 +736,4 @@ def _initialize_cards(current_gameboard, game_schema):
 
 
 def _initialize_game_history_structs(current_gameboard):
-    current_gameboard['history'] = dict()
-    current_gameboard['history']['function'] = list()
-    current_gameboard['history']['param'] = list()
-    current_gameboard['history']['return'] = list()
+    current_gameboard['history'] = GameHistory()
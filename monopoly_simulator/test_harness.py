@@ -1,70 +1,69 @@
-import numpy as np
-from monopoly_simulator import gameplay
 from monopoly_simulator import novelty_generator
-from monopoly_simulator.logging_info import log_file_create
+from monopoly_simulator import tournament_helper
+from monopoly_simulator import tournament_statistics
+from monopoly_simulator import game_summary
+from monopoly_simulator import experiment_grid
 import os
 import shutil
 import json
+import itertools
 
+_game_length_history_name = 'game_lengths.json'   # see _play_tournament_games
 
-def play_tournament_without_novelty(tournament_log_folder=None, meta_seed=5, num_games=100):
+def play_tournament_without_novelty(tournament_log_folder=None, meta_seed=5, num_games=100, num_workers=1,
+                                    outcome_cache_folder=None, budget=None, hang_timeout=None):
     """
     Tournament logging is not currently supported, but will be soon.
     :param tournament_log_folder: String. The path to a folder.
     :param meta_seed: This is the seed we will use to generate a sequence of seeds, that will (in turn) spawn the games in gameplay/simulate_game_instance
     :param num_games: The number of games to simulate in a tournament
+    :param num_workers: The number of processes over which the games are played. If 1, the games are played one after
+    the other in the current process. The winners and the game logs do not depend on this number.
+    :param outcome_cache_folder: String or None. If specified, games whose outcome is in the outcome cache in this folder
+    are not played again (see outcome_cache.py), and the outcomes of the games that are played are added to it.
+    :param budget: A dict or None. The wall clock, turn and agent call budget of every game (see game_budget.py). A game
+    that runs out of it ends with the player of the highest net worth as the winner, and is marked as truncated.
+    :param hang_timeout: A float or None. With num_workers > 1, a game still running after this many seconds has its
+    worker killed and replaced, and is recorded without a winner (see tournament_helper.play_games_in_pool). Such a game
+    is not checkpointed, so it is played again if the tournament is resumed.
     :return: None. Will print out the win-loss metrics, and will write out game logs
+
+    The result of every game is appended to tournament_results.jsonl in the tournament folder as soon as the game ends.
+    If the tournament is stopped, calling this function again with the same folder and parameters resumes it: games
+    that already finished are not played again.
     """
 
-    if not tournament_log_folder:
-        print("No logging folder specified, cannot log tournaments. Provide a logging folder path.")
-        raise Exception
+    _check_tournament_log_folder(tournament_log_folder)
 
-    np.random.seed(meta_seed)
-    big_list = list(range(0,1000000))
-    np.random.shuffle(big_list)
-    tournament_seeds = big_list[0:num_games]
-    winners = list()
+    tournament_seeds = tournament_helper.tournament_seeds(meta_seed, num_games)
     count = 1
 
     folder_name = "../tournament_logs" + tournament_log_folder
-    try:
-        os.makedirs(folder_name)
-        print('Logging gameplay')
-    except:
-        print('Given logging folder already exists. Clearing folder before logging new files.')
-        shutil.rmtree(folder_name)
-        os.makedirs(folder_name)
-
     metadata_dict = {
         "function": "play_tournament_without_novelty",
         "parameters": {
             "meta_seed": meta_seed,
-            "num_game": num_games
+            "num_game": num_games,
+            "budget": budget
         }
     }
+    _set_up_tournament_folder(folder_name, metadata_dict)
+    results_filename = folder_name + "tournament_results.jsonl"
 
-    json_filename = folder_name + "tournament_meta_data.json"
-    out_file = open(json_filename, "w")
-    json.dump(metadata_dict, out_file, indent=4)
-    out_file.close()
-
+    game_args_list = list()
     for t in tournament_seeds:
-        print('Logging gameplay for seed: ', str(t), ' ---> Game ' + str(count))
         filename = folder_name + "meta_seed_" + str(meta_seed) + '_num_games_' + str(count) + '.log'
-        logger = log_file_create(filename)
-        winners.append(gameplay.play_game_in_tournament(t))
-        handlers_copy = logger.handlers[:]
-        for handler in handlers_copy:
-            logger.removeHandler(handler)
-            handler.close()
-            handler.flush()
+        game_args_list.append((t, filename, False, None, outcome_cache_folder, None, None, budget))
         count += 1
 
+    winners = _play_tournament_games(game_args_list, 'Logging gameplay for seed: ', 1, num_workers, results_filename,
+                                     hang_timeout)
+
     print(winners)
 
 
-def play_tournament_with_novelty_1(tournament_log_folder=None, meta_seed=5, num_games=100, novelty_index=23, novelty_info=False):
+def play_tournament_with_novelty_1(tournament_log_folder=None, meta_seed=5, num_games=100, novelty_index=23, novelty_info=False, num_workers=1,
+                                   outcome_cache_folder=None, budget=None, hang_timeout=None):
     """
 
     :param tournament_log_folder:
@@ -72,72 +71,540 @@ def play_tournament_with_novelty_1(tournament_log_folder=None, meta_seed=5, num_
     :param num_games:
     :param novelty_index: an integer between 1 and num_games-1. We will play this many games BEFORE introducing novelty.
     :param novelty_info: boolean that specifies if the agent will be notified when novelty is injected or not.
+    :param num_workers: number of processes over which the games are played (1 plays them in the current process).
+    :param outcome_cache_folder: path to an outcome cache folder, or None (see play_tournament_without_novelty).
+    :param budget: the budget of every game, or None (see play_tournament_without_novelty).
+    :param hang_timeout: seconds after which a hanging game's worker is replaced, or None (see play_tournament_without_novelty).
     :return:
+
+    Like play_tournament_without_novelty, the tournament resumes where it stopped if it is called again with the same
+    folder and parameters.
     """
 
-    if not tournament_log_folder:
-        print("No logging folder specified, cannot log tournaments. Provide a logging folder path.")
-        raise Exception
+    _check_tournament_log_folder(tournament_log_folder)
 
-    np.random.seed(meta_seed)
-    big_list = list(range(0, 1000000))
-    np.random.shuffle(big_list)
-    tournament_seeds = big_list[0:num_games]
-    winners = list()
+    tournament_seeds = tournament_helper.tournament_seeds(meta_seed, num_games)
     count = 1
 
     folder_name = "../tournament_logs" + tournament_log_folder
-    try:
-        os.makedirs(folder_name)
-        print('Logging gameplay')
-    except:
-        print('Given logging folder already exists. Clearing folder before logging new files.')
-        shutil.rmtree(folder_name)
-        os.makedirs(folder_name)
-
     metadata_dict = {
         "function": "play_tournament_with_novelty_1",
         "parameters": {
             "meta_seed": meta_seed,
             "novelty_index": novelty_index,
-            "num_game": num_games
+            "novelty_info": novelty_info,
+            "num_game": num_games,
+            "budget": budget
         }
     }
+    _set_up_tournament_folder(folder_name, metadata_dict)
+    results_filename = folder_name + "tournament_results.jsonl"
 
-    json_filename = folder_name + "tournament_meta_data.json"
-    out_file = open(json_filename, "w")
-    json.dump(metadata_dict, out_file, indent=4)
-    out_file.close()
-
+    game_args_list = list()
     for t in range(0,novelty_index):
-        print('Logging gameplay without novelty for seed: ', str(tournament_seeds[t]), ' ---> Game ' + str(count))
         filename = folder_name + "meta_seed_" + str(meta_seed) + '_without_novelty' + '_num_games_' + str(count) + '.log'
-        logger = log_file_create(filename)
-        winners.append(gameplay.play_game_in_tournament(tournament_seeds[t], novelty_info))
-        handlers_copy = logger.handlers[:]
-        for handler in handlers_copy:
-            logger.removeHandler(handler)
-            handler.close()
-            handler.flush()
+        game_args_list.append((tournament_seeds[t], filename, novelty_info, None, outcome_cache_folder, None, None, budget))
         count += 1
+    winners = _play_tournament_games(game_args_list, 'Logging gameplay without novelty for seed: ', 1, num_workers,
+                                     results_filename, hang_timeout)
 
-    new_winners = list()
+    game_args_list = list()
     for t in range(novelty_index, len(tournament_seeds)):
-        print('Logging gameplay with novelty for seed: ', str(tournament_seeds[t]), ' ---> Game ' + str(count))
         filename = folder_name + "meta_seed_" + str(meta_seed) + '_with_novelty' + '_num_games_' + str(count) + '.log'
-        logger = log_file_create(filename)
-        new_winners.append(gameplay.play_game_in_tournament(tournament_seeds[t], novelty_info, class_novelty_1))
-        handlers_copy = logger.handlers[:]
-        for handler in handlers_copy:
-            logger.removeHandler(handler)
-            handler.close()
-            handler.flush()
+        game_args_list.append((tournament_seeds[t], filename, novelty_info, class_novelty_1, outcome_cache_folder, None, None,
+                               budget))
         count += 1
+    new_winners = _play_tournament_games(game_args_list, 'Logging gameplay with novelty for seed: ', novelty_index+1,
+                                         num_workers, results_filename, hang_timeout)
 
     print('pre_novelty winners', winners)
     print('post_novelty_winners', new_winners)
 
 
+def play_seat_rotation_tournament(tournament_log_folder=None, meta_seed=5, num_seeds=25, rotations_only=False,
+                                  num_workers=1, outcome_cache_folder=None, budget=None, hang_timeout=None):
+    """
+    A tournament with common random numbers: every seed is played once under every seat order (all 24 permutations of
+    the four players, or only the 4 cyclic rotations if rotations_only is True). All the games of a seed share the same
+    dice rolls and card draws, since those streams are derived from the seed alone (see
+    initialize_game_elements.initialize_random_generators), so the games of a seed only differ in who sits where. Win
+    rates are computed over seeds (see tournament_statistics.blocked_win_rates), which removes the luck of the dice
+    and of the seat from the comparison between players.
+    :param tournament_log_folder: String. The path to a folder.
+    :param meta_seed: The seed from which the sequence of game seeds is generated (as in play_tournament_without_novelty).
+    :param num_seeds: The number of seeds. The tournament plays num_seeds*24 (or num_seeds*4) games.
+    :param rotations_only: If True, only the cyclic rotations of the seat order are played, so that every player
+    still sits in every seat once per seed.
+    :param num_workers: The number of processes over which the games are played.
+    :param outcome_cache_folder: String or None. See play_tournament_without_novelty.
+    :param budget: the budget of every game, or None (see play_tournament_without_novelty).
+    :param hang_timeout: seconds after which a hanging game's worker is replaced, or None (see play_tournament_without_novelty).
+    :return: A dict with player names as keys and tuples (win rate, lower end, upper end) as values. The win rates are
+    also printed out.
+
+    Like the other tournaments, it resumes where it stopped if it is called again with the same folder and parameters.
+    """
+
+    _check_tournament_log_folder(tournament_log_folder)
+
+    tournament_seeds = tournament_helper.tournament_seeds(meta_seed, num_seeds)
+
+    player_names = ['player_1', 'player_2', 'player_3', 'player_4']
+    if rotations_only:
+        seat_orders = [player_names[i:] + player_names[:i] for i in range(len(player_names))]
+    else:
+        seat_orders = [list(order) for order in itertools.permutations(player_names)]
+
+    folder_name = "../tournament_logs" + tournament_log_folder
+    metadata_dict = {
+        "function": "play_seat_rotation_tournament",
+        "parameters": {
+            "meta_seed": meta_seed,
+            "num_seeds": num_seeds,
+            "rotations_only": rotations_only,
+            "budget": budget
+        }
+    }
+    _set_up_tournament_folder(folder_name, metadata_dict)
+    results_filename = folder_name + "tournament_results.jsonl"
+
+    game_args_list = list()
+    count = 1
+    for t in tournament_seeds:
+        for seat_order in seat_orders:
+            filename = folder_name + "meta_seed_" + str(meta_seed) + '_num_games_' + str(count) + '.log'
+            game_args_list.append((t, filename, False, None, outcome_cache_folder, seat_order, None, budget))
+            count += 1
+
+    _play_tournament_games(game_args_list, 'Logging gameplay for seed: ', 1, num_workers, results_filename, hang_timeout)
+    summaries = [game_summary.read_game_summary(game_summary.summary_filename(game_args[1]))
+                 for game_args in game_args_list]
+    block_summaries = [summaries[i:i+len(seat_orders)] for i in range(0, len(summaries), len(seat_orders))]
+    win_rates = tournament_statistics.blocked_win_rates(block_summaries)
+    for player_name in sorted(win_rates):
+        print(player_name + ': win rate %.3f [%.3f, %.3f]' % win_rates[player_name])
+    return win_rates
+
+
+def play_paired_novelty_tournament(tournament_log_folder=None, meta_seed=5, num_seeds=100, novelty_info=False,
+                                   num_workers=1, outcome_cache_folder=None, budget=None, hang_timeout=None):
+    """
+    Measure the effect of novelty with paired games: every seed is played twice, once without novelty and once with
+    class_novelty_1 injected. Both games of a seed have the same seat order, dice rolls and card draws (the streams are
+    derived from the seed alone, see initialize_game_elements.initialize_random_generators), so the difference between
+    them is due to the novelty and not to the luck of the seed, unlike the disjoint seeds of play_tournament_with_novelty_1.
+    :param tournament_log_folder: String. The path to a folder.
+    :param meta_seed: The seed from which the sequence of game seeds is generated (as in play_tournament_without_novelty).
+    :param num_seeds: The number of seeds. The tournament plays 2*num_seeds games.
+    :param novelty_info: boolean that specifies if the agent will be notified when novelty is injected or not.
+    :param num_workers: The number of processes over which the games are played.
+    :param outcome_cache_folder: String or None. See play_tournament_without_novelty. The games without novelty are the
+    same as those of play_tournament_with_novelty_1 with the same seeds, so they are shared through the cache.
+    :param budget: the budget of every game, or None (see play_tournament_without_novelty).
+    :param hang_timeout: seconds after which a hanging game's worker is replaced, or None (see play_tournament_without_novelty).
+    :return: A dict with the paired differences in win rate and rank of every player (see
+    tournament_statistics.paired_differences). The differences are also printed out.
+
+    Like the other tournaments, it resumes where it stopped if it is called again with the same folder and parameters.
+    The game logs are named like those of play_tournament_with_novelty_1, so metrics_helper splits them the same way.
+    """
+
+    _check_tournament_log_folder(tournament_log_folder)
+
+    tournament_seeds = tournament_helper.tournament_seeds(meta_seed, num_seeds)
+
+    folder_name = "../tournament_logs" + tournament_log_folder
+    metadata_dict = {
+        "function": "play_paired_novelty_tournament",
+        "parameters": {
+            "meta_seed": meta_seed,
+            "num_seeds": num_seeds,
+            "novelty_info": novelty_info,
+            "budget": budget
+        }
+    }
+    _set_up_tournament_folder(folder_name, metadata_dict)
+    results_filename = folder_name + "tournament_results.jsonl"
+
+    game_args_list = list()
+    count = 1
+    for t in tournament_seeds:
+        filename = folder_name + "meta_seed_" + str(meta_seed) + '_without_novelty' + '_num_games_' + str(count) + '.log'
+        game_args_list.append((t, filename, novelty_info, None, outcome_cache_folder, None, None, budget))
+        count += 1
+        filename = folder_name + "meta_seed_" + str(meta_seed) + '_with_novelty' + '_num_games_' + str(count) + '.log'
+        game_args_list.append((t, filename, novelty_info, class_novelty_1, outcome_cache_folder, None, None, budget))
+        count += 1
+
+    _play_tournament_games(game_args_list, 'Logging paired gameplay for seed: ', 1, num_workers, results_filename,
+                           hang_timeout)
+    summaries = [game_summary.read_game_summary(game_summary.summary_filename(game_args[1]))
+                 for game_args in game_args_list]
+    differences = tournament_statistics.paired_differences(list(zip(summaries[0::2], summaries[1::2])))
+    print('Effect of novelty (with novelty minus without), over ' + str(num_seeds) + ' seeds:')
+    for player_name in sorted(differences):
+        print(player_name + ': win rate %+.3f [%+.3f, %+.3f]' % differences[player_name]['win'] +
+              ', rank %+.2f [%+.2f, %+.2f]' % differences[player_name]['rank'])
+    return differences
+
+
+def play_experiment_grid(manifest_file, num_workers=1, outcome_cache_folder=None):
+    """
+    Play every cell of an experiment grid (configurations x agents x seeds, see experiment_grid.py) and write the results
+    to experiment_results.csv in the experiment folder, as a tidy table with one row per cell and player. Cells that are
+    the same game are played once, and the distinct games are spread over num_workers processes.
+    :param manifest_file: String. Path of the experiment manifest json file.
+    :param num_workers: The number of processes over which the games are played.
+    :param outcome_cache_folder: String or None. See play_tournament_without_novelty. Games shared between experiments
+    (e.g., the baseline) are then only played once across experiments.
+    :return: String. The path of the results table.
+
+    Like the tournaments, an experiment resumes where it stopped if it is run again with the same manifest.
+    """
+    manifest = experiment_grid.read_manifest(manifest_file)
+    cells, games = experiment_grid.experiment_cells(manifest)
+
+    folder_name = "../tournament_logs/" + manifest['name'] + "/"
+    metadata_dict = {
+        "function": "play_experiment_grid",
+        "parameters": manifest
+    }
+    _set_up_tournament_folder(folder_name, metadata_dict)
+    results_filename = folder_name + "tournament_results.jsonl"
+
+    game_args_list = list()
+    count = 1
+    for seed, configuration, agent_modules in games:
+        filename = folder_name + 'game_' + str(count) + '.log'
+        game_args_list.append((seed, filename, manifest['novelty_info'], configuration, outcome_cache_folder, None,
+                               agent_modules, manifest['budget']))
+        count += 1
+    print('Playing ' + str(len(games)) + ' distinct games for the ' + str(len(cells)) + ' cells of the experiment.')
+    _play_tournament_games(game_args_list, 'Logging experiment gameplay for seed: ', 1, num_workers, results_filename,
+                           manifest['hang_timeout'])
+
+    summaries = [game_summary.read_game_summary(game_summary.summary_filename(game_args[1]))
+                 for game_args in game_args_list]
+    table_filename = folder_name + "experiment_results.csv"
+    experiment_grid.write_results_table(table_filename, manifest, cells, summaries,
+                                        [game_args[1] for game_args in game_args_list])
+    print('Experiment results written to ' + table_filename)
+    return table_filename
+
+
+def play_adaptive_tournament_without_novelty(tournament_log_folder=None, meta_seed=5, max_games=2000, min_games=100,
+                                             batch_size=50, precision=0.05, rank_precision=None, confidence=0.95,
+                                             stop_on_separation=True, num_workers=1, outcome_cache_folder=None,
+                                             budget=None, hang_timeout=None):
+    """
+    Like play_tournament_without_novelty, but instead of playing a fixed number of games, games are played in batches of
+    batch_size until the win (and rank) statistics are settled, as decided by tournament_statistics.TournamentStatistics,
+    or until max_games have been played. The seeds are the same as those of play_tournament_without_novelty with the same
+    meta_seed, so an adaptive tournament plays the first games of the corresponding fixed one.
+    :param tournament_log_folder: String. The path to a folder.
+    :param meta_seed: The seed from which the sequence of game seeds is generated.
+    :param max_games: The maximum number of games to play.
+    :param min_games: The number of games played before stopping is considered at all.
+    :param batch_size: The number of games played between two checks of the stopping rule. The games played (and so
+    the results) do not depend on num_workers, only on this.
+    :param precision: Target half-width of the win rate interval of every player.
+    :param rank_precision: Target half-width of the mean rank interval of every player, or None to stop on win rates only.
+    :param confidence: Confidence level of the intervals.
+    :param stop_on_separation: If True, also stop as soon as the leading player's win rate is separated from all others.
+    :param num_workers: The number of processes over which the games are played.
+    :param outcome_cache_folder: String or None. See play_tournament_without_novelty.
+    :param budget: the budget of every game, or None (see play_tournament_without_novelty).
+    :param hang_timeout: seconds after which a hanging game's worker is replaced, or None (see play_tournament_without_novelty).
+    :return: A TournamentStatistics instance. The statistics are also printed out.
+
+    The tournament can be resumed like play_tournament_without_novelty; since the stopping rule only depends on the games
+    played so far, a resumed tournament stops after the same game as an uninterrupted one.
+    """
+
+    _check_tournament_log_folder(tournament_log_folder)
+
+    tournament_seeds = tournament_helper.tournament_seeds(meta_seed, max_games)
+
+    folder_name = "../tournament_logs" + tournament_log_folder
+    metadata_dict = {
+        "function": "play_adaptive_tournament_without_novelty",
+        "parameters": {
+            "meta_seed": meta_seed,
+            "max_games": max_games,
+            "min_games": min_games,
+            "batch_size": batch_size,
+            "precision": precision,
+            "rank_precision": rank_precision,
+            "confidence": confidence,
+            "stop_on_separation": stop_on_separation,
+            "budget": budget
+        }
+    }
+    _set_up_tournament_folder(folder_name, metadata_dict)
+    results_filename = folder_name + "tournament_results.jsonl"
+
+    def _game_args(seed, count):
+        filename = folder_name + "meta_seed_" + str(meta_seed) + '_num_games_' + str(count) + '.log'
+        return seed, filename, False, None, outcome_cache_folder, None, None, budget
+
+    statistics = _play_adaptive_phase(tournament_seeds, _game_args, 'Logging gameplay for seed: ', 1, num_workers,
+                                      results_filename, min_games, batch_size, precision, rank_precision, confidence,
+                                      stop_on_separation, hang_timeout)
+    statistics.print_statistics()
+    return statistics
+
+
+def play_adaptive_tournament_with_novelty_1(tournament_log_folder=None, meta_seed=5, max_games=2000, min_games=100,
+                                            batch_size=50, precision=0.05, rank_precision=None, confidence=0.95,
+                                            stop_on_separation=True, novelty_info=False, num_workers=1,
+                                            outcome_cache_folder=None, budget=None, hang_timeout=None):
+    """
+    The adaptive counterpart of play_tournament_with_novelty_1. Games without novelty are played until their statistics
+    are settled (see play_adaptive_tournament_without_novelty), and then games with novelty are played until the
+    statistics of those games, kept separately, are settled as well. Each phase plays at most max_games games.
+    :param tournament_log_folder: String. The path to a folder.
+    :param meta_seed: The seed from which the sequence of game seeds is generated. The phase without novelty uses the
+    first max_games seeds of the sequence and the phase with novelty the next max_games.
+    :param novelty_info: boolean that specifies if the agent will be notified when novelty is injected or not.
+    The other parameters are as in play_adaptive_tournament_without_novelty.
+    :return: A tuple of two TournamentStatistics instances, for the games without and with novelty.
+    """
+
+    _check_tournament_log_folder(tournament_log_folder)
+
+    tournament_seeds = tournament_helper.tournament_seeds(meta_seed, 2*max_games)
+
+    folder_name = "../tournament_logs" + tournament_log_folder
+    metadata_dict = {
+        "function": "play_adaptive_tournament_with_novelty_1",
+        "parameters": {
+            "meta_seed": meta_seed,
+            "max_games": max_games,
+            "min_games": min_games,
+            "batch_size": batch_size,
+            "precision": precision,
+            "rank_precision": rank_precision,
+            "confidence": confidence,
+            "stop_on_separation": stop_on_separation,
+            "novelty_info": novelty_info,
+            "budget": budget
+        }
+    }
+    _set_up_tournament_folder(folder_name, metadata_dict)
+    results_filename = folder_name + "tournament_results.jsonl"
+
+    def _game_args_without_novelty(seed, count):
+        filename = folder_name + "meta_seed_" + str(meta_seed) + '_without_novelty' + '_num_games_' + str(count) + '.log'
+        return seed, filename, novelty_info, None, outcome_cache_folder, None, None, budget
+
+    def _game_args_with_novelty(seed, count):
+        filename = folder_name + "meta_seed_" + str(meta_seed) + '_with_novelty' + '_num_games_' + str(count) + '.log'
+        return seed, filename, novelty_info, class_novelty_1, outcome_cache_folder, None, None, budget
+
+    statistics = _play_adaptive_phase(tournament_seeds[0:max_games], _game_args_without_novelty,
+                                      'Logging gameplay without novelty for seed: ', 1, num_workers, results_filename,
+                                      min_games, batch_size, precision, rank_precision, confidence, stop_on_separation,
+                                      hang_timeout)
+    novelty_statistics = _play_adaptive_phase(tournament_seeds[max_games:2*max_games], _game_args_with_novelty,
+                                              'Logging gameplay with novelty for seed: ',
+                                              statistics.num_games+statistics.num_hung_games+1,
+                                              num_workers, results_filename, min_games, batch_size, precision,
+                                              rank_precision, confidence, stop_on_separation, hang_timeout)
+    print('Pre-novelty statistics:')
+    statistics.print_statistics()
+    print('Post-novelty statistics:')
+    novelty_statistics.print_statistics()
+    return statistics, novelty_statistics
+
+
+def _play_adaptive_phase(seeds, game_args_function, progress_message, first_game, num_workers, results_filename,
+                         min_games, batch_size, precision, rank_precision, confidence, stop_on_separation,
+                         hang_timeout=None):
+    """
+    Internal function that plays the games of one phase of an adaptive tournament in batches, until the stopping rule
+    is met or all seeds have been used.
+    :param seeds: A list of game seeds, in the order in which they are played.
+    :param game_args_function: A function taking a seed and a game number and returning the arguments to
+    tournament_helper.play_logged_game for that game.
+    :param progress_message: String that is printed (along with the seed) as each game is logged.
+    :param first_game: An integer. The game number (within the tournament) of the first game of the phase.
+    :param num_workers: An integer. See _play_tournament_games.
+    :param results_filename: String. Path to the tournament results file.
+    :param hang_timeout: A float or None. See _play_tournament_games.
+    The other parameters are as in play_adaptive_tournament_without_novelty.
+    :return: A TournamentStatistics instance with the games of the phase.
+    """
+    batch_ends = list(range(batch_size, len(seeds), batch_size)) + [len(seeds)]
+    max_looks = len([end for end in batch_ends if end >= min_games])
+    statistics = tournament_statistics.TournamentStatistics(confidence, precision, rank_precision, stop_on_separation,
+                                                            max_looks)
+    start = 0
+    for end in batch_ends:
+        game_args_list = [game_args_function(seeds[t], first_game + t) for t in range(start, end)]
+        _play_tournament_games(game_args_list, progress_message, first_game + start, num_workers, results_filename,
+                               hang_timeout)
+        for game_args in game_args_list:
+            statistics.add_game(game_summary.read_game_summary(game_summary.summary_filename(game_args[1])))
+        start = end
+        if statistics.num_games >= min_games:
+            reason = statistics.stopping_reason()
+            if reason is not None:
+                print('Statistics settled (' + reason + ') after ' + str(statistics.num_games) + ' games.')
+                break
+    return statistics
+
+
+def _check_tournament_log_folder(tournament_log_folder):
+    """
+    Internal function that makes sure a tournament was given a logging folder.
+    :param tournament_log_folder: String or None. The tournament_log_folder argument of a tournament function.
+    :return: None
+    """
+    if not tournament_log_folder:
+        print("No logging folder specified, cannot log tournaments. Provide a logging folder path.")
+        raise Exception
+
+
+def _set_up_tournament_folder(folder_name, metadata_dict):
+    """
+    Internal function that creates the tournament folder and writes the tournament metadata into it. If the folder already
+    holds a tournament with exactly the same metadata (function and parameters), it is left untouched so that the
+    tournament can resume. A folder holding anything else is cleared first, except for the game length history (see
+    _play_tournament_games), which still predicts the lengths of the games well if the tournament is played again with
+    other parameters.
+    :param folder_name: String. The path to the tournament folder (ending with a '/').
+    :param metadata_dict: A dict. The function that plays the tournament and its parameters.
+    :return: None
+    """
+    json_filename = folder_name + "tournament_meta_data.json"
+    if os.path.isdir(folder_name):
+        existing_metadata = None
+        if os.path.exists(json_filename):
+            try:
+                with open(json_filename, "r") as in_file:
+                    existing_metadata = json.load(in_file)
+            except ValueError:
+                pass
+        if existing_metadata == metadata_dict:
+            print('Given logging folder already holds this tournament. Resuming it; finished games will not be replayed.')
+            return
+        print('Given logging folder already exists. Clearing folder before logging new files.')
+        length_history = None
+        if os.path.exists(folder_name + _game_length_history_name):
+            with open(folder_name + _game_length_history_name, "r") as in_file:
+                length_history = in_file.read()
+        shutil.rmtree(folder_name)
+        os.makedirs(folder_name)
+        if length_history is not None:
+            with open(folder_name + _game_length_history_name, "w") as out_file:
+                out_file.write(length_history)
+    else:
+        print('Logging gameplay')
+        os.makedirs(folder_name)
+
+    out_file = open(json_filename, "w")
+    json.dump(metadata_dict, out_file, indent=4)
+    out_file.close()
+
+
+def _read_finished_games(results_filename):
+    """
+    Internal function that reads the results of the games that already finished from the tournament results file.
+    :param results_filename: String. Path to the tournament results file (one json object per line and game).
+    :return: A dict with the game number as key and the game result (a dict with the keys 'game', 'seed', 'log_file'
+    and 'winner') as value.
+    """
+    finished_games = dict()
+    if not os.path.exists(results_filename):
+        return finished_games
+    with open(results_filename, "r") as in_file:
+        content = in_file.read()
+    for line in content.splitlines():
+        try:
+            result = json.loads(line)
+        except ValueError:   # the last line may have been cut short if the tournament died while writing it
+            continue
+        finished_games[result['game']] = result
+    if content and not content.endswith('\n'):
+        with open(results_filename, "a") as out_file:   # so that the next result starts on a line of its own
+            out_file.write('\n')
+    return finished_games
+
+
+def _record_game_result(results_filename, game, game_args, winner):
+    """
+    Internal function that appends the result of a finished game to the tournament results file, and makes sure it is
+    on disk before returning.
+    :param results_filename: String. Path to the tournament results file.
+    :param game: An integer. The game number within the tournament.
+    :param game_args: A tuple of arguments to tournament_helper.play_logged_game (game_seed, log_filename, ...).
+    :param winner: String. The name of the winner, or None.
+    :return: None
+    """
+    result = {'game': game, 'seed': game_args[0], 'log_file': game_args[1], 'winner': winner}
+    with open(results_filename, "a") as out_file:
+        out_file.write(json.dumps(result) + '\n')
+        out_file.flush()
+        os.fsync(out_file.fileno())
+
+
+def _play_tournament_games(game_args_list, progress_message, first_game=1, num_workers=1, results_filename=None,
+                           hang_timeout=None):
+    """
+    Internal function that plays out the games of a tournament, either serially or over a pool of worker processes.
+    :param game_args_list: A list of tuples of arguments to tournament_helper.play_logged_game, one per game.
+    :param progress_message: String that is printed (along with the seed) as each game is logged.
+    :param first_game: An integer. The game number (within the tournament) of the first game in game_args_list.
+    :param num_workers: An integer. If greater than 1, the games are distributed over that many worker processes.
+    :param results_filename: String or None. If specified, games that are already recorded in this file (with the same
+    seed) are not played again, and the result of every game that is played is appended to it as soon as the game ends.
+    Games that hang are not recorded, so that they are played again when the tournament is resumed.
+    :param hang_timeout: A float or None. See tournament_helper.play_games_in_pool. Only used if num_workers > 1.
+    :return: A list of winners in the same order as game_args_list.
+
+    With num_workers > 1, the lengths of the games are kept in a game length history next to results_filename, so that
+    the games are scheduled longest first when the tournament is played again (see tournament_helper.play_games_in_pool).
+    """
+    def _print_progress(index, game_args, winner=None):
+        print(progress_message, str(game_args[0]), ' ---> Game ' + str(first_game + index))
+
+    finished_games = dict()
+    if results_filename:
+        finished_games = _read_finished_games(results_filename)
+    winners = [None]*len(game_args_list)
+    games_to_play = list()   # indexes (into game_args_list) of the games that still have to be played
+    for index, game_args in enumerate(game_args_list):
+        result = finished_games.get(first_game + index)
+        if result is not None and result['seed'] == game_args[0]:
+            winners[index] = result['winner']
+        else:
+            games_to_play.append(index)
+    if len(games_to_play) < len(game_args_list):
+        print('Skipping ' + str(len(game_args_list) - len(games_to_play)) + ' games that already finished.')
+
+    def _game_finished(index, game_args, winner, hung=False):
+        winners[index] = winner
+        if results_filename and not hung:
+            _record_game_result(results_filename, first_game + index, game_args, winner)
+
+    if num_workers > 1:
+        def _pool_callback(pool_index, game_args, winner, hung):
+            _print_progress(games_to_play[pool_index], game_args)
+            _game_finished(games_to_play[pool_index], game_args, winner, hung)
+        length_history_file = None
+        if results_filename:
+            length_history_file = os.path.join(os.path.dirname(results_filename), _game_length_history_name)
+        tournament_helper.play_games_in_pool([game_args_list[index] for index in games_to_play], num_workers,
+                                             callback=_pool_callback, length_history_file=length_history_file,
+                                             hang_timeout=hang_timeout)
+        return winners
+
+    for index in games_to_play:
+        _print_progress(index, game_args_list[index])
+        _game_finished(index, game_args_list[index], tournament_helper.play_logged_game(*game_args_list[index]))
+    return winners
+
+
 def class_novelty_1(current_gameboard):
     classCardNovelty = novelty_generator.TypeClassNovelty()
     novel_cc = dict()
@@ -147,13 +614,15 @@ def class_novelty_1(current_gameboard):
     classCardNovelty.card_novelty(current_gameboard, novel_cc, novel_chance)
 
 
-#All the tournaments get logged in seperate folders inside ../tournament_logs folder
-try:
-    os.makedirs("../tournament_logs/")
-except:
-    pass
+if __name__ == '__main__':
+    # guarded so that worker processes (when num_workers > 1) can import this module without starting a tournament
+    #All the tournaments get logged in seperate folders inside ../tournament_logs folder
+    try:
+        os.makedirs("../tournament_logs/")
+    except:
+        pass
 
-#Specify the name of the folder in which the tournament games has to be logged in the following format: "/name_of_your_folder/"
+    #Specify the name of the folder in which the tournament games has to be logged in the following format: "/name_of_your_folder/"
 
-# play_tournament_with_novelty_1('/tournament_with_novelty/')
-play_tournament_with_novelty_1(tournament_log_folder='/tournament_with_novelty/', meta_seed=5, num_games=20, novelty_index=10, novelty_info=True)
+    # play_tournament_with_novelty_1('/tournament_with_novelty/')
+    play_tournament_with_novelty_1(tournament_log_folder='/tournament_with_novelty/', meta_seed=5, num_games=20, novelty_index=10, novelty_info=True)
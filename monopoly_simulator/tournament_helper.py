@@ -0,0 +1,310 @@
+"""
+Helper functions used by test_harness.py to play the games of a tournament. Each game is logged into its own file, so a
+game can be played in the current process or in a worker process of a multiprocessing pool without changing what gets
+written out. Since every game is seeded independently, the winner of a seed does not depend on which process played it.
+
+The board is built from the game schema once per process (see _get_board_template), and every game is played on a clone
+of it. When games are played over a pool, they are scheduled longest first, using their lengths in earlier runs of the
+tournament (see play_games_in_pool).
+"""
+import multiprocessing
+import multiprocessing.connection
+import collections
+import traceback
+import json
+import os
+import time
+import logging
+import numpy as np
+from monopoly_simulator import gameplay
+from monopoly_simulator.logging_info import log_file_create
+from monopoly_simulator import game_summary
+# not a child of the gameplay logger (monopoly_simulator.logging_info), so that switching gameplay logging off does not
+# hide the warnings of the tournament
+logger = logging.getLogger('monopoly_simulator.tournament_helper')
+
+_board_template = None
+
+
+def _get_board_template():
+    """
+    Internal function that returns the board template of this process, building it on first use.
+    :return: A dict. The board template (see gameplay.set_up_board_template)
+    """
+    global _board_template
+    if _board_template is None:
+        _board_template = gameplay.set_up_board_template('../monopoly_game_schema_v1-2.json')
+    return _board_template
+
+
+def tournament_seeds(meta_seed, num_seeds):
+    """
+    The seeds of the games of a tournament: the first num_seeds numbers of a permutation of 0, ..., 999999 drawn with
+    meta_seed. The same meta_seed always gives the same seeds, and a longer tournament starts with the seeds of a shorter
+    one. Seeds the global numpy random number generator with meta_seed.
+    :param meta_seed: An integer.
+    :param num_seeds: An integer. Number of seeds (at most 1000000).
+    :return: A list of integers.
+    """
+    np.random.seed(meta_seed)
+    return np.random.permutation(1000000)[0:num_seeds].tolist()
+
+
+def play_logged_game(game_seed, log_filename, novelty_info=False, inject_novelty_function=None, outcome_cache_folder=None,
+                     seat_order=None, agent_modules=None, budget=None, return_summary=False):
+    """
+    Play a single tournament game and log its gameplay into log_filename. A summary of the game is written next to the
+    log file (see game_summary.summary_filename), from which the tournament metrics are computed.
+    :param game_seed: An integer. The seed that is passed on to gameplay.play_game_in_tournament
+    :param log_filename: A string. Path of the file into which the game will be logged.
+    :param novelty_info: A boolean. Specifies if the agents will be notified when novelty is injected or not.
+    :param inject_novelty_function: A function or None. If specified, it is used to inject novelty into the gameboard.
+    :param outcome_cache_folder: A string or None. If specified, the outcome cache in this folder is used (see
+    gameplay.play_game_in_tournament). A game taken from the cache gets a summary file, but its log only records the
+    cache hit.
+    :param seat_order: A list of player names or None. If specified, the players take their turns in this order (see
+    gameplay.simulate_game_instance).
+    :param agent_modules: A dict or None. The agent module of every player (see gameplay.play_game_in_tournament).
+    :param budget: A dict or None. The wall clock, turn and agent call budget of the game (see game_budget.py).
+    :param return_summary: A boolean. If True, the game summary is returned instead of the winner (see
+    gameplay.play_game_in_tournament).
+    :return: String. The name of the player who won the game, or None if there was no winner. With return_summary, a
+    dict (the game summary, telling whether the outcome was taken from the outcome cache), or None.
+    """
+    logger = log_file_create(log_filename)
+    outcome = gameplay.play_game_in_tournament(game_seed, novelty_info, inject_novelty_function,
+                                               board_template=_get_board_template(),
+                                               summary_file=game_summary.summary_filename(log_filename),
+                                               outcome_cache_folder=outcome_cache_folder, seat_order=seat_order,
+                                               agent_modules=agent_modules, budget=budget, return_summary=return_summary)
+    handlers_copy = logger.handlers[:]
+    for handler in handlers_copy:
+        logger.removeHandler(handler)
+        handler.close()
+        handler.flush()
+    return outcome
+
+
+def _worker_loop(connection):
+    """
+    Internal function that is run by every worker process of play_games_in_pool. The worker receives chunks of games
+    (lists of tuples (index, game_args), where game_args is a tuple of arguments to play_logged_game) over connection
+    and plays them, sending a message as every game starts and finishes (with the seconds it took to play, or None if it
+    was taken from the outcome cache), until it receives None.
+    :param connection: The worker's end of a multiprocessing Pipe.
+    :return: None
+    """
+    while True:
+        chunk = connection.recv()
+        if chunk is None:
+            break
+        for index, game_args in chunk:
+            connection.send(('started', index))
+            start_time = time.time()
+            try:
+                summary = play_logged_game(*game_args, return_summary=True)
+            except Exception:
+                connection.send(('failed', index, traceback.format_exc()))
+                return
+            winner = summary['winner'] if summary else None
+            seconds = time.time() - start_time
+            if summary and summary['from_outcome_cache']:
+                seconds = None   # a game taken from the outcome cache says nothing about how long the game takes to play
+            connection.send(('finished', index, winner, seconds))
+    connection.close()
+
+
+def _start_worker():
+    """
+    Internal function that starts a worker process for play_games_in_pool.
+    :return: A dict with the process, the connection to it, the indexes of the games of its current chunk that have not
+    finished yet ('games'), and the index and start time of the game it is playing ('game' and 'started').
+    """
+    parent_connection, child_connection = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_worker_loop, args=(child_connection,), daemon=True)
+    process.start()
+    child_connection.close()
+    return {'process': process, 'connection': parent_connection, 'games': [], 'game': None, 'started': None}
+
+
+def play_games_in_pool(game_args_list, num_workers, chunksize=None, callback=None, length_history_file=None,
+                       hang_timeout=None):
+    """
+    Play a list of games over a pool of num_workers worker processes. The games are handed out in chunks, and every worker
+    gets the next chunk as soon as it is done with its last one, so no worker sits idle while there are games left.
+    Unless chunksize is given, the games are ordered and chunked by _schedule_chunks, using the lengths of the games in
+    earlier runs (read from length_history_file) to start the longest ones first.
+    :param game_args_list: A list of tuples of arguments to play_logged_game, one per game.
+    The inject_novelty_function (if any) must be a module level function so that it can be sent to the workers.
+    :param num_workers: An integer. Number of worker processes in the pool.
+    :param chunksize: An integer or None. If specified, the games are handed out in the order of game_args_list,
+    chunksize games at a time.
+    :param callback: A function or None. If specified, it is called as callback(index, game_args, winner, hung) in the
+    main process as soon as a game finishes (so not necessarily in the order of game_args_list). hung is True for a game
+    that was taken to hang (see hang_timeout), and False otherwise.
+    :param length_history_file: A string or None. Path of the json file in which the length of every game played is
+    recorded (see _game_length_key), and from which the lengths of games are predicted. Games taken from the outcome
+    cache and games that hang are not recorded. If None, there is no history and the games keep their order.
+    :param hang_timeout: A float or None. If specified, a game that is still running after this many seconds is taken to
+    hang: its worker is killed and replaced, and the game is recorded without a winner, with a summary that marks it as
+    truncated (see game_summary.build_hung_game_summary). The rest of the worker's chunk is handed out again.
+    :return: A list of winners, in the same order as game_args_list.
+    """
+    game_lengths = _read_game_lengths(length_history_file) if length_history_file else dict()
+    if chunksize:
+        chunks = [list(range(i, min(i+chunksize, len(game_args_list)))) for i in range(0, len(game_args_list), chunksize)]
+    else:
+        chunks = _schedule_chunks([game_lengths.get(_game_length_key(game_args)) for game_args in game_args_list],
+                                  num_workers)
+
+    winners = [None]*len(game_args_list)
+
+    def _game_finished(index, winner, seconds, hung=False):
+        winners[index] = winner
+        if seconds is not None:
+            game_lengths[_game_length_key(game_args_list[index])] = seconds
+        if callback:
+            callback(index, game_args_list[index], winner, hung)
+
+    pending_chunks = collections.deque(chunks)
+    workers = [_start_worker() for i in range(min(num_workers, len(chunks)))]
+    try:
+        while pending_chunks or any(w['games'] for w in workers):
+            for w in workers:
+                if not w['games'] and pending_chunks:
+                    w['games'] = list(pending_chunks.popleft())
+                    w['connection'].send([(index, game_args_list[index]) for index in w['games']])
+
+            timeout = None
+            if hang_timeout:
+                running = [w['started'] for w in workers if w['game'] is not None]
+                timeout = max(0.0, min(running) + hang_timeout - time.time()) if running else hang_timeout
+            ready = multiprocessing.connection.wait([w['connection'] for w in workers if w['games']], timeout)
+
+            for w in workers:
+                if w['connection'] not in ready:
+                    continue
+                while w['connection'].poll():
+                    message = w['connection'].recv()
+                    if message[0] == 'started':
+                        w['game'] = message[1]
+                        w['started'] = time.time()
+                    elif message[0] == 'finished':
+                        w['games'].remove(message[1])
+                        w['game'] = None
+                        _game_finished(message[1], message[2], message[3])
+                    else:
+                        print(message[2])
+                        print('Game of seed ' + str(game_args_list[message[1]][0]) + ' failed.')
+                        raise Exception
+
+            if hang_timeout:
+                for position, w in enumerate(workers):
+                    if w['game'] is None or time.time() - w['started'] < hang_timeout:
+                        continue
+                    index = w['game']
+                    print('Game of seed ' + str(game_args_list[index][0]) + ' did not finish within ' + str(hang_timeout)
+                          + ' seconds. Replacing its worker.')
+                    w['process'].kill()
+                    w['process'].join()
+                    w['connection'].close()
+                    game_summary.write_game_summary(game_summary.build_hung_game_summary(game_args_list[index][0]),
+                                                    game_summary.summary_filename(game_args_list[index][1]))
+                    _game_finished(index, None, None, hung=True)
+                    remaining_games = [i for i in w['games'] if i != index]
+                    if remaining_games:
+                        pending_chunks.appendleft(remaining_games)
+                    workers[position] = _start_worker()
+    finally:
+        for w in workers:
+            if w['process'].is_alive():
+                if w['games']:   # only get here on an error, in which case the games in progress are abandoned
+                    w['process'].kill()
+                else:
+                    w['connection'].send(None)
+            w['process'].join()
+        if length_history_file:
+            _write_game_lengths(length_history_file, game_lengths)
+    return winners
+
+
+def _schedule_chunks(predicted_seconds, num_workers, chunks_per_worker=4):
+    """
+    Internal function that orders games longest first and groups them into chunks of decreasing size (guided
+    scheduling): a chunk holds about 1/(chunks_per_worker*num_workers) of the predicted time of the games that are not
+    yet in a chunk. Long games get a chunk of their own, short games are grouped so that the pool does not spend its
+    time passing tiny tasks around, and the chunks get smaller towards the end so that the workers finish at about the
+    same time.
+    :param predicted_seconds: A list with the predicted length of every game in seconds, or None where it is unknown.
+    Unknown lengths are taken to be the mean of the known ones. If no length is known, the games keep their order.
+    :param num_workers: An integer. Number of worker processes.
+    :param chunks_per_worker: An integer. Controls the chunk size, see above.
+    :return: A list of chunks, each a list of indexes into predicted_seconds, in the order in which they should be played.
+    """
+    known_seconds = [t for t in predicted_seconds if t is not None]
+    default_seconds = sum(known_seconds) / len(known_seconds) if known_seconds else 1.0
+    seconds = [default_seconds if t is None else t for t in predicted_seconds]
+    order = sorted(range(len(seconds)), key=lambda index: -seconds[index])   # sorted is stable, ties keep their order
+
+    chunks = list()
+    remaining_seconds = sum(seconds)
+    position = 0
+    while position < len(order):
+        target_seconds = remaining_seconds / (chunks_per_worker * num_workers)
+        chunk = [order[position]]
+        chunk_seconds = seconds[order[position]]
+        position += 1
+        while position < len(order) and chunk_seconds + seconds[order[position]] <= target_seconds:
+            chunk.append(order[position])
+            chunk_seconds += seconds[order[position]]
+            position += 1
+        chunks.append(chunk)
+        remaining_seconds -= chunk_seconds
+    return chunks
+
+
+def _game_length_key(game_args):
+    """
+    :param game_args: A tuple of arguments to play_logged_game.
+    :return: A string identifying the game for the game length history, made of the seed, the novelty injection
+    function (if any) and the remaining arguments that change the game (the seat order and the agents).
+    """
+    novelty_function = game_args[3] if len(game_args) > 3 else None
+    if novelty_function is not None:
+        novelty_function = getattr(novelty_function, '__name__', repr(novelty_function))
+    return json.dumps([game_args[0], novelty_function] + [a for a in game_args[5:]], sort_keys=True)
+
+
+def _read_game_lengths(length_history_file):
+    """
+    :param length_history_file: A string. Path of the game length history file.
+    :return: A dict with game keys (see _game_length_key) as keys and game lengths in seconds as values. Empty if the file
+    does not exist or cannot be read.
+    """
+    if not os.path.exists(length_history_file):
+        return dict()
+    try:
+        with open(length_history_file, 'r') as infile:
+            return json.load(infile)
+    except ValueError:
+        return dict()
+
+
+def _write_game_lengths(length_history_file, game_lengths):
+    """
+    Write the game length history to file. Another tournament may be writing it at the same time, so the file is
+    first read again and merged, and then replaced in one go. If it cannot be written, a warning is logged and the lengths
+    are not kept.
+    :param length_history_file: A string. Path of the game length history file.
+    :param game_lengths: A dict, as returned by _read_game_lengths.
+    :return: None
+    """
+    merged_game_lengths = _read_game_lengths(length_history_file)
+    merged_game_lengths.update(game_lengths)
+    temp_filename = length_history_file + '.' + str(os.getpid()) + '.tmp'
+    try:
+        with open(temp_filename, 'w') as outfile:
+            json.dump(merged_game_lengths, outfile, separators=(',', ':'))
+        os.replace(temp_filename, length_history_file)
+    except OSError as error:
+        logger.warning('Could not write the game length history %s: %s', length_history_file, error)
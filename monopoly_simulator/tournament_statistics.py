@@ -0,0 +1,204 @@
+"""
+Online win and rank statistics of a tournament, used by the adaptive tournaments in test_harness.py to decide when enough
+games have been played. Games are added one at a time (see TournamentStatistics.add_game), and at any point the
+statistics give each player's win rate with a Wilson score interval and mean rank with a normal interval.
+
+A tournament phase is settled (see TournamentStatistics.stopping_reason) once either
+    - the win rate interval of every player is no wider than +/- precision (and, if rank_precision is given, the mean rank
+      interval of every player is no wider than +/- rank_precision), or
+    - the player with the highest win rate is separated from all others, i.e. the lower end of its win rate interval is
+      above the upper end of every other player's interval. Since this is checked after every batch of games, the
+      intervals used for it are widened (Bonferroni) by the maximum number of checks, so that stopping early does not
+      inflate the chance of a spurious separation.
+
+blocked_win_rates computes win rates for seat rotation tournaments, where the games come in blocks that share a seed,
+and paired_differences computes the effect of novelty from pairs of games played with the same seed.
+"""
+import math
+from statistics import NormalDist
+
+
+class TournamentStatistics(object):
+    def __init__(self, confidence=0.95, precision=0.05, rank_precision=None, stop_on_separation=True, max_looks=1):
+        """
+        :param confidence: A float. Confidence level of the intervals.
+        :param precision: A float. Target half-width of the win rate intervals.
+        :param rank_precision: A float or None. Target half-width of the mean rank intervals. If None, ranks are tracked
+        but do not affect stopping.
+        :param stop_on_separation: A boolean. If True, the phase is also settled once the leading player is separated
+        from all others.
+        :param max_looks: An integer. The maximum number of times stopping_reason will be called, used to widen the
+        separation intervals.
+        """
+        self.confidence = confidence
+        self.precision = precision
+        self.rank_precision = rank_precision
+        self.stop_on_separation = stop_on_separation
+        self._z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+        self._separation_z = NormalDist().inv_cdf(1.0 - (1.0 - confidence) / (2.0 * max(1, max_looks)))
+        self.num_games = 0
+        self.num_hung_games = 0   # games that never finished, which are left out of the statistics
+        self.wins = dict()
+        self._rank_mean = dict()   # running mean and sum of squared deviations (Welford) of each player's rank
+        self._rank_m2 = dict()
+
+    def add_game(self, summary):
+        """
+        Add the outcome of a game.
+        :param summary: A dict. The game summary (see game_summary.py).
+        :return: None
+        """
+        if summary.get('truncated') == 'hung':
+            self.num_hung_games += 1
+            return
+        self.num_games += 1
+        for rank, player_name in enumerate(summary['rank_order'], 1):
+            if player_name not in self.wins:
+                self.wins[player_name] = 0
+                self._rank_mean[player_name] = 0.0
+                self._rank_m2[player_name] = 0.0
+            delta = rank - self._rank_mean[player_name]
+            self._rank_mean[player_name] += delta / self.num_games
+            self._rank_m2[player_name] += delta * (rank - self._rank_mean[player_name])
+        if summary['winner'] is not None:
+            self.wins[summary['winner']] += 1
+
+    def win_rate_interval(self, player_name, z=None):
+        """
+        :param player_name: A string.
+        :param z: A float or None. The normal quantile of the interval, defaults to the one of the confidence level.
+        :return: A tuple (win rate, lower end, upper end) of the Wilson score interval.
+        """
+        if z is None:
+            z = self._z
+        n = self.num_games
+        if n == 0:
+            return 0.0, 0.0, 1.0
+        p = self.wins.get(player_name, 0) / float(n)
+        denominator = 1.0 + z * z / n
+        centre = (p + z * z / (2.0 * n)) / denominator
+        half_width = z * math.sqrt(p * (1.0 - p) / n + z * z / (4.0 * n * n)) / denominator
+        return p, max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+    def mean_rank_interval(self, player_name):
+        """
+        :param player_name: A string.
+        :return: A tuple (mean rank, lower end, upper end) of the normal interval of the player's mean rank.
+        """
+        n = self.num_games
+        mean = self._rank_mean.get(player_name, 0.0)
+        if n < 2:
+            return mean, -math.inf, math.inf
+        half_width = self._z * math.sqrt(self._rank_m2[player_name] / (n - 1) / n)
+        return mean, mean - half_width, mean + half_width
+
+    def stopping_reason(self):
+        """
+        :return: A string describing why the statistics are settled ('precision' or 'separation'), or None if they are not.
+        """
+        if self.num_games == 0:
+            return None
+        players = sorted(self.wins)
+        precise = True
+        for player_name in players:
+            p, lower, upper = self.win_rate_interval(player_name)
+            if (upper - lower) / 2.0 > self.precision:
+                precise = False
+                break
+            if self.rank_precision is not None:
+                mean, lower, upper = self.mean_rank_interval(player_name)
+                if (upper - lower) / 2.0 > self.rank_precision:
+                    precise = False
+                    break
+        if precise:
+            return 'precision'
+
+        if self.stop_on_separation and len(players) > 1:
+            leader = max(players, key=lambda player_name: self.wins[player_name])
+            leader_lower = self.win_rate_interval(leader, self._separation_z)[1]
+            if all(leader_lower > self.win_rate_interval(player_name, self._separation_z)[2]
+                   for player_name in players if player_name != leader):
+                return 'separation'
+        return None
+
+    def print_statistics(self):
+        print('Games played: ' + str(self.num_games))
+        if self.num_hung_games:
+            print('Games that never finished (left out): ' + str(self.num_hung_games))
+        for player_name in sorted(self.wins):
+            p, lower, upper = self.win_rate_interval(player_name)
+            mean, rank_lower, rank_upper = self.mean_rank_interval(player_name)
+            print(player_name + ': win rate %.3f [%.3f, %.3f], mean rank %.2f [%.2f, %.2f]'
+                  % (p, lower, upper, mean, rank_lower, rank_upper))
+
+
+def blocked_win_rates(block_summaries, confidence=0.95):
+    """
+    Win rates of a tournament that plays every seed (a block) under several seat orders, with the same dice and card
+    streams (see test_harness.play_seat_rotation_tournament). Each block contributes the fraction of its games that a
+    player won, and the interval of the player's win rate is computed over these per-block fractions. Since the seat
+    orders of a block share their dice and cards, and every player sits in every seat, neither the luck of the seed nor
+    the seat a player was given shows up as noise between the players, and far fewer seeds are needed than in a
+    tournament of independent games.
+    :param block_summaries: A list with one list per block, holding the game summaries of its games. Games that never
+    finished are left out of their block, and blocks in which no game finished are left out altogether.
+    :param confidence: A float. Confidence level of the intervals.
+    :return: A dict with player names as keys and tuples (win rate, lower end, upper end) as values.
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    block_winners = list()
+    for summaries in block_summaries:
+        winners = [summary['winner'] for summary in summaries if summary.get('truncated') != 'hung']
+        if winners:
+            block_winners.append(winners)
+    player_names = sorted(set([w for winners in block_winners for w in winners if w is not None]))
+    win_rates = dict()
+    for player_name in player_names:
+        fractions = [winners.count(player_name) / float(len(winners)) for winners in block_winners]
+        win_rates[player_name] = _mean_interval(fractions, z)
+    return win_rates
+
+
+def paired_differences(summary_pairs, confidence=0.95):
+    """
+    The effect of novelty, measured on pairs of games that were played with the same seed (and so the same seat order,
+    dice rolls and card draws), once without and once with novelty (see test_harness.play_paired_novelty_tournament).
+    For every player, the difference (with novelty minus without) in winning and in rank is taken within each pair, and
+    the mean differences are given with normal intervals over the pairs. Since both games of a pair share their luck,
+    the differences are far less noisy than comparing games played with different seeds.
+    :param summary_pairs: A list of tuples (summary without novelty, summary with novelty) of game summaries. Pairs in
+    which a game never finished are left out.
+    :param confidence: A float. Confidence level of the intervals.
+    :return: A dict with player names as keys and, as values, dicts with the keys 'win' and 'rank' holding tuples
+    (mean difference, lower end, upper end).
+    """
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    summary_pairs = [pair for pair in summary_pairs if pair[0].get('truncated') != 'hung' and
+                     pair[1].get('truncated') != 'hung']
+    player_names = sorted(set([p for pair in summary_pairs for summary in pair for p in summary['rank_order']]))
+    differences = dict()
+    for player_name in player_names:
+        win_differences = list()
+        rank_differences = list()
+        for summary, novelty_summary in summary_pairs:
+            win_differences.append(int(novelty_summary['winner'] == player_name) - int(summary['winner'] == player_name))
+            rank_differences.append(novelty_summary['rank_order'].index(player_name) -
+                                    summary['rank_order'].index(player_name))
+        differences[player_name] = {'win': _mean_interval(win_differences, z),
+                                    'rank': _mean_interval(rank_differences, z)}
+    return differences
+
+
+def _mean_interval(values, z):
+    """
+    :param values: A list of numbers.
+    :param z: A float. The normal quantile of the interval.
+    :return: A tuple (mean, lower end, upper end) of the normal interval of the mean of values.
+    """
+    n = len(values)
+    mean = sum(values) / float(n)
+    if n < 2:
+        return mean, -math.inf, math.inf
+    variance = sum([(v - mean) ** 2 for v in values]) / (n - 1)
+    half_width = z * math.sqrt(variance / n)
+    return mean, mean - half_width, mean + half_width